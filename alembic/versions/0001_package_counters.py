@@ -0,0 +1,26 @@
+# coding=utf-8
+"""Package counters of test result
+
+Tables which existed before this revision were created without migrations, so it's the first revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("test_result", sa.Column("error_packages", sa.Integer))
+    op.add_column("test_result", sa.Column("shadow_packages", sa.Integer))
+
+
+def downgrade() -> None:
+    op.drop_column("test_result", "shadow_packages")
+    op.drop_column("test_result", "error_packages")
@@ -0,0 +1,26 @@
+# coding=utf-8
+"""Confidence interval of package error probability
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("test_result", sa.Column("confidence_level", sa.Float))
+    op.add_column("test_result", sa.Column("confidence_low", sa.Float))
+    op.add_column("test_result", sa.Column("confidence_high", sa.Float))
+
+
+def downgrade() -> None:
+    op.drop_column("test_result", "confidence_high")
+    op.drop_column("test_result", "confidence_low")
+    op.drop_column("test_result", "confidence_level")
@@ -0,0 +1,26 @@
+# coding=utf-8
+"""Noise mode and likelihood weights of importance sampling
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("test_result", sa.Column("noise_mode", sa.String(1)))
+    op.add_column("test_result", sa.Column("weighted_error_packages", sa.Float))
+    op.add_column("test_result", sa.Column("weighted_error_packages_square", sa.Float))
+
+
+def downgrade() -> None:
+    op.drop_column("test_result", "weighted_error_packages_square")
+    op.drop_column("test_result", "weighted_error_packages")
+    op.drop_column("test_result", "noise_mode")
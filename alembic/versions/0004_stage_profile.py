@@ -0,0 +1,25 @@
+# coding=utf-8
+"""Profile of transfer stages
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("test_result", sa.Column("stage_durations", postgresql.JSONB))
+    op.add_column("test_result", sa.Column("stage_calls", postgresql.JSONB))
+
+
+def downgrade() -> None:
+    op.drop_column("test_result", "stage_calls")
+    op.drop_column("test_result", "stage_durations")
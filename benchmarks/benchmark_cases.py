@@ -0,0 +1,230 @@
+# coding=utf-8
+import random
+from itertools import chain
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from src.channel.chanel import Chanel
+from src.channel.codec import Codec
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.coders.abstract_coder import AbstractCoder
+from src.coders.convolutional.coder import Coder as Convolutional
+from src.coders.convolutional.turbo import Coder as Turbo
+from src.coders.cyclical.bch import Coder as Bch
+from src.coders.cyclical.coder import Coder as Cyclical
+from src.coders.cyclical.reed_solomon import Coder as ReedSolomon
+from src.coders.fountain.luby_transform import Coder as LubyTransform
+from src.coders.interleaver.Interleaver import Interleaver
+from src.coders.ldpc.coder import Coder as Ldpc
+from src.coders.linear.hamming import Coder as Hamming
+from src.coders.linear.linear_block import Coder as LinearBlock
+from src.coders.polar.coder import Coder as Polar
+
+# Length of information for coders without division into packages and for noise generators
+_STREAM_LENGTH: int = 64
+_NOISE_LENGTH: int = 1024
+_SWEEP_NOISE: tuple = (1, 5, 10, 20)
+# Quantity of packages processed by one call of batch methods
+_BATCH_SIZE: int = 256
+# Burst noise: one package of errors with this length in each period of stream
+_BURST_LENGTH: int = 16
+_BURST_PERIOD: int = 512
+# Quantity of codewords of Reed-Solomon (255, 223) code in stream with burst noise
+_BURST_COUNT_CODEWORDS: int = 8
+# Generator polynomial x^11 + x^10 + x^6 + x^5 + x^4 + x^2 + 1 of Golay (23, 12) code
+_GOLAY_POLYNOMIAL: List[int] = [1, 1, 0, 0, 0, 1, 1, 1, 0, 1, 0, 1]
+_CODER_CASE_NAMES: Tuple[str, str] = ("coder.encode.{0}", "coder.decode.{0}")
+_BATCH_CASE_NAMES: Tuple[str, str] = ("coder.encode_batch.{0}", "coder.decode_batch.{0}")
+# Coders with batch methods which process all packages at once
+_BATCH_CODERS: tuple = ("hamming(7,4)", "linear_block", "ldpc", "bch", "reed_solomon", "turbo", "polar")
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    function: Callable[[], object]
+    # Quantity of information bits processed by one call, throughput is measured in operations/s if None
+    quantity_bits: Optional[int] = None
+
+
+def _get_information(length: int) -> List[int]:
+    random_generator: random.Random = random.Random(length)
+    return [random_generator.randint(0, 1) for _ in range(length)]
+
+
+def _get_coders() -> List[Tuple[str, Callable[[], AbstractCoder]]]:
+    """
+    Coders are created by factories only for selected cases, because some of them (LDPC, polar) are built long
+    :return: List[Tuple[str, Callable[[], AbstractCoder]]]
+    """
+    return [
+        ("hamming(7,4)", lambda: Hamming(4)),
+        ("hamming(15,11)", lambda: Hamming(11)),
+        ("hamming(31,26)", lambda: Hamming(26)),
+        ("cyclical(7,4)", lambda: Cyclical(4, 11)),
+        ("cyclical(15,11)", lambda: Cyclical(11, 19)),
+        ("convolution(5,7;K=3)", lambda: Convolutional([5, 7], 1, 2, 3)),
+        ("convolution(133,171;K=7)", lambda: Convolutional([91, 121], 1, 2, 7)),
+        ("convolution(133,171;K=7;R=3/4)",
+         lambda: Convolutional([79, 109], 1, 2, 6, Convolutional.get_puncturing_matrix("3/4"))),
+        ("fountain(9,6)", lambda: LubyTransform(3, 3, 6)),
+        ("fountain(32,16)", lambda: LubyTransform(4, 8, 16)),
+        ("linear_block(7,4)",
+         lambda: LinearBlock(generator_matrix=LinearBlock.get_matrix("1000110,0100101,0010011,0001111"))),
+        ("linear_block.golay(23,12)", lambda: LinearBlock(
+            generator_matrix=[[0] * shift + _GOLAY_POLYNOMIAL + [0] * (11 - shift) for shift in range(12)]
+        )),
+        ("ldpc(96,3,6)", lambda: Ldpc(Ldpc.get_parity_check_matrix(96, 3, 6))),
+        ("ldpc(504,3,6)", lambda: Ldpc(Ldpc.get_parity_check_matrix(504, 3, 6))),
+        ("bch(255,223)", lambda: Bch(8, 4)),
+        ("bch(1023,943)", lambda: Bch(10, 8)),
+        ("reed_solomon(255,223)", lambda: ReedSolomon(255, 223)),
+        ("turbo(40;13,11)", lambda: Turbo(40)),
+        ("turbo(1024;13,11)", lambda: Turbo(1024)),
+        ("polar(256,128)", lambda: Polar(256, 128)),
+        ("polar(1024,512)", lambda: Polar(1024, 512)),
+        ("polar(1024,512;L=8)", lambda: Polar(1024, 512, list_size=8)),
+    ]
+
+
+def _is_selected(names: List[str], name_filter: Optional[str]) -> bool:
+    return name_filter is None or any(name_filter in name for name in names)
+
+
+def _get_coder_cases(name: str, coder: AbstractCoder) -> List[BenchmarkCase]:
+    length: int = coder.lengthInformation if coder.isDivIntoPackage else _STREAM_LENGTH
+    information: List[int] = _get_information(length)
+    encoded_information: List[int] = coder.encoding(information)
+    return [
+        BenchmarkCase(_CODER_CASE_NAMES[0].format(name), lambda: coder.encoding(information), length),
+        BenchmarkCase(_CODER_CASE_NAMES[1].format(name), lambda: coder.decoding(encoded_information), length),
+    ]
+
+
+def _get_batch_cases(name: str, coder: AbstractCoder) -> List[BenchmarkCase]:
+    packages: List[List[int]] = [_get_information(coder.lengthInformation) for _ in range(_BATCH_SIZE)]
+    encoded_packages: List[List[int]] = coder.encoding_batch(packages)
+    length: int = coder.lengthInformation * _BATCH_SIZE
+    return [
+        BenchmarkCase(_BATCH_CASE_NAMES[0].format(name), lambda: coder.encoding_batch(packages), length),
+        BenchmarkCase(_BATCH_CASE_NAMES[1].format(name), lambda: coder.decoding_batch(encoded_packages), length),
+    ]
+
+
+def _get_chanel_cases() -> List[BenchmarkCase]:
+    information: List[int] = _get_information(_NOISE_LENGTH)
+    return [
+        BenchmarkCase(
+            "chanel.interference",
+            lambda: Chanel().gen_interference(information, 5),
+            _NOISE_LENGTH,
+        ),
+        BenchmarkCase(
+            "chanel.biased_interference",
+            lambda: Chanel().gen_biased_interference(information, 1, 5),
+            _NOISE_LENGTH,
+        ),
+        BenchmarkCase(
+            "chanel.package_interference",
+            # Probability of package noise is specified as fraction
+            lambda: Chanel().gen_package_interference(information, 4, 0.05),
+            _NOISE_LENGTH,
+        ),
+    ]
+
+
+def _get_codec_cases() -> List[BenchmarkCase]:
+    cases: List[BenchmarkCase] = []
+    for name, coder in (
+            ("hamming(7,4)", Hamming(4)),
+            ("cyclical(7,4)", Cyclical(4, 11)),
+            ("convolution(5,7;K=3)", Convolutional([5, 7], 1, 2, 3)),
+    ):
+        length: int = coder.lengthInformation if coder.isDivIntoPackage else _STREAM_LENGTH
+        information: List[int] = _get_information(length)
+        codec: Codec = Codec(
+            coder=coder,
+            noise_probability=_SWEEP_NOISE[0],
+            count_cyclical=1,
+            duplex=False,
+            interleaver=None,
+            noise_mode=EnumNoiseMode.SINGLE,
+            noise_package_length=1,
+            noise_package_period=2,
+        )
+
+        def sweep(current_codec: Codec = codec, current_information: List[int] = information) -> None:
+            for noise in _SWEEP_NOISE:
+                current_codec.noiseProbability = noise
+                current_codec.transfer_one_step(current_information)
+
+        cases.append(BenchmarkCase(
+            "codec.transfer_sweep.{0}".format(name),
+            sweep,
+            length * len(_SWEEP_NOISE),
+        ))
+    return cases
+
+
+def _transfer_burst(
+        coder: AbstractCoder,
+        packages: List[List[int]],
+        interleaver: Optional[Interleaver] = None,
+) -> List[Optional[List[int]]]:
+    stream: List[int] = list(chain.from_iterable(coder.encoding_batch(packages)))
+    if interleaver is not None:
+        stream = interleaver.shuffle(stream)
+    stream = Chanel().generate_package_interference(stream, _BURST_LENGTH, _BURST_PERIOD)
+    if interleaver is not None:
+        stream = interleaver.reestablish(stream)
+    return coder.decoding_batch(np.array(stream).reshape(len(packages), coder.lengthTotal))
+
+
+def _get_burst_cases() -> List[BenchmarkCase]:
+    """
+    Reed-Solomon code against Hamming code with interleaver of codewords for the same information stream,
+    each burst spoils at most three bytes of Reed-Solomon code and one bit of each of 16 Hamming codewords
+    """
+    reed_solomon: ReedSolomon = ReedSolomon(255, 223)
+    hamming: Hamming = Hamming(4)
+    information: List[int] = _get_information(reed_solomon.lengthInformation * _BURST_COUNT_CODEWORDS)
+    reed_solomon_packages: List[List[int]] = np.reshape(information, (-1, reed_solomon.lengthInformation)).tolist()
+    hamming_packages: List[List[int]] = np.reshape(information, (-1, hamming.lengthInformation)).tolist()
+    interleaver: Interleaver = Interleaver(hamming.lengthTotal)
+    return [
+        BenchmarkCase(
+            "codec.burst.reed_solomon(255,223)",
+            lambda: _transfer_burst(reed_solomon, reed_solomon_packages),
+            len(information),
+        ),
+        BenchmarkCase(
+            "codec.burst.hamming(7,4)+interleaver",
+            lambda: _transfer_burst(hamming, hamming_packages, interleaver),
+            len(information),
+        ),
+    ]
+
+
+def get_benchmark_cases(name_filter: Optional[str] = None) -> List[BenchmarkCase]:
+    """
+    Function provide functionality for creation of benchmark cases which names contain name_filter, coders are
+    created only for selected cases
+    :param name_filter: Optional[str] All cases are created if None
+    :return: List[BenchmarkCase]
+    """
+    cases: List[BenchmarkCase] = []
+    for name, get_coder in _get_coders():
+        flg_coder_cases: bool = _is_selected([case_name.format(name) for case_name in _CODER_CASE_NAMES], name_filter)
+        flg_batch_cases: bool = name.startswith(_BATCH_CODERS) \
+            and _is_selected([case_name.format(name) for case_name in _BATCH_CASE_NAMES], name_filter)
+        if not flg_coder_cases and not flg_batch_cases:
+            continue
+        coder: AbstractCoder = get_coder()
+        if flg_coder_cases:
+            cases.extend(_get_coder_cases(name, coder))
+        if flg_batch_cases:
+            cases.extend(_get_batch_cases(name, coder))
+    cases.extend(_get_chanel_cases() + _get_codec_cases() + _get_burst_cases())
+    return [case for case in cases if name_filter is None or name_filter in case.name]
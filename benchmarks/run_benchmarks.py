@@ -0,0 +1,108 @@
+# coding=utf-8
+"""
+Benchmarks of coders, noise generators and codec.
+
+Usage (from root of repository):
+    python -m benchmarks.run_benchmarks                                  # measure and print
+    python -m benchmarks.run_benchmarks --save benchmarks/baseline.json  # store baseline
+    python -m benchmarks.run_benchmarks --compare benchmarks/baseline.json --threshold 0.2
+Comparison exits with code 1 if throughput of any benchmark fell more then threshold.
+"""
+import argparse
+import json
+import sys
+import timeit
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+from benchmarks.benchmark_cases import BenchmarkCase, get_benchmark_cases
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    # Best time of one call in seconds
+    duration: float
+    # Mbit/s for cases with quantity of bits, operations/s for other
+    throughput: float
+    unit: str
+
+
+def measure(case: BenchmarkCase, repeat: int, min_time: float) -> BenchmarkResult:
+    """
+    Function provide functionality for measuring of case, the best of repeats is used because it less depends on
+    background load
+    :param case: BenchmarkCase
+    :param repeat: int Quantity of repeats
+    :param min_time: float Minimal duration of one repeat in seconds
+    :return: BenchmarkResult
+    """
+    timer: timeit.Timer = timeit.Timer(case.function)
+    number: int = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    duration: float = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    if case.quantity_bits is not None:
+        return BenchmarkResult(case.name, duration, case.quantity_bits / duration / 1e6, "Mbit/s")
+    return BenchmarkResult(case.name, duration, 1 / duration, "op/s")
+
+
+def compare(
+        results: List[BenchmarkResult],
+        baseline: Dict[str, dict],
+        threshold: float,
+) -> List[str]:
+    """
+    Function provide functionality for searching of regressions against baseline
+    :param results: List[BenchmarkResult]
+    :param baseline: Dict[str, dict] Stored results by names
+    :param threshold: float Allowed relative decrease of throughput
+    :return: List[str] Names of regressed benchmarks
+    """
+    regressions: List[str] = []
+    for result in results:
+        if result.name not in baseline:
+            print("{0:55} {1:12.4f} {2:7} (new)".format(result.name, result.throughput, result.unit))
+            continue
+        ratio: float = result.throughput / baseline[result.name]["throughput"]
+        flg_regression: bool = ratio < 1 - threshold
+        if flg_regression:
+            regressions.append(result.name)
+        print("{0:55} {1:12.4f} {2:7} x{3:.2f}{4}".format(
+            result.name, result.throughput, result.unit, ratio, " REGRESSION" if flg_regression else ""))
+    return regressions
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(prog="benchmarks")
+    argument_parser.add_argument("-f", "--filter", type=str, help="Run only benchmarks which names contain value")
+    argument_parser.add_argument("-r", "--repeat", type=int, default=5, help="Quantity of repeats")
+    argument_parser.add_argument("-mt", "--min_time", type=float, default=0.05, help="Minimal time of repeat in s")
+    argument_parser.add_argument("-s", "--save", type=str, help="Store results as baseline to file")
+    argument_parser.add_argument("-c", "--compare", type=str, help="Compare results with baseline from file")
+    argument_parser.add_argument("-t", "--threshold", type=float, default=0.2,
+                                 help="Allowed relative decrease of throughput for comparison")
+    parsed_arguments = argument_parser.parse_args(arguments)
+
+    results: List[BenchmarkResult] = []
+    for case in get_benchmark_cases(parsed_arguments.filter):
+        results.append(measure(case, parsed_arguments.repeat, parsed_arguments.min_time))
+        if parsed_arguments.compare is None:
+            print("{0:55} {1:12.4f} {2}".format(results[-1].name, results[-1].throughput, results[-1].unit))
+
+    if parsed_arguments.save is not None:
+        with open(parsed_arguments.save, "w", encoding="UTF-8") as baseline_file:
+            json.dump({result.name: asdict(result) for result in results}, baseline_file, indent=2)
+
+    if parsed_arguments.compare is not None:
+        with open(parsed_arguments.compare, encoding="UTF-8") as baseline_file:
+            regressions: List[str] = compare(results, json.load(baseline_file), parsed_arguments.threshold)
+        if regressions:
+            print("Regressions: {0}".format(", ".join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,7 @@
 # coding=utf-8
 
-from src.GUI.controller.main_controller import MainController
 from src.config.config_processor import ConfigProcessor
 from src.endpoint.console.app_parser import AppParser
-from src.endpoint.console.console_processor import ConsoleProcessor
 from src.endpoint.console.enum_app_mode import EnumAppMode
 from src.helper.error.exception.application_exception import ApplicationException
 from src.logger import log
@@ -12,12 +10,26 @@ if __name__ == '__main__':
     ConfigProcessor().parse_config()
     try:
         log.info("Start program")
+        # Modes are imported lazily, so console mode doesn't load PyQt5 and resources of GUI
         if AppParser().app_mode == EnumAppMode.GUI:
             log.info("GUI mode")
+            from src.GUI.controller.main_controller import MainController
+
             controller = MainController()
         elif AppParser().app_mode == EnumAppMode.CONSOLE:
             log.info("Console mode")
+            from src.endpoint.console.console_processor import ConsoleProcessor
+
             ConsoleProcessor().transfer()
+        elif AppParser().app_mode == EnumAppMode.BATCH:
+            log.info("Batch mode")
+            from src.endpoint.batch.batch_runner import BatchRunner
+            from src.endpoint.batch.batch_spec_parser import BatchSpecParser
+
+            BatchRunner(
+                spec_parser=BatchSpecParser.from_file(AppParser().batch_parser.batch_spec),
+                quantity_workers=AppParser().batch_parser.batch_workers,
+            ).run()
         log.info("End program")
     except Exception as error:
         print(error)
@@ -16,5 +16,9 @@ setup(
     description='Diploma Codding',
     install_requires=[
         'sqlalchemy', 'alembic', 'matplotlib', 'PyQt5', 'numpy', 'psycopg2', 'jsonpickle',
-    ]
+    ],
+    # Compiled kernels of decoders and channel, numpy implementations are used without it
+    extras_require={
+        'jit': ['numba'],
+    },
 )
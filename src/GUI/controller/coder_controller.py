@@ -39,6 +39,17 @@ class CoderController(GeneralCoderSimulate):
     def set_con_count_reg(self, value: int) -> None:
         self._conCountReg = value
 
+    def set_con_puncturing_rate(self, value: str) -> None:
+        # Empty value means coder without puncturing
+        self._conPuncturingRate = value or None
+
+    def set_con_termination_mode(self, value: str) -> None:
+        self._conTerminationMode = value
+
+    def set_con_traceback_depth(self, value: int) -> None:
+        # Zero means default depth
+        self._conTracebackDepth = value or None
+
     def set_fou_size_pack(self, value: int) -> None:
         self._fouSizePack = value
 
@@ -2,8 +2,11 @@
 from numpy import deprecate
 
 from src.GUI.controller.coder_controller import CoderController
+from src.GUI.signal_simulation_listener import SignalSimulationListener
 from src.channel.enum_noise_mode import EnumNoiseMode
 from src.endpoint.general_chanel_simulate import GeneralChanelSimulate
+from src.endpoint.simulation.single_coder_simulation import SingleCoderSimulation
+from src.endpoint.thread.simulation_thread import SimulationThread
 from src.helper.error.error_handler import ErrorHandler
 from src.helper.error.exception.application_exception import ApplicationException
 from src.helper.error.exception.parameters_parse_exception import ParametersParseException
@@ -16,6 +19,8 @@ class TestController(GeneralChanelSimulate):
     _NOISE_MIN: int = 1
     _NOISE_MAX: int = 50
 
+    _thread: SimulationThread
+
     def __init__(
             self,
             first_coder_params: CoderController,
@@ -24,6 +29,7 @@ class TestController(GeneralChanelSimulate):
         super().__init__(
             first_coder_params=first_coder_params,
             second_coder_params=second_coder_params,
+            listener=SignalSimulationListener(),
         )
         # Should be defined
         self._noiseStart = self._NOISE_MIN
@@ -112,6 +118,11 @@ class TestController(GeneralChanelSimulate):
         elif value == 'Second':
             self._mode = 1
 
+    def _start_simulation(self, simulation: SingleCoderSimulation) -> None:
+        # Reference to thread should be kept until the end of processing
+        self._thread = SimulationThread(simulation)
+        self._thread.start()
+
     def start_first_single_test(self):
         try:
             super().start_first_single_test()
@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 
 from src.channel.enum_noise_mode import EnumNoiseMode
 from src.helper.calc.simple_calculation_for_transfer_process import SimpleCalculationForTransferProcess
+from src.helper.calc.weight_spectrum_calculation import WeightSpectrumCalculation
+from src.helper.error.exception.codding_exception import CodingException
 from src.helper.pattern.singleton import Singleton
 from src.statistics.object.statistic_collector import StatisticCollector
 
@@ -14,10 +16,12 @@ class GraphicController(metaclass=Singleton):
     __CORRECT_PACKAGE: str = "Quantity of incorrect packages"
     __CORRECT_BITS: str = "Quantity of incorrect bits"
     __SOURCE_CORRECT_BITS: str = "Quantity of source incorrect bits"
+    __ANALYTIC_BLOCK: str = "Analytic probability of incorrect block (BSC)"
     __FROM_Y_LIMIT: float = 10 ** (-10)
     __TO_Y_LIMIT: float = 1.1
     __Y_LABEL: str = "Chance of last _information, P*10^-1"
     __X_LABEL: str = "Power of signal, Db"
+    __NOISE_MODES_WITH_PROBABILITY: tuple = (EnumNoiseMode.SINGLE, EnumNoiseMode.MIX, EnumNoiseMode.IMPORTANCE)
 
     def draw_graphic(
             self,
@@ -31,10 +35,10 @@ class GraphicController(metaclass=Singleton):
             matches.Patch(color='blue', label=GraphicController.__CORRECT_PACKAGE),
             # matches.Patch(color='purple', label=GraphicController.__CORRECT_BITS),
             matches.Patch(color='red', label=GraphicController.__SOURCE_CORRECT_BITS),
+            matches.Patch(color='green', label=GraphicController.__ANALYTIC_BLOCK),
         ])
         plt.ylim([self.__TO_Y_LIMIT, self.__FROM_Y_LIMIT])
-        if static_collector.testResult[0].noise_type == EnumNoiseMode.SINGLE \
-                or static_collector.testResult[0].noise_type == EnumNoiseMode.MIX:
+        if static_collector.testResult[0].noise_type in self.__NOISE_MODES_WITH_PROBABILITY:
             plt.xlim([static_collector.beginNoise, static_collector.endNoise])
         else:
             package_noise = abs(1 / static_collector.noiseLength * static_collector.noisePeriod) - 1
@@ -53,8 +57,7 @@ class GraphicController(metaclass=Singleton):
 
         test_noise_sequence: list = []
         # Axis X - noise
-        if static_collector.testResult[0].noise_type == EnumNoiseMode.SINGLE \
-                or static_collector.testResult[0].noise_type == EnumNoiseMode.MIX:
+        if static_collector.testResult[0].noise_type in self.__NOISE_MODES_WITH_PROBABILITY:
             test_noise_sequence: list = [
                 static_collector.beginNoise + number_of_step * noise_step_different
                 for number_of_step in range(static_collector.quantityStepsInCycle)
@@ -68,9 +71,8 @@ class GraphicController(metaclass=Singleton):
         plt.plot(
             test_noise_sequence,
             # Axis Y - result of test (Package)
-            [test_result.error_packages
-             / (test_result.error_packages + test_result.repair_packages + test_result.successful_packages)
-             + (self.__FROM_Y_LIMIT * 1.1) for test_result in static_collector.testResult],
+            [test_result.error_package_probability + (self.__FROM_Y_LIMIT * 1.1)
+             for test_result in static_collector.testResult],
             color='blue',
         )
 
@@ -90,4 +92,19 @@ class GraphicController(metaclass=Singleton):
              static_collector.testResult],
             color='red',
         )
+
+        # Plot analytic _information for validation of simulation (only for linear block coders)
+        if not static_collector.flgCascade \
+                and static_collector.testResult[0].noise_type in self.__NOISE_MODES_WITH_PROBABILITY:
+            try:
+                plt.plot(
+                    test_noise_sequence,
+                    [x + (self.__FROM_Y_LIMIT * 1.1) for x in WeightSpectrumCalculation.get_error_curve(
+                        coder=static_collector.firstCoder,
+                        noise_list=[test_result.noise for test_result in static_collector.testResult]
+                    )],
+                    color='green',
+                )
+            except CodingException:
+                pass
         plt.show()
@@ -0,0 +1,25 @@
+# coding=utf-8
+from src.GUI.globals_signals import globalSignals
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.helper.error.exception.application_exception import ApplicationException
+
+
+class SignalSimulationListener(ISimulationListener):
+    """
+    Listener which transfer notifications of simulation to GUI via global signals
+    """
+
+    def start_testing(self) -> None:
+        globalSignals.startTesting.emit(True)
+
+    def step_finished(self, progress: int) -> None:
+        globalSignals.stepFinished.emit(progress)
+
+    def auto_step_finished(self, progress: int) -> None:
+        globalSignals.autoStepFinished.emit(progress)
+
+    def ended(self) -> None:
+        globalSignals.ended.emit()
+
+    def not_correct(self, exception: ApplicationException) -> None:
+        globalSignals.notCorrect.emit(exception)
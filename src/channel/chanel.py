@@ -1,9 +1,12 @@
 # coding=utf-8
 import random
-from typing import Union, Optional, List
+from typing import Union, Optional, List, Tuple
 
 from math import ceil
 
+import numpy as np
+
+from src.helper import jit
 from src.helper.error.exception.chanel_exception import ChanelException
 from src.helper.pattern.singleton import Singleton
 from src.logger import log
@@ -32,17 +35,37 @@ class Chanel(metaclass=Singleton):
         :return: List[int]
         """
         if len(information) <= block_len:
-            return [information + ([0] * (block_len - len(information)))]
-
-        blocks: List[list] = []
-        for number_of_block in range(ceil(block_len / len(information))):
-            blocks.append(information[number_of_block * block_len: (number_of_block + 1) * block_len])
-
-        for block_iterator in blocks:
-            if len(block_iterator) < block_len:
-                block_iterator.append([0] * (block_len - len(block_iterator)))
+            # Single block is cheaper to supplement without numpy
+            return [list(information) + [0] * (block_len - len(information))]
+        return self.get_blocks(information, block_len).tolist()
 
-        return blocks
+    # noinspection PyMethodMayBeStatic
+    def get_blocks(
+            self,
+            information: Union[List[int], np.ndarray],
+            block_len: int,
+            buffer: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Method provide functionality for dividing information into blocks without copying of each block.
+        Information is copied once into array supplemented by zero bits, array is reshaped into matrix view with
+        block in each row. Array of suitable length is reshaped without copying
+        :param information: Union[List[int], np.ndarray]
+        :param block_len: int
+        :param buffer: Optional[np.ndarray] Array for supplemented information, it's used if it's long enough
+        :return: np.ndarray Matrix with shape (quantity of blocks, block_len)
+        """
+        count_blocks: int = max(1, ceil(len(information) / block_len))
+        length: int = count_blocks * block_len
+        if isinstance(information, np.ndarray) and len(information) == length:
+            return information.reshape(count_blocks, block_len)
+
+        if buffer is None or len(buffer) < length:
+            buffer = np.empty(length, dtype=np.int64)
+        bits: np.ndarray = buffer[:length]
+        bits[:len(information)] = information
+        bits[len(information):] = 0
+        return bits.reshape(count_blocks, block_len)
 
     def gen_interference(self, information: list, straight: float = None) -> list:
         """
@@ -81,6 +104,39 @@ class Chanel(metaclass=Singleton):
         log.debug("During transport package noise changed package to {0}".format(answer))
         return answer
 
+    def gen_biased_interference(
+            self,
+            information: list,
+            straight: float,
+            biased_straight: float,
+    ) -> Tuple[list, float]:
+        """
+        Генерация независимых ошибок со смещённой вероятностью для оценки методом выборки по значимости
+        :param information: list Информация, представленная в виде массива битов
+        :param straight: float Исходная вероятность ошибки бита от 0.00 до 100.00
+        :param biased_straight: float Смещённая вероятность ошибки бита от 0.00 до 100.00, с которой генерируются ошибки
+        :return: Искажённую информацию и отношение правдоподобия исходного и смещённого распределений
+        """
+        log.debug("Biased noise with probably {0} instead of {1}".format(biased_straight, straight))
+
+        random_generator: random.Random = random.Random(random.random() * 50)  # генератор случайных чисел
+        probability: float = straight / 100
+        biased_probability: float = biased_straight / 100
+
+        answer: list = information.copy()
+        count_change_bit: int = 0
+        for iterator in range(len(answer)):
+            if random_generator.random() < biased_probability:
+                answer[iterator] ^= 1
+                count_change_bit += 1
+
+        likelihood_ratio: float = \
+            (probability / biased_probability) ** count_change_bit \
+            * ((1 - probability) / (1 - biased_probability)) ** (len(answer) - count_change_bit)
+
+        log.debug("During transport package noise changed package to {0}".format(answer))
+        return answer, likelihood_ratio
+
     def gen_package_interference(
             self,
             information: list,
@@ -123,37 +179,41 @@ class Chanel(metaclass=Singleton):
         # random generator
         random_generator: random.Random = random.Random(random.random() * 50)
         count_free_bits: int = len(information) - count_error_package * length_of_block
-        # mask of changed bits
-        changes_bits: list = []
+        # beginnings of error packages
+        list_of_begin_noise_error: List[int] = []
+        position: int = 0
         for iterator in range(count_error_package):
             if flg_split_package:
                 # we should save bits for split package: count_free_bits - count of package - current step - 1
                 count_save_bits: int = count_error_package - iterator - 1
                 count_pass_bits = random_generator.randint(1, count_free_bits - count_save_bits)
-                changes_bits += count_pass_bits * [0]
-                changes_bits += length_of_block * [1]
             else:
                 count_pass_bits = random_generator.randint(0, count_free_bits)
-                if count_pass_bits != 0:
-                    changes_bits += count_pass_bits * [0]
-                changes_bits += length_of_block * [1]
+            list_of_begin_noise_error.append(position + count_pass_bits)
+            position += count_pass_bits + length_of_block
             # We should degrease count free bits
             count_free_bits -= count_pass_bits
 
-        result: list = information.copy()
-        # inversion of bits
-        for iterator in range(len(changes_bits)):
-            result[iterator] ^= changes_bits[iterator]
+        bits: np.ndarray = np.array(information, dtype=np.uint8)
+        self._flip_bursts(bits, list_of_begin_noise_error, length_of_block)
+        result: list = bits.tolist()
 
         log.debug("During transport package noise changed package to {0}".format(result))
         return result
 
     def generate_package_interference(
             self,
-            information: list,
+            information: Union[List[int], np.ndarray],
             length_of_block: int,
             frequency_of_block: int
-    ) -> List[int]:
+    ) -> Union[List[int], np.ndarray]:
+        """
+        Generation of error package in each period of information, information is changed in place
+        :param information: Union[List[int], np.ndarray]
+        :param length_of_block: int Length of error package
+        :param frequency_of_block: int Length of period
+        :return: Union[List[int], np.ndarray] Changed information
+        """
         random_generator: random.Random = random.Random(random.random() * 50)
 
         count_of_blocks: int = int(len(information) / frequency_of_block)
@@ -180,10 +240,35 @@ class Chanel(metaclass=Singleton):
                 random_generator.randint(begin_of_error, end_of_error)
             )
 
-        result: List[int] = information
+        if isinstance(information, np.ndarray):
+            self._flip_bursts(information, list_of_begin_noise_error, length_of_block)
+            return information
 
+        # Only inverted bits of list are visited, it's cheaper than conversion of list to array
+        result: List[int] = information
         for begin_iterator in list_of_begin_noise_error:
             for iterator in range(length_of_block):
                 result[begin_iterator + iterator] ^= 1
 
         return result
+
+    # noinspection PyMethodMayBeStatic
+    def _flip_bursts(self, bits: np.ndarray, begins: List[int], length_of_block: int) -> None:
+        """
+        Method provide functionality for inversion of error packages in place, packages shouldn't overlap
+        :param bits: np.ndarray Information
+        :param begins: List[int] Beginnings of error packages
+        :param length_of_block: int Length of error package
+        """
+        starts: np.ndarray = np.array(begins, dtype=np.int64)
+        if jit.ENABLED:
+            _flip_bursts_kernel(bits, starts, length_of_block)
+        else:
+            bits[(starts[:, np.newaxis] + np.arange(length_of_block)).reshape(-1)] ^= 1
+
+
+@jit.kernel
+def _flip_bursts_kernel(bits: np.ndarray, starts: np.ndarray, length_of_block: int) -> None:
+    for start in starts:
+        for position in range(start, start + length_of_block):
+            bits[position] ^= 1
@@ -1,10 +1,14 @@
 # coding=utf-8
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Callable
+
+import numpy as np
 
 from src.channel import chanel
 from src.channel.enum_bit_transfer_result import EnumBitTransferResult
 from src.channel.enum_noise_mode import EnumNoiseMode
 from src.channel.enum_package_transfer_result import EnumPackageTransferResult
+from src.channel.enum_transfer_stage import EnumTransferStage
+from src.channel.stage_profiler import StageProfiler
 from src.coders.abstract_coder import AbstractCoder
 from src.coders.interleaver import Interleaver
 from src.helper.error.exception.codding_exception import CodingException
@@ -24,16 +28,42 @@ class Codec:
     _noiseMode: EnumNoiseMode
     _noisePackageLength: int
 
+    # Importance noise mode attr
+    # Quantity of bit errors in one package which is expected with default biased noise probability
+    _IMPORTANCE_EXPECTED_ERRORS: int = 2
+    _IMPORTANCE_MAX_PROBABILITY: float = 50.0
+    noiseBiasedProbability: Optional[float] = None
+    _likelihoodWeight: float = 1.0
+
+    # Profiling of transfer stages, disabled if None
+    _profiler: Optional[StageProfiler] = None
+
     class TransferStatistic:
-        result_status: EnumPackageTransferResult = EnumPackageTransferResult.SUCCESS
-        quantity_successful_bits: int = 0
-        quantity_error_bits: int = 0
-        quantity_repair_bits: int = 0
-        quantity_shadow_bits: int = 0
-        quantity_changed_bits: int = 0
-        based_error_bits: int = 0
-        based_correct_bits: int = 0
-        current_information_state: list = []
+        """
+        Counters of transfer of one package. Layout is fixed by slots and every instance has own lists
+        """
+        __slots__ = (
+            "result_status", "quantity_successful_bits", "quantity_error_bits", "quantity_repair_bits",
+            "quantity_shadow_bits", "quantity_changed_bits", "based_error_bits", "based_correct_bits",
+            "quantity_inner_error_bits", "stage_error_bits", "likelihood_weight", "current_information_state",
+        )
+
+        def __init__(self):
+            self.result_status: EnumPackageTransferResult = EnumPackageTransferResult.SUCCESS
+            self.quantity_successful_bits: int = 0
+            self.quantity_error_bits: int = 0
+            self.quantity_repair_bits: int = 0
+            self.quantity_shadow_bits: int = 0
+            self.quantity_changed_bits: int = 0
+            self.based_error_bits: int = 0
+            self.based_correct_bits: int = 0
+            # Bits of outer codewords which are wrong after inner decoder of cascade codec
+            self.quantity_inner_error_bits: int = 0
+            # Wrong bits of input stream of each stage of concatenated codec after decoding of this stage
+            self.stage_error_bits: List[int] = []
+            # Likelihood ratio of transfer for importance noise mode
+            self.likelihood_weight: float = 1.0
+            self.current_information_state: list = []
 
     def __init__(
             self,
@@ -45,6 +75,7 @@ class Codec:
             noise_mode: EnumNoiseMode,
             noise_package_length: int,
             noise_package_period: int,
+            noise_biased_probability: Optional[float] = None,
     ):
 
         log.debug("Create chanel")
@@ -61,6 +92,7 @@ class Codec:
             self.duplex = duplex
         if interleaver is not None:
             self._interleaver = interleaver
+        self.noiseBiasedProbability = noise_biased_probability
         log.debug("Chanel created")
 
     def __str__(self) -> str:
@@ -79,109 +111,158 @@ class Codec:
                 self._information
             )
 
+    def set_profiler(self, profiler: Optional[StageProfiler]) -> None:
+        """
+        Method provide functionality for enabling (disabling if None) of profiling of transfer stages
+        :param profiler: Optional[StageProfiler] Profiler which collects durations of stages
+        :return: None
+        """
+        self._profiler = profiler
+
+    def _run_stage(self, stage: EnumTransferStage, function: Callable, *args):
+        if self._profiler is None:
+            return function(*args)
+        return self._profiler.measure(stage, function, *args)
+
+    @staticmethod
+    def _apply(function: Callable, packages: List[List[int]]) -> List[List[int]]:
+        return [function(package) for package in packages]
+
+    def _get_blocks_change_state(self, source_blocks: List[List[int]], current_blocks: List[List[int]]) -> List[int]:
+        """
+        :param source_blocks: List[List[int]]
+        :param current_blocks: List[List[int]]
+        :return: List[int] Quantity of correct and error bits of all blocks
+        """
+        correct_bits: int = 0
+        error_bits: int = 0
+        for source_block, current_block in zip(source_blocks, current_blocks):
+            block_correct_bits, block_error_bits = self._get_change_state(source_block, current_block)
+            correct_bits += block_correct_bits
+            error_bits += block_error_bits
+        return [correct_bits, error_bits]
+
+    def _get_blocks_different_information(self, first_blocks: List[List[int]], second_blocks: List[List[int]]) -> int:
+        return sum(
+            self._get_different_information(first_block, second_block)
+            for first_block, second_block in zip(first_blocks, second_blocks)
+        )
+
     def transfer_one_step(self, information: List[int]) -> TransferStatistic:
         transfer_statistic = Codec.TransferStatistic()
+        self._likelihoodWeight = 1.0
 
-        #  Разбиение на Package
+        #  Разбиение на Package, all blocks are encoded and decoded at once as rows of matrix
         if self._coder.isDivIntoPackage:
-            block_list = chanel.Chanel().divide_on_blocks(
-                information=information,
-                block_len=self._coder.lengthInformation
-            )
+            blocks: Union[List[List[int]], np.ndarray] = chanel.Chanel().get_blocks(
+                information, self._coder.lengthInformation)
+            normalization_blocks: List[List[int]] = blocks.tolist()
         else:
-            block_list = [information.copy()]
-
-        for block in block_list:
-            current_information: List[int] = block.copy()
-            log.info("Transfer bits - {0}".format(current_information))
-            status: EnumBitTransferResult = EnumBitTransferResult.SUCCESS
-            normalization_information: List[int] = self._coder.try_normalization(current_information)
-            try:
-                current_information = self._coder.encoding(normalization_information)
-
-                if self._interleaver:
-                    current_information = self._interleaver.shuffle(current_information)
-
-                help_information = current_information
-
-                compare_information: list = current_information
-                current_information = self._do_noise(
-                    information=current_information,
-                    noise_probability=self.noiseProbability,
-                )
-                transfer_statistic.based_correct_bits, transfer_statistic.based_error_bits = self._get_change_state(
-                    source_state=compare_information,
-                    current_state=current_information
-                )
-
-                if help_information != current_information:
-                    status = EnumBitTransferResult.REPAIR
-
-                if self._interleaver:
-                    current_information = self._interleaver.reestablish(current_information)
-
-                current_information = self._coder.decoding(current_information)
-            except CodingException:
-                status = EnumBitTransferResult.ERROR
-                log.info(
-                    "During decoding package {0} founded cannot repair error".format(current_information))
+            normalization_blocks = [self._coder.try_normalization(information.copy())]
+            blocks = normalization_blocks
+        log.info("Transfer bits - {0}".format(normalization_blocks))
+
+        try:
+            codewords: List[List[int]] = self._run_stage(
+                EnumTransferStage.ENCODE, self._coder.encoding_batch, blocks)
+        except CodingException:
+            log.info("Package {0} cannot be encoded".format(information))
+            self._information = "Package corrupted amd cannot be repair\n"
+            transfer_statistic.result_status = EnumPackageTransferResult.ERROR
+            transfer_statistic.quantity_successful_bits = sum(len(block) for block in normalization_blocks)
+            transfer_statistic.likelihood_weight = self._likelihoodWeight
+            return transfer_statistic
+
+        if self._interleaver:
+            codewords = self._run_stage(EnumTransferStage.SHUFFLE, self._apply, self._interleaver.shuffle, codewords)
+
+        noise_codewords: List[List[int]] = self._run_stage(
+            EnumTransferStage.NOISE,
+            self._apply,
+            lambda codeword: self._do_noise(codeword, self.noiseProbability),
+            codewords,
+        )
+        transfer_statistic.based_correct_bits, transfer_statistic.based_error_bits = self._run_stage(
+            EnumTransferStage.COMPARE, self._get_blocks_change_state, codewords, noise_codewords)
+        transfer_statistic.quantity_changed_bits = transfer_statistic.based_error_bits
+
+        received: List[List[int]] = noise_codewords
+        if self._interleaver:
+            received = self._run_stage(
+                EnumTransferStage.REESTABLISH, self._apply, self._interleaver.reestablish, received)
+
+        decoded_blocks: List[Optional[List[int]]] = self._run_stage(
+            EnumTransferStage.DECODE, self._coder.decoding_batch, received)
+
+        current_blocks: List[List[int]] = []
+        for normalization_information, codeword, noise_codeword, received_block, decoded_block in zip(
+                normalization_blocks, codewords, noise_codewords, received, decoded_blocks):
+            if decoded_block is None:
+                # Block which cannot be decoded is compared as it was received
+                current_blocks.append(received_block)
+                status: EnumBitTransferResult = EnumBitTransferResult.ERROR
+                log.info("During decoding package {0} founded cannot repair error".format(received_block))
                 self._information = "Package corrupted amd cannot be repair\n"
+            elif decoded_block == normalization_information:
+                current_blocks.append(decoded_block)
+                status = EnumBitTransferResult.REPAIR if codeword != noise_codeword else EnumBitTransferResult.SUCCESS
+                log.info("Package {0} transferred successfully".format(information))
+                self._information = "Package transferred successfully\n"
             else:
-                if current_information == normalization_information:
-                    if status != EnumBitTransferResult.REPAIR:
-                        status = EnumBitTransferResult.SUCCESS
-                    log.info("Package {0} transferred successfully".format(information))
-                    self._information = "Package transferred successfully\n"
-                else:
-                    status = EnumBitTransferResult.SHADOW
-                    log.error("Package {0} corrupted and impossible to repair it".format(
-                        current_information))
-                    self._information = "Package {0} corrupted and impossible to repair it\n"
-
-            # calculate changing information
-            current_step_success_bits = self._get_different_information(current_information, normalization_information)
-            transfer_statistic.quantity_successful_bits += current_step_success_bits
-            transfer_statistic.quantity_error_bits += len(normalization_information) - current_step_success_bits
-            transfer_statistic.quantity_changed_bits = transfer_statistic.based_error_bits
+                current_blocks.append(decoded_block)
+                status = EnumBitTransferResult.SHADOW
+                log.error("Package {0} corrupted and impossible to repair it".format(decoded_block))
+                self._information = "Package {0} corrupted and impossible to repair it\n"
 
+            # Status of package is status of the worst block: error, shadow, repair, success
             if status == EnumBitTransferResult.ERROR:
                 transfer_statistic.result_status = EnumPackageTransferResult.ERROR
-            elif status == EnumBitTransferResult.SHADOW:
+            elif status == EnumBitTransferResult.SHADOW \
+                    and transfer_statistic.result_status != EnumPackageTransferResult.ERROR:
                 transfer_statistic.result_status = EnumPackageTransferResult.SHADOW
             elif status == EnumBitTransferResult.REPAIR \
-                    and transfer_statistic.result_status != EnumPackageTransferResult.ERROR \
-                    and transfer_statistic.result_status != EnumPackageTransferResult.SHADOW:
+                    and transfer_statistic.result_status == EnumPackageTransferResult.SUCCESS:
                 transfer_statistic.result_status = EnumPackageTransferResult.REPAIR
-            else:
-                transfer_statistic.result_status = EnumPackageTransferResult.SUCCESS
+
+        # calculate changing information
+        transfer_statistic.quantity_successful_bits = self._run_stage(
+            EnumTransferStage.COMPARE,
+            self._get_blocks_different_information,
+            current_blocks,
+            normalization_blocks,
+        )
+        transfer_statistic.quantity_error_bits = \
+            sum(len(block) for block in normalization_blocks) - transfer_statistic.quantity_successful_bits
+        transfer_statistic.likelihood_weight = self._likelihoodWeight
         return transfer_statistic
 
     def get_transfer_one_step(self, information: List[int]) -> TransferStatistic:
         transfer_statistic = Codec.TransferStatistic()
+        self._likelihoodWeight = 1.0
         current_information_state: List[int] = information.copy()
 
         log.info("Transfer package - {0}".format(current_information_state))
         normalization_information: List[int] = self._coder.try_normalization(current_information_state)
         try:
-            current_information_state = self._coder.encoding(normalization_information)
+            current_information_state = self._run_stage(
+                EnumTransferStage.ENCODE, self._coder.encoding, normalization_information)
 
             if self._interleaver:
-                current_information_state = self._interleaver.shuffle(current_information_state)
+                current_information_state = self._run_stage(
+                    EnumTransferStage.SHUFFLE, self._interleaver.shuffle, current_information_state)
 
             compare_information: list = current_information_state
-            current_information_state = self._do_noise(
-                information=current_information_state,
-                noise_probability=self.noiseProbability,
-            )
-            transfer_statistic.based_correct_bits, transfer_statistic.based_error_bits = self._get_change_state(
-                source_state=compare_information,
-                current_state=current_information_state
-            )
+            current_information_state = self._run_stage(
+                EnumTransferStage.NOISE, self._do_noise, current_information_state, self.noiseProbability)
+            transfer_statistic.based_correct_bits, transfer_statistic.based_error_bits = self._run_stage(
+                EnumTransferStage.COMPARE, self._get_change_state, compare_information, current_information_state)
 
             if self._interleaver:
-                current_information_state = self._interleaver.reestablish(current_information_state)
+                current_information_state = self._run_stage(
+                    EnumTransferStage.REESTABLISH, self._interleaver.reestablish, current_information_state)
 
-            current_information_state = self._coder.decoding(current_information_state)
+            current_information_state = self._run_stage(
+                EnumTransferStage.DECODE, self._coder.decoding, current_information_state)
         except CodingException:
             log.info(
                 "During decoding package {0} founded unrepairable".format(
@@ -204,12 +285,17 @@ class Codec:
                                     "востановлению\n"
 
         # Calculate count decoded bits
-        current_step_success_bits = self._get_different_information(
-            current_information_state, normalization_information)
+        current_step_success_bits = self._run_stage(
+            EnumTransferStage.COMPARE,
+            self._get_different_information,
+            current_information_state,
+            normalization_information,
+        )
 
         transfer_statistic.quantity_successful_bits += current_step_success_bits
         transfer_statistic.quantity_error_bits += len(normalization_information) - current_step_success_bits
         transfer_statistic.current_information_state = current_information_state
+        transfer_statistic.likelihood_weight = self._likelihoodWeight
         return transfer_statistic
 
     def _do_noise(self, information: list, noise_probability: float) -> list:
@@ -232,12 +318,36 @@ class Codec:
                 length_of_block=self._noisePackageLength,
                 frequency_of_block=self._noisePackagePeriod
             )
+        elif self._noiseMode == EnumNoiseMode.IMPORTANCE:
+            noise_information, likelihood_ratio = chanel.Chanel().gen_biased_interference(
+                information=information,
+                straight=noise_probability,
+                biased_straight=self.get_biased_probability(len(information)),
+            )
+            # Errors in all blocks of package are independent, so likelihood ratio of package is product
+            self._likelihoodWeight *= likelihood_ratio
+            return noise_information
         else:
             raise ParametersParseException(
                 message=ParametersParseException.NOISE_MODE_UNDEFINED.message,
                 long_message=ParametersParseException.NOISE_MODE_UNDEFINED.long_message
             )
 
+    def get_biased_probability(self, length_information: int) -> float:
+        """
+        Method provide functionality for determination of noise probability which used for generation of errors in
+        importance noise mode. If it is not specified, probability is chosen so that package of length_information
+        bits contains _IMPORTANCE_EXPECTED_ERRORS errors in average
+        :param length_information: int
+        :return: float from 0.00 to 50.00
+        """
+        if self.noiseBiasedProbability is not None:
+            return self.noiseBiasedProbability
+        return min(
+            self._IMPORTANCE_MAX_PROBABILITY,
+            max(self.noiseProbability, 100 * self._IMPORTANCE_EXPECTED_ERRORS / length_information)
+        )
+
     # noinspection PyMethodMayBeStatic
     def _get_change_state(
             self,
@@ -0,0 +1,15 @@
+# coding=utf-8
+from dataclasses import dataclass
+from typing import Optional
+
+from src.coders.abstract_coder import AbstractCoder
+from src.coders.interleaver.Interleaver import Interleaver
+
+
+@dataclass
+class CodecStage:
+    """
+    Stage of concatenated codec: coder and interleaver of its codewords
+    """
+    coder: AbstractCoder
+    interleaver: Optional[Interleaver] = None
@@ -0,0 +1,181 @@
+# coding=utf-8
+from itertools import chain
+from typing import Optional, Union, List, Tuple
+
+import numpy as np
+
+from src.channel import chanel, codec
+from src.channel.codec import Codec
+from src.channel.codec_stage import CodecStage
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.channel.enum_package_transfer_result import EnumPackageTransferResult
+from src.channel.enum_transfer_stage import EnumTransferStage
+from src.coders.abstract_coder import AbstractCoder
+from src.logger import log
+
+
+class ConcatenatedCodec(codec.Codec):
+    """
+    Codec with several coders from outer to inner. Each stage processes all packages of transfer at once:
+    coder of stage encodes stream of all codewords of previous (outer) stage divided into its packages
+    """
+    _stages: List[CodecStage]
+    # Buffers for dividing of streams into packages, they are reused between transfers
+    _buffers: List[np.ndarray]
+
+    def __init__(
+            self,
+            stages: List[CodecStage],
+            noise_probability: Union[int, float],
+            count_cyclical: Optional[int],
+            duplex: Optional[bool],
+            noise_mode: EnumNoiseMode,
+            noise_package_length: int,
+            noise_package_period: int,
+            noise_biased_probability: Optional[float] = None,
+    ):
+        super().__init__(
+            coder=stages[-1].coder,
+            noise_probability=noise_probability,
+            count_cyclical=count_cyclical,
+            duplex=duplex,
+            interleaver=stages[-1].interleaver,
+            noise_mode=noise_mode,
+            noise_package_length=noise_package_length,
+            noise_package_period=noise_package_period,
+            noise_biased_probability=noise_biased_probability,
+        )
+        self._stages = stages
+        self._buffers = [np.zeros(0, dtype=np.int64) for _ in stages]
+
+    @property
+    def stages(self) -> List[CodecStage]:
+        return self._stages
+
+    def _divide_into_packages(
+            self,
+            number: int,
+            coder: AbstractCoder,
+            information: List[int]
+    ) -> Union[List[List[int]], np.ndarray]:
+        """
+        Method provide functionality for dividing information into packages of coder, the last package is
+        supplemented by zero bits. Packages are rows of view of buffer of stage
+        :param number: int Number of stage
+        :param coder: AbstractCoder
+        :param information: List[int]
+        :return: Union[List[List[int]], np.ndarray]
+        """
+        if not coder.isDivIntoPackage:
+            return [coder.try_normalization(information)]
+        length: int = max(1, -(-len(information) // coder.lengthInformation)) * coder.lengthInformation
+        if len(self._buffers[number]) < length:
+            self._buffers[number] = np.empty(length, dtype=np.int64)
+        return chanel.Chanel().get_blocks(information, coder.lengthInformation, self._buffers[number])
+
+    @staticmethod
+    def _compare(first: List[int], second: List[int]) -> int:
+        """
+        :param first: List[int]
+        :param second: List[int]
+        :return: int Quantity of equal bits on the same positions
+        """
+        length: int = min(len(first), len(second))
+        return int(np.count_nonzero(np.asarray(first[:length]) == np.asarray(second[:length])))
+
+    def _compare_packages(self, first: List[List[int]], second: List[List[int]]) -> Tuple[int, int]:
+        """
+        :param first: List[List[int]]
+        :param second: List[List[int]]
+        :return: Tuple[int, int] Quantity of equal and different bits of all packages
+        """
+        equal_bits: int = sum(
+            self._compare(first_package, second_package) for first_package, second_package in zip(first, second))
+        return equal_bits, sum(len(package) for package in first) - equal_bits
+
+    @staticmethod
+    def _split(information: List[int], packages: List[List[int]]) -> List[List[int]]:
+        """
+        Method provide functionality for dividing stream into packages with the same lengths as packages
+        :param information: List[int]
+        :param packages: List[List[int]]
+        :return: List[List[int]]
+        """
+        answer: List[List[int]] = []
+        position: int = 0
+        for package in packages:
+            answer.append(information[position:position + len(package)])
+            position += len(package)
+        return answer
+
+    def transfer_one_step(self, information: list) -> Codec.TransferStatistic:
+        transfer_statistic: Codec.TransferStatistic = Codec.TransferStatistic()
+        self._likelihoodWeight = 1.0
+
+        # Streams, packages and codewords of all stages from outer to inner
+        streams: List[List[int]] = []
+        stage_packages: List[Union[List[List[int]], np.ndarray]] = []
+        stage_codewords: List[List[List[int]]] = []
+        stream: List[int] = information
+        for number, stage in enumerate(self._stages):
+            packages: Union[List[List[int]], np.ndarray] = self._divide_into_packages(number, stage.coder, stream)
+            codewords: List[List[int]] = self._run_stage(
+                EnumTransferStage.ENCODE, stage.coder.encoding_batch, packages)
+            if stage.interleaver is not None:
+                codewords = self._run_stage(
+                    EnumTransferStage.SHUFFLE, self._apply, stage.interleaver.shuffle, codewords)
+
+            streams.append(stream)
+            stage_packages.append(packages)
+            stage_codewords.append(codewords)
+            stream = list(chain.from_iterable(codewords))
+
+        received: List[List[int]] = self._run_stage(
+            EnumTransferStage.NOISE,
+            self._apply,
+            lambda package: self._do_noise(package, self.noiseProbability),
+            stage_codewords[-1],
+        )
+        transfer_statistic.based_correct_bits, transfer_statistic.based_error_bits = self._run_stage(
+            EnumTransferStage.COMPARE, self._compare_packages, stage_codewords[-1], received)
+        transfer_statistic.quantity_changed_bits = transfer_statistic.based_error_bits
+
+        transfer_statistic.stage_error_bits = [0] * len(self._stages)
+        decoded: List[List[int]] = []
+        for number in range(len(self._stages) - 1, -1, -1):
+            stage: CodecStage = self._stages[number]
+            if stage.interleaver is not None:
+                received = self._run_stage(
+                    EnumTransferStage.REESTABLISH, self._apply, stage.interleaver.reestablish, received)
+            stage_decoded: List[Optional[List[int]]] = self._run_stage(
+                EnumTransferStage.DECODE, stage.coder.decoding_batch, received)
+
+            if number == 0:
+                decoded = [package if package is not None else [] for package in stage_decoded]
+                break
+
+            # Package which cannot be decoded is replaced by zero bits
+            stream = list(chain.from_iterable(
+                package if package is not None else [0] * len(source)
+                for package, source in zip(stage_decoded, stage_packages[number])
+            ))[:len(streams[number])]
+            transfer_statistic.stage_error_bits[number] = len(streams[number]) - self._run_stage(
+                EnumTransferStage.COMPARE, self._compare, streams[number], stream)
+            received = self._split(stream, stage_codewords[number - 1])
+
+        transfer_statistic.quantity_successful_bits, transfer_statistic.quantity_error_bits = self._run_stage(
+            EnumTransferStage.COMPARE, self._compare_packages, stage_packages[0], decoded)
+        transfer_statistic.stage_error_bits[0] = transfer_statistic.quantity_error_bits
+        transfer_statistic.quantity_inner_error_bits = transfer_statistic.stage_error_bits[-1]
+        transfer_statistic.current_information_state = list(chain.from_iterable(decoded))
+        transfer_statistic.likelihood_weight = self._likelihoodWeight
+
+        if transfer_statistic.quantity_error_bits != 0 \
+                or any(len(package) != len(source) for package, source in zip(decoded, stage_packages[0])):
+            log.info("Package {0} corrupted and impossible to repair it".format(information))
+            transfer_statistic.result_status = EnumPackageTransferResult.ERROR
+        elif transfer_statistic.based_error_bits != 0:
+            transfer_statistic.result_status = EnumPackageTransferResult.REPAIR
+        else:
+            transfer_statistic.result_status = EnumPackageTransferResult.SUCCESS
+        return transfer_statistic
@@ -6,4 +6,4 @@ class EnumBitTransferResult(Enum):
     SUCCESS = "success"
     REPAIR = "repair"
     ERROR = "error"
-    SHADOW = "error"
+    SHADOW = "shadow"
@@ -6,3 +6,5 @@ class EnumNoiseMode(Enum):
     SINGLE = "s"
     PACKAGE = "p"
     MIX = "m"
+    # Independent bit errors generated with biased probability and weighted by likelihood ratio
+    IMPORTANCE = "i"
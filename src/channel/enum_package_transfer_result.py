@@ -6,4 +6,4 @@ class EnumPackageTransferResult(Enum):
     SUCCESS = "success"
     REPAIR = "repair"
     ERROR = "error"
-    SHADOW = "error"
+    SHADOW = "shadow"
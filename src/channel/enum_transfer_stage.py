@@ -0,0 +1,11 @@
+# coding=utf-8
+from enum import Enum
+
+
+class EnumTransferStage(Enum):
+    ENCODE = "encode"
+    SHUFFLE = "shuffle"
+    NOISE = "noise"
+    REESTABLISH = "reestablish"
+    DECODE = "decode"
+    COMPARE = "compare"
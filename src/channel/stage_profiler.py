@@ -0,0 +1,33 @@
+# coding=utf-8
+import time
+from typing import Callable, Dict
+
+from src.channel.enum_transfer_stage import EnumTransferStage
+
+
+class StageProfiler:
+    """
+    Class provide functionality for collecting of durations and quantity of calls of transfer stages
+    """
+    durations: Dict[str, float]
+    calls: Dict[str, int]
+
+    def __init__(self):
+        self.durations = {stage.value: 0.0 for stage in EnumTransferStage}
+        self.calls = {stage.value: 0 for stage in EnumTransferStage}
+
+    def measure(self, stage: EnumTransferStage, function: Callable, *args):
+        """
+        Method provide functionality for calling of function with measuring of its duration
+        (duration is stored even if function raises exception, e.g. CodingException during decoding)
+        :param stage: EnumTransferStage
+        :param function: Callable
+        :param args: Arguments of function
+        :return: Result of function
+        """
+        start_time: float = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.durations[stage.value] += time.perf_counter() - start_time
+            self.calls[stage.value] += 1
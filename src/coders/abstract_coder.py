@@ -1,7 +1,9 @@
 # coding=utf-8
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
-from typing import List
+from typing import List, Optional, Union
+
+import numpy as np
 
 from src.endpoint.console.i_console_coder import IConsoleCoder
 from src.helper.error.exception.codding_exception import CodingException
@@ -60,6 +62,45 @@ class AbstractCoder(IConsoleCoder, IDataBaseSerialize, metaclass=__ObserverMeta)
         """
         raise NotImplementedError
 
+    def encoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[List[int]]:
+        """
+        Method for encoding of several packages, coders can override it for processing of all packages at once
+        Args:
+            packages: list of packages of bits for encoding or matrix with package in each row
+        Returns:
+            list: list of encoded packages
+        """
+        return [self.encoding(package) for package in self._get_package_list(packages)]
+
+    def decoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[Optional[List[int]]]:
+        """
+        Method for decoding of several packages, coders can override it for processing of all packages at once
+        Args:
+            packages: list of packages of bits for decoding or matrix with package in each row
+        Returns:
+            list: list of decoded packages, None for package which cannot be decoded
+        """
+        answer: List[Optional[List[int]]] = []
+        for package in self._get_package_list(packages):
+            try:
+                answer.append(self.decoding(package))
+            except CodingException:
+                answer.append(None)
+        return answer
+
+    @staticmethod
+    def _get_package_list(packages: Union[List[List[int]], np.ndarray]) -> List[List[int]]:
+        """
+        Method for conversion of matrix of packages to lists for coders which process packages one by one
+        Args:
+            packages: list of packages of bits or matrix with package in each row
+        Returns:
+            list: list of packages
+        """
+        if isinstance(packages, np.ndarray):
+            return packages.tolist()
+        return packages
+
     def get_redundancy(self) -> float:
         """
         Method for get redundancy _information
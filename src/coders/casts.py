@@ -1,8 +1,14 @@
 # coding=utf-8
-from typing import List
+import operator
+from typing import List, Sequence, Union
+
+import numpy as np
 
 from src.helper.error.exception.codding_exception import CodingException
 
+# Bit length from which conversion through numpy is faster than bit by bit processing
+_VECTORIZATION_THRESHOLD: int = 48
+
 
 def int_to_bit_list(num: int, size: int = None, rev: bool = False) -> List[int]:
     """
@@ -13,49 +19,84 @@ def int_to_bit_list(num: int, size: int = None, rev: bool = False) -> List[int]:
     :param rev: bool
     :return: list
     """
-    iterator: int = 1
-    answer: list = []
-    while iterator <= num:
-        if num | iterator == num:
-            answer.append(1)
-        else:
-            answer.append(0)
-        iterator <<= 1
-    if size is not None:
-        answer += [0] * (size - len(answer))
-    if not rev:
+    length: int = max(num.bit_length(), size or 0)
+    if length < _VECTORIZATION_THRESHOLD:
+        answer: List[int] = [(num >> iterator) & 1 for iterator in range(length - 1, -1, -1)]
+    else:
+        answer = int_to_bit_array(num, length).tolist()
+    if rev:
         answer.reverse()
     return answer
 
 
-def bit_list_to_int_list(num: list) -> List[int]:
-    it: int = 0
-    answer: list = []
+def int_to_bit_array(num: int, size: int = None) -> np.ndarray:
+    """
+    Convert numeric integer to array of bits from the most significant bit
+    :param num: int
+    :param size: int Minimal length of array, it's supplemented by leading zero bits
+    :return: np.ndarray Array of uint8
+    """
+    length: int = max(num.bit_length(), size or 0)
+    count_bytes: int = (length + 7) >> 3
+    return np.unpackbits(np.frombuffer(num.to_bytes(count_bytes, "big"), dtype=np.uint8))[(count_bytes << 3) - length:]
 
-    num.reverse()
-    for x in num:
-        if x != 0:
-            answer.append(it)
-        it += 1
-    return answer
 
+def int_array_to_bit_array(values: Union[Sequence[int], np.ndarray], size: int) -> np.ndarray:
+    """
+    Convert array of integers to matrix of bits, each row contains bits of integer from the most significant bit
+    :param values: Union[Sequence[int], np.ndarray] Integers less than 2 ** 64
+    :param size: int Quantity of bits of each integer
+    :return: np.ndarray Array of uint8 with shape (len(values), size)
+    """
+    shifts: np.ndarray = np.arange(size - 1, -1, -1, dtype=np.uint64)
+    return ((np.asarray(values, dtype=np.uint64)[:, np.newaxis] >> shifts) & 1).astype(np.uint8)
 
-def bit_list_to_int(num: List[int], rev: bool = False) -> int:
+
+def bit_list_to_int_list(num: Sequence[int]) -> List[int]:
+    """
+    Convert list of bits to list of positions of non zero bits counted from the least significant bit
+    Example: num = [1, 0, 1, 1]; return [0, 1, 3]
+    :param num: Sequence[int]
+    :return: List[int]
+    """
+    return [iterator for iterator, x in enumerate(reversed(num)) if x != 0]
+
+
+def bit_list_to_int(num: Sequence[int], rev: bool = False) -> int:
     """
-    Convert list of bits to integer
-    :param num: List[int]
+    Convert list of bits to integer. Input list isn't changed
+    :param num: Sequence[int]
     :param rev: bool Default value = False
     :return: int
     """
     if rev:
-        num.reverse()
+        num = num[::-1]
 
-    it = 1 << len(num) - 1
-    answer = 0
-    for power in num:
-        answer += it * power
-        it >>= 1
-    return answer
+    if len(num) < _VECTORIZATION_THRESHOLD:
+        answer: int = 0
+        for power in num:
+            answer = (answer << 1) | int(power)
+        return answer
+    return bit_array_to_int(np.asarray(num, dtype=np.uint8))
+
+
+def bit_array_to_int(bits: np.ndarray) -> int:
+    """
+    Convert array of bits from the most significant bit to integer
+    :param bits: np.ndarray
+    :return: int
+    """
+    return int.from_bytes(np.packbits(bits).tobytes(), "big") >> (-len(bits) % 8)
+
+
+def bit_array_to_int_array(bits: np.ndarray) -> np.ndarray:
+    """
+    Convert matrix of bits to array of integers, each row contains bits of integer from the most significant bit
+    :param bits: np.ndarray Matrix with less than 64 columns
+    :return: np.ndarray Array of int64
+    """
+    weights: np.ndarray = np.left_shift(1, np.arange(bits.shape[-1] - 1, -1, -1, dtype=np.int64))
+    return np.asarray(bits, dtype=np.int64) @ weights
 
 
 def cycle_shift_list(num: list, right: bool = True, count: int = 1):
@@ -72,23 +113,50 @@ def cycle_shift_list(num: list, right: bool = True, count: int = 1):
         return num[count:] + num[:count]
 
 
-def get_hamming_distance(first: List[int], second: List[int]) -> int:
+def get_hamming_distance(first: Sequence[int], second: Sequence[int]) -> int:
     """
     Determined Hamming distance
-    :param first: List[int]
-    :param second: List[int]
+    :param first: Sequence[int]
+    :param second: Sequence[int]
     :return: hamming's distance between first and second
     """
-    distance: int = 0
     if len(first) != len(second):
         raise CodingException(
             message="Cannot determine hamming's distance between list with different length"
         )
+    if isinstance(first, np.ndarray) or isinstance(second, np.ndarray):
+        return int(np.count_nonzero(np.not_equal(first, second)))
+    # For lists comparison without conversion to arrays is faster
+    return int(sum(map(operator.ne, first, second)))
+
+
+def get_hamming_distances(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Determined Hamming distances between rows of matrices, second matrix can be single row
+    :param first: np.ndarray
+    :param second: np.ndarray
+    :return: np.ndarray Distance for each row
+    """
+    return np.count_nonzero(np.not_equal(first, second), axis=-1)
 
-    for iterator in range(len(first)):
-        if first[iterator] != second[iterator]:
-            distance += 1
-    return distance
+
+def get_weight(num: int) -> int:
+    """
+    Determined quantity of non zero bits of integer
+    :param num: int
+    :return: int
+    """
+    return num.bit_count()
+
+
+def get_weights(values: np.ndarray) -> np.ndarray:
+    """
+    Determined quantity of non zero bits of each integer of array
+    :param values: np.ndarray Array of unsigned integers
+    :return: np.ndarray
+    """
+    values = np.ascontiguousarray(values)
+    return np.unpackbits(values.view(np.uint8).reshape(values.shape + (-1,)), axis=-1).sum(axis=-1)
 
 
 def str_list_to_list(value: str) -> list:
@@ -0,0 +1,52 @@
+# coding=utf-8
+import importlib
+from typing import Dict, List, Optional
+
+from src.statistics.db.enum_coders_type import EnumCodersType
+
+
+class CoderLoader:
+    """
+    Class provide functionality for loading of coder modules on demand,
+    so console mode imports only coders which are really used
+    """
+    __CODER_MODULES: Dict[EnumCodersType, str] = {
+        EnumCodersType.CONVOLUTION: "src.coders.convolutional.coder",
+        EnumCodersType.CYCLICAL: "src.coders.cyclical.coder",
+        EnumCodersType.FOUNTAIN: "src.coders.fountain.luby_transform",
+        EnumCodersType.HAMMING: "src.coders.linear.hamming",
+        EnumCodersType.LINEAR_BLOCK: "src.coders.linear.linear_block",
+        EnumCodersType.LDPC: "src.coders.ldpc.coder",
+        EnumCodersType.BCH: "src.coders.cyclical.bch",
+        EnumCodersType.REED_SOLOMON: "src.coders.cyclical.reed_solomon",
+        EnumCodersType.TURBO: "src.coders.convolutional.turbo",
+        EnumCodersType.POLAR: "src.coders.polar.coder",
+    }
+
+    @staticmethod
+    def get_coder_types() -> List[EnumCodersType]:
+        """
+        Method provide functionality for getting types of coders which can be loaded
+        :return: List[EnumCodersType]
+        """
+        return list(CoderLoader.__CODER_MODULES.keys())
+
+    @staticmethod
+    def get_coder_class(coder_type: EnumCodersType) -> type:
+        """
+        Method provide functionality for importing module of coder and getting class of it
+        :param coder_type: EnumCodersType
+        :return: type Class of coder
+        """
+        return importlib.import_module(CoderLoader.__CODER_MODULES[coder_type]).Coder
+
+    @staticmethod
+    def get_coder_classes(coder_types: Optional[List[EnumCodersType]] = None) -> List[type]:
+        """
+        Method provide functionality for getting classes of coders with specified types
+        :param coder_types: Optional[List[EnumCodersType]] All coders if None
+        :return: List[type]
+        """
+        if coder_types is None:
+            coder_types = CoderLoader.get_coder_types()
+        return [CoderLoader.get_coder_class(coder_type) for coder_type in coder_types]
@@ -1,2 +1,3 @@
 # coding=utf-8
 import src.coders.convolutional.coder
+import src.coders.convolutional.turbo
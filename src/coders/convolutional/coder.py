@@ -4,12 +4,18 @@ from sqlite3 import Connection
 from typing import Optional, List, Tuple, Dict
 from uuid import UUID
 
+import numpy as np
+
 from src.coders import abstract_coder
-from src.coders.casts import bit_list_to_int, get_hamming_distance, int_to_bit_list, cycle_shift_list
+from src.coders.convolutional import viterbi
+from src.coders.convolutional.enum_termination_mode import EnumTerminationMode
+from src.coders.convolutional.puncturing import Puncturing
+from src.coders.convolutional.stream import StreamDecoder, StreamEncoder
+from src.coders.convolutional.trellis import Trellis, get_trellis
+from src.config.config_processor import ConfigProcessor
 from src.endpoint.console.abstract_group_parser import AbstractGroupParser
 from src.logger import log
 from src.statistics.db.enum_coders_type import EnumCodersType
-from src.statistics.db.table import convolution_table
 
 
 class Coder(abstract_coder.AbstractCoder):
@@ -18,15 +24,18 @@ class Coder(abstract_coder.AbstractCoder):
     """
     _name = "Convolution"
     _typeOfCoder = EnumCodersType.CONVOLUTION
-    __MAX_STEPS: int = 9999999999999
 
     _countPolynomials: int = 0
     _listPolynomials: List[int] = []
     _countInput: int = 0
     _countOutput: int = 0
     _countRegisters: int = 0
-    _register: int = 0
+    _trellis: Trellis
     _graph: List[List[Tuple[int, List[int]]]] = []
+    _puncturing: Optional[Puncturing] = None
+    _terminationMode: EnumTerminationMode = EnumTerminationMode.TRUNCATED
+    # Depth of survivor paths for tail-biting and stream decoding
+    _tracebackDepth: int = 0
     isDivIntoPackage: bool = False
 
     def __init__(
@@ -34,7 +43,10 @@ class Coder(abstract_coder.AbstractCoder):
             list_polynomials: List[int],
             count_input: int,
             count_output: int,
-            count_register: int
+            count_register: int,
+            puncturing_matrix: Optional[List[List[int]]] = None,
+            termination_mode: EnumTerminationMode = EnumTerminationMode.TRUNCATED,
+            traceback_depth: Optional[int] = None
     ):
         log.debug("Create convolution _coder")
         self._countInput = count_input
@@ -47,14 +59,67 @@ class Coder(abstract_coder.AbstractCoder):
         self.lengthInformation = self._countInput
         self.lengthAdditional = self.lengthTotal - self.lengthInformation
 
-        self._graph = self._get_graph()
+        # Trellis is shared between coders with the same configuration
+        self._trellis = get_trellis(
+            tuple(list_polynomials),
+            count_register,
+            ConfigProcessor().config.cache_setting.trellis_directory,
+        )
+        self._graph = self._trellis.graph
+
+        if puncturing_matrix is not None:
+            self._puncturing = Puncturing(puncturing_matrix, self._countPolynomials)
+
+        self._terminationMode = termination_mode
+        self._tracebackDepth = traceback_depth
+        if traceback_depth is None:
+            # Punctured code requires longer paths for the same reliability of decision
+            self._tracebackDepth = 5 * (count_register + 1) * (1 if self._puncturing is None else 2)
+
+    @staticmethod
+    def get_puncturing_matrix(puncturing_rate: Optional[str]) -> Optional[List[List[int]]]:
+        """
+        :param puncturing_rate: Optional[str] Rate of standard puncturing pattern (e.g. "3/4"), None without puncturing
+        :return: Optional[List[List[int]]]
+        """
+        if puncturing_rate is None:
+            return None
+        return Puncturing.PATTERNS[puncturing_rate]
+
+    @staticmethod
+    def get_termination_mode(termination_mode: Optional[str]) -> EnumTerminationMode:
+        """
+        :param termination_mode: Optional[str] Value of termination mode, None for truncated package
+        :return: EnumTerminationMode
+        """
+        if termination_mode is None:
+            return EnumTerminationMode.TRUNCATED
+        return EnumTerminationMode(termination_mode)
+
+    def __getstate__(self) -> dict:
+        # Trellis isn't stored with coder (e.g. in results), it's restored from shared cache
+        state: dict = self.__dict__.copy()
+        state.pop("_trellis", None)
+        state.pop("_graph", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._trellis = get_trellis(
+            tuple(self._listPolynomials),
+            self._countRegisters,
+            ConfigProcessor().config.cache_setting.trellis_directory,
+        )
+        self._graph = self._trellis.graph
 
     def get_speed(self) -> float:
         """
         Method contain functionality for calculation speed of this _coder configuration
         :return:
         """
-        return 1 / self._countRegisters
+        if self._puncturing is not None:
+            return self._countInput * self._puncturing.period / self._puncturing.count_transmitted
+        return self._countInput / self._countOutput
 
     def get_redundancy(self) -> float:
         """
@@ -63,119 +128,90 @@ class Coder(abstract_coder.AbstractCoder):
         """
         return self._countOutput
 
-    def _do_step(self, information_bit: int) -> list:
+    def _get_tail_biting_state(self, information: np.ndarray) -> int:
         """
-        Method contain functionality for generation _graph of
-        :param information_bit:
-        :return:
+        State of tail-biting coder is formed by last bits of package (package is repeated if it's short)
+        :param information: np.ndarray
+        :return: int
         """
-        log.debug("Step coding convolution - {0}".format(information_bit))
-        self._register <<= 1
-
-        # зануление старшего бита
-        self._register &= (1 << (self._countRegisters + 1)) - 1
-        self._register += information_bit
-
-        answer = []
-        power = 0
-        for count in range(self._countPolynomials):
-            added_bit = 0
-            for x in int_to_bit_list(self._listPolynomials[count] & self._register):
-                added_bit ^= x
-            answer.append(added_bit % 2)
-            power += 1
-        return answer
-
-    def _get_graph(self) -> List[List[Tuple[int, List[int]]]]:
-        """
-        Формирует список представляющий граф переходов, где каждая вершина
-        [
-            [номер вершины в которую переходим, [биты которые соответвуют переходу]],
-            ...
-        ]
-        """
-        answer: list = []
-        for x in range(2 ** self._countRegisters):
-            vertex: list = []
-            self._register = x
-            list_integers: list = int_to_bit_list(x, self._countRegisters)
-            list_integers = cycle_shift_list(list_integers)
-            list_integers[0] = 0
-            vertex.append([bit_list_to_int(list_integers), self._do_step(0)])
-            self._register = x
-            list_integers[0] = 1
-            vertex.append([bit_list_to_int(list_integers), self._do_step(1)])
-            answer.append(vertex)
-
-        self._register = 0
-        return answer
+        if len(information) == 0:
+            return 0
+        last_bits: np.ndarray = information[np.arange(-self._countRegisters, 0) % len(information)]
+        return int((last_bits << np.arange(self._countRegisters, dtype=np.int64)).sum())
 
     def encoding(self, information: list) -> list:
         """
-        TODO
-        :param information:
-        :return:
+        Encoding of convolution coder, output of all steps is calculated at once by trellis
+        :param information: list
+        :return: list
         """
         log.info("Encode package {0} by convolution coder".format(information))
-        answer: list = []
+        bits: np.ndarray = np.asarray(information, dtype=np.int64)
+        start_state: int = 0
+        if self._terminationMode == EnumTerminationMode.ZERO:
+            bits = np.concatenate((bits, np.zeros(self._countRegisters, dtype=np.int64)))
+        elif self._terminationMode == EnumTerminationMode.TAIL_BITING:
+            start_state = self._get_tail_biting_state(bits)
+
+        # Shape (steps, quantity of polynomials)
+        answer, _ = self._trellis.encode(bits, start_state)
+        if self._puncturing is not None:
+            return self._puncturing.puncture(answer).tolist()
+        return answer.ravel().tolist()
 
-        # текущая вершина
-        current_vertex: int = 0
-        for nowBit in information:
-            answer.append(self._graph[current_vertex][nowBit][1])
-            current_vertex = self._graph[current_vertex][nowBit][0]
+    def decoding(self, information: List[int]) -> List[int]:
+        """
+        Decoding of convolution coder by Viterbi algorithm.
+        Punctured bits are erasures and don't change metric of path.
+        On equal metrics path from lower previous state and the lowest final state are chosen
+        :param information: List[int]
+        :return: List[int]
+        """
+        log.info("Decode package {0} by convolution decoder".format(information))
+        if self._puncturing is not None:
+            bits, mask = self._puncturing.depuncture(information)
+        else:
+            bits = np.asarray(information, dtype=np.uint8).reshape(-1, self._countPolynomials)
+            mask = np.ones(bits.shape, dtype=bool)
 
-        # Transform [[][]...] to []
-        answer = [y for x in answer for y in x]
-        return answer
+        if self._terminationMode == EnumTerminationMode.TAIL_BITING:
+            return self._tail_biting_viterbi(bits, mask)
 
-    def __divide_into_steps(self, information: List[int]) -> List[List[int]]:
-        info_divided_into_steps: list = []
-        for iterator in range(0, len(information), self._countOutput):
-            count: int = 0
-            temp_list: list = []
-            while count < self._countOutput:
-                temp_list.append(information[iterator + count])
-                count += 1
-            info_divided_into_steps.append(temp_list)
+        metrics, decisions = viterbi.forward(self._trellis, viterbi.get_start_metrics(self._trellis), bits, mask)
+        if self._terminationMode == EnumTerminationMode.ZERO:
+            answer, _ = viterbi.traceback(self._trellis, decisions, 0)
+            return answer[:max(len(answer) - self._countRegisters, 0)]
 
-        return info_divided_into_steps
+        answer, _ = viterbi.traceback(self._trellis, decisions, int(np.argmin(metrics)))
+        return answer
 
-    def decoding(self, information: List[int]) -> List[int]:
+    def _tail_biting_viterbi(self, bits: np.ndarray, mask: np.ndarray) -> List[int]:
         """
-        Decoding of convolution coder
-        :param information: List[int]
+        Viterbi algorithm for tail-biting package. Package is extended by traceback depth cyclically on both sides
+        and decoded from unknown state, so path in the middle doesn't depend on start and end of extended package
+        :param bits: np.ndarray
+        :param mask: np.ndarray
         :return: List[int]
         """
-        log.info("Decode package {0} by convolution decoder".format(information))
-        info_divided_into_steps = self.__divide_into_steps(information)
-        # Fill first step value
-        last_step = [[0, []]] + [[self.__MAX_STEPS, []] for x in range(2 ** self._countRegisters - 1)]
-
-        for iterator in info_divided_into_steps:
-            now_step = [[self.__MAX_STEPS, []] for x in range(2 ** self._countRegisters)]
-            number: int = 0
-            for info_about_vertex in last_step:
-                vertex_step: int = self._graph[number][0][0]  # вершина перехода
-                distance: int = get_hamming_distance(iterator, self._graph[number][0][1])
-                if now_step[vertex_step][0] > last_step[number][0] + distance:
-                    now_step[vertex_step] = [info_about_vertex[0] + distance, info_about_vertex[1] + [0]]
-
-                vertex_step: int = self._graph[number][1][0]  # вершина перехода
-                distance: int = get_hamming_distance(iterator, self._graph[number][1][1])
-                if now_step[vertex_step][0] > last_step[number][0] + distance:
-                    now_step[vertex_step] = [info_about_vertex[0] + distance, info_about_vertex[1] + [1]]
-
-                number += 1
-            last_step = now_step
-
-        min_answer: list = []
-        min_cost: int = self.__MAX_STEPS
-        for iterator in last_step:
-            if min_cost > iterator[0]:
-                min_cost = iterator[0]
-                min_answer = iterator[1]
-        return min_answer
+        if len(bits) == 0:
+            return []
+        positions: np.ndarray = np.arange(-self._tracebackDepth, len(bits) + self._tracebackDepth) % len(bits)
+        metrics, decisions = viterbi.forward(
+            self._trellis, viterbi.get_start_metrics(self._trellis, -1), bits[positions], mask[positions])
+        answer, _ = viterbi.traceback(self._trellis, decisions, int(np.argmin(metrics)))
+        return answer[self._tracebackDepth:self._tracebackDepth + len(bits)]
+
+    def get_stream_encoder(self) -> StreamEncoder:
+        """
+        :return: StreamEncoder Encoder of continuous stream with the same configuration
+        """
+        return StreamEncoder(self._trellis, self._puncturing, self._terminationMode)
+
+    def get_stream_decoder(self) -> StreamDecoder:
+        """
+        :return: StreamDecoder Decoder of continuous stream with the same configuration
+        """
+        return StreamDecoder(self._trellis, self._tracebackDepth, self._puncturing, self._terminationMode)
 
     def try_normalization(self, bit_list: List[int]) -> List[int]:
         """
@@ -197,22 +233,31 @@ class Coder(abstract_coder.AbstractCoder):
             'count of outputs': self._countOutput,
             'count of registers': self._countRegisters,
             '_graph': self._graph,
+            'puncturing matrix': self._puncturing.matrix if self._puncturing is not None else None,
+            'termination mode': self._terminationMode.value,
+            'traceback depth': self._tracebackDepth,
             'speed': self.get_speed()
         }
 
     def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import convolution_table
         connection.execute(convolution_table.insert().values(
             guid=coder_guid,
             count_polynomial=self._countPolynomials,
             count_input_bits=self._countInput,
             count_output_bits=self._countOutput,
             count_registers=self._countRegisters,
+            puncturing_matrix=self._puncturing.matrix if self._puncturing is not None else None,
+            termination_mode=self._terminationMode.value,
         ))
 
     class ConvolutionCoderParser(AbstractGroupParser):
         _prefix: str = ""
         __POLYNOMIAL_LIST: str = "convolution_polynomial_list"
         __QUANTITY_MEMORY_REGISTER: str = "convolution_quantity_memory_register"
+        __PUNCTURING_RATE: str = "convolution_puncturing_rate"
+        __TERMINATION_MODE: str = "convolution_termination_mode"
+        __TRACEBACK_DEPTH: str = "convolution_traceback_depth"
 
         # noinspection SpellCheckingInspection
         def __init__(
@@ -239,6 +284,30 @@ class Coder(abstract_coder.AbstractCoder):
                 help="""Quantity of memory registers of counvolution _coder"""
             )
 
+            self._argumentParser.add_argument(
+                "-{0}cnvpr".format(prefix), "--{0}{1}".format(prefix, self.__PUNCTURING_RATE),
+                type=str,
+                choices=list(Puncturing.PATTERNS),
+                default=None,
+                help="""Rate of punctured convolution _coder with two polynomials (without puncturing by default)"""
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}cnvtm".format(prefix), "--{0}{1}".format(prefix, self.__TERMINATION_MODE),
+                type=str,
+                choices=[mode.value for mode in EnumTerminationMode],
+                default=EnumTerminationMode.TRUNCATED.value,
+                help="""Termination of package (t - truncated, z - zero-terminated, b - tail-biting)"""
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}cnvtd".format(prefix), "--{0}{1}".format(prefix, self.__TRACEBACK_DEPTH),
+                type=int,
+                default=None,
+                help="""Traceback depth of tail-biting decoding (5 * constraint length by default,
+                twice more for punctured _coder)"""
+            )
+
             # We should parse arguments only for unique _coder
             if self._argumentGroup is None:
                 self.arguments = vars(self._argumentParser.parse_args())
@@ -251,6 +320,18 @@ class Coder(abstract_coder.AbstractCoder):
         def convolution_memory_register(self) -> int:
             return self.arguments["{0}{1}".format(self._prefix, self.__QUANTITY_MEMORY_REGISTER)]
 
+        @property
+        def convolution_puncturing_rate(self) -> Optional[str]:
+            return self.arguments["{0}{1}".format(self._prefix, self.__PUNCTURING_RATE)]
+
+        @property
+        def convolution_termination_mode(self) -> str:
+            return self.arguments["{0}{1}".format(self._prefix, self.__TERMINATION_MODE)]
+
+        @property
+        def convolution_traceback_depth(self) -> Optional[int]:
+            return self.arguments["{0}{1}".format(self._prefix, self.__TRACEBACK_DEPTH)]
+
     @staticmethod
     def get_coder_parameters(
             argument_parser: Optional[argparse.ArgumentParser] = None,
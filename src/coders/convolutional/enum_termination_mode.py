@@ -0,0 +1,11 @@
+# coding=utf-8
+from enum import Enum
+
+
+class EnumTerminationMode(Enum):
+    # Package ends in arbitrary state
+    TRUNCATED = "t"
+    # Registers are flushed by zero bits after package
+    ZERO = "z"
+    # Coder starts in the same state as it ends
+    TAIL_BITING = "b"
@@ -0,0 +1,89 @@
+# coding=utf-8
+import numpy as np
+
+from src.coders.convolutional.trellis import Trellis
+
+# Metric of unreachable state, it isn't infinity to avoid nan in subtraction
+MIN_METRIC: float = -1e9
+
+
+def get_branch_metrics(
+        trellis: Trellis,
+        systematic: np.ndarray,
+        parities: np.ndarray,
+        a_priori: np.ndarray
+) -> np.ndarray:
+    """
+    Function provide functionality for calculation of branch metrics of all steps of batch at once.
+    Log-likelihood ratios are log(P(0) / P(1)), metric of branch is half of correlation of its bits with them
+    :param trellis: Trellis Trellis of recursive systematic coder
+    :param systematic: np.ndarray Channel values of systematic bits with shape (words, steps)
+    :param parities: np.ndarray Channel values of parity bits with shape (words, steps, quantity of polynomials)
+    :param a_priori: np.ndarray A priori values of input bits with shape (words, steps)
+    :return: np.ndarray Metrics with shape (steps, 2, states, words) for input bit and state before step,
+        words are the last axis, so operations over states of one step work with contiguous rows
+    """
+    output_signs: np.ndarray = 1.0 - 2.0 * trellis.outputs
+    metrics: np.ndarray = np.einsum("wkp,sup->kusw", parities, output_signs)
+    input_signs: np.ndarray = np.array([1.0, -1.0])[:, np.newaxis, np.newaxis]
+    metrics += (systematic + a_priori).T[:, np.newaxis, np.newaxis, :] * input_signs
+    metrics *= 0.5
+    return metrics
+
+
+def decode(
+        trellis: Trellis,
+        systematic: np.ndarray,
+        parities: np.ndarray,
+        a_priori: np.ndarray,
+        flg_terminated: bool = True
+) -> np.ndarray:
+    """
+    Function provide functionality for max-log-MAP (BCJR) decoding of batch of words. Forward and backward passes
+    are made step by step over all states and words at once, metrics are normalized on each step.
+    Coder starts in zero state
+    :param trellis: Trellis Trellis of recursive systematic coder
+    :param systematic: np.ndarray Channel values of systematic bits with shape (words, steps)
+    :param parities: np.ndarray Channel values of parity bits with shape (words, steps, quantity of polynomials)
+    :param a_priori: np.ndarray A priori values of input bits with shape (words, steps)
+    :param flg_terminated: bool Coder ends in zero state
+    :return: np.ndarray A posteriori values of input bits with shape (words, steps)
+    """
+    count_words, count_steps = systematic.shape
+    branch_metrics: np.ndarray = get_branch_metrics(trellis, systematic, parities, a_priori)
+    previous_states: np.ndarray = trellis.previous_states
+    next_states: np.ndarray = trellis.nextStates
+    # Metrics of branches which come into each state from its lower and upper previous state
+    incoming_metrics: np.ndarray = np.stack([
+        branch_metrics[:, trellis.previous_inputs[:, number], previous_states[:, number]] for number in (0, 1)
+    ], axis=1)
+
+    forward_metrics: np.ndarray = np.empty((count_steps + 1, trellis.count_states, count_words))
+    forward_metrics[0] = MIN_METRIC
+    forward_metrics[0, 0] = 0.0
+    for step in range(count_steps):
+        metrics: np.ndarray = np.maximum(
+            forward_metrics[step][previous_states[:, 0]] + incoming_metrics[step, 0],
+            forward_metrics[step][previous_states[:, 1]] + incoming_metrics[step, 1],
+        )
+        forward_metrics[step + 1] = metrics - metrics.max(axis=0)
+
+    backward_metrics: np.ndarray = np.empty((count_steps + 1, trellis.count_states, count_words))
+    if flg_terminated:
+        backward_metrics[count_steps] = MIN_METRIC
+        backward_metrics[count_steps, 0] = 0.0
+    else:
+        backward_metrics[count_steps] = 0.0
+    for step in range(count_steps - 1, -1, -1):
+        metrics: np.ndarray = np.maximum(
+            backward_metrics[step + 1][next_states[:, 0]] + branch_metrics[step, 0],
+            backward_metrics[step + 1][next_states[:, 1]] + branch_metrics[step, 1],
+        )
+        backward_metrics[step] = metrics - metrics.max(axis=0)
+
+    # Best metrics of paths with each input bit with shape (steps, words)
+    best_metrics = [
+        (forward_metrics[:-1] + branch_metrics[:, bit] + backward_metrics[1:][:, next_states[:, bit]]).max(axis=1)
+        for bit in (0, 1)
+    ]
+    return (best_metrics[0] - best_metrics[1]).T
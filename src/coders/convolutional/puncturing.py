@@ -0,0 +1,115 @@
+# coding=utf-8
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.helper.error.exception.codding_exception import CodingException
+
+
+class Puncturing:
+    """
+    Puncturing of convolutional code output.
+    Matrix has row for each polynomial and column for each step of period,
+    bit of polynomial on step is transmitted if matrix[polynomial][step % period] equals 1
+    """
+    # Standard patterns for mother code with rate 1/2. Patterns are designed for polynomials with the highest bit
+    # for current input, but coder uses the lowest one, so standard code (133, 171) is specified as [79, 109]:
+    # the first row of pattern is applied to 171. With other order of polynomials ([109, 79] or [91, 121])
+    # code with rate 3/4 is catastrophic: periodic input 001... is encoded into word of constant weight
+    PATTERNS: Dict[str, List[List[int]]] = {
+        "2/3": [[1, 1], [1, 0]],
+        "3/4": [[1, 1, 0], [1, 0, 1]],
+        "5/6": [[1, 1, 0, 1, 0], [1, 0, 1, 0, 1]],
+        "7/8": [[1, 1, 1, 1, 0, 1, 0], [1, 0, 0, 0, 1, 0, 1]],
+    }
+
+    # Shape (period, quantity of polynomials)
+    _mask: np.ndarray
+    _period: int
+    # Quantity of transmitted bits for each step of period
+    _countTransmitted: List[int]
+
+    def __init__(self, matrix: List[List[int]], count_polynomials: int):
+        mask: np.ndarray = np.array(matrix, dtype=bool)
+        if mask.ndim != 2 or mask.shape[0] != count_polynomials or not mask.any(axis=0).all():
+            raise CodingException(
+                message=CodingException.PUNCTURING_MATRIX_INCORRECT.message,
+                long_message=CodingException.PUNCTURING_MATRIX_INCORRECT.long_message.format(
+                    count_polynomials, matrix)
+            )
+        self._mask = mask.T.copy()
+        self._period = self._mask.shape[0]
+        self._countTransmitted = self._mask.sum(axis=1).tolist()
+
+    @property
+    def matrix(self) -> List[List[int]]:
+        return self._mask.T.astype(int).tolist()
+
+    @property
+    def period(self) -> int:
+        return self._period
+
+    @property
+    def count_transmitted(self) -> int:
+        """
+        :return: Quantity of transmitted bits for period
+        """
+        return sum(self._countTransmitted)
+
+    def _get_mask(self, count_steps: int, phase: int = 0) -> np.ndarray:
+        return np.resize(np.roll(self._mask, -phase, axis=0), (count_steps, self._mask.shape[1]))
+
+    def puncture(self, information: np.ndarray, phase: int = 0) -> np.ndarray:
+        """
+        Method provide functionality for deleting of not transmitted bits
+        :param information: np.ndarray Output of coder with shape (steps, quantity of polynomials)
+        :param phase: int Step of period for first step of information
+        :return: np.ndarray Transmitted bits
+        """
+        return information[self._get_mask(len(information), phase)]
+
+    def get_count_available_steps(self, length: int, phase: int = 0) -> Tuple[int, int]:
+        """
+        Method provide functionality for calculation quantity of whole coder steps in punctured bits
+        :param length: int
+        :param phase: int Step of period for first step
+        :return: Tuple[int, int] Quantity of steps and quantity of their bits
+        """
+        count_steps: int = (length // self.count_transmitted) * self._period
+        count_bits: int = (length // self.count_transmitted) * self.count_transmitted
+        for step in range(self._period):
+            count_transmitted: int = self._countTransmitted[(phase + step) % self._period]
+            if count_bits + count_transmitted > length:
+                break
+            count_bits += count_transmitted
+            count_steps += 1
+        return count_steps, count_bits
+
+    def get_count_steps(self, length: int, phase: int = 0) -> int:
+        """
+        Method provide functionality for calculation quantity of coder steps by length of punctured package
+        :param length: int
+        :param phase: int Step of period for first step
+        :return: int
+        """
+        count_steps, count_bits = self.get_count_available_steps(length, phase)
+        if count_bits != length:
+            raise CodingException(
+                message=CodingException.LENGTH_OF_PUNCTURED_PACKAGE_INCORRECT.message,
+                long_message=CodingException.LENGTH_OF_PUNCTURED_PACKAGE_INCORRECT.long_message.format(
+                    length, self.matrix)
+            )
+        return count_steps
+
+    def depuncture(self, information: List[int], phase: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method provide functionality for restoring positions of transmitted bits, deleted bits are erasures
+        :param information: List[int] Transmitted bits
+        :param phase: int Step of period for first step
+        :return: Tuple[np.ndarray, np.ndarray] Bits and mask of not erased bits with shape
+            (steps, quantity of polynomials)
+        """
+        mask: np.ndarray = self._get_mask(self.get_count_steps(len(information), phase), phase)
+        bits: np.ndarray = np.zeros(mask.shape, dtype=np.uint8)
+        bits[mask] = information
+        return bits, mask
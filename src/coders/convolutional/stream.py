@@ -0,0 +1,154 @@
+# coding=utf-8
+from typing import List, Optional
+
+import numpy as np
+
+from src.coders.convolutional import viterbi
+from src.coders.convolutional.enum_termination_mode import EnumTerminationMode
+from src.coders.convolutional.puncturing import Puncturing
+from src.coders.convolutional.trellis import Trellis
+from src.helper.error.exception.codding_exception import CodingException
+
+
+def _check_termination_mode(termination_mode: EnumTerminationMode) -> None:
+    if termination_mode == EnumTerminationMode.TAIL_BITING:
+        raise CodingException(
+            message=CodingException.TAIL_BITING_STREAM.message,
+            long_message=CodingException.TAIL_BITING_STREAM.long_message,
+        )
+
+
+class StreamEncoder:
+    """
+    Encoder of continuous stream, which is provided by parts of arbitrary length
+    """
+    _trellis: Trellis
+    _puncturing: Optional[Puncturing]
+    _terminationMode: EnumTerminationMode
+    _state: int = 0
+    # Step of puncturing period for next bit
+    _phase: int = 0
+
+    def __init__(
+            self,
+            trellis: Trellis,
+            puncturing: Optional[Puncturing] = None,
+            termination_mode: EnumTerminationMode = EnumTerminationMode.TRUNCATED
+    ):
+        _check_termination_mode(termination_mode)
+        self._trellis = trellis
+        self._puncturing = puncturing
+        self._terminationMode = termination_mode
+
+    def push(self, information: List[int]) -> List[int]:
+        """
+        Method provide functionality for encoding of next part of stream
+        :param information: List[int]
+        :return: List[int]
+        """
+        answer, self._state = self._trellis.encode(np.asarray(information, dtype=np.int64), self._state)
+        if self._puncturing is None:
+            return answer.ravel().tolist()
+
+        answer = self._puncturing.puncture(answer, self._phase)
+        self._phase = (self._phase + len(information)) % self._puncturing.period
+        return answer.tolist()
+
+    def flush(self) -> List[int]:
+        """
+        Method provide functionality for ending of stream, zero-terminated stream is ended by flushing of registers
+        :return: List[int]
+        """
+        answer: List[int] = []
+        if self._terminationMode == EnumTerminationMode.ZERO:
+            answer = self.push([0] * self._trellis.countRegisters)
+        self._state = 0
+        self._phase = 0
+        return answer
+
+
+class StreamDecoder:
+    """
+    Viterbi decoder of continuous stream with fixed traceback depth.
+    Decoded bits are returned when survivor paths are longer than two depths, so latency and memory are bounded
+    """
+    _trellis: Trellis
+    _puncturing: Optional[Puncturing]
+    _terminationMode: EnumTerminationMode
+    _tracebackDepth: int
+    _metrics: np.ndarray
+    # Decisions of steps which aren't returned yet
+    _decisions: np.ndarray
+    # Received bits which don't form whole step
+    _pending: List[int]
+    _phase: int = 0
+
+    def __init__(
+            self,
+            trellis: Trellis,
+            traceback_depth: int,
+            puncturing: Optional[Puncturing] = None,
+            termination_mode: EnumTerminationMode = EnumTerminationMode.TRUNCATED
+    ):
+        _check_termination_mode(termination_mode)
+        self._trellis = trellis
+        # Tail of zero-terminated stream should be in not returned steps
+        self._tracebackDepth = max(traceback_depth, trellis.countRegisters)
+        self._puncturing = puncturing
+        self._terminationMode = termination_mode
+        self._reset()
+
+    def _reset(self) -> None:
+        self._metrics = viterbi.get_start_metrics(self._trellis)
+        self._decisions = np.empty((0, self._trellis.count_states), dtype=bool)
+        self._pending = []
+        self._phase = 0
+
+    def push(self, information: List[int]) -> List[int]:
+        """
+        Method provide functionality for decoding of next part of stream
+        :param information: List[int]
+        :return: List[int] Decoded bits which are already determined
+        """
+        self._pending.extend(information)
+        if self._puncturing is not None:
+            count_steps, count_bits = self._puncturing.get_count_available_steps(len(self._pending), self._phase)
+            bits, mask = self._puncturing.depuncture(self._pending[:count_bits], self._phase)
+            self._phase = (self._phase + count_steps) % self._puncturing.period
+        else:
+            count_polynomials: int = len(self._trellis.polynomials)
+            count_bits = len(self._pending) - len(self._pending) % count_polynomials
+            bits = np.asarray(self._pending[:count_bits], dtype=np.uint8).reshape(-1, count_polynomials)
+            mask = np.ones(bits.shape, dtype=bool)
+        del self._pending[:count_bits]
+
+        metrics, decisions = viterbi.forward(self._trellis, self._metrics, bits, mask)
+        # Metrics are normalized, so they don't grow on long stream
+        self._metrics = np.where(metrics >= viterbi.MAX_METRIC, viterbi.MAX_METRIC, metrics - metrics.min())
+        self._decisions = np.concatenate((self._decisions, decisions))
+
+        if len(self._decisions) < 2 * self._tracebackDepth:
+            return []
+        count_decided: int = len(self._decisions) - self._tracebackDepth
+        answer, _ = viterbi.traceback(self._trellis, self._decisions, int(np.argmin(self._metrics)))
+        self._decisions = self._decisions[count_decided:]
+        return answer[:count_decided]
+
+    def flush(self) -> List[int]:
+        """
+        Method provide functionality for ending of stream and getting of the rest decoded bits
+        :return: List[int]
+        """
+        if len(self._pending) != 0:
+            raise CodingException(
+                message=CodingException.STREAM_ENDED_INSIDE_STEP.message,
+                long_message=CodingException.STREAM_ENDED_INSIDE_STEP.long_message.format(len(self._pending))
+            )
+
+        if self._terminationMode == EnumTerminationMode.ZERO:
+            answer, _ = viterbi.traceback(self._trellis, self._decisions, 0)
+            answer = answer[:max(len(answer) - self._trellis.countRegisters, 0)]
+        else:
+            answer, _ = viterbi.traceback(self._trellis, self._decisions, int(np.argmin(self._metrics)))
+        self._reset()
+        return answer
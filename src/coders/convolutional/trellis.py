@@ -0,0 +1,242 @@
+# coding=utf-8
+import os
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.coders.casts import get_weights
+from src.logger import log
+
+
+class Trellis:
+    """
+    Precomputed transitions of convolutional coder.
+    Transition from state with input bit:
+        next state = (bit << (registers - 1)) | (state >> 1)
+        output[i] = parity(polynomial[i] & ((state << 1) | bit))
+    Instances are shared between coders with the same polynomials and registers, so they shouldn't be changed.
+    Trellis of recursive systematic coder has the same layout of states, but bit shifted into state isn't input bit
+    """
+    polynomials: Tuple[int, ...]
+    countRegisters: int
+    # Feedback polynomial of recursive coder, None for not recursive one
+    feedback: Optional[int] = None
+    # Shape (2 ** registers, 2)
+    nextStates: np.ndarray
+    # Shape (2 ** registers, 2, quantity of polynomials)
+    outputs: np.ndarray
+    _graph: Optional[List[List[list]]] = None
+    _previousStates: Optional[np.ndarray] = None
+    _previousInputs: Optional[np.ndarray] = None
+    _branchDistances: Optional[np.ndarray] = None
+
+    def __init__(self, polynomials: Tuple[int, ...], count_registers: int, next_states: np.ndarray,
+                 outputs: np.ndarray, feedback: Optional[int] = None):
+        self.polynomials = polynomials
+        self.countRegisters = count_registers
+        self.feedback = feedback
+        self.nextStates = next_states
+        self.outputs = outputs
+        self.nextStates.setflags(write=False)
+        self.outputs.setflags(write=False)
+
+    @property
+    def count_states(self) -> int:
+        return 1 << self.countRegisters
+
+    @property
+    def graph(self) -> List[List[list]]:
+        """
+        Transitions in list form:
+        [
+            [[next state for bit 0, [output bits]], [next state for bit 1, [output bits]]],
+            ...
+        ]
+        """
+        if self._graph is None:
+            self._graph = [
+                [[next_states[0], outputs[0]], [next_states[1], outputs[1]]]
+                for next_states, outputs in zip(self.nextStates.tolist(), self.outputs.tolist())
+            ]
+        return self._graph
+
+    @property
+    def previous_states(self) -> np.ndarray:
+        """
+        Both states with transition to state, shape (2 ** registers, 2).
+        Input bit of transition is the highest bit of state, lower state is first
+        """
+        if self._previousStates is None:
+            states: np.ndarray = np.arange(self.count_states, dtype=np.int64)
+            lower: np.ndarray = (states << 1) & (self.count_states - 1)
+            self._previousStates = np.stack((lower, lower | 1), axis=1)
+            self._previousStates.setflags(write=False)
+        return self._previousStates
+
+    @property
+    def previous_inputs(self) -> np.ndarray:
+        """
+        Input bits of transitions from both previous states (in order of previous_states), shape (2 ** registers, 2).
+        Previous state is the lower one if its lowest bit is zero
+        """
+        if self._previousInputs is None:
+            states: np.ndarray = np.arange(self.count_states, dtype=np.int64)
+            self._previousInputs = np.empty((self.count_states, 2), dtype=np.int64)
+            for bit in (0, 1):
+                self._previousInputs[self.nextStates[:, bit], states & 1] = bit
+            self._previousInputs.setflags(write=False)
+        return self._previousInputs
+
+    @property
+    def termination_inputs(self) -> np.ndarray:
+        """
+        Input bit for each state which shifts zero into state, so count_registers such steps lead coder to zero state
+        """
+        return np.argmin(self.nextStates, axis=1)
+
+    @property
+    def branch_distances(self) -> np.ndarray:
+        """
+        Hamming distances between received symbol and outputs of transitions to each state, only not erased bits
+        are counted. Shape (2 ** polynomials, 2 ** polynomials, 2 ** registers, 2), indexes are mask of not erased
+        bits, received symbol (bit of polynomial i is i-th bit of index), state and number of previous state
+        """
+        if self._branchDistances is None:
+            count_polynomials: int = len(self.polynomials)
+            symbols: np.ndarray = np.arange(1 << count_polynomials)
+            symbol_bits: np.ndarray = ((symbols[:, None] >> np.arange(count_polynomials)) & 1).astype(np.uint8)
+
+            input_bits: np.ndarray = np.arange(self.count_states) >> (self.countRegisters - 1)
+            # Shape (states, 2, polynomials)
+            transition_outputs: np.ndarray = self.outputs[self.previous_states, input_bits[:, None]]
+            # Shape (received, states, 2, polynomials)
+            differences: np.ndarray = symbol_bits[:, None, None, :] != transition_outputs[None]
+            self._branchDistances = np.einsum(
+                "mp,rskp->mrsk", symbol_bits.astype(np.int64), differences.astype(np.int64))
+            self._branchDistances.setflags(write=False)
+        return self._branchDistances
+
+    def encode(self, information: np.ndarray, start_state: int = 0) -> Tuple[np.ndarray, int]:
+        """
+        Method provide functionality for encoding of all bits at once. State before each bit is previous
+        count_registers bits (the last bit is the highest), so states are calculated by convolution
+        :param information: np.ndarray
+        :param start_state: int
+        :return: Tuple[np.ndarray, int] Outputs with shape (steps, quantity of polynomials) and state after last step
+        """
+        count_registers: int = self.countRegisters
+        # Bits which lead coder from zero to start state
+        start_bits: np.ndarray = (start_state >> np.arange(count_registers, dtype=np.int64)) & 1
+        bits: np.ndarray = np.concatenate((start_bits, information.astype(np.int64)))
+
+        weights: np.ndarray = np.zeros(count_registers + 1, dtype=np.int64)
+        weights[1:] = 1 << np.arange(count_registers - 1, -1, -1, dtype=np.int64)
+        states: np.ndarray = np.convolve(bits, weights)[count_registers:len(bits) + 1]
+        return self.outputs[states[:-1], information], int(states[-1])
+
+    @staticmethod
+    def build(polynomials: Tuple[int, ...], count_registers: int) -> 'Trellis':
+        """
+        Method provide functionality for calculation of transitions for all states at once
+        :param polynomials: Tuple[int, ...]
+        :param count_registers: int
+        :return: Trellis
+        """
+        states: np.ndarray = np.arange(1 << count_registers, dtype=np.int64)
+        next_states: np.ndarray = np.empty((len(states), 2), dtype=np.int64)
+        outputs: np.ndarray = np.empty((len(states), 2, len(polynomials)), dtype=np.uint8)
+
+        for bit in (0, 1):
+            next_states[:, bit] = (bit << (count_registers - 1)) | (states >> 1)
+            register: np.ndarray = (states << 1) | bit
+            for number, polynomial in enumerate(polynomials):
+                masked: np.ndarray = register & polynomial
+                parity: np.ndarray = np.zeros(len(states), dtype=np.int64)
+                # Register has count_registers + 1 significant bits
+                for position in range(count_registers + 1):
+                    parity ^= (masked >> position) & 1
+                outputs[:, bit, number] = parity
+
+        return Trellis(polynomials, count_registers, next_states, outputs)
+
+    @staticmethod
+    def build_recursive(feedback: int, polynomials: Tuple[int, ...], count_registers: int) -> 'Trellis':
+        """
+        Method provide functionality for calculation of transitions of recursive systematic coder for all states
+        at once. Bit d of feedback and polynomials is coefficient of delay D^d (feedback should have D^0), bit shifted
+        into state is input bit plus feedback of delayed bits. Outputs contain only parity bits,
+        systematic bit equals input bit
+        :param feedback: int
+        :param polynomials: Tuple[int, ...]
+        :param count_registers: int
+        :return: Trellis
+        """
+        states: np.ndarray = np.arange(1 << count_registers, dtype=np.uint64)
+        next_states: np.ndarray = np.empty((len(states), 2), dtype=np.int64)
+        outputs: np.ndarray = np.empty((len(states), 2, len(polynomials)), dtype=np.uint8)
+
+        def get_delayed_parity(polynomial: int) -> np.ndarray:
+            # Bit with delay d is bit (count_registers - d) of state
+            mask: int = sum(((polynomial >> delay) & 1) << (count_registers - delay)
+                            for delay in range(1, count_registers + 1))
+            return (get_weights(states & np.uint64(mask)) & 1).astype(np.int64)
+
+        feedback_parity: np.ndarray = get_delayed_parity(feedback)
+        for bit in (0, 1):
+            shifted: np.ndarray = bit ^ feedback_parity
+            next_states[:, bit] = (shifted << (count_registers - 1)) | (states.astype(np.int64) >> 1)
+            for number, polynomial in enumerate(polynomials):
+                outputs[:, bit, number] = ((polynomial & 1) * shifted) ^ get_delayed_parity(polynomial)
+
+        return Trellis(polynomials, count_registers, next_states, outputs, feedback)
+
+    @staticmethod
+    def get_file_name(directory: str, polynomials: Tuple[int, ...], count_registers: int) -> str:
+        return os.path.join(directory, "trellis_{0}_{1}.npz".format(
+            count_registers, "_".join(str(polynomial) for polynomial in polynomials)))
+
+    def save(self, file_name: str) -> None:
+        np.savez(file_name, next_states=self.nextStates, outputs=self.outputs)
+
+    @staticmethod
+    def load(file_name: str, polynomials: Tuple[int, ...], count_registers: int) -> 'Trellis':
+        with np.load(file_name) as trellis_file:
+            return Trellis(polynomials, count_registers, trellis_file["next_states"], trellis_file["outputs"])
+
+
+@lru_cache(maxsize=None)
+def get_trellis(polynomials: Tuple[int, ...], count_registers: int, directory: Optional[str] = None) -> Trellis:
+    """
+    Function provide functionality for getting of trellis shared between coders. If directory is specified,
+    trellis is loaded from it or calculated and stored to it
+    :param polynomials: Tuple[int, ...]
+    :param count_registers: int
+    :param directory: Optional[str] Directory for storing of trellis between runs
+    :return: Trellis
+    """
+    if directory is None:
+        return Trellis.build(polynomials, count_registers)
+
+    file_name: str = Trellis.get_file_name(directory, polynomials, count_registers)
+    if os.path.exists(file_name):
+        log.debug("Trellis loaded from {0}".format(file_name))
+        return Trellis.load(file_name, polynomials, count_registers)
+
+    trellis: Trellis = Trellis.build(polynomials, count_registers)
+    os.makedirs(directory, exist_ok=True)
+    trellis.save(file_name)
+    log.debug("Trellis stored to {0}".format(file_name))
+    return trellis
+
+
+@lru_cache(maxsize=None)
+def get_recursive_trellis(feedback: int, polynomials: Tuple[int, ...], count_registers: int) -> Trellis:
+    """
+    Function provide functionality for getting of trellis of recursive systematic coder shared between coders
+    :param feedback: int
+    :param polynomials: Tuple[int, ...]
+    :param count_registers: int
+    :return: Trellis
+    """
+    return Trellis.build_recursive(feedback, polynomials, count_registers)
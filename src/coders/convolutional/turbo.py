@@ -0,0 +1,325 @@
+# coding=utf-8
+import argparse
+import math
+from sqlite3 import Connection
+from typing import Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+import numpy as np
+
+from src.coders import abstract_coder
+from src.coders.convolutional import max_log_map
+from src.coders.convolutional.trellis import Trellis, get_recursive_trellis
+from src.coders.interleaver.Interleaver import Interleaver
+from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+from src.helper.error.exception.codding_exception import CodingException
+from src.logger import log
+from src.statistics.db.enum_coders_type import EnumCodersType
+
+
+class Coder(abstract_coder.AbstractCoder):
+    """
+    Turbo coder: two equal recursive systematic convolutional coders, the second one encodes information
+    permuted by block interleaver. Codeword is triples (information bit, parity of first coder, parity of second
+    coder) followed by pairs (input bit, parity) of termination of first and then second coder.
+    Decoder makes iterations of max-log-MAP decoding of both coders over batch of words, words where hard decisions
+    of both decoders agree are removed from processing
+    """
+    _typeOfCoder: EnumCodersType = EnumCodersType.TURBO
+    _name: str = "Turbo"
+    # Extrinsic information of max-log-MAP decoder is overestimated, it's scaled before exchange between decoders
+    EXTRINSIC_SCALE: float = 0.7
+
+    _trellis: Trellis
+    _feedback: int
+    _polynomial: int
+    _countRegisters: int
+    _interleaverLength: int
+    _maxIterations: int
+    # Position of information bit for each input of second coder
+    _permutation: np.ndarray
+
+    def __init__(
+            self,
+            information_length: int,
+            feedback: int = 13,
+            polynomial: int = 11,
+            count_registers: int = 3,
+            interleaver_length: Optional[int] = None,
+            max_iterations: int = 8,
+    ):
+        log.debug("Create turbo _coder")
+        if information_length <= 0 or count_registers <= 0 or not feedback & 1 \
+                or max(feedback, polynomial) >> (count_registers + 1):
+            raise CodingException(
+                message=CodingException.TURBO_PARAMETERS_INCORRECT.message,
+                long_message=CodingException.TURBO_PARAMETERS_INCORRECT.long_message.format(
+                    information_length, feedback, polynomial, count_registers),
+            )
+        self._feedback = feedback
+        self._polynomial = polynomial
+        self._countRegisters = count_registers
+        self._interleaverLength = interleaver_length or math.ceil(math.sqrt(information_length))
+        self._maxIterations = max_iterations
+        self._trellis = get_recursive_trellis(feedback, (polynomial,), count_registers)
+        self._permutation = np.array(
+            Interleaver(self._interleaverLength).shuffle(list(range(information_length))), dtype=np.int64)
+
+        self.lengthInformation = information_length
+        self.lengthTotal = 3 * information_length + 4 * count_registers
+        self.lengthAdditional = self.lengthTotal - self.lengthInformation
+
+    @property
+    def feedback(self) -> int:
+        return self._feedback
+
+    @property
+    def polynomial(self) -> int:
+        return self._polynomial
+
+    @property
+    def count_registers(self) -> int:
+        return self._countRegisters
+
+    @property
+    def interleaver_length(self) -> int:
+        return self._interleaverLength
+
+    @property
+    def max_iterations(self) -> int:
+        return self._maxIterations
+
+    def _check_length(self, information: List[int]) -> None:
+        if len(information) != self.lengthTotal:
+            raise CodingException(
+                message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.message,
+                long_message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.long_message.format(
+                    self.name, self.lengthTotal, len(information)),
+            )
+
+    def _encode_constituent(self, information: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Method provide functionality for encoding by recursive coder of all words at once
+        :param information: np.ndarray Bits with shape (words, information length)
+        :return: Tuple[np.ndarray, np.ndarray, np.ndarray] Parity bits, input bits and parity bits of termination
+        """
+        next_states: np.ndarray = self._trellis.nextStates
+        outputs: np.ndarray = self._trellis.outputs[:, :, 0]
+        termination_inputs: np.ndarray = self._trellis.termination_inputs
+        states: np.ndarray = np.zeros(len(information), dtype=np.int64)
+        parities: np.ndarray = np.empty(information.shape, dtype=np.uint8)
+        for step in range(information.shape[1]):
+            parities[:, step] = outputs[states, information[:, step]]
+            states = next_states[states, information[:, step]]
+
+        tail: np.ndarray = np.empty((len(information), self._countRegisters), dtype=np.int64)
+        tail_parities: np.ndarray = np.empty((len(information), self._countRegisters), dtype=np.uint8)
+        for step in range(self._countRegisters):
+            tail[:, step] = termination_inputs[states]
+            tail_parities[:, step] = outputs[states, tail[:, step]]
+            states = next_states[states, tail[:, step]]
+        return parities, tail.astype(np.uint8), tail_parities
+
+    def _encode(self, information: np.ndarray) -> np.ndarray:
+        information = information.astype(np.int64)
+        first_parities, first_tail, first_tail_parities = self._encode_constituent(information)
+        second_parities, second_tail, second_tail_parities = self._encode_constituent(
+            information[:, self._permutation])
+        return np.concatenate((
+            np.stack((information.astype(np.uint8), first_parities, second_parities), axis=2).reshape(
+                len(information), -1),
+            np.stack((first_tail, first_tail_parities), axis=2).reshape(len(information), -1),
+            np.stack((second_tail, second_tail_parities), axis=2).reshape(len(information), -1),
+        ), axis=1)
+
+    def encoding(self, information: List[int]) -> List[int]:
+        log.info("Encoding package {0} of turbo _coder".format(information))
+        return self._encode(np.array([self.try_normalization(information)], dtype=np.uint8))[0].tolist()
+
+    def encoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[List[int]]:
+        if any(len(package) != self.lengthInformation for package in packages):
+            return super().encoding_batch(packages)
+        return self._encode(np.asarray(packages, dtype=np.uint8).reshape(-1, self.lengthInformation)).tolist()
+
+    def decoding(self, information: List[int]) -> List[int]:
+        log.info("Decoding package {0} of turbo _coder".format(information))
+        self._check_length(information)
+        return self._decode(np.array([information], dtype=np.uint8))[0]
+
+    def decoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[Optional[List[int]]]:
+        if any(len(package) != self.lengthTotal for package in packages):
+            return super().decoding_batch(packages)
+        return self._decode(np.array(packages, dtype=np.uint8).reshape(-1, self.lengthTotal))
+
+    def _decode(self, received: np.ndarray) -> List[List[int]]:
+        # Hard decisions of channel have the same reliability
+        channel_llr: np.ndarray = 1.0 - 2.0 * received
+        length: int = self.lengthInformation
+        body: np.ndarray = channel_llr[:, :3 * length].reshape(len(received), length, 3)
+        tails: np.ndarray = channel_llr[:, 3 * length:].reshape(len(received), 2, self._countRegisters, 2)
+        systematic: np.ndarray = body[:, :, 0]
+        first_systematic: np.ndarray = np.concatenate((systematic, tails[:, 0, :, 0]), axis=1)
+        first_parities: np.ndarray = np.concatenate((body[:, :, 1], tails[:, 0, :, 1]), axis=1)[:, :, np.newaxis]
+        second_systematic: np.ndarray = np.concatenate((systematic[:, self._permutation], tails[:, 1, :, 0]), axis=1)
+        second_parities: np.ndarray = np.concatenate((body[:, :, 2], tails[:, 1, :, 1]), axis=1)[:, :, np.newaxis]
+        # A priori information of tail bits isn't exchanged
+        tail_priori: np.ndarray = np.zeros((len(received), self._countRegisters))
+
+        hard_decisions: np.ndarray = received[:, 0:3 * length:3].copy()
+        extrinsic: np.ndarray = np.zeros((len(received), length))
+        # Rows of batch which are processed yet
+        rows: np.ndarray = np.arange(len(received))
+        for _ in range(self._maxIterations):
+            first_posterior: np.ndarray = max_log_map.decode(
+                self._trellis, first_systematic, first_parities,
+                np.concatenate((extrinsic, tail_priori), axis=1),
+            )[:, :length]
+            first_extrinsic: np.ndarray = self.EXTRINSIC_SCALE * (first_posterior - systematic - extrinsic)
+
+            second_posterior: np.ndarray = max_log_map.decode(
+                self._trellis, second_systematic, second_parities,
+                np.concatenate((first_extrinsic[:, self._permutation], tail_priori), axis=1),
+            )[:, :length]
+            posterior: np.ndarray = np.empty_like(second_posterior)
+            posterior[:, self._permutation] = second_posterior
+            extrinsic = self.EXTRINSIC_SCALE * (posterior - systematic - first_extrinsic)
+            hard_decisions[rows] = posterior < 0
+
+            # Words where both decoders make the same decisions are considered as decoded
+            unsolved: np.ndarray = ((first_posterior < 0) != (posterior < 0)).any(axis=1)
+            if not unsolved.all():
+                rows, extrinsic, systematic = rows[unsolved], extrinsic[unsolved], systematic[unsolved]
+                first_systematic, first_parities = first_systematic[unsolved], first_parities[unsolved]
+                second_systematic, second_parities = second_systematic[unsolved], second_parities[unsolved]
+                tail_priori = tail_priori[unsolved]
+            if not len(rows):
+                break
+        return hard_decisions.tolist()
+
+    def to_json(self) -> Dict:
+        return {
+            'name': self.name,
+            'length _information word': self.lengthInformation,
+            'length additional bits': self.lengthAdditional,
+            'length coding word': self.lengthTotal,
+            'feedback polynomial': self._feedback,
+            'polynomial': self._polynomial,
+            'count registers': self._countRegisters,
+            'length of interleaver': self._interleaverLength,
+            'max iterations': self._maxIterations,
+            'speed': self.get_speed(),
+        }
+
+    def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import turbo_table
+        connection.execute(turbo_table.insert().values(
+            guid=coder_guid,
+            length_information=self.lengthInformation,
+            feedback=self._feedback,
+            polynomial=self._polynomial,
+            count_registers=self._countRegisters,
+            interleaver_length=self._interleaverLength,
+            max_iterations=self._maxIterations,
+        ))
+
+    class TurboCoderParser(AbstractGroupParser):
+        _prefix: str = ""
+        __INFORMATION_LENGTH: str = "turbo_information_length"
+        __FEEDBACK: str = "turbo_feedback"
+        __POLYNOMIAL: str = "turbo_polynomial"
+        __COUNT_REGISTERS: str = "turbo_count_registers"
+        __INTERLEAVER_LENGTH: str = "turbo_interleaver_length"
+        __MAX_ITERATIONS: str = "turbo_max_iterations"
+
+        def __init__(
+                self,
+                argument_parser: Optional[argparse.ArgumentParser] = None,
+                argument_group=None,
+                prefix: str = ""
+        ):
+            super().__init__(
+                argument_parser=argument_parser,
+                argument_group=argument_group
+            )
+            self._prefix = prefix
+
+            self._argumentParser.add_argument(
+                "-{0}turk".format(prefix), "--{0}{1}".format(prefix, self.__INFORMATION_LENGTH),
+                type=int,
+                default=64,
+                help="Length of information word of turbo _coder"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}turf".format(prefix), "--{0}{1}".format(prefix, self.__FEEDBACK),
+                type=int,
+                default=13,
+                help="Feedback polynomial of turbo _coder, bit d is coefficient of D^d (13 is 1 + D^2 + D^3)"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}turp".format(prefix), "--{0}{1}".format(prefix, self.__POLYNOMIAL),
+                type=int,
+                default=11,
+                help="Parity polynomial of turbo _coder, bit d is coefficient of D^d (11 is 1 + D + D^3)"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}turr".format(prefix), "--{0}{1}".format(prefix, self.__COUNT_REGISTERS),
+                type=int,
+                default=3,
+                help="Quantity of registers of each convolutional _coder of turbo _coder"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}turl".format(prefix), "--{0}{1}".format(prefix, self.__INTERLEAVER_LENGTH),
+                type=int,
+                help="Length of smashing of interleaver of turbo _coder (by default square root of length)"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}turi".format(prefix), "--{0}{1}".format(prefix, self.__MAX_ITERATIONS),
+                type=int,
+                default=8,
+                help="Maximal quantity of iterations of turbo decoder"
+            )
+
+            # We should parse arguments only for unique _coder
+            if self._argumentGroup is None:
+                self.arguments = vars(self._argumentParser.parse_args())
+
+        @property
+        def turbo_information_length(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__INFORMATION_LENGTH)]
+
+        @property
+        def turbo_feedback(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__FEEDBACK)]
+
+        @property
+        def turbo_polynomial(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__POLYNOMIAL)]
+
+        @property
+        def turbo_count_registers(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__COUNT_REGISTERS)]
+
+        @property
+        def turbo_interleaver_length(self) -> Optional[int]:
+            return self.arguments["{0}{1}".format(self._prefix, self.__INTERLEAVER_LENGTH)]
+
+        @property
+        def turbo_max_iterations(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__MAX_ITERATIONS)]
+
+    @staticmethod
+    def get_coder_parameters(
+            argument_parser: Optional[argparse.ArgumentParser] = None,
+            argument_group=None,
+            prefix: str = ""
+    ):
+        return Coder.TurboCoderParser(
+            argument_parser=argument_parser,
+            argument_group=argument_group,
+            prefix=prefix
+        )
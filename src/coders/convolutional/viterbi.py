@@ -0,0 +1,118 @@
+# coding=utf-8
+from typing import List, Tuple
+
+import numpy as np
+
+from src.coders.convolutional.trellis import Trellis
+from src.helper import jit
+
+# Metric of unreachable state
+MAX_METRIC: int = 9999999999999
+
+
+def get_start_metrics(trellis: Trellis, start_state: int = 0) -> np.ndarray:
+    """
+    :param trellis: Trellis
+    :param start_state: int State of coder before first step, -1 if it's unknown (all states are equal)
+    :return: np.ndarray Path metrics before first step
+    """
+    if start_state < 0:
+        return np.zeros(trellis.count_states, dtype=np.int64)
+    metrics: np.ndarray = np.full(trellis.count_states, MAX_METRIC, dtype=np.int64)
+    metrics[start_state] = 0
+    return metrics
+
+
+def forward(
+        trellis: Trellis,
+        metrics: np.ndarray,
+        bits: np.ndarray,
+        mask: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function provide functionality for forward pass of Viterbi algorithm for all states at once.
+    On equal metrics path from lower previous state is chosen
+    :param trellis: Trellis
+    :param metrics: np.ndarray Path metrics before first step
+    :param bits: np.ndarray Received bits with shape (steps, quantity of polynomials)
+    :param mask: np.ndarray Mask of not erased bits with the same shape
+    :return: Tuple[np.ndarray, np.ndarray] Path metrics after last step and chosen previous state
+        (lower or upper) with shape (steps, states)
+    """
+    weights: np.ndarray = 1 << np.arange(bits.shape[1])
+    symbols: np.ndarray = (bits & mask) @ weights
+    symbol_masks: np.ndarray = mask @ weights
+
+    previous_states: np.ndarray = trellis.previous_states
+    branch_distances: np.ndarray = trellis.branch_distances
+    decisions: np.ndarray = np.empty((len(bits), trellis.count_states), dtype=bool)
+    if jit.ENABLED:
+        metrics = _forward_kernel(
+            np.array(metrics, dtype=np.int64), previous_states, branch_distances, symbol_masks, symbols, decisions)
+        return metrics, decisions
+
+    for step in range(len(bits)):
+        candidates: np.ndarray = metrics[previous_states] + branch_distances[symbol_masks[step], symbols[step]]
+        decisions[step] = candidates[:, 1] < candidates[:, 0]
+        metrics = np.where(decisions[step], candidates[:, 1], candidates[:, 0])
+        # Unreachable states stay unreachable
+        np.minimum(metrics, MAX_METRIC, out=metrics)
+    return metrics, decisions
+
+
+def traceback(trellis: Trellis, decisions: np.ndarray, state: int) -> Tuple[List[int], int]:
+    """
+    Function provide functionality for restoring input bits of survivor path
+    :param trellis: Trellis
+    :param decisions: np.ndarray Decisions of forward pass
+    :param state: int State after last step
+    :return: Tuple[List[int], int] Input bits and state before first step
+    """
+    if jit.ENABLED:
+        answer, state = _traceback_kernel(trellis.previous_states, decisions, trellis.countRegisters, state)
+        return answer.tolist(), int(state)
+
+    answer: List[int] = [0] * len(decisions)
+    previous_states: np.ndarray = trellis.previous_states
+    for step in range(len(decisions) - 1, -1, -1):
+        answer[step] = state >> (trellis.countRegisters - 1)
+        state = int(previous_states[state, int(decisions[step, state])])
+    return answer, state
+
+
+@jit.kernel
+def _forward_kernel(
+        metrics: np.ndarray,
+        previous_states: np.ndarray,
+        branch_distances: np.ndarray,
+        symbol_masks: np.ndarray,
+        symbols: np.ndarray,
+        decisions: np.ndarray
+) -> np.ndarray:
+    """
+    Add-compare-select of forward pass by loops over steps and states, decisions are written in place
+    """
+    updated: np.ndarray = np.empty_like(metrics)
+    for step in range(len(symbols)):
+        distances: np.ndarray = branch_distances[symbol_masks[step], symbols[step]]
+        for state in range(len(metrics)):
+            lower: int = metrics[previous_states[state, 0]] + distances[state, 0]
+            upper: int = metrics[previous_states[state, 1]] + distances[state, 1]
+            decisions[step, state] = upper < lower
+            updated[state] = min(min(lower, upper), MAX_METRIC)
+        metrics, updated = updated, metrics
+    return metrics
+
+
+@jit.kernel
+def _traceback_kernel(
+        previous_states: np.ndarray,
+        decisions: np.ndarray,
+        count_registers: int,
+        state: int
+) -> Tuple[np.ndarray, int]:
+    answer: np.ndarray = np.empty(len(decisions), dtype=np.int64)
+    for step in range(len(decisions) - 1, -1, -1):
+        answer[step] = state >> (count_registers - 1)
+        state = previous_states[state, np.int64(decisions[step, state])]
+    return answer, state
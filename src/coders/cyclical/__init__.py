@@ -1,2 +1,4 @@
 # coding=utf-8
+import src.coders.cyclical.bch
 import src.coders.cyclical.coder
+import src.coders.cyclical.reed_solomon
@@ -0,0 +1,280 @@
+# coding=utf-8
+import argparse
+from sqlite3 import Connection
+from typing import Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+import numpy as np
+
+from src.coders import abstract_coder
+from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+from src.helper.calc.galois_field import GaloisField
+from src.helper.calc.gf2_calculation import GF2Calculation
+from src.helper.error.exception.codding_exception import CodingException
+from src.logger import log
+from src.statistics.db.enum_coders_type import EnumCodersType
+
+
+class Coder(abstract_coder.AbstractCoder):
+    """
+    Binary narrow-sense BCH coder with length 2^m - 1 (or shortened). Codeword is coefficients of polynomial
+    from x^0 like in cyclical coder: check bits are followed by information bits.
+    Decoder computes syndromes by one matrix product for batch, error locator by Berlekamp-Massey algorithm
+    and its roots by Chien search over all positions and words at once.
+    If quantity of errors exceeds correctable one, received information bits are returned
+    """
+    _typeOfCoder: EnumCodersType = EnumCodersType.BCH
+    _name: str = "BCH"
+
+    _field: GaloisField
+    _correctableErrors: int
+    # Packed generator polynomial, bit i is coefficient of x^i
+    _generatorPolynomial: int
+    # Check bits of each information bit with shape (information length, check length)
+    _checkMatrix: np.ndarray
+    # Bits of alpha^(i * j) for position i and odd j from 1 to 2t - 1 with shape (length, t * m)
+    _syndromeMatrix: np.ndarray
+
+    def __init__(self, degree: int, correctable_errors: int, information_length: Optional[int] = None):
+        log.debug("Create BCH _coder")
+        if not 3 <= degree <= 16 or correctable_errors <= 0 or 2 * correctable_errors >= (1 << degree) - 1:
+            raise self._get_parameters_exception(degree, correctable_errors, information_length)
+        self._field = GaloisField(degree)
+        self._correctableErrors = correctable_errors
+
+        # Generator polynomial is product of minimal polynomials of alpha^1, ..., alpha^2t,
+        # minimal polynomials of even powers are the same as for odd powers
+        generator_polynomial: int = 1
+        used_powers: set = set()
+        for power in range(1, 2 * correctable_errors, 2):
+            if power not in used_powers:
+                used_powers.update(self._field.get_cyclotomic_coset(power))
+                generator_polynomial = GF2Calculation.multiply_polynomials(
+                    generator_polynomial, self._field.get_minimal_polynomial(power))
+        self._generatorPolynomial = generator_polynomial
+
+        self.lengthAdditional = generator_polynomial.bit_length() - 1
+        full_information_length: int = self._field.order - self.lengthAdditional
+        if information_length is None:
+            information_length = full_information_length
+        if not 0 < information_length <= full_information_length:
+            raise self._get_parameters_exception(degree, correctable_errors, information_length)
+        self.lengthInformation = information_length
+        self.lengthTotal = self.lengthAdditional + self.lengthInformation
+
+        # Remainders of x^(r + i) by generator polynomial
+        remainders: List[int] = []
+        remainder: int = GF2Calculation.get_polynomial_remainder(1 << self.lengthAdditional, generator_polynomial)
+        for _ in range(self.lengthInformation):
+            remainders.append(remainder)
+            remainder <<= 1
+            if remainder >> self.lengthAdditional:
+                remainder ^= generator_polynomial
+        self._checkMatrix = (
+            (np.array(remainders, dtype=object)[:, np.newaxis] >> np.arange(self.lengthAdditional)) & 1
+        ).astype(np.float32)
+
+        odd_powers: np.ndarray = np.arange(1, 2 * correctable_errors, 2)
+        elements: np.ndarray = self._field.exp[np.outer(np.arange(self.lengthTotal), odd_powers) % self._field.order]
+        self._syndromeMatrix = ((elements[:, :, np.newaxis] >> np.arange(degree)) & 1).reshape(
+            self.lengthTotal, -1).astype(np.float32)
+
+    @staticmethod
+    def _get_parameters_exception(
+            degree: int,
+            correctable_errors: int,
+            information_length: Optional[int],
+    ) -> CodingException:
+        return CodingException(
+            message=CodingException.BCH_PARAMETERS_INCORRECT.message,
+            long_message=CodingException.BCH_PARAMETERS_INCORRECT.long_message.format(
+                degree, correctable_errors, information_length),
+        )
+
+    @property
+    def correctable_errors(self) -> int:
+        return self._correctableErrors
+
+    @property
+    def generator_polynomial(self) -> List[int]:
+        """
+        :return: List[int] Coefficients from x^0
+        """
+        return [(self._generatorPolynomial >> iterator) & 1 for iterator in range(self.lengthAdditional + 1)]
+
+    def _check_length(self, information: List[int]) -> None:
+        if len(information) != self.lengthTotal:
+            raise CodingException(
+                message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.message,
+                long_message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.long_message.format(
+                    self.name, self.lengthTotal, len(information)),
+            )
+
+    def _encode(self, information: np.ndarray) -> np.ndarray:
+        # Sum of products is exact in float32 for length less than 2^24
+        check_bits: np.ndarray = (information.astype(np.float32) @ self._checkMatrix) % 2
+        return np.concatenate((check_bits.astype(np.uint8), information.astype(np.uint8)), axis=1)
+
+    def encoding(self, information: List[int]) -> List[int]:
+        log.info("Encoding package {0} of BCH _coder".format(information))
+        return self._encode(np.array([self.try_normalization(information)], dtype=np.uint8))[0].tolist()
+
+    def encoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[List[int]]:
+        if any(len(package) != self.lengthInformation for package in packages):
+            return super().encoding_batch(packages)
+        return self._encode(np.asarray(packages, dtype=np.uint8).reshape(-1, self.lengthInformation)).tolist()
+
+    def decoding(self, information: List[int]) -> List[int]:
+        log.info("Decoding package {0} of BCH _coder".format(information))
+        self._check_length(information)
+        return self._decode(np.array([information], dtype=np.uint8))[0]
+
+    def decoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[Optional[List[int]]]:
+        if any(len(package) != self.lengthTotal for package in packages):
+            return super().decoding_batch(packages)
+        return self._decode(np.array(packages, dtype=np.uint8).reshape(-1, self.lengthTotal))
+
+    def _get_syndromes(self, received: np.ndarray) -> np.ndarray:
+        """
+        :param received: np.ndarray Words with shape (words, length)
+        :return: np.ndarray Syndromes of odd powers r(alpha^1), r(alpha^3), ... with shape (words, t)
+        """
+        bits: np.ndarray = ((received.astype(np.float32) @ self._syndromeMatrix) % 2).astype(np.int64)
+        return bits.reshape(len(received), self._correctableErrors, self._field.degree) \
+            @ np.left_shift(1, np.arange(self._field.degree, dtype=np.int64))
+
+    def _get_error_locator(self, odd_syndromes: List[int]) -> List[int]:
+        """
+        Method provide functionality for calculation of error locator from syndromes of odd powers
+        :param odd_syndromes: List[int] Syndromes of odd powers of alpha
+        :return: List[int] Coefficients of error locator from x^0
+        """
+        field: GaloisField = self._field
+        syndromes: List[int] = [0] * (2 * self._correctableErrors)
+        for iterator, syndrome in enumerate(odd_syndromes):
+            power: int = 2 * iterator + 1
+            # Syndrome of even power 2j equals square of syndrome of power j for binary code
+            while power <= len(syndromes):
+                syndromes[power - 1] = syndrome
+                syndrome = field.multiply(syndrome, syndrome)
+                power *= 2
+        return field.get_error_locator(syndromes)
+
+    def _get_error_positions(self, locators: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method provide functionality for Chien search: error locator is evaluated in alpha^-i for all positions i
+        of all words at once
+        :param locators: List[List[int]] Coefficients of error locators from x^0
+        :return: Tuple[np.ndarray, np.ndarray] Mask of errors with shape (words, length)
+            and flags of words where quantity of roots equals degree of locator
+        """
+        coefficients: np.ndarray = np.zeros((len(locators), self._correctableErrors + 1), dtype=np.int64)
+        degrees: np.ndarray = np.array([len(locator) - 1 for locator in locators])
+        for iterator, locator in enumerate(locators):
+            coefficients[iterator, :len(locator)] = locator
+
+        errors: np.ndarray = self._field.evaluate_at_inverse_powers(coefficients, self.lengthTotal) == 0
+        return errors, errors.sum(axis=1) == degrees
+
+    def _decode(self, received: np.ndarray) -> List[List[int]]:
+        odd_syndromes: np.ndarray = self._get_syndromes(received)
+        rows: np.ndarray = np.flatnonzero(odd_syndromes.any(axis=1))
+        if len(rows):
+            log.debug("Error(s) detected")
+            locators: List[List[int]] = [self._get_error_locator(odd_syndromes[row].tolist()) for row in rows]
+            # Locator with degree greater than t means uncorrectable errors
+            correctable: np.ndarray = np.array([len(locator) - 1 <= self._correctableErrors for locator in locators])
+            rows = rows[correctable]
+            locators = [locator for locator, flg_correctable in zip(locators, correctable) if flg_correctable]
+            if len(rows):
+                errors, found = self._get_error_positions(locators)
+                received[rows[found]] ^= errors[found].astype(np.uint8)
+        return received[:, self.lengthAdditional:].tolist()
+
+    def to_json(self) -> Dict:
+        return {
+            'name': self.name,
+            'length _information word': self.lengthInformation,
+            'length additional bits': self.lengthAdditional,
+            'length coding word': self.lengthTotal,
+            'degree of field': self._field.degree,
+            'correctable errors': self._correctableErrors,
+            'generator polynomial': self.generator_polynomial,
+            'speed': self.get_speed(),
+        }
+
+    def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import bch_table
+        connection.execute(bch_table.insert().values(
+            guid=coder_guid,
+            degree=self._field.degree,
+            correctable_errors=self._correctableErrors,
+            length_information=self.lengthInformation,
+            generator_polynomial=self.generator_polynomial,
+        ))
+
+    class BchCoderParser(AbstractGroupParser):
+        _prefix: str = ""
+        __DEGREE: str = "bch_degree"
+        __CORRECTABLE_ERRORS: str = "bch_correctable_errors"
+        __INFORMATION_LENGTH: str = "bch_information_length"
+
+        def __init__(
+                self,
+                argument_parser: Optional[argparse.ArgumentParser] = None,
+                argument_group=None,
+                prefix: str = ""
+        ):
+            super().__init__(
+                argument_parser=argument_parser,
+                argument_group=argument_group
+            )
+            self._prefix = prefix
+
+            self._argumentParser.add_argument(
+                "-{0}bchm".format(prefix), "--{0}{1}".format(prefix, self.__DEGREE),
+                type=int,
+                default=8,
+                help="Degree of Galois field of BCH _coder, length of codeword is 2^m - 1"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}bcht".format(prefix), "--{0}{1}".format(prefix, self.__CORRECTABLE_ERRORS),
+                type=int,
+                default=4,
+                help="Quantity of errors which are corrected by BCH _coder"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}bchk".format(prefix), "--{0}{1}".format(prefix, self.__INFORMATION_LENGTH),
+                type=int,
+                help="Length of information of shortened BCH _coder (by default code isn't shortened)"
+            )
+
+            # We should parse arguments only for unique _coder
+            if self._argumentGroup is None:
+                self.arguments = vars(self._argumentParser.parse_args())
+
+        @property
+        def bch_degree(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__DEGREE)]
+
+        @property
+        def bch_correctable_errors(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__CORRECTABLE_ERRORS)]
+
+        @property
+        def bch_information_length(self) -> Optional[int]:
+            return self.arguments["{0}{1}".format(self._prefix, self.__INFORMATION_LENGTH)]
+
+    @staticmethod
+    def get_coder_parameters(
+            argument_parser: Optional[argparse.ArgumentParser] = None,
+            argument_group=None,
+            prefix: str = ""
+    ):
+        return Coder.BchCoderParser(
+            argument_parser=argument_parser,
+            argument_group=argument_group,
+            prefix=prefix
+        )
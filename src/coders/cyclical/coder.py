@@ -12,7 +12,6 @@ from src.coders.casts import int_to_bit_list
 from src.endpoint.console.abstract_group_parser import AbstractGroupParser
 from src.logger import log
 from src.statistics.db.enum_coders_type import EnumCodersType
-from src.statistics.db.table import cyclic_table
 
 
 class Coder(abstract_coder.AbstractCoder):
@@ -54,6 +53,7 @@ class Coder(abstract_coder.AbstractCoder):
                 'speed': self.get_speed()}
 
     def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import cyclic_table
         connection.execute(cyclic_table.insert().values(
             guid=coder_guid,
             polynomial=[int(iterator) for iterator in list(self._polynomial)],
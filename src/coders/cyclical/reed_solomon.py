@@ -0,0 +1,325 @@
+# coding=utf-8
+import argparse
+from sqlite3 import Connection
+from typing import Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+import numpy as np
+
+from src.coders import abstract_coder
+from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+from src.helper.calc.galois_field import GaloisField
+from src.helper.error.exception.codding_exception import CodingException
+from src.logger import log
+from src.statistics.db.enum_coders_type import EnumCodersType
+
+
+class Coder(abstract_coder.AbstractCoder):
+    """
+    Reed-Solomon coder over GF(2^8) with roots alpha^1, ..., alpha^(n - k) of generator polynomial.
+    Codeword is sequence of bytes from the highest coefficient of polynomial: information symbols are followed
+    by check symbols, bits of each symbol are ordered from the most significant one.
+    Code with less than 255 symbols is shortened. Decoder corrects (n - k) / 2 wrong symbols, so burst of errors
+    costs one symbol per 8 bits. If errors cannot be corrected, received information symbols are returned
+    """
+    _typeOfCoder: EnumCodersType = EnumCodersType.REED_SOLOMON
+    _name: str = "Reed-Solomon"
+    SYMBOL_SIZE: int = 8
+
+    _field: GaloisField
+    _countSymbols: int
+    _countInformationSymbols: int
+    # Coefficients of generator polynomial from x^0
+    _generatorPolynomial: List[int]
+    # Check symbols of each information symbol with shape (information symbols, check symbols)
+    _checkMatrix: np.ndarray
+    # Logarithms of alpha^(j * (n - 1 - i)) for position i and syndrome j with shape (symbols, check symbols)
+    _syndromeLogarithms: np.ndarray
+
+    def __init__(self, count_symbols: int, count_information_symbols: int):
+        log.debug("Create Reed-Solomon _coder")
+        self._field = GaloisField(self.SYMBOL_SIZE)
+        if not 0 < count_information_symbols <= count_symbols - 2 or count_symbols > self._field.order:
+            raise CodingException(
+                message=CodingException.REED_SOLOMON_PARAMETERS_INCORRECT.message,
+                long_message=CodingException.REED_SOLOMON_PARAMETERS_INCORRECT.long_message.format(
+                    count_symbols, count_information_symbols, self._field.order),
+            )
+        self._countSymbols = count_symbols
+        self._countInformationSymbols = count_information_symbols
+        self.lengthInformation = count_information_symbols * self.SYMBOL_SIZE
+        self.lengthAdditional = self.count_check_symbols * self.SYMBOL_SIZE
+        self.lengthTotal = count_symbols * self.SYMBOL_SIZE
+
+        generator_polynomial: List[int] = [1]
+        for power in range(1, self.count_check_symbols + 1):
+            # Multiplication by (x + alpha^power)
+            root: int = self._field.power_of_alpha(power)
+            shifted: List[int] = [0] + generator_polynomial
+            for iterator, coefficient in enumerate(generator_polynomial):
+                shifted[iterator] ^= self._field.multiply(coefficient, root)
+            generator_polynomial = shifted
+        self._generatorPolynomial = generator_polynomial
+
+        # Remainders of x^(n - 1 - i) by generator polynomial from the last information symbol
+        check_rows: List[List[int]] = []
+        remainder: List[int] = generator_polynomial[:-1]
+        for _ in range(count_information_symbols):
+            check_rows.append(remainder)
+            # Multiplication by x with reduction by monic generator polynomial
+            shifted = [0] + remainder[:-1]
+            remainder = [value ^ self._field.multiply(remainder[-1], coefficient)
+                         for value, coefficient in zip(shifted, generator_polynomial)]
+        # Rows are reversed to order of information symbols, columns - to order of check symbols in codeword
+        self._checkMatrix = np.array(check_rows[::-1], dtype=np.int64)[:, ::-1].copy()
+
+        powers: np.ndarray = np.arange(count_symbols - 1, -1, -1)
+        self._syndromeLogarithms = np.outer(powers, np.arange(1, self.count_check_symbols + 1)) % self._field.order
+
+    @property
+    def count_symbols(self) -> int:
+        return self._countSymbols
+
+    @property
+    def count_information_symbols(self) -> int:
+        return self._countInformationSymbols
+
+    @property
+    def count_check_symbols(self) -> int:
+        return self._countSymbols - self._countInformationSymbols
+
+    @property
+    def correctable_symbols(self) -> int:
+        return self.count_check_symbols // 2
+
+    @property
+    def generator_polynomial(self) -> List[int]:
+        return list(self._generatorPolynomial)
+
+    def _get_sum_of_products(self, symbols: np.ndarray, logarithms: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Method provide functionality for sums of products of symbols of words and matrix over field
+        :param symbols: np.ndarray Symbols with shape (words, rows)
+        :param logarithms: np.ndarray Logarithms of matrix with shape (rows, columns)
+        :param mask: np.ndarray Not zero elements of matrix
+        :return: np.ndarray Sums with shape (words, columns)
+        """
+        products: np.ndarray = self._field.exp[self._field.log[symbols][:, :, np.newaxis] + logarithms]
+        products[(symbols == 0)[:, :, np.newaxis] | ~mask] = 0
+        return np.bitwise_xor.reduce(products, axis=1)
+
+    def encode_symbols(self, symbols: np.ndarray) -> np.ndarray:
+        """
+        :param symbols: np.ndarray Information symbols with shape (words, information symbols)
+        :return: np.ndarray Codewords with shape (words, symbols)
+        """
+        symbols = np.asarray(symbols, dtype=np.int64).reshape(-1, self._countInformationSymbols)
+        check_symbols: np.ndarray = self._get_sum_of_products(
+            symbols, self._field.log[self._checkMatrix], self._checkMatrix != 0)
+        return np.concatenate((symbols, check_symbols), axis=1)
+
+    def get_syndromes(self, symbols: np.ndarray) -> np.ndarray:
+        """
+        :param symbols: np.ndarray Codewords with shape (words, symbols)
+        :return: np.ndarray Syndromes r(alpha^1), ..., r(alpha^(n - k)) with shape (words, check symbols)
+        """
+        return self._get_sum_of_products(
+            symbols, self._syndromeLogarithms, np.ones(self._syndromeLogarithms.shape, dtype=bool))
+
+    def _get_error_values(
+            self,
+            syndromes: np.ndarray,
+            locators: np.ndarray,
+            degrees: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method provide functionality for Chien search of error positions and calculation of error values
+        by Forney algorithm Omega(X^-1) / Lambda'(X^-1) for all words at once
+        :param syndromes: np.ndarray Syndromes with shape (words, check symbols)
+        :param locators: np.ndarray Coefficients of error locators from x^0 with shape (words, t + 1)
+        :param degrees: np.ndarray Degrees of error locators
+        :return: Tuple[np.ndarray, np.ndarray] Error values of symbols of codeword with shape (words, symbols)
+            and flags of words which errors are found
+        """
+        field: GaloisField = self._field
+        # Evaluator Omega(x) = S(x) * Lambda(x) mod x^(n - k)
+        evaluators: np.ndarray = np.zeros(syndromes.shape, dtype=np.int64)
+        for degree in range(locators.shape[1]):
+            evaluators[:, degree:] ^= field.multiply_arrays(
+                syndromes[:, :syndromes.shape[1] - degree], locators[:, degree:degree + 1])
+        # Formal derivative keeps odd coefficients only
+        derivatives: np.ndarray = locators[:, 1:].copy()
+        derivatives[:, 1::2] = 0
+
+        # Value in position of power p of codeword is evaluated in alpha^-p, positions are reversed to symbols
+        errors: np.ndarray = (field.evaluate_at_inverse_powers(locators, self._countSymbols) == 0)[:, ::-1]
+        numerators: np.ndarray = field.evaluate_at_inverse_powers(evaluators, self._countSymbols)[:, ::-1]
+        denominators: np.ndarray = field.evaluate_at_inverse_powers(derivatives, self._countSymbols)[:, ::-1]
+        values: np.ndarray = field.exp[(field.log[numerators] - field.log[denominators]) % field.order]
+        values[~errors | (numerators == 0)] = 0
+        found: np.ndarray = (errors.sum(axis=1) == degrees) & ~(errors & (denominators == 0)).any(axis=1)
+        return values, found
+
+    def decode_symbols(self, symbols: np.ndarray) -> np.ndarray:
+        """
+        :param symbols: np.ndarray Codewords with shape (words, symbols)
+        :return: np.ndarray Information symbols with shape (words, information symbols)
+        """
+        symbols = np.array(symbols, dtype=np.int64).reshape(-1, self._countSymbols)
+        syndromes: np.ndarray = self.get_syndromes(symbols)
+        rows: np.ndarray = np.flatnonzero(syndromes.any(axis=1))
+        if len(rows):
+            log.debug("Error(s) detected")
+            locators: List[List[int]] = [self._field.get_error_locator(syndromes[row].tolist()) for row in rows]
+            # Locator with degree greater than t means uncorrectable errors
+            correctable: np.ndarray = np.array([len(locator) - 1 <= self.correctable_symbols for locator in locators])
+            rows = rows[correctable]
+            if len(rows):
+                coefficients: np.ndarray = np.zeros((len(rows), self.correctable_symbols + 1), dtype=np.int64)
+                for iterator, locator in enumerate(
+                        locator for locator, flg_correctable in zip(locators, correctable) if flg_correctable):
+                    coefficients[iterator, :len(locator)] = locator
+                values, found = self._get_error_values(
+                    syndromes[rows], coefficients, np.array([len(locator) - 1 for locator in locators])[correctable])
+                symbols[rows[found]] ^= values[found]
+        return symbols[:, :self._countInformationSymbols]
+
+    def _check_bytes(self, data: bytes, count_symbols: int) -> None:
+        if len(data) % count_symbols != 0:
+            raise CodingException(
+                message=CodingException.LENGTH_OF_BYTES_INCORRECT.message,
+                long_message=CodingException.LENGTH_OF_BYTES_INCORRECT.long_message.format(
+                    self.name, len(data), count_symbols),
+            )
+
+    def encoding_bytes(self, data: bytes) -> bytes:
+        """
+        Method provide functionality for encoding of bytes, each information symbols form codeword
+        :param data: bytes Length should be multiple of quantity of information symbols
+        :return: bytes Codewords
+        """
+        self._check_bytes(data, self._countInformationSymbols)
+        symbols: np.ndarray = np.frombuffer(data, dtype=np.uint8)
+        return self.encode_symbols(symbols).astype(np.uint8).tobytes()
+
+    def decoding_bytes(self, data: bytes) -> bytes:
+        """
+        :param data: bytes Codewords, length should be multiple of quantity of symbols
+        :return: bytes Information symbols
+        """
+        self._check_bytes(data, self._countSymbols)
+        symbols: np.ndarray = np.frombuffer(data, dtype=np.uint8)
+        return self.decode_symbols(symbols).astype(np.uint8).tobytes()
+
+    def _check_length(self, information: List[int]) -> None:
+        if len(information) != self.lengthTotal:
+            raise CodingException(
+                message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.message,
+                long_message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.long_message.format(
+                    self.name, self.lengthTotal, len(information)),
+            )
+
+    def _to_symbols(self, bits: np.ndarray) -> np.ndarray:
+        return np.packbits(np.asarray(bits, dtype=np.uint8), axis=-1).astype(np.int64)
+
+    @staticmethod
+    def _to_bits(symbols: np.ndarray) -> np.ndarray:
+        return np.unpackbits(symbols.astype(np.uint8), axis=-1)
+
+    def encoding(self, information: List[int]) -> List[int]:
+        log.info("Encoding package {0} of Reed-Solomon _coder".format(information))
+        symbols: np.ndarray = self._to_symbols(self.try_normalization(information))
+        return self._to_bits(self.encode_symbols(symbols)[0]).tolist()
+
+    def encoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[List[int]]:
+        if any(len(package) != self.lengthInformation for package in packages):
+            return super().encoding_batch(packages)
+        symbols: np.ndarray = self._to_symbols(np.asarray(packages).reshape(-1, self.lengthInformation))
+        return self._to_bits(self.encode_symbols(symbols)).tolist()
+
+    def decoding(self, information: List[int]) -> List[int]:
+        log.info("Decoding package {0} of Reed-Solomon _coder".format(information))
+        self._check_length(information)
+        return self._to_bits(self.decode_symbols(self._to_symbols(information))[0]).tolist()
+
+    def decoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[Optional[List[int]]]:
+        if any(len(package) != self.lengthTotal for package in packages):
+            return super().decoding_batch(packages)
+        symbols: np.ndarray = self._to_symbols(np.asarray(packages).reshape(-1, self.lengthTotal))
+        return self._to_bits(self.decode_symbols(symbols)).tolist()
+
+    def to_json(self) -> Dict:
+        return {
+            'name': self.name,
+            'length _information word': self.lengthInformation,
+            'length additional bits': self.lengthAdditional,
+            'length coding word': self.lengthTotal,
+            'count symbols': self._countSymbols,
+            'count information symbols': self._countInformationSymbols,
+            'generator polynomial': self.generator_polynomial,
+            'speed': self.get_speed(),
+        }
+
+    def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import reed_solomon_table
+        connection.execute(reed_solomon_table.insert().values(
+            guid=coder_guid,
+            count_symbols=self._countSymbols,
+            count_information_symbols=self._countInformationSymbols,
+            generator_polynomial=self.generator_polynomial,
+        ))
+
+    class ReedSolomonCoderParser(AbstractGroupParser):
+        _prefix: str = ""
+        __COUNT_SYMBOLS: str = "reed_solomon_count_symbols"
+        __COUNT_INFORMATION_SYMBOLS: str = "reed_solomon_count_information_symbols"
+
+        def __init__(
+                self,
+                argument_parser: Optional[argparse.ArgumentParser] = None,
+                argument_group=None,
+                prefix: str = ""
+        ):
+            super().__init__(
+                argument_parser=argument_parser,
+                argument_group=argument_group
+            )
+            self._prefix = prefix
+
+            self._argumentParser.add_argument(
+                "-{0}rsn".format(prefix), "--{0}{1}".format(prefix, self.__COUNT_SYMBOLS),
+                type=int,
+                default=255,
+                help="Quantity of bytes of codeword of Reed-Solomon _coder (up to 255)"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}rsk".format(prefix), "--{0}{1}".format(prefix, self.__COUNT_INFORMATION_SYMBOLS),
+                type=int,
+                default=223,
+                help="Quantity of information bytes of codeword of Reed-Solomon _coder"
+            )
+
+            # We should parse arguments only for unique _coder
+            if self._argumentGroup is None:
+                self.arguments = vars(self._argumentParser.parse_args())
+
+        @property
+        def reed_solomon_count_symbols(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__COUNT_SYMBOLS)]
+
+        @property
+        def reed_solomon_count_information_symbols(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__COUNT_INFORMATION_SYMBOLS)]
+
+    @staticmethod
+    def get_coder_parameters(
+            argument_parser: Optional[argparse.ArgumentParser] = None,
+            argument_group=None,
+            prefix: str = ""
+    ):
+        return Coder.ReedSolomonCoderParser(
+            argument_parser=argument_parser,
+            argument_group=argument_group,
+            prefix=prefix
+        )
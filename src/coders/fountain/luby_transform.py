@@ -7,14 +7,16 @@ from uuid import UUID
 
 from math import ceil
 
+import numpy as np
+
 from src.coders import abstract_coder
 from src.coders.casts import bit_list_to_int, bit_list_to_int_list, int_to_bit_list
 from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+from src.helper import jit
 from src.helper.error.exception.GUI.setting_exception import SettingException
 from src.helper.error.exception.codding_exception import CodingException
 from src.logger import log
 from src.statistics.db.enum_coders_type import EnumCodersType
-from src.statistics.db.table import fountain_table
 
 
 class Coder(abstract_coder.AbstractCoder):
@@ -82,40 +84,27 @@ class Coder(abstract_coder.AbstractCoder):
         :return: list Декодированная информация, представленная в виде массива битов
         """
         log.info("Fountain LT-decoder decoding of package {0}".format(information))
-        decoded_set_list: list = [set(bit_list_to_int_list(int_to_bit_list(x, self._sizeBlock))) for x in
-                                  self._generationBlocks]
-        decoded_set_list.append(set())  # костыль, чтобы работало
-        is_kill: bool = False
-
-        # Divided into blocks
-        status: list = [False for x in range(self._countBlocks)]
-        status.append(True)  # One block should be always true
-
-        block_int_values: List[int] = []
-        for num_of_block in range(0, len(information), self._sizeBlock):
-            help_data: list = []
-            for num_of_bit in range(self._sizeBlock):
-                if (num_of_block + num_of_bit) < len(information):
-                    help_data.append(information[num_of_block + num_of_bit])
-            block_int_values.append(bit_list_to_int(help_data))
-        block_int_values.append(0)  # One block should be always 0
-
-        answer: list = [0] * self._countCodingBlocks
-        while not is_kill and {True} != set(status):
-            is_kill = True
-            for iterator_f in range(len(decoded_set_list)):
-                for iterator_s in range(len(decoded_set_list)):
-                    difference = decoded_set_list[iterator_f] - decoded_set_list[iterator_s]
-                    if len(difference) == 1 and (decoded_set_list[iterator_s] - decoded_set_list[iterator_f]) == set():
-                        is_kill = False
-                        status[list(difference)[0]] = True
-                        answer[list(difference)[0]] = block_int_values[iterator_f] ^ block_int_values[iterator_s]
-                        for z in range(len(decoded_set_list)):
-                            if list(difference)[0] in decoded_set_list[z]:
-                                block_int_values[z] ^= answer[list(difference)[0]]
-                                decoded_set_list[z] = decoded_set_list[z] - difference
-
-        if set(status) != {True}:
+        # Blocks of each combination, the last combination is empty and its value is zero
+        sets: np.ndarray = np.zeros((len(self._generationBlocks) + 1, self._countBlocks), dtype=bool)
+        for iterator, generation_block in enumerate(self._generationBlocks):
+            sets[iterator, bit_list_to_int_list(int_to_bit_list(generation_block, self._sizeBlock))] = True
+
+        # Divided into blocks, bits of each block are aligned by the least significant bit
+        block_values: np.ndarray = np.zeros((len(sets), self._sizeBlock), dtype=np.uint8)
+        for number, num_of_block in enumerate(range(0, len(information), self._sizeBlock)):
+            help_data: list = information[num_of_block:num_of_block + self._sizeBlock]
+            block_values[number, self._sizeBlock - len(help_data):] = help_data
+
+        status: np.ndarray = np.zeros(self._countBlocks, dtype=bool)
+        answer_values: np.ndarray = np.zeros((max(self._countCodingBlocks, self._countBlocks), self._sizeBlock),
+                                             dtype=np.uint8)
+        if jit.ENABLED:
+            _peel_kernel(sets, block_values, status, answer_values)
+        else:
+            _peel(sets, block_values, status, answer_values)
+        answer: list = [bit_list_to_int(bits) for bits in answer_values.tolist()]
+
+        if not status.all():
             log.debug("Lacks of blocks for decoding package with fountain _coder")
             raise CodingException(
                 message=CodingException.LACKS_OF_BLOCKS_FOR_DECODING.message,
@@ -145,6 +134,7 @@ class Coder(abstract_coder.AbstractCoder):
         }
 
     def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import fountain_table
         connection.execute(fountain_table.insert().values(
             guid=coder_guid,
             count_info_block=self._countCodingBlocks,
@@ -216,3 +206,67 @@ class Coder(abstract_coder.AbstractCoder):
             argument_group=argument_group,
             prefix=prefix
         )
+
+
+def _peel(sets: np.ndarray, values: np.ndarray, status: np.ndarray, answer: np.ndarray) -> None:
+    """
+    Function provide functionality for solving of combinations: if the first combination contains all blocks of
+    the second one and one more block, value of this block is sum of their values and it's removed
+    from all combinations. Pairs are checked in the same order as by kernel, but all pairs of pass are found
+    by one matrix product
+    :param sets: np.ndarray Blocks of each combination with shape (combinations, blocks), it's changed in place
+    :param values: np.ndarray Bits of combinations with shape (combinations, size of block), it's changed in place
+    :param status: np.ndarray Flags of solved blocks
+    :param answer: np.ndarray Bits of solved blocks with shape (at least blocks, size of block)
+    """
+    count_sets: int = len(sets)
+    position: int = 0
+    flg_changed: bool = False
+    while not status.all():
+        # Quantity of blocks of the first combination which aren't in the second one for each pair
+        differences: np.ndarray = sets.astype(np.int64) @ (~sets).T.astype(np.int64)
+        pairs: np.ndarray = np.flatnonzero(((differences == 1) & (differences.T == 0)).reshape(-1)[position:])
+        if not len(pairs):
+            # Next pass is made only if something was solved by this one
+            if not flg_changed:
+                break
+            position, flg_changed = 0, False
+            continue
+
+        first, second = divmod(position + int(pairs[0]), count_sets)
+        block: int = int(np.flatnonzero(sets[first] & ~sets[second])[0])
+        status[block] = True
+        answer[block] = values[first] ^ values[second]
+        values[sets[:, block]] ^= answer[block]
+        sets[:, block] = False
+        position, flg_changed = first * count_sets + second + 1, True
+
+
+@jit.kernel
+def _peel_kernel(sets: np.ndarray, values: np.ndarray, status: np.ndarray, answer: np.ndarray) -> None:
+    count_sets, count_blocks = sets.shape
+    flg_changed: bool = True
+    while flg_changed and not status.all():
+        flg_changed = False
+        for first in range(count_sets):
+            for second in range(count_sets):
+                block: int = -1
+                for column in range(count_blocks):
+                    if sets[first, column] and not sets[second, column]:
+                        if block >= 0:
+                            block = -2
+                            break
+                        block = column
+                    elif sets[second, column] and not sets[first, column]:
+                        block = -2
+                        break
+                if block < 0:
+                    continue
+
+                flg_changed = True
+                status[block] = True
+                answer[block] = values[first] ^ values[second]
+                for row in range(count_sets):
+                    if sets[row, block]:
+                        values[row] ^= answer[block]
+                        sets[row, block] = False
@@ -0,0 +1,207 @@
+# coding=utf-8
+import argparse
+from sqlite3 import Connection
+from typing import Dict, List, Optional, Union
+from uuid import UUID
+
+import numpy as np
+
+from src.coders.ldpc.min_sum import MinSumDecoder
+from src.coders.ldpc.parity_check_matrix import ParityCheckMatrix
+from src.coders.linear import linear_block
+from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+from src.logger import log
+from src.statistics.db.enum_coders_type import EnumCodersType
+
+
+class Coder(linear_block.Coder):
+    """
+    LDPC coder defined by sparse parity check matrix. Encoding is systematic like encoding of linear block coder,
+    decoding is made by layered min-sum decoder with early termination on zero syndrome.
+    Decoder isn't maximum likelihood one: if it doesn't converge information bits of the last hard decision
+    are returned
+    """
+    _typeOfCoder: EnumCodersType = EnumCodersType.LDPC
+    _name: str = "LDPC"
+    # Syndrome table isn't used
+    MAX_SYNDROME_TABLE_BITS: int = -1
+
+    _matrix: ParityCheckMatrix
+    _decoder: MinSumDecoder
+    _maxIterations: int
+
+    def __init__(self, parity_check_matrix: ParityCheckMatrix, max_iterations: int = 20):
+        log.debug("Create LDPC _coder")
+        super().__init__(parity_check_matrix=parity_check_matrix.to_dense())
+        self._matrix = parity_check_matrix
+        self._decoder = MinSumDecoder(parity_check_matrix)
+        self._maxIterations = max_iterations
+
+    @staticmethod
+    def get_parity_check_matrix(
+            length: Optional[int] = None,
+            column_weight: Optional[int] = None,
+            row_weight: Optional[int] = None,
+            seed: Optional[int] = None,
+            alist: Optional[str] = None,
+    ) -> ParityCheckMatrix:
+        """
+        :param length: Optional[int] Length of codeword of generated matrix
+        :param column_weight: Optional[int]
+        :param row_weight: Optional[int]
+        :param seed: Optional[int]
+        :param alist: Optional[str] File with matrix, it's used instead of generation
+        :return: ParityCheckMatrix
+        """
+        if alist is not None:
+            return ParityCheckMatrix.load_alist(alist)
+        return ParityCheckMatrix.generate(int(length), int(column_weight), int(row_weight), int(seed or 0))
+
+    @property
+    def matrix(self) -> ParityCheckMatrix:
+        return self._matrix
+
+    @property
+    def max_iterations(self) -> int:
+        return self._maxIterations
+
+    def decoding(self, information: List[int]) -> List[int]:
+        log.info("Decoding package {0} of LDPC _coder".format(information))
+        self._check_length(information)
+        return self._decode(np.array([information], dtype=np.uint8))[0]
+
+    def decoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[Optional[List[int]]]:
+        if any(len(package) != self.lengthTotal for package in packages):
+            return super().decoding_batch(packages)
+        return self._decode(np.array(packages, dtype=np.uint8).reshape(-1, self.lengthTotal))
+
+    def _decode(self, received: np.ndarray) -> List[List[int]]:
+        # Hard decisions of channel have the same reliability
+        channel_llr: np.ndarray = 1.0 - 2.0 * received
+        hard_decisions: np.ndarray = self._decoder.decode(channel_llr, self._maxIterations)
+        return hard_decisions[:, self._informationColumns].tolist()
+
+    def to_json(self) -> Dict:
+        return {
+            'name': self.name,
+            'length _information word': self.lengthInformation,
+            'length additional bits': self.lengthAdditional,
+            'length coding word': self.lengthTotal,
+            'count checks': self._matrix.countChecks,
+            'count edges': self._matrix.count_edges,
+            'count layers': self._decoder.count_layers,
+            'max iterations': self._maxIterations,
+            'speed': self.get_speed(),
+        }
+
+    def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import ldpc_table
+        connection.execute(ldpc_table.insert().values(
+            guid=coder_guid,
+            length_total=self.lengthTotal,
+            length_information=self.lengthInformation,
+            check_indexes=self._matrix.checkIndexes.tolist(),
+            variable_indexes=self._matrix.variableIndexes.tolist(),
+            max_iterations=self._maxIterations,
+        ))
+
+    class LdpcCoderParser(AbstractGroupParser):
+        _prefix: str = ""
+        __LENGTH: str = "ldpc_length"
+        __COLUMN_WEIGHT: str = "ldpc_column_weight"
+        __ROW_WEIGHT: str = "ldpc_row_weight"
+        __SEED: str = "ldpc_seed"
+        __ALIST: str = "ldpc_alist"
+        __MAX_ITERATIONS: str = "ldpc_max_iterations"
+
+        def __init__(
+                self,
+                argument_parser: Optional[argparse.ArgumentParser] = None,
+                argument_group=None,
+                prefix: str = ""
+        ):
+            super().__init__(
+                argument_parser=argument_parser,
+                argument_group=argument_group
+            )
+            self._prefix = prefix
+
+            self._argumentParser.add_argument(
+                "-{0}ldpcl".format(prefix), "--{0}{1}".format(prefix, self.__LENGTH),
+                type=int,
+                help="Length of codeword of generated LDPC matrix, it should be divisible by row weight"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}ldpccw".format(prefix), "--{0}{1}".format(prefix, self.__COLUMN_WEIGHT),
+                type=int,
+                default=3,
+                help="Quantity of checks of each bit of generated LDPC matrix"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}ldpcrw".format(prefix), "--{0}{1}".format(prefix, self.__ROW_WEIGHT),
+                type=int,
+                default=6,
+                help="Quantity of bits of each check of generated LDPC matrix"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}ldpcs".format(prefix), "--{0}{1}".format(prefix, self.__SEED),
+                type=int,
+                default=0,
+                help="Seed of generated LDPC matrix"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}ldpca".format(prefix), "--{0}{1}".format(prefix, self.__ALIST),
+                type=str,
+                help="File with LDPC matrix in alist format (instead of generated matrix)"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}ldpci".format(prefix), "--{0}{1}".format(prefix, self.__MAX_ITERATIONS),
+                type=int,
+                default=20,
+                help="Maximal quantity of iterations of LDPC decoder"
+            )
+
+            # We should parse arguments only for unique _coder
+            if self._argumentGroup is None:
+                self.arguments = vars(self._argumentParser.parse_args())
+
+        @property
+        def ldpc_length(self) -> Optional[int]:
+            return self.arguments["{0}{1}".format(self._prefix, self.__LENGTH)]
+
+        @property
+        def ldpc_column_weight(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__COLUMN_WEIGHT)]
+
+        @property
+        def ldpc_row_weight(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__ROW_WEIGHT)]
+
+        @property
+        def ldpc_seed(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__SEED)]
+
+        @property
+        def ldpc_alist(self) -> Optional[str]:
+            return self.arguments["{0}{1}".format(self._prefix, self.__ALIST)]
+
+        @property
+        def ldpc_max_iterations(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__MAX_ITERATIONS)]
+
+    @staticmethod
+    def get_coder_parameters(
+            argument_parser: Optional[argparse.ArgumentParser] = None,
+            argument_group=None,
+            prefix: str = ""
+    ):
+        return Coder.LdpcCoderParser(
+            argument_parser=argument_parser,
+            argument_group=argument_group,
+            prefix=prefix
+        )
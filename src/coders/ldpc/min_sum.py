@@ -0,0 +1,112 @@
+# coding=utf-8
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from src.coders.ldpc.parity_check_matrix import ParityCheckMatrix
+
+
+@dataclass
+class MinSumLayer:
+    """
+    Checks without common variables, edges of each check are contiguous
+    """
+    # Indexes of edges in messages
+    edges: np.ndarray
+    # Variable of each edge
+    variables: np.ndarray
+    # Position of the first edge of each check in edges
+    starts: np.ndarray
+    # Quantity of edges of each check
+    counts: np.ndarray
+
+
+class MinSumDecoder:
+    """
+    Layered normalized min-sum decoder. Batch of words is processed at once: layers are processed one by one,
+    checks of layer - by operations over arrays with shape (words, edges of layer).
+    Words with zero syndrome are removed from processing
+    """
+    # Messages are multiplied by this value to compensate overestimation of min-sum approximation
+    SCALE: float = 0.75
+    # Message of check with single edge, it isn't infinity to avoid nan in subtraction
+    MAX_MAGNITUDE: float = 1e6
+
+    _matrix: ParityCheckMatrix
+    _layers: List[MinSumLayer]
+    # Position of the first edge of each not empty check
+    _checkStarts: np.ndarray
+
+    def __init__(self, matrix: ParityCheckMatrix):
+        self._matrix = matrix
+        self._layers = [self._get_layer(edges) for edges in matrix.get_layers() if len(edges)]
+        self._checkStarts = np.flatnonzero(np.diff(matrix.checkIndexes, prepend=-1))
+
+    @property
+    def count_layers(self) -> int:
+        return len(self._layers)
+
+    def _get_layer(self, edges: np.ndarray) -> MinSumLayer:
+        starts: np.ndarray = np.flatnonzero(np.diff(self._matrix.checkIndexes[edges], prepend=-1))
+        return MinSumLayer(
+            edges=edges,
+            variables=self._matrix.variableIndexes[edges],
+            starts=starts,
+            counts=np.diff(starts, append=len(edges)),
+        )
+
+    def get_syndromes(self, hard_decisions: np.ndarray) -> np.ndarray:
+        """
+        :param hard_decisions: np.ndarray Bits with shape (words, length)
+        :return: np.ndarray Syndromes of not empty checks with shape (words, checks)
+        """
+        return np.add.reduceat(
+            hard_decisions[:, self._matrix.variableIndexes], self._checkStarts, axis=1, dtype=np.int32
+        ) & 1
+
+    def _update_layer(self, layer: MinSumLayer, posterior: np.ndarray, messages: np.ndarray) -> None:
+        extrinsic: np.ndarray = posterior[:, layer.variables] - messages[:, layer.edges]
+        magnitudes: np.ndarray = np.abs(extrinsic)
+        signs: np.ndarray = extrinsic < 0
+
+        minimums: np.ndarray = np.minimum.reduceat(magnitudes, layer.starts, axis=1)
+        edge_minimums: np.ndarray = np.repeat(minimums, layer.counts, axis=1)
+        is_minimum: np.ndarray = magnitudes == edge_minimums
+        # Edge with minimal magnitude gets the second minimum, if minimum is repeated both minimums are equal
+        second_minimums: np.ndarray = np.minimum.reduceat(
+            np.where(is_minimum, self.MAX_MAGNITUDE, magnitudes), layer.starts, axis=1)
+        repeated: np.ndarray = np.add.reduceat(is_minimum, layer.starts, axis=1, dtype=np.int32) > 1
+        second_minimums = np.where(repeated, minimums, second_minimums)
+
+        parities: np.ndarray = np.add.reduceat(signs, layer.starts, axis=1, dtype=np.int32) & 1
+        negative: np.ndarray = np.repeat(parities, layer.counts, axis=1).astype(bool) ^ signs
+        updated: np.ndarray = self.SCALE * np.where(
+            is_minimum, np.repeat(second_minimums, layer.counts, axis=1), edge_minimums)
+        updated = np.where(negative, -updated, updated)
+
+        messages[:, layer.edges] = updated
+        posterior[:, layer.variables] = extrinsic + updated
+
+    def decode(self, channel_llr: np.ndarray, max_iterations: int) -> np.ndarray:
+        """
+        Method provide functionality for decoding of batch of words
+        :param channel_llr: np.ndarray Log-likelihood ratios log(P(0) / P(1)) with shape (words, length)
+        :param max_iterations: int Maximal quantity of iterations (passes over all layers)
+        :return: np.ndarray Hard decisions with shape (words, length)
+        """
+        hard_decisions: np.ndarray = (np.asarray(channel_llr) < 0).astype(np.uint8)
+        posterior: np.ndarray = np.array(channel_llr, dtype=np.float64)
+        messages: np.ndarray = np.zeros((len(posterior), self._matrix.count_edges), dtype=np.float64)
+        # Rows of batch which are processed yet
+        rows: np.ndarray = np.arange(len(posterior))
+        for _ in range(max_iterations):
+            unsolved: np.ndarray = self.get_syndromes(hard_decisions[rows]).any(axis=1)
+            if not unsolved.all():
+                rows, posterior, messages = rows[unsolved], posterior[unsolved], messages[unsolved]
+            if not len(rows):
+                break
+            for layer in self._layers:
+                self._update_layer(layer, posterior, messages)
+            hard_decisions[rows] = posterior < 0
+        return hard_decisions
@@ -0,0 +1,166 @@
+# coding=utf-8
+from typing import List, Set
+
+import numpy as np
+
+from src.helper.error.exception.codding_exception import CodingException
+
+
+class ParityCheckMatrix:
+    """
+    Sparse parity check matrix of LDPC code stored as list of edges (check, variable) sorted by check,
+    so edges of each check are contiguous (like columns of CSR format)
+    """
+    countChecks: int
+    countVariables: int
+    checkIndexes: np.ndarray
+    variableIndexes: np.ndarray
+
+    def __init__(self, count_checks: int, count_variables: int, check_indexes: List[int], variable_indexes: List[int]):
+        checks: np.ndarray = np.array(check_indexes, dtype=np.int64)
+        variables: np.ndarray = np.array(variable_indexes, dtype=np.int64)
+        if len(checks) == 0 or len(checks) != len(variables) \
+                or not (0 <= checks.min() and checks.max() < count_checks) \
+                or not (0 <= variables.min() and variables.max() < count_variables):
+            raise CodingException(
+                message=CodingException.LDPC_MATRIX_INCORRECT.message,
+                long_message=CodingException.LDPC_MATRIX_INCORRECT.long_message.format(count_checks, count_variables),
+            )
+
+        # Repeated edges cancel each other over GF(2)
+        edges, counts = np.unique(checks * count_variables + variables, return_counts=True)
+        edges = edges[counts % 2 == 1]
+
+        self.countChecks = count_checks
+        self.countVariables = count_variables
+        self.checkIndexes = edges // count_variables
+        self.variableIndexes = edges % count_variables
+        self.checkIndexes.setflags(write=False)
+        self.variableIndexes.setflags(write=False)
+
+    @property
+    def count_edges(self) -> int:
+        return len(self.checkIndexes)
+
+    def to_dense(self) -> List[List[int]]:
+        matrix: np.ndarray = np.zeros((self.countChecks, self.countVariables), dtype=np.uint8)
+        matrix[self.checkIndexes, self.variableIndexes] = 1
+        return matrix.tolist()
+
+    def get_layers(self) -> List[np.ndarray]:
+        """
+        Method provide functionality for greedy grouping of checks into layers, checks of one layer don't have
+        common variables, so they can be processed by layered decoder at once
+        :return: List[np.ndarray] Indexes of edges of each layer sorted by check
+        """
+        row_starts: np.ndarray = np.searchsorted(self.checkIndexes, np.arange(self.countChecks + 1))
+        layer_variables: List[Set[int]] = []
+        layer_checks: List[List[int]] = []
+        for check in range(self.countChecks):
+            variables: Set[int] = set(self.variableIndexes[row_starts[check]:row_starts[check + 1]].tolist())
+            for number, used_variables in enumerate(layer_variables):
+                if used_variables.isdisjoint(variables):
+                    used_variables.update(variables)
+                    layer_checks[number].append(check)
+                    break
+            else:
+                layer_variables.append(variables)
+                layer_checks.append([check])
+
+        return [
+            np.concatenate([np.arange(row_starts[check], row_starts[check + 1]) for check in checks])
+            for checks in layer_checks
+        ]
+
+    @staticmethod
+    def generate(length: int, column_weight: int, row_weight: int, seed: int = 0) -> 'ParityCheckMatrix':
+        """
+        Method provide functionality for generating of regular matrix by Gallager construction: the first band has
+        row_weight consecutive ones in each row, other bands are random permutations of columns of the first band
+        :param length: int Length of codeword, it should be divisible by row_weight
+        :param column_weight: int Quantity of checks of each variable (quantity of bands)
+        :param row_weight: int Quantity of variables of each check
+        :param seed: int Seed of permutations
+        :return: ParityCheckMatrix
+        """
+        if length <= 0 or column_weight <= 0 or row_weight <= 1 or length % row_weight != 0:
+            raise CodingException(
+                message=CodingException.LDPC_PARAMETERS_INCORRECT.message,
+                long_message=CodingException.LDPC_PARAMETERS_INCORRECT.long_message.format(
+                    length, column_weight, row_weight),
+            )
+        random_generator: np.random.RandomState = np.random.RandomState(seed)
+        count_band_checks: int = length // row_weight
+        band_checks: np.ndarray = np.arange(length) // row_weight
+        check_indexes: List[np.ndarray] = []
+        variable_indexes: List[np.ndarray] = []
+        for band in range(column_weight):
+            variables: np.ndarray = np.arange(length) if band == 0 else random_generator.permutation(length)
+            check_indexes.append(band_checks + band * count_band_checks)
+            variable_indexes.append(variables)
+        return ParityCheckMatrix(
+            count_band_checks * column_weight,
+            length,
+            np.concatenate(check_indexes).tolist(),
+            np.concatenate(variable_indexes).tolist(),
+        )
+
+    @staticmethod
+    def load_alist(file_name: str) -> 'ParityCheckMatrix':
+        """
+        Method provide functionality for loading of matrix from file in alist format (MacKay):
+        sizes, maximal weights, weights of columns and rows, then indexes (from 1) of checks of each column
+        and indexes of variables of each row, zeros are padding
+        :param file_name: str
+        :return: ParityCheckMatrix
+        """
+        with open(file_name, encoding='UTF-8') as alist_file:
+            values: List[int] = [int(value) for value in alist_file.read().split()]
+        try:
+            count_variables, count_checks = values[0], values[1]
+            column_weights: List[int] = values[4:4 + count_variables]
+            position: int = 4 + count_variables + count_checks
+            check_indexes: List[int] = []
+            variable_indexes: List[int] = []
+            for variable in range(count_variables):
+                # Columns can be padded by zeros to maximal weight
+                column: List[int] = values[position:position + values[2]]
+                checks: List[int] = [check - 1 for check in column if check != 0]
+                if len(checks) != column_weights[variable]:
+                    raise ValueError
+                check_indexes.extend(checks)
+                variable_indexes.extend([variable] * len(checks))
+                position += values[2]
+        except (IndexError, ValueError) as error:
+            raise CodingException(
+                message=CodingException.LDPC_ALIST_INCORRECT.message,
+                long_message=CodingException.LDPC_ALIST_INCORRECT.long_message.format(file_name),
+                previous=error,
+            )
+        return ParityCheckMatrix(count_checks, count_variables, check_indexes, variable_indexes)
+
+    def save_alist(self, file_name: str) -> None:
+        """
+        Method provide functionality for storing of matrix in alist format
+        :param file_name: str
+        :return: None
+        """
+        columns: List[List[int]] = [[] for _ in range(self.countVariables)]
+        rows: List[List[int]] = [[] for _ in range(self.countChecks)]
+        for check, variable in zip(self.checkIndexes.tolist(), self.variableIndexes.tolist()):
+            columns[variable].append(check + 1)
+            rows[check].append(variable + 1)
+        max_column_weight: int = max(len(column) for column in columns)
+        max_row_weight: int = max(len(row) for row in rows)
+
+        lines: List[str] = [
+            "{0} {1}".format(self.countVariables, self.countChecks),
+            "{0} {1}".format(max_column_weight, max_row_weight),
+            " ".join(str(len(column)) for column in columns),
+            " ".join(str(len(row)) for row in rows),
+        ]
+        lines += [" ".join(str(index) for index in column + [0] * (max_column_weight - len(column)))
+                  for column in columns]
+        lines += [" ".join(str(index) for index in row + [0] * (max_row_weight - len(row))) for row in rows]
+        with open(file_name, "w", encoding='UTF-8') as alist_file:
+            alist_file.write("\n".join(lines) + "\n")
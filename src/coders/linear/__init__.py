@@ -1,2 +1,3 @@
 # coding=utf-8
 import src.coders.linear.hamming
+import src.coders.linear.linear_block
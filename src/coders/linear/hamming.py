@@ -12,7 +12,6 @@ from src.coders.casts import *
 from src.endpoint.console.abstract_group_parser import AbstractGroupParser
 from src.logger import log
 from src.statistics.db.enum_coders_type import EnumCodersType
-from src.statistics.db.table import hamming_table
 
 
 class Coder(abstract_coder.AbstractCoder):
@@ -130,6 +129,7 @@ class Coder(abstract_coder.AbstractCoder):
         }
 
     def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import hamming_table
         # noinspection PyUnresolvedReferences
         connection.execute(hamming_table.insert().values(
             guid=coder_guid,
@@ -0,0 +1,281 @@
+# coding=utf-8
+import argparse
+from sqlite3 import Connection
+from typing import Dict, List, Optional, Union
+from uuid import UUID
+
+import numpy as np
+
+from src.coders import abstract_coder
+from src.coders.casts import bit_list_to_int, int_to_bit_list
+from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+from src.helper.calc.gf2_calculation import GF2Calculation
+from src.helper.error.exception.codding_exception import CodingException
+from src.logger import log
+from src.statistics.db.enum_coders_type import EnumCodersType
+
+
+class Coder(abstract_coder.AbstractCoder):
+    """
+    Linear block coder over GF(2) defined by generator or parity check matrix.
+    Generator matrix is reduced to row echelon form, so code is systematic: information bits are placed
+    in pivot columns of codeword. Decoder corrects error with minimal weight (coset leader) of syndrome
+    """
+    _typeOfCoder: EnumCodersType = EnumCodersType.LINEAR_BLOCK
+    _name: str = "Linear block"
+    # Syndrome table is built if quantity of check bits doesn't exceed this value,
+    # otherwise only single errors are corrected
+    MAX_SYNDROME_TABLE_BITS: int = 16
+
+    # Packed rows of matrices, the most significant bit corresponds to the first column
+    _generatorRows: List[int]
+    _parityCheckRows: List[int]
+    # Positions of information bits in codeword
+    _informationColumns: List[int]
+    # Matrices of bits for batch processing
+    _generatorMatrix: np.ndarray
+    _parityCheckMatrix: np.ndarray
+    # Packed syndrome of single error in each position
+    _columnSyndromes: List[int]
+    # Syndrome table as tree: coset leader of syndrome equals coset leader of parent syndrome with one more error
+    # in position of syndrome, None if table isn't built
+    _syndromeParents: Optional[np.ndarray] = None
+    _syndromePositions: Optional[np.ndarray] = None
+
+    def __init__(
+            self,
+            generator_matrix: Optional[List[List[int]]] = None,
+            parity_check_matrix: Optional[List[List[int]]] = None,
+    ):
+        log.debug("Create linear block _coder")
+        matrix: Optional[List[List[int]]] = generator_matrix if generator_matrix is not None else parity_check_matrix
+        if (generator_matrix is None) == (parity_check_matrix is None) or not matrix or not matrix[0] \
+                or any(len(row) != len(matrix[0]) or any(bit not in (0, 1) for bit in row) for row in matrix):
+            raise CodingException(
+                message=CodingException.LINEAR_MATRIX_INCORRECT.message,
+                long_message=CodingException.LINEAR_MATRIX_INCORRECT.long_message.format(matrix),
+            )
+
+        self.lengthTotal = len(matrix[0])
+        rows: List[int] = [bit_list_to_int(row) for row in matrix]
+        if generator_matrix is not None:
+            self._generatorRows, self._informationColumns = GF2Calculation.get_reduced_row_echelon_form(
+                rows, self.lengthTotal)
+            if len(self._generatorRows) != len(rows):
+                raise CodingException(
+                    message=CodingException.LINEAR_MATRIX_INCORRECT.message,
+                    long_message=CodingException.LINEAR_MATRIX_INCORRECT.long_message.format(matrix),
+                )
+            self._parityCheckRows = GF2Calculation.get_dual_rows(self._generatorRows, self.lengthTotal)
+        else:
+            # Dependent rows of parity check matrix are removed
+            self._parityCheckRows, _ = GF2Calculation.get_reduced_row_echelon_form(rows, self.lengthTotal)
+            self._generatorRows, self._informationColumns = GF2Calculation.get_reduced_row_echelon_form(
+                GF2Calculation.get_dual_rows(self._parityCheckRows, self.lengthTotal), self.lengthTotal)
+
+        self.lengthInformation = len(self._generatorRows)
+        self.lengthAdditional = self.lengthTotal - self.lengthInformation
+        self._generatorMatrix = np.array(
+            [int_to_bit_list(row, self.lengthTotal) for row in self._generatorRows], dtype=np.uint8
+        ).reshape(self.lengthInformation, self.lengthTotal)
+        self._parityCheckMatrix = np.array(
+            [int_to_bit_list(row, self.lengthTotal) for row in self._parityCheckRows], dtype=np.uint8
+        ).reshape(self.lengthAdditional, self.lengthTotal)
+        self._columnSyndromes = [
+            bit_list_to_int(column) for column in self._parityCheckMatrix.T.tolist()
+        ] if self.lengthAdditional else [0] * self.lengthTotal
+
+        if self.lengthAdditional <= self.MAX_SYNDROME_TABLE_BITS:
+            self._build_syndrome_table()
+
+    @staticmethod
+    def get_matrix(value: Optional[str]) -> Optional[List[List[int]]]:
+        """
+        :param value: Optional[str] Rows of matrix separated by comma (e.g. "1000110,0100101,0010011,0001111")
+        :return: Optional[List[List[int]]]
+        """
+        if value is None:
+            return None
+        return [[int(bit) for bit in row.strip()] for row in value.split(",")]
+
+    @property
+    def generator_matrix(self) -> List[List[int]]:
+        return self._generatorMatrix.tolist()
+
+    @property
+    def parity_check_matrix(self) -> List[List[int]]:
+        return self._parityCheckMatrix.tolist()
+
+    @property
+    def information_columns(self) -> List[int]:
+        return list(self._informationColumns)
+
+    def _build_syndrome_table(self) -> None:
+        """
+        Method provide functionality for building of syndrome table by breadth-first search over syndromes:
+        syndromes of layer w are syndromes of errors with weight w, the first found error is coset leader
+        :return: None
+        """
+        parents: np.ndarray = np.full(1 << self.lengthAdditional, -1, dtype=np.int64)
+        positions: np.ndarray = np.full(1 << self.lengthAdditional, -1, dtype=np.int64)
+        parents[0] = 0
+        column_syndromes: np.ndarray = np.array(self._columnSyndromes, dtype=np.int64)
+        layer: np.ndarray = np.zeros(1, dtype=np.int64)
+        while len(layer):
+            candidates: np.ndarray = (layer[:, np.newaxis] ^ column_syndromes).ravel()
+            syndromes, indexes = np.unique(candidates, return_index=True)
+            unknown: np.ndarray = parents[syndromes] < 0
+            syndromes, indexes = syndromes[unknown], indexes[unknown]
+            parents[syndromes] = layer[indexes // self.lengthTotal]
+            positions[syndromes] = indexes % self.lengthTotal
+            layer = syndromes
+
+        self._syndromeParents = parents
+        self._syndromePositions = positions
+
+    def _get_syndrome(self, word: int) -> int:
+        syndrome: int = 0
+        for row in self._parityCheckRows:
+            syndrome = (syndrome << 1) | ((word & row).bit_count() & 1)
+        return syndrome
+
+    def _get_error(self, syndrome: int) -> int:
+        """
+        :param syndrome: int Packed syndrome
+        :return: int Packed error with minimal weight, zero if it isn't found
+        """
+        error: int = 0
+        if self._syndromeParents is None:
+            # Without syndrome table only single errors are corrected
+            if syndrome in self._columnSyndromes:
+                error = 1 << (self.lengthTotal - 1 - self._columnSyndromes.index(syndrome))
+            return error
+
+        while syndrome != 0:
+            error ^= 1 << (self.lengthTotal - 1 - int(self._syndromePositions[syndrome]))
+            syndrome = int(self._syndromeParents[syndrome])
+        return error
+
+    def _check_length(self, information: List[int]) -> None:
+        if len(information) != self.lengthTotal:
+            raise CodingException(
+                message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.message,
+                long_message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.long_message.format(
+                    self.name, self.lengthTotal, len(information)),
+            )
+
+    def encoding(self, information: List[int]) -> List[int]:
+        log.info("Encoding package {0} of linear block _coder".format(information))
+        word: int = 0
+        for bit, row in zip(self.try_normalization(information), self._generatorRows):
+            if bit:
+                word ^= row
+        return int_to_bit_list(word, self.lengthTotal)
+
+    def decoding(self, information: List[int]) -> List[int]:
+        log.info("Decoding package {0} of linear block _coder".format(information))
+        self._check_length(information)
+        word: int = bit_list_to_int(information)
+        syndrome: int = self._get_syndrome(word)
+        if syndrome != 0:
+            log.debug("Error(s) detected")
+            word ^= self._get_error(syndrome)
+        return [(word >> (self.lengthTotal - 1 - column)) & 1 for column in self._informationColumns]
+
+    def encoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[List[int]]:
+        if any(len(package) != self.lengthInformation for package in packages):
+            return super().encoding_batch(packages)
+        # Sum of products overflows uint8, but parity is kept
+        bits: np.ndarray = np.asarray(packages, dtype=np.uint8).reshape(-1, self.lengthInformation)
+        return ((bits @ self._generatorMatrix) & 1).tolist()
+
+    def decoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[Optional[List[int]]]:
+        if self._syndromeParents is None or any(len(package) != self.lengthTotal for package in packages):
+            return super().decoding_batch(packages)
+
+        received: np.ndarray = np.array(packages, dtype=np.uint8).reshape(-1, self.lengthTotal)
+        syndromes: np.ndarray = ((received @ self._parityCheckMatrix.T) & 1).astype(np.int64) \
+            @ np.left_shift(1, np.arange(self.lengthAdditional - 1, -1, -1, dtype=np.int64))
+        rows: np.ndarray = np.arange(len(received))
+        # All syndromes are corrected at once, each iteration adds one error of coset leaders
+        active: np.ndarray = syndromes != 0
+        while active.any():
+            received[rows[active], self._syndromePositions[syndromes[active]]] ^= 1
+            syndromes[active] = self._syndromeParents[syndromes[active]]
+            active = syndromes != 0
+        return received[:, self._informationColumns].tolist()
+
+    def to_json(self) -> Dict:
+        return {
+            'name': self.name,
+            'length _information word': self.lengthInformation,
+            'length additional bits': self.lengthAdditional,
+            'length coding word': self.lengthTotal,
+            'matrix of generating': self.generator_matrix,
+            'parity check matrix': self.parity_check_matrix,
+            'speed': self.get_speed(),
+        }
+
+    def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import linear_block_table
+        connection.execute(linear_block_table.insert().values(
+            guid=coder_guid,
+            generator_matrix=self.generator_matrix,
+            parity_check_matrix=self.parity_check_matrix,
+            information_columns=self.information_columns,
+        ))
+
+    class LinearBlockCoderParser(AbstractGroupParser):
+        _prefix: str = ""
+        __GENERATOR_MATRIX: str = "linear_generator_matrix"
+        __PARITY_CHECK_MATRIX: str = "linear_parity_check_matrix"
+
+        def __init__(
+                self,
+                argument_parser: Optional[argparse.ArgumentParser] = None,
+                argument_group=None,
+                prefix: str = ""
+        ):
+            super().__init__(
+                argument_parser=argument_parser,
+                argument_group=argument_group
+            )
+            self._prefix = prefix
+
+            self._argumentParser.add_argument(
+                "-{0}lnrg".format(prefix), "--{0}{1}".format(prefix, self.__GENERATOR_MATRIX),
+                type=str,
+                help="""Generator matrix of linear block _coder, rows are separated by comma
+                (e.g. 1000110,0100101,0010011,0001111)"""
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}lnrh".format(prefix), "--{0}{1}".format(prefix, self.__PARITY_CHECK_MATRIX),
+                type=str,
+                help="""Parity check matrix of linear block _coder (instead of generator matrix),
+                rows are separated by comma"""
+            )
+
+            # We should parse arguments only for unique _coder
+            if self._argumentGroup is None:
+                self.arguments = vars(self._argumentParser.parse_args())
+
+        @property
+        def linear_generator_matrix(self) -> Optional[str]:
+            return self.arguments["{0}{1}".format(self._prefix, self.__GENERATOR_MATRIX)]
+
+        @property
+        def linear_parity_check_matrix(self) -> Optional[str]:
+            return self.arguments["{0}{1}".format(self._prefix, self.__PARITY_CHECK_MATRIX)]
+
+    @staticmethod
+    def get_coder_parameters(
+            argument_parser: Optional[argparse.ArgumentParser] = None,
+            argument_group=None,
+            prefix: str = ""
+    ):
+        return Coder.LinearBlockCoderParser(
+            argument_parser=argument_parser,
+            argument_group=argument_group,
+            prefix=prefix
+        )
@@ -1,12 +1,14 @@
 # coding=utf-8
 import itertools
 import uuid
+from typing import Tuple
 
 import numpy as np
 from sqlalchemy.engine import Connection
 
 from src.coders import abstract_coder
 from src.coders.casts import bit_list_to_int, int_to_bit_list
+from src.helper import jit
 
 
 class Coder(abstract_coder.AbstractCoder):
@@ -32,6 +34,10 @@ class Coder(abstract_coder.AbstractCoder):
     vectors_rise: list = []
     r: int
     power: int
+    # Checks of majority voting for all rows except the first one (in reversed order) with shape (checks, length)
+    # and row of each check
+    _checkMasks: np.ndarray
+    _checkRows: np.ndarray
 
     def __init__(self, power: int, r: int):
         self.r = r
@@ -61,6 +67,43 @@ class Coder(abstract_coder.AbstractCoder):
         self.lengthInformation = len(self.matrix_G.tolist())
         self.lengthTotal = len(self.matrix_G.tolist()[0])
         self.lengthAdditional = self.lengthTotal - self.lengthInformation
+        self._checkMasks, self._checkRows = self._get_checks()
+
+    def _get_checks(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method provide functionality for calculation of checks of majority voting: for each row products of all
+        combinations of orthogonal rows and its inversions. Checks don't depend on received word
+        :return: Tuple[np.ndarray, np.ndarray] Checks with shape (checks, length) and row of each check
+        """
+        rows: np.ndarray = np.array(self.matrix_G.tolist(), dtype=np.uint8)
+        masks: list = [np.empty((0, self.lengthTotal), dtype=np.uint8)]
+        numbers: list = [np.empty(0, dtype=np.int64)]
+        for number, vector in enumerate(rows[::-1][:-1]):
+            orthogonal_vectors: list = [vector]
+            for test_vector in rows[1:]:
+                if np.array_equal(test_vector, vector):
+                    continue
+                if all(np.count_nonzero(x & test_vector) % 2 == 0 for x in orthogonal_vectors):
+                    orthogonal_vectors.append(test_vector)
+
+            products: np.ndarray = np.ones((1, self.lengthTotal), dtype=np.uint8)
+            for orthogonal_vector in orthogonal_vectors[1:]:
+                products = np.concatenate((products & (orthogonal_vector ^ 1), products & orthogonal_vector))
+            masks.append(products)
+            numbers.append(np.full(len(products), number, dtype=np.int64))
+        return np.concatenate(masks), np.concatenate(numbers)
+
+    def _get_votes(self, information: list) -> np.ndarray:
+        """
+        :param information: list
+        :return: np.ndarray Result of voting for each row except the first one (in reversed order)
+        """
+        bits: np.ndarray = np.array(information, dtype=np.uint8)
+        count_rows: int = self.lengthInformation - 1
+        if jit.ENABLED:
+            return _get_votes_kernel(self._checkMasks, self._checkRows, bits, count_rows)
+        parities: np.ndarray = (self._checkMasks.astype(np.int64) @ bits) & 1
+        return 1 + np.bincount(self._checkRows, weights=2 * parities - 1, minlength=count_rows).astype(np.int64)
 
     def encoding(self, information: list):
         information[0] = 0
@@ -73,42 +116,10 @@ class Coder(abstract_coder.AbstractCoder):
         def vec_mul(a, b):
             return [a[i] & b[i] for i in range(len(a))]
 
-        def vec_inv(a):
-            return [x ^ 1 for x in a]
-
         def vec_gen(a, b):
             return [a for x in range(b)]
 
-        result_voice: list = []
-        for vector in self.matrix_G.tolist()[::-1][:-1]:
-            voice: int = 1  # голосовалка
-
-            # проверка на ортогональность
-            orthogonal_vectors: list = [vector]
-            for test_vector in self.matrix_G.tolist()[1:]:
-                for x in orthogonal_vectors:
-                    if sum(vec_mul(x, test_vector)) % 2 != 0 or test_vector == vector:
-                        break
-                else:
-                    orthogonal_vectors.append(test_vector)
-
-            orthogonal_vectors = orthogonal_vectors[1:]
-            # проверка на ортогональность
-
-            for options_mul in range(1 << len(orthogonal_vectors)):
-                orthogonal_vec_num: int = 0
-
-                val_vector_mul = vec_gen(1, len(information))  # заглушка состоящая из одних единиц, нужна для умножения
-                for option in int_to_bit_list(options_mul, size=len(orthogonal_vectors)):
-                    if option:
-                        val_vector_mul = vec_mul(val_vector_mul, orthogonal_vectors[orthogonal_vec_num])
-                    else:
-                        val_vector_mul = vec_mul(val_vector_mul, vec_inv(orthogonal_vectors[orthogonal_vec_num]))
-                    orthogonal_vec_num += 1
-
-                voice += 1 if sum(vec_mul(val_vector_mul, information)) % 2 != 0 else -1
-
-            result_voice.append(0 if voice < 1 else 1)
+        result_voice: list = [0 if voice < 1 else 1 for voice in self._get_votes(information).tolist()]
 
         first_sum: int = information.copy()
         counter: int = 0
@@ -136,3 +147,14 @@ class Coder(abstract_coder.AbstractCoder):
                 'length coding word': self.lengthTotal,
                 'matrix of generating': self.matrix_G.tolist(),
                 'speed': self.get_speed()}
+
+
+@jit.kernel
+def _get_votes_kernel(masks: np.ndarray, rows: np.ndarray, bits: np.ndarray, count_rows: int) -> np.ndarray:
+    votes: np.ndarray = np.ones(count_rows, dtype=np.int64)
+    for check in range(len(masks)):
+        parity: int = 0
+        for position in range(len(bits)):
+            parity ^= masks[check, position] & bits[position]
+        votes[rows[check]] += 2 * np.int64(parity) - 1
+    return votes
@@ -0,0 +1,239 @@
+# coding=utf-8
+import argparse
+from sqlite3 import Connection
+from typing import Dict, List, Optional, Union
+from uuid import UUID
+
+import numpy as np
+
+from src.coders import abstract_coder
+from src.coders.polar.enum_construction_mode import EnumConstructionMode
+from src.coders.polar.frozen_bits import get_frozen_bits
+from src.coders.polar.successive_cancellation import SuccessiveCancellationDecoder
+from src.coders.polar.transform import polar_transform
+from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+from src.helper.error.exception.codding_exception import CodingException
+from src.logger import log
+from src.statistics.db.enum_coders_type import EnumCodersType
+
+
+class Coder(abstract_coder.AbstractCoder):
+    """
+    Polar coder with length 2^n. Information bits are placed into the most reliable bit channels for design SNR,
+    other bits are frozen to zero, codeword is polar transform of this word (not systematic code).
+    Decoding is made by successive cancellation (list) decoder for batch of words
+    """
+    _typeOfCoder: EnumCodersType = EnumCodersType.POLAR
+    _name: str = "Polar"
+
+    _designSnr: float
+    _construction: EnumConstructionMode
+    # Mask of frozen positions, it's shared between coders with the same parameters
+    _frozenBits: np.ndarray
+    _informationPositions: np.ndarray
+    _decoder: SuccessiveCancellationDecoder
+
+    def __init__(
+            self,
+            length: int,
+            information_length: int,
+            design_snr: float = 0.0,
+            construction: EnumConstructionMode = EnumConstructionMode.GAUSSIAN_APPROXIMATION,
+            list_size: int = 1,
+    ):
+        log.debug("Create polar _coder")
+        if length < 2 or length & (length - 1) or not 0 < information_length <= length or list_size <= 0:
+            raise CodingException(
+                message=CodingException.POLAR_PARAMETERS_INCORRECT.message,
+                long_message=CodingException.POLAR_PARAMETERS_INCORRECT.long_message.format(
+                    length, information_length, list_size),
+            )
+        self._designSnr = design_snr
+        self._construction = construction
+        self._frozenBits = get_frozen_bits(length, information_length, design_snr, construction)
+        self._informationPositions = np.flatnonzero(~self._frozenBits)
+        self._decoder = SuccessiveCancellationDecoder(self._frozenBits, list_size)
+
+        self.lengthInformation = information_length
+        self.lengthTotal = length
+        self.lengthAdditional = length - information_length
+
+    @staticmethod
+    def get_construction_mode(construction: Optional[str]) -> EnumConstructionMode:
+        """
+        :param construction: Optional[str] Value of construction mode, None for Gaussian approximation
+        :return: EnumConstructionMode
+        """
+        if construction is None:
+            return EnumConstructionMode.GAUSSIAN_APPROXIMATION
+        return EnumConstructionMode(construction)
+
+    @property
+    def design_snr(self) -> float:
+        return self._designSnr
+
+    @property
+    def construction(self) -> EnumConstructionMode:
+        return self._construction
+
+    @property
+    def list_size(self) -> int:
+        return self._decoder.list_size
+
+    @property
+    def information_positions(self) -> List[int]:
+        return self._informationPositions.tolist()
+
+    def _check_length(self, information: List[int]) -> None:
+        if len(information) != self.lengthTotal:
+            raise CodingException(
+                message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.message,
+                long_message=CodingException.LENGTH_OF_CODEWORD_INCORRECT.long_message.format(
+                    self.name, self.lengthTotal, len(information)),
+            )
+
+    def _encode(self, information: np.ndarray) -> np.ndarray:
+        words: np.ndarray = np.zeros((len(information), self.lengthTotal), dtype=np.uint8)
+        words[:, self._informationPositions] = information
+        return polar_transform(words)
+
+    def encoding(self, information: List[int]) -> List[int]:
+        log.info("Encoding package {0} of polar _coder".format(information))
+        return self._encode(np.array([self.try_normalization(information)], dtype=np.uint8))[0].tolist()
+
+    def encoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[List[int]]:
+        if any(len(package) != self.lengthInformation for package in packages):
+            return super().encoding_batch(packages)
+        return self._encode(np.asarray(packages, dtype=np.uint8).reshape(-1, self.lengthInformation)).tolist()
+
+    def decoding(self, information: List[int]) -> List[int]:
+        log.info("Decoding package {0} of polar _coder".format(information))
+        self._check_length(information)
+        return self._decode(np.array([information], dtype=np.uint8))[0]
+
+    def decoding_batch(self, packages: Union[List[List[int]], np.ndarray]) -> List[Optional[List[int]]]:
+        if any(len(package) != self.lengthTotal for package in packages):
+            return super().decoding_batch(packages)
+        return self._decode(np.array(packages, dtype=np.uint8).reshape(-1, self.lengthTotal))
+
+    def _decode(self, received: np.ndarray) -> List[List[int]]:
+        # Hard decisions of channel have the same reliability
+        return self._decoder.decode(1.0 - 2.0 * received).tolist()
+
+    def to_json(self) -> Dict:
+        return {
+            'name': self.name,
+            'length _information word': self.lengthInformation,
+            'length additional bits': self.lengthAdditional,
+            'length coding word': self.lengthTotal,
+            'design SNR': self._designSnr,
+            'construction': self._construction.value,
+            'size of list': self.list_size,
+            'information positions': self.information_positions,
+            'speed': self.get_speed(),
+        }
+
+    def save_to_database(self, coder_guid: UUID, connection: Connection) -> None:
+        from src.statistics.db.table import polar_table
+        connection.execute(polar_table.insert().values(
+            guid=coder_guid,
+            length_total=self.lengthTotal,
+            length_information=self.lengthInformation,
+            design_snr=self._designSnr,
+            construction=self._construction.value,
+            list_size=self.list_size,
+            information_positions=self.information_positions,
+        ))
+
+    class PolarCoderParser(AbstractGroupParser):
+        _prefix: str = ""
+        __LENGTH: str = "polar_length"
+        __INFORMATION_LENGTH: str = "polar_information_length"
+        __DESIGN_SNR: str = "polar_design_snr"
+        __CONSTRUCTION: str = "polar_construction"
+        __LIST_SIZE: str = "polar_list_size"
+
+        def __init__(
+                self,
+                argument_parser: Optional[argparse.ArgumentParser] = None,
+                argument_group=None,
+                prefix: str = ""
+        ):
+            super().__init__(
+                argument_parser=argument_parser,
+                argument_group=argument_group
+            )
+            self._prefix = prefix
+
+            self._argumentParser.add_argument(
+                "-{0}plrn".format(prefix), "--{0}{1}".format(prefix, self.__LENGTH),
+                type=int,
+                default=256,
+                help="Length of codeword of polar _coder, it should be power of two"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}plrk".format(prefix), "--{0}{1}".format(prefix, self.__INFORMATION_LENGTH),
+                type=int,
+                default=128,
+                help="Length of information word of polar _coder"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}plrs".format(prefix), "--{0}{1}".format(prefix, self.__DESIGN_SNR),
+                type=float,
+                default=0.0,
+                help="Design Eb/N0 (dB) for choice of frozen bits of polar _coder"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}plrc".format(prefix), "--{0}{1}".format(prefix, self.__CONSTRUCTION),
+                type=str,
+                choices=[mode.value for mode in EnumConstructionMode],
+                default=EnumConstructionMode.GAUSSIAN_APPROXIMATION.value,
+                help="Construction of polar _coder (bhattacharyya - Bhattacharyya parameters, "
+                     "ga - Gaussian approximation)"
+            )
+
+            self._argumentParser.add_argument(
+                "-{0}plrl".format(prefix), "--{0}{1}".format(prefix, self.__LIST_SIZE),
+                type=int,
+                default=1,
+                help="Size of list of polar decoder (1 - successive cancellation decoder)"
+            )
+
+            # We should parse arguments only for unique _coder
+            if self._argumentGroup is None:
+                self.arguments = vars(self._argumentParser.parse_args())
+
+        @property
+        def polar_length(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__LENGTH)]
+
+        @property
+        def polar_information_length(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__INFORMATION_LENGTH)]
+
+        @property
+        def polar_design_snr(self) -> float:
+            return self.arguments["{0}{1}".format(self._prefix, self.__DESIGN_SNR)]
+
+        @property
+        def polar_construction(self) -> str:
+            return self.arguments["{0}{1}".format(self._prefix, self.__CONSTRUCTION)]
+
+        @property
+        def polar_list_size(self) -> int:
+            return self.arguments["{0}{1}".format(self._prefix, self.__LIST_SIZE)]
+
+    @staticmethod
+    def get_coder_parameters(
+            argument_parser: Optional[argparse.ArgumentParser] = None,
+            argument_group=None,
+            prefix: str = ""
+    ):
+        return Coder.PolarCoderParser(
+            argument_parser=argument_parser,
+            argument_group=argument_group,
+            prefix=prefix
+        )
@@ -0,0 +1,9 @@
+# coding=utf-8
+from enum import Enum
+
+
+class EnumConstructionMode(Enum):
+    # Bhattacharyya parameters of bit channels for BPSK in AWGN channel
+    BHATTACHARYYA = "bhattacharyya"
+    # Gaussian approximation of means of LLR of bit channels
+    GAUSSIAN_APPROXIMATION = "ga"
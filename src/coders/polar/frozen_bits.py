@@ -0,0 +1,93 @@
+# coding=utf-8
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+
+from src.coders.polar.enum_construction_mode import EnumConstructionMode
+
+
+def _polarize(
+        value: float,
+        count_levels: int,
+        get_worse: Callable[[np.ndarray], np.ndarray],
+        get_better: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """
+    Function provide functionality for calculation of parameter of all bit channels from parameter of channel.
+    The highest bit of position selects transformation of physical channel, the lowest one - the last transformation
+    :param value: float Parameter of channel
+    :param count_levels: int Logarithm of length
+    :param get_worse: Callable[[np.ndarray], np.ndarray] Parameter of channel of the first bit of kernel
+    :param get_better: Callable[[np.ndarray], np.ndarray] Parameter of channel of the second bit of kernel
+    :return: np.ndarray Parameters of bit channels
+    """
+    values: np.ndarray = np.array([value], dtype=np.float64)
+    for _ in range(count_levels):
+        values = np.stack((get_worse(values), get_better(values)), axis=1).reshape(-1)
+    return values
+
+
+def get_bhattacharyya_reliabilities(count_levels: int, snr: float) -> np.ndarray:
+    """
+    :param count_levels: int Logarithm of length
+    :param snr: float Ratio of energy of symbol to noise (not in dB)
+    :return: np.ndarray Negative logarithms of Bhattacharyya parameters of bit channels, more is better
+    """
+    # Logarithms are used, parameters of good channels are less than the least float
+    return -_polarize(
+        -snr,
+        count_levels,
+        lambda values: values + np.log(2.0 - np.exp(values)),
+        lambda values: 2.0 * values,
+    )
+
+
+def _get_check_mean(means: np.ndarray) -> np.ndarray:
+    # Approximation of phi^-1(1 - (1 - phi(x))^2) by Trifonov
+    return np.select(
+        [means > 12.0, means > 3.5, means > 1.0],
+        [
+            0.9861 * means - 2.3152,
+            means * (9.005e-3 * means + 0.7694) - 0.9507,
+            means * (0.062883 * means + 0.3678) - 0.1627,
+        ],
+        means * (0.2202 * means + 0.06448),
+    )
+
+
+def get_gaussian_reliabilities(count_levels: int, snr: float) -> np.ndarray:
+    """
+    :param count_levels: int Logarithm of length
+    :param snr: float Ratio of energy of symbol to noise (not in dB)
+    :return: np.ndarray Means of LLR of bit channels, more is better
+    """
+    return _polarize(4.0 * snr, count_levels, _get_check_mean, lambda values: 2.0 * values)
+
+
+@lru_cache(maxsize=None)
+def get_frozen_bits(
+        length: int,
+        information_length: int,
+        design_snr: float,
+        construction: EnumConstructionMode
+) -> np.ndarray:
+    """
+    Function provide functionality for choice of the least reliable bit channels, result is shared between coders
+    :param length: int Power of two
+    :param information_length: int
+    :param design_snr: float Design Eb/N0 in dB
+    :param construction: EnumConstructionMode
+    :return: np.ndarray Read only mask of frozen positions
+    """
+    count_levels: int = length.bit_length() - 1
+    snr: float = information_length / length * 10 ** (design_snr / 10)
+    if construction == EnumConstructionMode.BHATTACHARYYA:
+        reliabilities: np.ndarray = get_bhattacharyya_reliabilities(count_levels, snr)
+    else:
+        reliabilities: np.ndarray = get_gaussian_reliabilities(count_levels, snr)
+
+    frozen_bits: np.ndarray = np.ones(length, dtype=bool)
+    frozen_bits[np.argsort(reliabilities, kind="stable")[length - information_length:]] = False
+    frozen_bits.setflags(write=False)
+    return frozen_bits
@@ -0,0 +1,163 @@
+# coding=utf-8
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from src.coders.polar.transform import polar_transform
+
+
+@dataclass
+class SuccessiveCancellationMemory:
+    """
+    Arrays of one call of decoder, they are allocated once and changed in place
+    """
+    # LLR of node on each depth with shape (words, paths, length >> depth)
+    llrs: List[np.ndarray]
+    # Bits of node on each depth (left half keeps bits of decoded left child) with the same shapes
+    bits: List[np.ndarray]
+    # Metrics of paths with shape (words, paths), less is better
+    metrics: np.ndarray
+    # Decided information bits with shape (information length, words, paths)
+    decisions: np.ndarray
+    # Path of previous information bit for each path with the same shape
+    parents: np.ndarray
+    # Row of arrays of each depth for each path with shape (depths, words, paths). List decoder changes only them,
+    # rows are gathered when they are read and are written in order of paths
+    llrPaths: np.ndarray
+    bitPaths: np.ndarray
+
+
+class SuccessiveCancellationDecoder:
+    """
+    Successive cancellation decoder of polar code over batch of words. Tree of code is traversed recursively,
+    all words (and paths of list) of node are processed by one operation over arrays of its depth.
+    Nodes with only frozen bits are skipped. Decoder with list of one path decides nodes with only information bits
+    at once by hard decisions, list decoder keeps paths with the least metrics for each information bit
+    and returns the best path
+    """
+    _frozenBits: np.ndarray
+    _listSize: int
+    _countLevels: int
+    # Flags of nodes with only frozen and with only information bits for each depth, shape (2 ** depth,)
+    _rateZero: List[np.ndarray]
+    _rateOne: List[np.ndarray]
+    # Index of each position among information positions
+    _informationIndexes: np.ndarray
+
+    def __init__(self, frozen_bits: np.ndarray, list_size: int = 1):
+        self._frozenBits = frozen_bits
+        self._listSize = list_size
+        self._countLevels = len(frozen_bits).bit_length() - 1
+        self._rateZero = []
+        self._rateOne = []
+        for depth in range(self._countLevels + 1):
+            nodes: np.ndarray = frozen_bits.reshape(1 << depth, -1)
+            self._rateZero.append(nodes.all(axis=1))
+            self._rateOne.append(~nodes.any(axis=1))
+        self._informationIndexes = np.cumsum(~frozen_bits) - 1
+
+    @property
+    def list_size(self) -> int:
+        return self._listSize
+
+    def decode(self, channel_llr: np.ndarray) -> np.ndarray:
+        """
+        Method provide functionality for decoding of batch of words
+        :param channel_llr: np.ndarray Log-likelihood ratios log(P(0) / P(1)) with shape (words, length)
+        :return: np.ndarray Information bits with shape (words, information length)
+        """
+        count_words: int = len(channel_llr)
+        length: int = len(self._frozenBits)
+        memory: SuccessiveCancellationMemory = SuccessiveCancellationMemory(
+            llrs=[np.empty((count_words, self._listSize, length >> depth)) for depth in range(self._countLevels + 1)],
+            bits=[np.empty((count_words, self._listSize, length >> depth), dtype=np.uint8)
+                  for depth in range(self._countLevels + 1)],
+            metrics=np.full((count_words, self._listSize), np.inf),
+            decisions=np.zeros((int((~self._frozenBits).sum()), count_words, self._listSize), dtype=np.uint8),
+            parents=np.zeros((int((~self._frozenBits).sum()), count_words, self._listSize), dtype=np.int64),
+            llrPaths=np.tile(np.arange(self._listSize), (self._countLevels + 1, count_words, 1)),
+            bitPaths=np.tile(np.arange(self._listSize), (self._countLevels + 1, count_words, 1)),
+        )
+        # Decoding starts with one path
+        memory.llrs[0][:] = np.asarray(channel_llr, dtype=np.float64)[:, np.newaxis, :]
+        memory.metrics[:, 0] = 0.0
+        self._decode_node(memory, 0, 0)
+
+        if self._listSize == 1:
+            return memory.decisions[:, :, 0].T
+        rows: np.ndarray = np.arange(count_words)
+        paths: np.ndarray = np.argmin(memory.metrics, axis=1)
+        answer: np.ndarray = np.empty((count_words, len(memory.decisions)), dtype=np.uint8)
+        for index in range(len(memory.decisions) - 1, -1, -1):
+            answer[:, index] = memory.decisions[index, rows, paths]
+            paths = memory.parents[index, rows, paths]
+        return answer
+
+    def _get_rows(self, values: np.ndarray, paths: np.ndarray) -> np.ndarray:
+        if self._listSize == 1:
+            return values
+        return np.take_along_axis(values, paths[:, :, np.newaxis], axis=1)
+
+    def _decode_node(self, memory: SuccessiveCancellationMemory, depth: int, node: int) -> None:
+        # LLR of node are written by its parent just before, so rows are in order of paths
+        llrs: np.ndarray = memory.llrs[depth]
+        bits: np.ndarray = memory.bits[depth]
+        if self._rateZero[depth][node]:
+            # Each negative LLR of zero codeword is penalty of path
+            if self._listSize > 1:
+                memory.metrics += np.maximum(-llrs, 0.0).sum(axis=2)
+            bits[:] = 0
+            memory.bitPaths[depth] = np.arange(self._listSize)
+            return
+        if depth == self._countLevels:
+            self._decide_bit(memory, self._informationIndexes[node])
+            return
+        if self._rateOne[depth][node] and self._listSize == 1:
+            bits[:] = llrs < 0
+            memory.bitPaths[depth] = np.arange(self._listSize)
+            start: int = self._informationIndexes[node * bits.shape[2]]
+            memory.decisions[start:start + bits.shape[2]] = polar_transform(bits).transpose(2, 0, 1)
+            return
+
+        half: int = llrs.shape[2] // 2
+        # Codeword of node is (left + right, right) for codewords of children
+        first, second = llrs[:, :, :half], llrs[:, :, half:]
+        np.copysign(np.minimum(np.abs(first), np.abs(second)), first * second, out=memory.llrs[depth + 1])
+        memory.llrPaths[depth + 1] = np.arange(self._listSize)
+        self._decode_node(memory, depth + 1, 2 * node)
+
+        # Paths could be changed by list decoder during decoding of left child
+        llrs = self._get_rows(llrs, memory.llrPaths[depth])
+        memory.llrPaths[depth] = np.arange(self._listSize)
+        first, second = llrs[:, :, :half], llrs[:, :, half:]
+        bits[:, :, :half] = memory.bits[depth + 1]
+        memory.bitPaths[depth] = np.arange(self._listSize)
+        np.add(second, np.where(bits[:, :, :half], -first, first), out=memory.llrs[depth + 1])
+        memory.llrPaths[depth + 1] = np.arange(self._listSize)
+        self._decode_node(memory, depth + 1, 2 * node + 1)
+
+        bits[:, :, :half] = self._get_rows(bits[:, :, :half], memory.bitPaths[depth]) ^ memory.bits[depth + 1]
+        bits[:, :, half:] = memory.bits[depth + 1]
+        memory.bitPaths[depth] = np.arange(self._listSize)
+
+    def _decide_bit(self, memory: SuccessiveCancellationMemory, index: int) -> None:
+        llrs: np.ndarray = memory.llrs[self._countLevels][:, :, 0]
+        if self._listSize == 1:
+            decisions: np.ndarray = llrs < 0
+        else:
+            # Each path is continued by both bits, bit opposite to sign of LLR costs its magnitude
+            penalties: np.ndarray = np.abs(llrs)
+            candidates: np.ndarray = np.concatenate((
+                memory.metrics + np.where(llrs < 0, penalties, 0.0),
+                memory.metrics + np.where(llrs < 0, 0.0, penalties),
+            ), axis=1)
+            chosen: np.ndarray = np.argsort(candidates, axis=1, kind="stable")[:, :self._listSize]
+            memory.metrics[:] = np.take_along_axis(candidates, chosen, axis=1)
+            parents: np.ndarray = chosen % self._listSize
+            decisions = chosen >= self._listSize
+            memory.parents[index] = parents
+            for paths in (memory.llrPaths, memory.bitPaths):
+                paths[:] = np.take_along_axis(paths, parents[np.newaxis], axis=2)
+        memory.bits[self._countLevels][:, :, 0] = decisions
+        memory.decisions[index] = decisions
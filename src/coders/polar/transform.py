@@ -0,0 +1,20 @@
+# coding=utf-8
+import numpy as np
+
+
+def polar_transform(bits: np.ndarray) -> np.ndarray:
+    """
+    Function provide functionality for multiplication by n-th Kronecker power of kernel [[1, 0], [1, 1]]
+    (without bit reversal) by log2(length) butterfly stages over the last axis. Transform is inverse of itself
+    :param bits: np.ndarray Bits with shape (..., length), length is power of two
+    :return: np.ndarray New array of uint8 with the same shape
+    """
+    answer: np.ndarray = np.array(bits, dtype=np.uint8)
+    length: int = answer.shape[-1]
+    half: int = 1
+    while half < length:
+        # Copy is contiguous, so reshape returns view
+        blocks: np.ndarray = answer.reshape(answer.shape[:-1] + (-1, 2, half))
+        blocks[..., 0, :] ^= blocks[..., 1, :]
+        half *= 2
+    return answer
@@ -1,5 +1,6 @@
 # coding=utf-8
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
 
 @dataclass
@@ -17,5 +18,31 @@ class Config:
     class GraphicSetting:
         flg_enabled: bool = False
 
-    db_setting: DBSetting = DBSetting()
-    graphic_setting: GraphicSetting = GraphicSetting()
+    @dataclass
+    class AdaptiveSetting:
+        flg_enabled: bool = False
+        # Quantity of trials between checks of stop conditions
+        chunk_size: int = 100
+        # Stop when quantity of package errors reached this value
+        target_error_packages: int = 100
+        # Stop when (high - low) / estimate of confidence interval less then this value (0 - disabled)
+        max_relative_interval_width: float = 0.0
+        confidence_level: float = 0.95
+        # Maximal quantity of trials for one noise level
+        max_count_test: int = 100000
+
+    @dataclass
+    class ProfilingSetting:
+        # Collect durations of transfer stages (encode, noise, decode, ...) for every noise level
+        flg_enabled: bool = False
+
+    @dataclass
+    class CacheSetting:
+        # Directory for storing of precomputed trellises of convolutional coders between runs (disabled if None)
+        trellis_directory: Optional[str] = None
+
+    db_setting: DBSetting = field(default_factory=DBSetting)
+    graphic_setting: GraphicSetting = field(default_factory=GraphicSetting)
+    adaptive_setting: AdaptiveSetting = field(default_factory=AdaptiveSetting)
+    profiling_setting: ProfilingSetting = field(default_factory=ProfilingSetting)
+    cache_setting: CacheSetting = field(default_factory=CacheSetting)
@@ -15,6 +15,9 @@ class ConfigProcessor(metaclass=Singleton):
     __CONFIG_FILE_NAME: str = "config.json"
     __DB_CONFIG: str = "db_setting"
     __GRAPHIC_CONFIG: str = "graphic_setting"
+    __ADAPTIVE_CONFIG: str = "adaptive_setting"
+    __PROFILING_CONFIG: str = "profiling_setting"
+    __CACHE_CONFIG: str = "cache_setting"
 
     def __init__(self):
         self._config = Config()
@@ -35,6 +38,16 @@ class ConfigProcessor(metaclass=Singleton):
             parsed_config = jsonpickle.decode(config_file.read())
             self._config.db_setting = Config.DBSetting(**parsed_config[ConfigProcessor.__DB_CONFIG])
             self._config.graphic_setting = Config.GraphicSetting(**parsed_config[ConfigProcessor.__GRAPHIC_CONFIG])
+            # Section can be absent in config files created by previous versions
+            self._config.adaptive_setting = Config.AdaptiveSetting(
+                **parsed_config.get(ConfigProcessor.__ADAPTIVE_CONFIG, {})
+            )
+            self._config.profiling_setting = Config.ProfilingSetting(
+                **parsed_config.get(ConfigProcessor.__PROFILING_CONFIG, {})
+            )
+            self._config.cache_setting = Config.CacheSetting(
+                **parsed_config.get(ConfigProcessor.__CACHE_CONFIG, {})
+            )
             config_file.close()
         else:
             self._create_standard_config(file_path=local_file_path)
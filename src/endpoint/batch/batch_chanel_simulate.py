@@ -0,0 +1,54 @@
+# coding=utf-8
+import os
+from typing import Optional
+
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.endpoint.batch.batch_job import BatchJob
+from src.endpoint.batch.batch_simulation_listener import BatchSimulationListener
+from src.endpoint.general_chanel_simulate import GeneralChanelSimulate
+from src.endpoint.general_coder_simulate import GeneralCoderSimulate
+from src.endpoint.simulation.single_coder_simulation import SingleCoderSimulation
+from src.statistics.object.statistic_collector import StatisticCollector
+
+
+class BatchChanelSimulate(GeneralChanelSimulate):
+    """
+    Class provide functionality for processing of one job of batch with storing result in directory of batch
+    """
+    _resultFileName: str
+    statistic: Optional[StatisticCollector] = None
+
+    def __init__(self, job: BatchJob, result_dir: str, progress_queue: Optional[object] = None):
+        super().__init__(
+            first_coder_params=GeneralCoderSimulate(**job.first_coder),
+            second_coder_params=GeneralCoderSimulate(**job.second_coder) if job.flg_cascade else None,
+            listener=BatchSimulationListener(job.name, progress_queue),
+            noise_start=job.noise_start,
+            noise_end=job.noise_end,
+            count_test=job.count_test,
+            test_info=job.test_info,
+            noise_mode=EnumNoiseMode(job.noise_mode),
+            noise_package_length=job.noise_package_length,
+            flg_split_package=True,
+            quantity_steps_in_test_cycle=job.quantity_steps,
+            package_period=job.noise_package_period,
+            flg_first_interleaver=job.length_first_interleaver is not None,
+            flg_second_interleaver=job.length_second_interleaver is not None,
+            length_first_interleaver=job.length_first_interleaver,
+            length_second_interleaver=job.length_second_interleaver,
+            noise_biased_probability=job.noise_biased_probability,
+            stages_params=[
+                GeneralCoderSimulate(**coder_parameters) for coder_parameters in job.stages
+            ] if job.flg_concatenated else None,
+            length_stage_interleavers=job.length_stage_interleavers,
+        )
+        self._resultFileName = os.path.join(result_dir, job.name)
+
+    @property
+    def result_file_name(self) -> str:
+        return self._resultFileName
+
+    def _start_simulation(self, simulation: SingleCoderSimulation) -> None:
+        simulation.set_result_file_name(self._resultFileName)
+        simulation.set_flg_graphic(False)
+        self.statistic = simulation.run()
@@ -0,0 +1,50 @@
+# coding=utf-8
+from dataclasses import dataclass
+from typing import Optional, Dict, List
+
+
+@dataclass
+class BatchJob:
+    """
+    Settings of one simulation (point of grid) from batch specification
+    """
+    index: int
+    # Parameters of coders like arguments of GeneralCoderSimulate (coder_type_int, hem_size_pack, ...)
+    first_coder: Dict
+    second_coder: Optional[Dict]
+    noise_mode: str
+    noise_start: float
+    noise_end: float
+    quantity_steps: int
+    count_test: int
+    test_info: int
+    noise_package_length: int
+    noise_package_period: int
+    length_first_interleaver: Optional[int]
+    length_second_interleaver: Optional[int]
+    noise_biased_probability: Optional[float]
+    # Parameters of coders of concatenated codec from outer to inner and lengths of interleavers of their codewords
+    stages: Optional[List[Dict]] = None
+    length_stage_interleavers: Optional[List[Optional[int]]] = None
+
+    @property
+    def name(self) -> str:
+        return "job_{0:04d}".format(self.index)
+
+    @property
+    def flg_cascade(self) -> bool:
+        return self.second_coder is not None
+
+    @property
+    def flg_concatenated(self) -> bool:
+        return self.stages is not None
+
+
+@dataclass
+class BatchJobResult:
+    job: BatchJob
+    flg_successful: bool
+    result_file: Optional[str]
+    duration: float
+    # Message of error which stopped job before simulation
+    error: Optional[str] = None
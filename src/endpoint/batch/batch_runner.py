@@ -0,0 +1,129 @@
+# coding=utf-8
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import jsonpickle
+
+from src.config.config_processor import ConfigProcessor
+from src.endpoint.batch.batch_chanel_simulate import BatchChanelSimulate
+from src.endpoint.batch.batch_job import BatchJob, BatchJobResult
+from src.endpoint.batch.batch_spec_parser import BatchSpecParser
+from src.endpoint.simulation.progress_info import ProgressInfo
+from src.endpoint.simulation.progress_reporter import ProgressAggregator
+from src.logger import log
+
+
+def _init_worker() -> None:
+    # Worker can be started by spawn (e.g. on Windows), so config should be parsed again
+    ConfigProcessor().parse_config()
+
+
+def _process_job(job: BatchJob, result_dir: str, progress_queue: Optional[object] = None) -> BatchJobResult:
+    """
+    Function provide functionality for processing of one job in worker process
+    :param job: BatchJob
+    :param result_dir: str Directory for storing of results
+    :param progress_queue: Optional[object] Queue for sending of progress to main process
+    :return: BatchJobResult
+    """
+    start_time: float = time.perf_counter()
+    # Error of one job (e.g. incorrect parameters of coder) shouldn't stop other jobs of batch
+    # noinspection PyBroadException
+    try:
+        chanel: BatchChanelSimulate = BatchChanelSimulate(job, result_dir, progress_queue)
+        if job.flg_concatenated:
+            chanel.start_concatenated_test_cycle()
+        elif job.flg_cascade:
+            chanel.start_cascade_test_cycle()
+        else:
+            chanel.start_first_test_cycle()
+    except Exception as err:
+        log.error("Job {0} failed: {1}".format(job.name, err))
+        return BatchJobResult(
+            job=job,
+            flg_successful=False,
+            result_file=None,
+            duration=time.perf_counter() - start_time,
+            error=str(err),
+        )
+
+    return BatchJobResult(
+        job=job,
+        flg_successful=chanel.statistic is not None,
+        result_file="{0}.state".format(chanel.result_file_name) if chanel.statistic is not None else None,
+        duration=time.perf_counter() - start_time,
+    )
+
+
+class BatchRunner:
+    """
+    Class provide functionality for processing all jobs of batch specification by pool of worker processes.
+    Results of jobs are stored in one directory together with summary of batch
+    """
+    __SUMMARY_FILE_NAME: str = "summary.json"
+    # Aggregated progress of batch is printed less often then progress of single simulation
+    __PROGRESS_PRINT_INTERVAL: float = 1.0
+
+    _specParser: BatchSpecParser
+    _quantityWorkers: Optional[int]
+
+    def __init__(self, spec_parser: BatchSpecParser, quantity_workers: Optional[int] = None):
+        self._specParser = spec_parser
+        self._quantityWorkers = quantity_workers
+
+    @property
+    def summary_file_name(self) -> str:
+        return os.path.join(self._specParser.result_dir, self.__SUMMARY_FILE_NAME)
+
+    def _report_progress(self, progress_queue) -> None:
+        """
+        Method provide functionality for aggregation of progress of workers until None is received
+        :param progress_queue: Queue with tuples (job name, quantity of trials, quantity of total trials)
+        :return: None
+        """
+        aggregator: ProgressAggregator = ProgressAggregator(self.__PROGRESS_PRINT_INTERVAL)
+        for message in iter(progress_queue.get, None):
+            progress_info: Optional[ProgressInfo] = aggregator.update(*message)
+            if progress_info is not None:
+                print("Batch progress: {0}".format(progress_info))
+
+    def run(self) -> List[BatchJobResult]:
+        """
+        Method provide functionality for processing of batch
+        :return: List[BatchJobResult] Results in order of jobs
+        """
+        jobs: List[BatchJob] = self._specParser.get_jobs()
+        result_dir: str = self._specParser.result_dir
+        os.makedirs(result_dir, exist_ok=True)
+        log.info("Batch of {0} jobs started".format(len(jobs)))
+
+        with multiprocessing.Manager() as manager:
+            progress_queue = manager.Queue()
+            progress_thread: threading.Thread = threading.Thread(
+                target=self._report_progress,
+                args=(progress_queue,),
+                daemon=True,
+            )
+            progress_thread.start()
+            # Thread should be stopped before shutdown of manager, even if pool raises
+            try:
+                with ProcessPoolExecutor(max_workers=self._quantityWorkers, initializer=_init_worker) as executor:
+                    job_results: List[BatchJobResult] = list(executor.map(
+                        _process_job,
+                        jobs,
+                        [result_dir] * len(jobs),
+                        [progress_queue] * len(jobs),
+                    ))
+            finally:
+                progress_queue.put(None)
+                progress_thread.join()
+
+        with open(self.summary_file_name, "w", encoding='UTF-8') as summary_file:
+            summary_file.write(jsonpickle.encode(job_results, unpicklable=False))
+        log.info("Batch finished, {0} of {1} jobs are successful".format(
+            sum(job_result.flg_successful for job_result in job_results), len(jobs)))
+        return job_results
@@ -0,0 +1,39 @@
+# coding=utf-8
+from typing import Optional
+
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.endpoint.simulation.progress_info import ProgressInfo
+from src.helper.error.exception.application_exception import ApplicationException
+from src.logger import log
+
+
+class BatchSimulationListener(ISimulationListener):
+    """
+    Listener for simulations in workers of batch. Notifications are only logged,
+    because output of parallel workers would be mixed. Progress is sent to main process via queue for aggregation
+    """
+    _jobName: str
+    _progressQueue: Optional[object]
+
+    def __init__(self, job_name: str, progress_queue: Optional[object] = None):
+        self._jobName = job_name
+        self._progressQueue = progress_queue
+
+    def start_testing(self) -> None:
+        log.info("Batch {0} started".format(self._jobName))
+
+    def step_finished(self, progress: int) -> None:
+        pass
+
+    def auto_step_finished(self, progress: int) -> None:
+        log.debug("Batch {0} progress {1}%".format(self._jobName, progress))
+
+    def progress_updated(self, progress_info: ProgressInfo) -> None:
+        if self._progressQueue is not None:
+            self._progressQueue.put((self._jobName, progress_info.quantity_trials, progress_info.quantity_total_trials))
+
+    def ended(self) -> None:
+        log.info("Batch {0} ended".format(self._jobName))
+
+    def not_correct(self, exception: ApplicationException) -> None:
+        log.error("Batch {0} failed: {1}".format(self._jobName, exception))
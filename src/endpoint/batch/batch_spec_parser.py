@@ -0,0 +1,220 @@
+# coding=utf-8
+import itertools
+import json
+import os
+from typing import Dict, List, Optional
+
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.endpoint.batch.batch_job import BatchJob
+from src.helper.error.exception.parameters_parse_exception import ParametersParseException
+from src.statistics.db.enum_coders_type import EnumCodersType
+
+
+class BatchSpecParser:
+    """
+    Parser of batch specification (JSON or YAML file). Each parameter can be specified by value or by list of values,
+    jobs are generated for every combination of values (Cartesian grid). Example:
+    {
+        "result_dir": "batch_result",
+        "first_coders": [{"coder_type_int": 0, "hem_size_pack": [4, 8]}],
+        "second_coders": [{"coder_type_int": 1, "cyc_size_pack": 4, "cyc_poly": 11}],
+        "noise_mode": ["s", "p"],
+        "first_interleaver_length": [null, 16],
+        "noise_start": 1, "noise_end": 20, "quantity_steps": 20, "count_test": 1000, "test_info": 11
+    }
+    Second coders are optional, without them single codec is simulated.
+    Instead of first and second coders concatenated codec can be specified by stages from outer to inner,
+    each stage is list of coders like first coders, and lengths of interleavers of codewords of each stage:
+        "stages": [[{"coder_type_int": 1, "cyc_size_pack": 4, "cyc_poly": 11}], [{"coder_type_int": 0, ...}], ...],
+        "stage_interleaver_lengths": [null, 16, ...]
+    """
+    __YAML_EXTENSIONS: tuple = (".yaml", ".yml")
+
+    __RESULT_DIR: str = "result_dir"
+    __FIRST_CODERS: str = "first_coders"
+    __SECOND_CODERS: str = "second_coders"
+    __STAGES: str = "stages"
+    __STAGE_INTERLEAVER_LENGTHS: str = "stage_interleaver_lengths"
+    __CODER_TYPE: str = "coder_type_int"
+    __CODER_PARAMETERS: tuple = (
+        "coder_type_int", "hem_size_pack", "cyc_size_pack", "cyc_poly", "con_list_poly", "con_count_reg",
+        "con_puncturing_rate", "con_termination_mode", "con_traceback_depth",
+        "fou_size_pack", "fou_size_block", "fou_count_block", "lin_generator_matrix", "lin_parity_check_matrix",
+        "ldp_length", "ldp_column_weight", "ldp_row_weight", "ldp_seed", "ldp_alist", "ldp_max_iterations",
+        "bch_degree", "bch_correctable_errors", "bch_information_length",
+        "ree_count_symbols", "ree_count_information_symbols",
+        "tur_information_length", "tur_feedback", "tur_polynomial", "tur_count_registers", "tur_interleaver_length",
+        "tur_max_iterations",
+        "pol_length", "pol_information_length", "pol_design_snr", "pol_construction", "pol_list_size",
+    )
+
+    # Grid parameters and its default values
+    __GRID_PARAMETERS: Dict = {
+        "noise_mode": EnumNoiseMode.SINGLE.value,
+        "noise_start": 1,
+        "noise_end": 20,
+        "quantity_steps": 20,
+        "count_test": 1000,
+        "test_info": 11,
+        "noise_package_length": 1,
+        "noise_package_period": 2,
+        "first_interleaver_length": None,
+        "second_interleaver_length": None,
+        "noise_biased_probability": None,
+    }
+
+    _spec: Dict
+
+    def __init__(self, spec: Dict):
+        self._spec = spec
+        unknown_parameters: List[str] = [
+            parameter for parameter in spec
+            if parameter not in self.__GRID_PARAMETERS
+            and parameter not in (
+                self.__RESULT_DIR, self.__FIRST_CODERS, self.__SECOND_CODERS, self.__STAGES,
+                self.__STAGE_INTERLEAVER_LENGTHS
+            )
+        ]
+        if not unknown_parameters:
+            if spec.get(self.__STAGES):
+                # Stages cannot be mixed with first and second coders
+                unknown_parameters = [
+                    parameter for parameter in (self.__FIRST_CODERS, self.__SECOND_CODERS) if parameter in spec
+                ]
+                if len(spec.get(self.__STAGE_INTERLEAVER_LENGTHS, spec[self.__STAGES])) != len(spec[self.__STAGES]):
+                    unknown_parameters.append(self.__STAGE_INTERLEAVER_LENGTHS)
+            elif not spec.get(self.__FIRST_CODERS):
+                unknown_parameters = [self.__FIRST_CODERS]
+        if unknown_parameters:
+            raise ParametersParseException(
+                message=ParametersParseException.BATCH_SPEC_INCORRECT.message,
+                long_message=ParametersParseException.BATCH_SPEC_INCORRECT.long_message,
+                additional_information=[unknown_parameters[0]]
+            )
+
+    @staticmethod
+    def from_file(file_path: str) -> 'BatchSpecParser':
+        """
+        Method provide functionality for loading of specification from JSON or YAML file
+        :param file_path: str
+        :return: BatchSpecParser
+        """
+        extension: str = os.path.splitext(file_path)[1].lower()
+        with open(file_path, encoding='UTF-8') as spec_file:
+            if extension == ".json":
+                return BatchSpecParser(json.load(spec_file))
+            elif extension in BatchSpecParser.__YAML_EXTENSIONS:
+                try:
+                    import yaml
+                except ImportError as import_error:
+                    raise ParametersParseException(
+                        message=ParametersParseException.BATCH_SPEC_FORMAT.message,
+                        long_message=ParametersParseException.BATCH_SPEC_FORMAT.long_message,
+                        additional_information=[file_path],
+                        previous=import_error,
+                    )
+                return BatchSpecParser(yaml.safe_load(spec_file))
+
+        raise ParametersParseException(
+            message=ParametersParseException.BATCH_SPEC_FORMAT.message,
+            long_message=ParametersParseException.BATCH_SPEC_FORMAT.long_message,
+            additional_information=[file_path],
+        )
+
+    @property
+    def result_dir(self) -> str:
+        return self._spec.get(self.__RESULT_DIR, "batch_result")
+
+    @staticmethod
+    def _expand(parameters: Dict) -> List[Dict]:
+        """
+        Method provide functionality for generating all combinations of parameters,
+        where parameter specified by list is iterated over its values
+        :param parameters: Dict
+        :return: List[Dict]
+        """
+        values: List[list] = [value if isinstance(value, list) else [value] for value in parameters.values()]
+        return [dict(zip(parameters.keys(), combination)) for combination in itertools.product(*values)]
+
+    def _get_coders(self, coders_parameters: Optional[List[Dict]]) -> List[Optional[Dict]]:
+        if not coders_parameters:
+            return [None]
+
+        coders: List[Dict] = []
+        for coder_parameters in coders_parameters:
+            for parameter in coder_parameters:
+                if parameter not in self.__CODER_PARAMETERS:
+                    raise ParametersParseException(
+                        message=ParametersParseException.BATCH_SPEC_INCORRECT.message,
+                        long_message=ParametersParseException.BATCH_SPEC_INCORRECT.long_message,
+                        additional_information=[parameter]
+                    )
+            coders.extend(self._expand(coder_parameters))
+
+        for coder in coders:
+            # Check of coder type, exception is raised for unknown type
+            EnumCodersType(coder[self.__CODER_TYPE])
+        return coders
+
+    def get_jobs(self) -> List[BatchJob]:
+        """
+        Method provide functionality for generating jobs for every point of grid
+        :return: List[BatchJob]
+        """
+        grid: Dict = {
+            parameter: self._spec.get(parameter, default_value)
+            for parameter, default_value in self.__GRID_PARAMETERS.items()
+        }
+        jobs: List[BatchJob] = []
+        if self._spec.get(self.__STAGES):
+            for stages, grid_point in itertools.product(
+                    itertools.product(*[self._get_coders(stage) for stage in self._spec[self.__STAGES]]),
+                    self._expand(grid)
+            ):
+                jobs.append(self._get_job(len(jobs), stages[0], None, grid_point, list(stages)))
+            return jobs
+
+        for first_coder, second_coder, grid_point in itertools.product(
+                self._get_coders(self._spec[self.__FIRST_CODERS]),
+                self._get_coders(self._spec.get(self.__SECOND_CODERS)),
+                self._expand(grid)
+        ):
+            jobs.append(self._get_job(len(jobs), first_coder, second_coder, grid_point))
+        return jobs
+
+    def _get_job(
+            self,
+            index: int,
+            first_coder: Dict,
+            second_coder: Optional[Dict],
+            grid_point: Dict,
+            stages: Optional[List[Dict]] = None
+    ) -> BatchJob:
+        """
+        Method provide functionality for creating job for point of grid
+        :param index: int
+        :param first_coder: Dict
+        :param second_coder: Optional[Dict]
+        :param grid_point: Dict
+        :param stages: Optional[List[Dict]] Coders of concatenated codec from outer to inner
+        :return: BatchJob
+        """
+        return BatchJob(
+            index=index,
+            first_coder=first_coder,
+            second_coder=second_coder,
+            noise_mode=EnumNoiseMode(grid_point["noise_mode"]).value,
+            noise_start=grid_point["noise_start"],
+            noise_end=grid_point["noise_end"],
+            quantity_steps=grid_point["quantity_steps"],
+            count_test=grid_point["count_test"],
+            test_info=grid_point["test_info"],
+            noise_package_length=grid_point["noise_package_length"],
+            noise_package_period=grid_point["noise_package_period"],
+            length_first_interleaver=grid_point["first_interleaver_length"],
+            length_second_interleaver=grid_point["second_interleaver_length"],
+            noise_biased_probability=grid_point["noise_biased_probability"],
+            stages=stages,
+            length_stage_interleavers=self._spec.get(
+                self.__STAGE_INTERLEAVER_LENGTHS, [None] * len(stages)) if stages is not None else None,
+        )
@@ -3,14 +3,16 @@ import argparse
 from enum import Enum
 from typing import Optional, List
 
-from src.coders.abstract_coder import AbstractCoder
+from src.coders.coder_loader import CoderLoader
 from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+from src.endpoint.console.batch_parser import BatchParser
 from src.endpoint.console.codec_parser import CodecParser
 from src.endpoint.console.coder_parser import CoderParser
 from src.endpoint.console.enum_app_mode import EnumAppMode
 from src.endpoint.console.transfer_info_parser import TransferInfoParser
 from src.helper.error.exception.parameters_parse_exception import ParametersParseException
 from src.helper.pattern.singleton import Singleton
+from src.statistics.db.enum_coders_type import EnumCodersType
 
 
 class AppParser(metaclass=Singleton):
@@ -23,6 +25,7 @@ class AppParser(metaclass=Singleton):
     _argument_parser = argparse.ArgumentParser()
     _codec_parser: CodecParser
     _coder_parser: CoderParser
+    _batch_parser: BatchParser
     _transfer_info_parser: TransferInfoParser
     _first_coder_parsers: List[AbstractGroupParser] = []
     _second_coder_parsers: List[AbstractGroupParser] = []
@@ -34,25 +37,35 @@ class AppParser(metaclass=Singleton):
         if argument_parser:
             self._argument_parser = argument_parser
         else:
-            self._argument_parser = argparse.ArgumentParser(prog="Diploma")
+            # Help is added after definition of coders parameters, otherwise it would be shown without them
+            self._argument_parser = argparse.ArgumentParser(prog="Diploma", add_help=False)
 
         self._argument_parser.add_argument(
             "-m", "--{0}".format(self.__MODE_PARAMETERS),
             required=False,
-            help="""Type of running mode (GUI - {0}, console - {1})""".format(
+            help="""Type of running mode (GUI - {0}, console - {1}, batch - {2})""".format(
                 EnumAppMode.GUI.value,
-                EnumAppMode.CONSOLE.value
+                EnumAppMode.CONSOLE.value,
+                EnumAppMode.BATCH.value
             )
         )
 
         # Add subparsers hire
         self._codec_parser = CodecParser(argument_group=self._argument_parser.add_argument_group("cm", "Codec mode"))
         self._coder_parser = CoderParser(argument_group=self._argument_parser.add_argument_group("ct", "Coder type"))
-        self._coders_template_generate()
+        self._batch_parser = BatchParser(argument_group=self._argument_parser.add_argument_group("bm", "Batch mode"))
+        self._coders_template_generate(self._get_required_coder_types())
+        if argument_parser is None:
+            self._argument_parser.add_argument(
+                "-h", "--help",
+                action="help",
+                help="show this help message and exit"
+            )
 
         self._arguments = vars(self._argument_parser.parse_args())
         self._coder_parser.arguments = self._arguments
         self._codec_parser.arguments = self._arguments
+        self._batch_parser.arguments = self._arguments
         self._coders_define_arguments()
 
     @property
@@ -64,6 +77,8 @@ class AppParser(metaclass=Singleton):
             return EnumAppMode.GUI
         elif app_mode == EnumAppMode.CONSOLE.value:
             return EnumAppMode.CONSOLE
+        elif app_mode == EnumAppMode.BATCH.value:
+            return EnumAppMode.BATCH
         else:
             raise ParametersParseException(
                 message=ParametersParseException.APPLICATION_MODE_UNDEFINED.message,
@@ -79,6 +94,10 @@ class AppParser(metaclass=Singleton):
     def codec_parser(self) -> CodecParser:
         return self._codec_parser
 
+    @property
+    def batch_parser(self) -> BatchParser:
+        return self._batch_parser
+
     @property
     def first_coders(self) -> List[AbstractGroupParser]:
         return self._first_coder_parsers
@@ -87,9 +106,30 @@ class AppParser(metaclass=Singleton):
     def second_coders(self) -> List[AbstractGroupParser]:
         return self._second_coder_parsers
 
+    def _get_required_coder_types(self) -> Optional[List[EnumCodersType]]:
+        """
+        Method provide functionality for preliminary parsing of coder types,
+        so in console mode only modules of used coders are imported
+        :return: Optional[List[EnumCodersType]] None if all coders are required (GUI mode or unknown coder types)
+        """
+        arguments: dict = vars(self._argument_parser.parse_known_args()[0])
+        self._coder_parser.arguments = arguments
+        # Coders of batch are defined in specification
+        if arguments[AppParser.__MODE_PARAMETERS] == EnumAppMode.BATCH.value:
+            return []
+        if arguments[AppParser.__MODE_PARAMETERS] != EnumAppMode.CONSOLE.value \
+                or self._coder_parser.first_coder_type is None:
+            return None
+
+        coder_types: List[EnumCodersType] = [EnumCodersType(self._coder_parser.first_coder_type)]
+        if self._coder_parser.second_coder_type is not None \
+                and self._coder_parser.second_coder_type != self._coder_parser.first_coder_type:
+            coder_types.append(EnumCodersType(self._coder_parser.second_coder_type))
+        return coder_types
+
     # noinspection SpellCheckingInspection
-    def _coders_template_generate(self):
-        for iterator in AbstractCoder.get_inheritors_coder_classes():
+    def _coders_template_generate(self, coder_types: Optional[List[EnumCodersType]] = None):
+        for iterator in CoderLoader.get_coder_classes(coder_types):
             self._first_coder_parsers.append(iterator.get_coder_parameters(
                 argument_group=self._argument_parser.add_argument_group("frtcdr", "First Coder"),
                 prefix=self.EnumCoderSequence.FIRST.value
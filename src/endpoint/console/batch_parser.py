@@ -0,0 +1,46 @@
+# coding=utf-8
+import argparse
+from typing import Optional
+
+from src.endpoint.console.abstract_group_parser import AbstractGroupParser
+
+
+class BatchParser(AbstractGroupParser):
+    """
+    Parser class for Batch Mode Attributes
+    """
+    __BATCH_SPEC: str = "batch_spec"
+    __BATCH_WORKERS: str = "batch_workers"
+
+    def __init__(
+            self,
+            argument_parser: Optional[argparse.ArgumentParser] = None,
+            argument_group=None
+    ):
+        super().__init__(
+            argument_parser=argument_parser,
+            argument_group=argument_group
+        )
+
+        self._argumentParser.add_argument(
+            "-bs", "--{0}".format(self.__BATCH_SPEC),
+            type=str,
+            help="""Path to batch specification (JSON or YAML) with grid of coder and noise settings"""
+        )
+        self._argumentParser.add_argument(
+            "-bw", "--{0}".format(self.__BATCH_WORKERS),
+            type=int,
+            help="""Quantity of worker processes for batch (quantity of CPU by default)"""
+        )
+
+        # We should parse arguments only for unique _coder
+        if self._argumentGroup is None:
+            self._arguments = vars(self._argumentParser.parse_args())
+
+    @property
+    def batch_spec(self) -> Optional[str]:
+        return self._arguments[self.__BATCH_SPEC]
+
+    @property
+    def batch_workers(self) -> Optional[int]:
+        return self._arguments[self.__BATCH_WORKERS]
@@ -20,6 +20,9 @@ class CodecParser(AbstractGroupParser):
     __NOISE_PACKAGE_LENGTH: str = "noise_package_length"
     __NOISE_PACKAGE_PERIOD: str = "noise_package_period"
     __TEST_QUANTITY_CYCLES: str = "test_quantity_cycles"
+    __NOISE_BIASED_PROBABILITY: str = "noise_biased_probability"
+    __EXTEND_STATISTIC: str = "extend_statistic"
+    __EXTEND_MIN_ERROR_PACKAGES: str = "extend_min_error_packages"
 
     def __init__(
             self,
@@ -47,12 +50,18 @@ class CodecParser(AbstractGroupParser):
             "-nt", "--{0}".format(__class__.__NOISE_TYPE_OPTION),
             required=False,
             type=str,
-            choices=(EnumNoiseMode.SINGLE.value, EnumNoiseMode.PACKAGE.value, EnumNoiseMode.MIX.value,),
+            choices=(
+                EnumNoiseMode.SINGLE.value,
+                EnumNoiseMode.PACKAGE.value,
+                EnumNoiseMode.MIX.value,
+                EnumNoiseMode.IMPORTANCE.value,
+            ),
             help="""Type of noises({0} - for single noise type(Gauss noise) or {1} - for packages error, 
-            {2} - for mix error)""".format(
+            {2} - for mix error, {3} - for independent errors with importance sampling)""".format(
                 EnumNoiseMode.SINGLE.value,
                 EnumNoiseMode.PACKAGE.value,
                 EnumNoiseMode.MIX.value,
+                EnumNoiseMode.IMPORTANCE.value,
             )
         )
 
@@ -98,6 +107,28 @@ class CodecParser(AbstractGroupParser):
             help="""How much test will be do"""
         )
 
+        self._argumentParser.add_argument(
+            "-nbp", "--{0}".format(self.__NOISE_BIASED_PROBABILITY),
+            required=False,
+            type=float,
+            help="""Noise probability which used for generation errors in importance sampling noise mode 
+            (from 0.0 to 50.0)"""
+        )
+
+        self._argumentParser.add_argument(
+            "-es", "--{0}".format(self.__EXTEND_STATISTIC),
+            type=str,
+            required=False,
+            help="""Path to stored result (*.state) which should be extended by additional trials"""
+        )
+
+        self._argumentParser.add_argument(
+            "-emep", "--{0}".format(self.__EXTEND_MIN_ERROR_PACKAGES),
+            type=int,
+            required=False,
+            help="""Extend only noise levels with quantity of package errors less then this value"""
+        )
+
         # We should parse arguments only for unique _coder
         if self._argumentGroup is None:
             self._arguments = vars(self._argumentParser.parse_args())
@@ -129,9 +160,11 @@ class CodecParser(AbstractGroupParser):
         if noise_type is None or noise_type == EnumNoiseMode.SINGLE.value:
             return EnumNoiseMode.SINGLE
         elif noise_type == EnumNoiseMode.PACKAGE.value:
-            return EnumNoiseMode.CASCADE
+            return EnumNoiseMode.PACKAGE
         elif noise_type == EnumNoiseMode.MIX.value:
             return EnumNoiseMode.MIX
+        elif noise_type == EnumNoiseMode.IMPORTANCE.value:
+            return EnumNoiseMode.IMPORTANCE
         else:
             raise ParametersParseException(long_message="""Unknown codec type""")
 
@@ -158,3 +191,15 @@ class CodecParser(AbstractGroupParser):
     @property
     def test_quantity_cycles(self) -> int:
         return self._arguments[self.__TEST_QUANTITY_CYCLES]
+
+    @property
+    def noise_biased_probability(self) -> Optional[float]:
+        return self._arguments[self.__NOISE_BIASED_PROBABILITY]
+
+    @property
+    def extend_statistic(self) -> Optional[str]:
+        return self._arguments[self.__EXTEND_STATISTIC]
+
+    @property
+    def extend_min_error_packages(self) -> Optional[int]:
+        return self._arguments[self.__EXTEND_MIN_ERROR_PACKAGES]
@@ -1,6 +1,6 @@
 # coding=utf-8
 import argparse
-from typing import Optional
+from typing import Dict, Optional
 
 from src.endpoint.console.abstract_group_parser import AbstractGroupParser
 from src.statistics.db.enum_coders_type import EnumCodersType
@@ -15,6 +15,19 @@ class CoderParser(AbstractGroupParser):
     __SECOND_CODER_TYPE: str = "second_coder_type"
     __FIRST_INTERLEAVER_LEN: str = "first_interleaver_length"
     __SECOND_INTERLEAVER_LEN: str = "second_interleaver_length"
+    # Names of coders for help
+    __CODER_TYPES: Dict[str, EnumCodersType] = {
+        "convolution": EnumCodersType.CONVOLUTION,
+        "fountain": EnumCodersType.FOUNTAIN,
+        "cyclical": EnumCodersType.CYCLICAL,
+        "hamming": EnumCodersType.HAMMING,
+        "linear block": EnumCodersType.LINEAR_BLOCK,
+        "ldpc": EnumCodersType.LDPC,
+        "bch": EnumCodersType.BCH,
+        "reed solomon": EnumCodersType.REED_SOLOMON,
+        "turbo": EnumCodersType.TURBO,
+        "polar": EnumCodersType.POLAR,
+    }
 
     def __init__(
             self,
@@ -26,38 +39,20 @@ class CoderParser(AbstractGroupParser):
             argument_group=argument_group
         )
 
+        coder_type_help: str = "Coder type ({0})".format(", ".join(
+            "{0} - {1}".format(name, coder_type.value) for name, coder_type in self.__CODER_TYPES.items()))
         self._argumentParser.add_argument(
             "-fct", "--{0}".format(self.__FIRST_CODER_TYPE),
             type=int,
-            choices=(
-                EnumCodersType.CONVOLUTION.value,
-                EnumCodersType.FOUNTAIN.value,
-                EnumCodersType.CYCLICAL.value,
-                EnumCodersType.HAMMING.value
-            ),
-            help="""Coder type (convolution - {0}, fountain - {1}, cyclical - {2}, hamming - {3})""".format(
-                EnumCodersType.CONVOLUTION.value,
-                EnumCodersType.FOUNTAIN.value,
-                EnumCodersType.CYCLICAL.value,
-                EnumCodersType.HAMMING.value
-            )
+            choices=tuple(coder_type.value for coder_type in self.__CODER_TYPES.values()),
+            help=coder_type_help
         )
 
         self._argumentParser.add_argument(
             "-sct", "--{0}".format(self.__SECOND_CODER_TYPE),
             type=int,
-            choices=(
-                EnumCodersType.CONVOLUTION.value,
-                EnumCodersType.FOUNTAIN.value,
-                EnumCodersType.CYCLICAL.value,
-                EnumCodersType.HAMMING.value
-            ),
-            help="""Coder type (convolution - {0}, fountain - {1}, cyclical - {2}, hamming - {3})""".format(
-                EnumCodersType.CONVOLUTION.value,
-                EnumCodersType.FOUNTAIN.value,
-                EnumCodersType.CYCLICAL.value,
-                EnumCodersType.HAMMING.value
-            )
+            choices=tuple(coder_type.value for coder_type in self.__CODER_TYPES.values()),
+            help=coder_type_help
         )
 
         self._argumentParser.add_argument(
@@ -90,8 +85,11 @@ class CoderParser(AbstractGroupParser):
             return None
 
     @property
-    def first_coder_type(self) -> int:
-        return int(self._arguments[self.__FIRST_CODER_TYPE])
+    def first_coder_type(self) -> Optional[int]:
+        if self._arguments[self.__FIRST_CODER_TYPE] is not None:
+            return int(self._arguments[self.__FIRST_CODER_TYPE])
+        else:
+            return None
 
     @property
     def second_coder_type(self) -> Optional[int]:
@@ -1,10 +1,7 @@
 # coding=utf-8
 from typing import List
 
-from src.coders.convolutional.coder import Coder as Convolutional
-from src.coders.cyclical.coder import Coder as Cyclical
-from src.coders.fountain.luby_transform import Coder as LubyTransform
-from src.coders.linear.hamming import Coder as Hamming
+from src.coders.coder_loader import CoderLoader
 from src.endpoint.console.abstract_group_parser import AbstractGroupParser
 from src.endpoint.general_coder_simulate import GeneralCoderSimulate
 from src.statistics.db.enum_coders_type import EnumCodersType
@@ -19,8 +16,8 @@ class ConsoleCoderSimulate(GeneralCoderSimulate):
             coder_parsers: List[AbstractGroupParser],
     ):
         if coder_type_int == EnumCodersType.HAMMING.value:
-            coder_parser: Hamming.HammingCoderParser = ConsoleCoderSimulate._parser_searcher(
-                coder_class=Hamming.HammingCoderParser,
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.HAMMING).HammingCoderParser,
                 coder_parsers=coder_parsers
             )
             super().__init__(
@@ -28,8 +25,8 @@ class ConsoleCoderSimulate(GeneralCoderSimulate):
                 hem_size_pack=coder_parser.hamming_package_length,
             )
         elif coder_type_int == EnumCodersType.CYCLICAL.value:
-            coder_parser: Cyclical.CyclicalCoderParser = ConsoleCoderSimulate._parser_searcher(
-                coder_class=Cyclical.CyclicalCoderParser,
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.CYCLICAL).CyclicalCoderParser,
                 coder_parsers=coder_parsers
             )
             super().__init__(
@@ -38,18 +35,21 @@ class ConsoleCoderSimulate(GeneralCoderSimulate):
                 cyc_poly=coder_parser.cyclic_polynomial,
             )
         elif coder_type_int == EnumCodersType.CONVOLUTION.value:
-            coder_parser: Convolutional.ConvolutionCoderParser = ConsoleCoderSimulate._parser_searcher(
-                coder_class=Convolutional.ConvolutionCoderParser,
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.CONVOLUTION).ConvolutionCoderParser,
                 coder_parsers=coder_parsers
             )
             super().__init__(
                 coder_type_int=coder_type_int,
                 con_count_reg=coder_parser.convolution_memory_register,
                 con_list_poly=coder_parser.convolution_polynomial_list,
+                con_puncturing_rate=coder_parser.convolution_puncturing_rate,
+                con_termination_mode=coder_parser.convolution_termination_mode,
+                con_traceback_depth=coder_parser.convolution_traceback_depth,
             )
         elif coder_type_int == EnumCodersType.FOUNTAIN.value:
-            coder_parser: LubyTransform.FountainCoderParser = ConsoleCoderSimulate._parser_searcher(
-                coder_class=LubyTransform.FountainCoderParser,
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.FOUNTAIN).FountainCoderParser,
                 coder_parsers=coder_parsers
             )
             super().__init__(
@@ -58,6 +58,78 @@ class ConsoleCoderSimulate(GeneralCoderSimulate):
                 fou_size_block=coder_parser.fountain_block_size,
                 fou_count_block=coder_parser.fountain_count_block,
             )
+        elif coder_type_int == EnumCodersType.LINEAR_BLOCK.value:
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.LINEAR_BLOCK).LinearBlockCoderParser,
+                coder_parsers=coder_parsers
+            )
+            super().__init__(
+                coder_type_int=coder_type_int,
+                lin_generator_matrix=coder_parser.linear_generator_matrix,
+                lin_parity_check_matrix=coder_parser.linear_parity_check_matrix,
+            )
+        elif coder_type_int == EnumCodersType.LDPC.value:
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.LDPC).LdpcCoderParser,
+                coder_parsers=coder_parsers
+            )
+            super().__init__(
+                coder_type_int=coder_type_int,
+                ldp_length=coder_parser.ldpc_length,
+                ldp_column_weight=coder_parser.ldpc_column_weight,
+                ldp_row_weight=coder_parser.ldpc_row_weight,
+                ldp_seed=coder_parser.ldpc_seed,
+                ldp_alist=coder_parser.ldpc_alist,
+                ldp_max_iterations=coder_parser.ldpc_max_iterations,
+            )
+        elif coder_type_int == EnumCodersType.BCH.value:
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.BCH).BchCoderParser,
+                coder_parsers=coder_parsers
+            )
+            super().__init__(
+                coder_type_int=coder_type_int,
+                bch_degree=coder_parser.bch_degree,
+                bch_correctable_errors=coder_parser.bch_correctable_errors,
+                bch_information_length=coder_parser.bch_information_length,
+            )
+        elif coder_type_int == EnumCodersType.REED_SOLOMON.value:
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.REED_SOLOMON).ReedSolomonCoderParser,
+                coder_parsers=coder_parsers
+            )
+            super().__init__(
+                coder_type_int=coder_type_int,
+                ree_count_symbols=coder_parser.reed_solomon_count_symbols,
+                ree_count_information_symbols=coder_parser.reed_solomon_count_information_symbols,
+            )
+        elif coder_type_int == EnumCodersType.TURBO.value:
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.TURBO).TurboCoderParser,
+                coder_parsers=coder_parsers
+            )
+            super().__init__(
+                coder_type_int=coder_type_int,
+                tur_information_length=coder_parser.turbo_information_length,
+                tur_feedback=coder_parser.turbo_feedback,
+                tur_polynomial=coder_parser.turbo_polynomial,
+                tur_count_registers=coder_parser.turbo_count_registers,
+                tur_interleaver_length=coder_parser.turbo_interleaver_length,
+                tur_max_iterations=coder_parser.turbo_max_iterations,
+            )
+        elif coder_type_int == EnumCodersType.POLAR.value:
+            coder_parser = ConsoleCoderSimulate._parser_searcher(
+                coder_class=CoderLoader.get_coder_class(EnumCodersType.POLAR).PolarCoderParser,
+                coder_parsers=coder_parsers
+            )
+            super().__init__(
+                coder_type_int=coder_type_int,
+                pol_length=coder_parser.polar_length,
+                pol_information_length=coder_parser.polar_information_length,
+                pol_design_snr=coder_parser.polar_design_snr,
+                pol_construction=coder_parser.polar_construction,
+                pol_list_size=coder_parser.polar_list_size,
+            )
 
     @staticmethod
     def _parser_searcher(
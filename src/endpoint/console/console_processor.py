@@ -7,7 +7,11 @@ from src.endpoint.console.codec_parser import CodecParser
 from src.endpoint.console.coder_parser import CoderParser
 from src.endpoint.console.console_chanel_simulate import ConsoleChanelSimulate
 from src.endpoint.console.console_coder_simulate import ConsoleCoderSimulate
+from src.endpoint.console.console_simulation_listener import ConsoleSimulationListener
+from src.endpoint.general_coder_simulate import GeneralCoderSimulate
 from src.helper.pattern.singleton import Singleton
+from src.statistics.object.statistic_collector import StatisticCollector
+from src.statistics.object.test_result_serializer import TestResultSerializer
 
 
 class ConsoleProcessor(metaclass=Singleton):
@@ -26,6 +30,9 @@ class ConsoleProcessor(metaclass=Singleton):
         self._coderParser = coder_parser if coder_parser is not None else AppParser().coder_parser
 
     def transfer(self):
+        if self._codecParser.extend_statistic is not None:
+            self.extend()
+            return
 
         first_coder: ConsoleCoderSimulate = ConsoleCoderSimulate(
             coder_type_int=self._coderParser.first_coder_type,
@@ -42,6 +49,7 @@ class ConsoleProcessor(metaclass=Singleton):
         chanel: ConsoleChanelSimulate = ConsoleChanelSimulate(
             first_coder_params=first_coder,
             second_coder_params=second_coder,
+            listener=ConsoleSimulationListener(),
             noise_start=self._codecParser.noise_start,
             noise_end=self._codecParser.noise_end,
             count_test=self._codecParser.test_quantity_cycles,
@@ -54,7 +62,8 @@ class ConsoleProcessor(metaclass=Singleton):
             flg_first_interleaver=self._coderParser.first_interleaver_length is not None,
             flg_second_interleaver=self._coderParser.second_interleaver_length is not None,
             length_first_interleaver=self._coderParser.first_interleaver_length,
-            length_second_interleaver=self._coderParser.first_interleaver_length
+            length_second_interleaver=self._coderParser.first_interleaver_length,
+            noise_biased_probability=self._codecParser.noise_biased_probability,
         )
 
         if self._codecParser.codec_type == EnumCodecType.SINGLE:
@@ -63,3 +72,30 @@ class ConsoleProcessor(metaclass=Singleton):
             chanel.start_cascade_test_cycle()
         else:
             raise AssertionError("Impossible situation")
+
+    def extend(self):
+        """
+        Extend stored result by additional trials without recomputation of whole test cycle
+        """
+        statistic: StatisticCollector = TestResultSerializer().deserialize_from_state(
+            self._codecParser.extend_statistic
+        )
+        noise_indexes = None
+        if self._codecParser.extend_min_error_packages is not None:
+            noise_indexes = statistic.get_low_confidence_indexes(self._codecParser.extend_min_error_packages)
+
+        chanel: ConsoleChanelSimulate = ConsoleChanelSimulate(
+            first_coder_params=GeneralCoderSimulate(),
+            second_coder_params=GeneralCoderSimulate(),
+            listener=ConsoleSimulationListener(),
+            count_test=self._codecParser.test_quantity_cycles,
+            test_info=self._codecParser.info_for_test,
+            noise_biased_probability=self._codecParser.noise_biased_probability,
+        )
+
+        if statistic.coders is not None:
+            chanel.start_concatenated_test_extension(statistic, noise_indexes)
+        elif statistic.flgCascade:
+            chanel.start_cascade_test_extension(statistic, noise_indexes)
+        else:
+            chanel.start_first_test_extension(statistic, noise_indexes)
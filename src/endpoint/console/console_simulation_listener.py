@@ -0,0 +1,40 @@
+# coding=utf-8
+from typing import Optional
+
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.endpoint.simulation.progress_info import ProgressInfo
+from src.helper.error.exception.application_exception import ApplicationException
+from src.logger import log
+
+
+class ConsoleSimulationListener(ISimulationListener):
+    """
+    Listener which show notifications of simulation in console
+    """
+    _progressInfo: Optional[ProgressInfo] = None
+
+    def start_testing(self) -> None:
+        log.info("Simulation started")
+
+    def step_finished(self, progress: int) -> None:
+        log.debug("Test case progress {0}%".format(progress))
+
+    def auto_step_finished(self, progress: int) -> None:
+        if self._progressInfo is not None:
+            print("Progress: {0}% - {1:.0f} trials/s, ETA {2}".format(
+                progress,
+                self._progressInfo.trials_per_second,
+                "{0:.0f}s".format(self._progressInfo.eta) if self._progressInfo.eta is not None else "unknown",
+            ))
+        else:
+            print("Progress: {0}%".format(progress))
+
+    def progress_updated(self, progress_info: ProgressInfo) -> None:
+        self._progressInfo = progress_info
+
+    def ended(self) -> None:
+        log.info("Simulation ended")
+
+    def not_correct(self, exception: ApplicationException) -> None:
+        log.error(str(exception))
+        print(exception)
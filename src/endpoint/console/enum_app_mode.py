@@ -5,3 +5,4 @@ from enum import Enum
 class EnumAppMode(Enum):
     GUI = "g"
     CONSOLE = "c"
+    BATCH = "b"
@@ -1,11 +1,13 @@
 # coding=utf-8
-from typing import Optional
+from typing import Optional, List
 
-from src.GUI.globals_signals import globalSignals
 from src.channel.enum_noise_mode import EnumNoiseMode
 from src.endpoint.general_coder_simulate import GeneralCoderSimulate
-from src.endpoint.thread.cascade_coder_test_thread import CascadeCoderTestThread
-from src.endpoint.thread.single_coder_test_thread import SingleCoderTestThread
+from src.endpoint.simulation.cascade_coder_simulation import CascadeCoderSimulation
+from src.endpoint.simulation.concatenated_coder_simulation import ConcatenatedCoderSimulation
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.endpoint.simulation.single_coder_simulation import SingleCoderSimulation
+from src.statistics.object.statistic_collector import StatisticCollector
 
 
 class GeneralChanelSimulate:
@@ -14,9 +16,13 @@ class GeneralChanelSimulate:
     """
     _firstCoderParams: GeneralCoderSimulate
     _secondCoderParams: GeneralCoderSimulate
+    # Coders of concatenated codec from outer to inner
+    _stagesParams: Optional[List[GeneralCoderSimulate]]
 
-    _singleThread: SingleCoderTestThread
-    _cascadeThread: CascadeCoderTestThread
+    _listener: ISimulationListener
+    _singleSimulation: SingleCoderSimulation
+    _cascadeSimulation: CascadeCoderSimulation
+    _concatenatedSimulation: ConcatenatedCoderSimulation
 
     _noiseStart: float
     _noiseEnd: float
@@ -29,18 +35,19 @@ class GeneralChanelSimulate:
     _flgSplitPackage: bool
     _quantityStepsInTestCycle: int
     _packagePeriod: int
+    _noiseBiasedProbability: Optional[float]
 
     _flgFirstInterleaver: bool
     _flgSecondInterleaver: bool
     _lengthFirstInterleaver: int
     _lengthSecondInterleaver: int
+    _lengthStageInterleavers: Optional[List[Optional[int]]]
 
     def __init__(
             self,
             first_coder_params: Optional[GeneralCoderSimulate] = None,
             second_coder_params: Optional[GeneralCoderSimulate] = None,
-            first_thread_class: Optional[SingleCoderTestThread] = None,
-            cascade_thread_class: Optional[CascadeCoderTestThread] = None,
+            listener: Optional[ISimulationListener] = None,
             noise_start: Optional[float] = None,
             noise_end: Optional[float] = None,
             count_test: Optional[int] = None,
@@ -55,12 +62,14 @@ class GeneralChanelSimulate:
             flg_second_interleaver: Optional[bool] = None,
             length_first_interleaver: Optional[int] = None,
             length_second_interleaver: Optional[int] = None,
+            noise_biased_probability: Optional[float] = None,
+            stages_params: Optional[List[GeneralCoderSimulate]] = None,
+            length_stage_interleavers: Optional[List[Optional[int]]] = None,
     ) -> None:
         self._firstCoderParams = first_coder_params
         self._secondCoderParams = second_coder_params
 
-        self._singleThread = first_thread_class
-        self._cascadeThread = cascade_thread_class
+        self._listener = listener
         self._noiseStart = noise_start
         self._noiseEnd = noise_end
         self._countTest = count_test
@@ -75,9 +84,12 @@ class GeneralChanelSimulate:
         self._flgSecondInterleaver = flg_second_interleaver
         self._lengthFirstInterleaver = length_first_interleaver
         self._lengthSecondInterleaver = length_second_interleaver
+        self._noiseBiasedProbability = noise_biased_probability
+        self._stagesParams = stages_params
+        self._lengthStageInterleavers = length_stage_interleavers
 
-    def set_first_coder_thread_class(self):
-        self._singleThread = SingleCoderTestThread(
+    def set_first_coder_simulation(self):
+        self._singleSimulation = SingleCoderSimulation(
             noise_chance=self._noiseStart,
             count_test=self._countTest,
             test_information=self._testInfo,
@@ -88,11 +100,13 @@ class GeneralChanelSimulate:
             noise_mode=self._noiseMode,
             noise_package_period=self._packagePeriod,
             first_interleaver_length=self._lengthFirstInterleaver if self._flgFirstInterleaver else None,
-            quantity_step=self._quantityStepsInTestCycle
+            quantity_step=self._quantityStepsInTestCycle,
+            listener=self._listener,
+            noise_biased_probability=self._noiseBiasedProbability,
         )
 
-    def set_cascade_coder_thread_class(self):
-        self._cascadeThread = CascadeCoderTestThread(
+    def set_cascade_coder_simulation(self):
+        self._cascadeSimulation = CascadeCoderSimulation(
             noise_chance=self._noiseStart,
             count_test=self._countTest,
             test_information=self._testInfo,
@@ -107,32 +121,131 @@ class GeneralChanelSimulate:
             length_first_interleaver=self._lengthFirstInterleaver if self._flgFirstInterleaver else None,
             length_second_interleaver=self._lengthSecondInterleaver if self._flgSecondInterleaver else None,
             quantity_step=self._quantityStepsInTestCycle,
+            listener=self._listener,
+            noise_biased_probability=self._noiseBiasedProbability,
+        )
+
+    def set_concatenated_coder_simulation(self):
+        self._concatenatedSimulation = ConcatenatedCoderSimulation(
+            noise_chance=self._noiseStart,
+            count_test=self._countTest,
+            test_information=self._testInfo,
+            coders=[stage_params.coder for stage_params in self._stagesParams],
+            length_interleavers=self._lengthStageInterleavers
+            if self._lengthStageInterleavers is not None else [None] * len(self._stagesParams),
+            noise_package_period=self._packagePeriod,
+            noise_mode=self._noiseMode,
+            noise_package_length=self._noisePackageLength,
+            start=self._noiseStart,
+            finish=self._noiseEnd,
+            quantity_step=self._quantityStepsInTestCycle,
+            listener=self._listener,
+            noise_biased_probability=self._noiseBiasedProbability,
         )
 
+    def _start_simulation(self, simulation: SingleCoderSimulation) -> None:
+        """
+        Method provide functionality for processing of prepared simulation.
+        By default simulation is processed in current thread, GUI redefine it for background processing
+        :param simulation: SingleCoderSimulation
+        :return: None
+        """
+        simulation.run()
+
     def start_first_single_test(self):
-        globalSignals.startTesting.emit(True)
+        self._listener.start_testing()
         self._firstCoderParams.create_coder()
-        self.set_first_coder_thread_class()
-        self._singleThread.start()
+        self.set_first_coder_simulation()
+        self._start_simulation(self._singleSimulation)
 
     def start_first_test_cycle(self):
-        globalSignals.startTesting.emit(True)
+        self._listener.start_testing()
         self._firstCoderParams.create_coder()
-        self.set_first_coder_thread_class()
-        self._singleThread.set_auto(True)
-        self._singleThread.start()
+        self.set_first_coder_simulation()
+        self._singleSimulation.set_auto(True)
+        self._start_simulation(self._singleSimulation)
 
     def start_cascade_single_test(self):
-        globalSignals.startTesting.emit(True)
+        self._listener.start_testing()
         self._firstCoderParams.create_coder()
         self._secondCoderParams.create_coder()
-        self.set_cascade_coder_thread_class()
-        self._cascadeThread.start()
+        self.set_cascade_coder_simulation()
+        self._start_simulation(self._cascadeSimulation)
 
     def start_cascade_test_cycle(self):
-        globalSignals.startTesting.emit(True)
+        self._listener.start_testing()
         self._firstCoderParams.create_coder()
         self._secondCoderParams.create_coder()
-        self.set_cascade_coder_thread_class()
-        self._cascadeThread.set_auto(True)
-        self._cascadeThread.start()
+        self.set_cascade_coder_simulation()
+        self._cascadeSimulation.set_auto(True)
+        self._start_simulation(self._cascadeSimulation)
+
+    def start_concatenated_single_test(self):
+        self._listener.start_testing()
+        for stage_params in self._stagesParams:
+            stage_params.create_coder()
+        self.set_concatenated_coder_simulation()
+        self._start_simulation(self._concatenatedSimulation)
+
+    def start_concatenated_test_cycle(self):
+        self._listener.start_testing()
+        for stage_params in self._stagesParams:
+            stage_params.create_coder()
+        self.set_concatenated_coder_simulation()
+        self._concatenatedSimulation.set_auto(True)
+        self._start_simulation(self._concatenatedSimulation)
+
+    def _restore_from_statistic(self, statistic: StatisticCollector) -> None:
+        """
+        Method provide functionality for restore test settings from stored result for extension of it
+        :param statistic: StatisticCollector
+        :return: None
+        """
+        # Stored coders should be reused, because some coders (e.g. fountain) are randomly generated
+        self._firstCoderParams.coder = statistic.firstCoder
+        if statistic.flgCascade:
+            self._secondCoderParams.coder = statistic.secondCoder
+        self._flgFirstInterleaver = statistic.lengthFirstInterleaver is not None
+        self._lengthFirstInterleaver = statistic.lengthFirstInterleaver
+        self._flgSecondInterleaver = statistic.lengthSecondInterleaver is not None
+        self._lengthSecondInterleaver = statistic.lengthSecondInterleaver
+        self._noiseStart = statistic.beginNoise
+        self._noiseEnd = statistic.endNoise
+        self._quantityStepsInTestCycle = statistic.quantityStepsInCycle
+        self._noiseMode = statistic.testResult[0].noise_type
+        self._noisePackageLength = statistic.noiseLength
+        self._packagePeriod = statistic.noisePeriod
+        # Result of concatenated codec stores all its coders, first and second coder are only outer and inner of them
+        if statistic.coders is not None:
+            self._stagesParams = []
+            for coder in statistic.coders:
+                stage_params: GeneralCoderSimulate = GeneralCoderSimulate()
+                stage_params.coder = coder
+                self._stagesParams.append(stage_params)
+            self._lengthStageInterleavers = list(statistic.lengthInterleavers) \
+                if statistic.lengthInterleavers is not None else None
+
+    def start_first_test_extension(self, statistic: StatisticCollector, noise_indexes: Optional[List[int]] = None):
+        self._listener.start_testing()
+        self._restore_from_statistic(statistic)
+        self.set_first_coder_simulation()
+        self._singleSimulation.set_extension(statistic, noise_indexes)
+        self._start_simulation(self._singleSimulation)
+
+    def start_cascade_test_extension(self, statistic: StatisticCollector, noise_indexes: Optional[List[int]] = None):
+        self._listener.start_testing()
+        self._restore_from_statistic(statistic)
+        self.set_cascade_coder_simulation()
+        self._cascadeSimulation.set_extension(statistic, noise_indexes)
+        self._start_simulation(self._cascadeSimulation)
+
+    def start_concatenated_test_extension(
+            self,
+            statistic: StatisticCollector,
+            noise_indexes: Optional[List[int]] = None,
+    ):
+        self._listener.start_testing()
+        self._restore_from_statistic(statistic)
+        self.set_concatenated_coder_simulation()
+        self._concatenatedSimulation.set_extension(statistic, noise_indexes)
+        self._start_simulation(self._concatenatedSimulation)
@@ -4,10 +4,7 @@ from typing import Optional
 
 from src.coders.abstract_coder import AbstractCoder
 from src.coders.casts import str_list_to_list
-from src.coders.convolutional.coder import Coder as Convolutional
-from src.coders.cyclical.coder import Coder as Cyclical
-from src.coders.fountain.luby_transform import Coder as LubyTransform
-from src.coders.linear.hamming import Coder as Hamming
+from src.coders.coder_loader import CoderLoader
 from src.statistics.db.enum_coders_type import EnumCodersType
 
 
@@ -23,11 +20,44 @@ class GeneralCoderSimulate(ABC):
 
     _conListPoly: str
     _conCountReg: int
+    _conPuncturingRate: Optional[str]
+    _conTerminationMode: Optional[str]
+    _conTracebackDepth: Optional[int]
 
     _fouSizePack: int
     _fouSizeBlock: int
     _fouCountBlock: int
 
+    _linGeneratorMatrix: Optional[str]
+    _linParityCheckMatrix: Optional[str]
+
+    _ldpLength: Optional[int]
+    _ldpColumnWeight: Optional[int]
+    _ldpRowWeight: Optional[int]
+    _ldpSeed: Optional[int]
+    _ldpAlist: Optional[str]
+    _ldpMaxIterations: Optional[int]
+
+    _bchDegree: Optional[int]
+    _bchCorrectableErrors: Optional[int]
+    _bchInformationLength: Optional[int]
+
+    _reeCountSymbols: Optional[int]
+    _reeCountInformationSymbols: Optional[int]
+
+    _turInformationLength: Optional[int]
+    _turFeedback: Optional[int]
+    _turPolynomial: Optional[int]
+    _turCountRegisters: Optional[int]
+    _turInterleaverLength: Optional[int]
+    _turMaxIterations: Optional[int]
+
+    _polLength: Optional[int]
+    _polInformationLength: Optional[int]
+    _polDesignSnr: Optional[float]
+    _polConstruction: Optional[str]
+    _polListSize: Optional[int]
+
     def __init__(
             self,
             coder_type_int: Optional[int] = None,
@@ -37,9 +67,36 @@ class GeneralCoderSimulate(ABC):
             cyc_poly: Optional[int] = None,
             con_list_poly: Optional[str] = None,
             con_count_reg: Optional[int] = None,
+            con_puncturing_rate: Optional[str] = None,
+            con_termination_mode: Optional[str] = None,
+            con_traceback_depth: Optional[int] = None,
             fou_size_pack: Optional[int] = None,
             fou_size_block: Optional[int] = None,
-            fou_count_block: Optional[int] = None
+            fou_count_block: Optional[int] = None,
+            lin_generator_matrix: Optional[str] = None,
+            lin_parity_check_matrix: Optional[str] = None,
+            ldp_length: Optional[int] = None,
+            ldp_column_weight: Optional[int] = None,
+            ldp_row_weight: Optional[int] = None,
+            ldp_seed: Optional[int] = None,
+            ldp_alist: Optional[str] = None,
+            ldp_max_iterations: Optional[int] = None,
+            bch_degree: Optional[int] = None,
+            bch_correctable_errors: Optional[int] = None,
+            bch_information_length: Optional[int] = None,
+            ree_count_symbols: Optional[int] = None,
+            ree_count_information_symbols: Optional[int] = None,
+            tur_information_length: Optional[int] = None,
+            tur_feedback: Optional[int] = None,
+            tur_polynomial: Optional[int] = None,
+            tur_count_registers: Optional[int] = None,
+            tur_interleaver_length: Optional[int] = None,
+            tur_max_iterations: Optional[int] = None,
+            pol_length: Optional[int] = None,
+            pol_information_length: Optional[int] = None,
+            pol_design_snr: Optional[float] = None,
+            pol_construction: Optional[str] = None,
+            pol_list_size: Optional[int] = None,
     ):
         self._coderTypeInt = coder_type_int
         self._coderType = coder_type
@@ -52,29 +109,107 @@ class GeneralCoderSimulate(ABC):
         self._cycPoly = cyc_poly
         self._conListPoly = con_list_poly
         self._conCountReg = con_count_reg
+        self._conPuncturingRate = con_puncturing_rate
+        self._conTerminationMode = con_termination_mode
+        self._conTracebackDepth = con_traceback_depth
         self._fouSizePack = fou_size_pack
         self._fouSizeBlock = fou_size_block
         self._fouCountBlock = fou_count_block
+        self._linGeneratorMatrix = lin_generator_matrix
+        self._linParityCheckMatrix = lin_parity_check_matrix
+        self._ldpLength = ldp_length
+        self._ldpColumnWeight = ldp_column_weight
+        self._ldpRowWeight = ldp_row_weight
+        self._ldpSeed = ldp_seed
+        self._ldpAlist = ldp_alist
+        self._ldpMaxIterations = ldp_max_iterations
+        self._bchDegree = bch_degree
+        self._bchCorrectableErrors = bch_correctable_errors
+        self._bchInformationLength = bch_information_length
+        self._reeCountSymbols = ree_count_symbols
+        self._reeCountInformationSymbols = ree_count_information_symbols
+        self._turInformationLength = tur_information_length
+        self._turFeedback = tur_feedback
+        self._turPolynomial = tur_polynomial
+        self._turCountRegisters = tur_count_registers
+        self._turInterleaverLength = tur_interleaver_length
+        self._turMaxIterations = tur_max_iterations
+        self._polLength = pol_length
+        self._polInformationLength = pol_information_length
+        self._polDesignSnr = pol_design_snr
+        self._polConstruction = pol_construction
+        self._polListSize = pol_list_size
 
     def create_coder(self) -> AbstractCoder:
         if self._coderTypeInt == EnumCodersType.HAMMING.value:
-            self.coder = Hamming(self._hemSizePack)
+            self.coder = CoderLoader.get_coder_class(EnumCodersType.HAMMING)(self._hemSizePack)
         elif self._coderTypeInt == EnumCodersType.CYCLICAL.value:
-            self.coder = Cyclical(
+            self.coder = CoderLoader.get_coder_class(EnumCodersType.CYCLICAL)(
                 information_length=int(self._cycSizePack),
                 polynomial=int(self._cycPoly)
             )
         elif self._coderTypeInt == EnumCodersType.CONVOLUTION.value:
-            self.coder = Convolutional(
+            coder_class = CoderLoader.get_coder_class(EnumCodersType.CONVOLUTION)
+            self.coder = coder_class(
                 str_list_to_list(self._conListPoly),
                 1,  # TODO change to constant or remove
                 int(len(str_list_to_list(self._conListPoly))),
-                self._conCountReg
+                self._conCountReg,
+                puncturing_matrix=coder_class.get_puncturing_matrix(self._conPuncturingRate),
+                termination_mode=coder_class.get_termination_mode(self._conTerminationMode),
+                traceback_depth=self._conTracebackDepth
             )
         elif self._coderTypeInt == EnumCodersType.FOUNTAIN.value:
-            self.coder = LubyTransform(
+            self.coder = CoderLoader.get_coder_class(EnumCodersType.FOUNTAIN)(
                 int(self._fouSizeBlock),
                 int(self._fouCountBlock),
                 int(self._fouSizePack)
             )
+        elif self._coderTypeInt == EnumCodersType.LINEAR_BLOCK.value:
+            coder_class = CoderLoader.get_coder_class(EnumCodersType.LINEAR_BLOCK)
+            self.coder = coder_class(
+                generator_matrix=coder_class.get_matrix(self._linGeneratorMatrix),
+                parity_check_matrix=coder_class.get_matrix(self._linParityCheckMatrix),
+            )
+        elif self._coderTypeInt == EnumCodersType.LDPC.value:
+            coder_class = CoderLoader.get_coder_class(EnumCodersType.LDPC)
+            self.coder = coder_class(
+                coder_class.get_parity_check_matrix(
+                    length=self._ldpLength,
+                    column_weight=self._ldpColumnWeight or 3,
+                    row_weight=self._ldpRowWeight or 6,
+                    seed=self._ldpSeed,
+                    alist=self._ldpAlist,
+                ),
+                max_iterations=int(self._ldpMaxIterations or 20),
+            )
+        elif self._coderTypeInt == EnumCodersType.BCH.value:
+            self.coder = CoderLoader.get_coder_class(EnumCodersType.BCH)(
+                int(self._bchDegree),
+                int(self._bchCorrectableErrors),
+                information_length=None if self._bchInformationLength is None else int(self._bchInformationLength),
+            )
+        elif self._coderTypeInt == EnumCodersType.REED_SOLOMON.value:
+            self.coder = CoderLoader.get_coder_class(EnumCodersType.REED_SOLOMON)(
+                int(self._reeCountSymbols),
+                int(self._reeCountInformationSymbols),
+            )
+        elif self._coderTypeInt == EnumCodersType.TURBO.value:
+            self.coder = CoderLoader.get_coder_class(EnumCodersType.TURBO)(
+                int(self._turInformationLength),
+                feedback=int(self._turFeedback or 13),
+                polynomial=int(self._turPolynomial or 11),
+                count_registers=int(self._turCountRegisters or 3),
+                interleaver_length=int(self._turInterleaverLength or 0) or None,
+                max_iterations=int(self._turMaxIterations or 8),
+            )
+        elif self._coderTypeInt == EnumCodersType.POLAR.value:
+            coder_class = CoderLoader.get_coder_class(EnumCodersType.POLAR)
+            self.coder = coder_class(
+                int(self._polLength),
+                int(self._polInformationLength),
+                design_snr=float(self._polDesignSnr or 0.0),
+                construction=coder_class.get_construction_mode(self._polConstruction),
+                list_size=int(self._polListSize or 1),
+            )
         return self.coder
@@ -0,0 +1,96 @@
+# coding=utf-8
+from typing import Optional, List
+
+from src.channel.cascadecodec import CascadeCodec
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.coders.abstract_coder import AbstractCoder
+from src.coders.interleaver.Interleaver import Interleaver
+from src.endpoint.simulation.concatenated_coder_simulation import ConcatenatedCoderSimulation
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.statistics.object.statistic_collector import StatisticCollector, TestResult
+
+
+class CascadeCoderSimulation(ConcatenatedCoderSimulation):
+    """
+    Simulation of transfer via cascade codec with two coders
+    """
+    _firstCoder: AbstractCoder
+    _secondCoder: AbstractCoder
+
+    _length_first_interleaver: Optional[int]
+    _length_second_interleaver: Optional[int]
+
+    def __init__(
+            self,
+            noise_chance: float,
+            count_test: int,
+            test_information: int,
+            current_coder: AbstractCoder,
+            first_coder: AbstractCoder,
+            second_coder: AbstractCoder,
+            noise_mode: EnumNoiseMode,
+            noise_package_length: int,
+            noise_package_period: int,
+            length_first_interleaver: Optional[int],
+            length_second_interleaver: Optional[int],
+            start: float,
+            finish: float,
+            quantity_step: int,
+            listener: ISimulationListener,
+            noise_biased_probability: Optional[float] = None,
+    ):
+        # Attributes of channel are set before constructor of base class which creates channel
+        self._length_first_interleaver = length_first_interleaver
+        self._length_second_interleaver = length_second_interleaver
+        self._firstCoder = first_coder
+        self._secondCoder = second_coder
+        # Second interleaver shuffles codewords of outer coder, first interleaver - codewords of inner coder
+        super().__init__(
+            noise_chance=noise_chance,
+            count_test=count_test,
+            test_information=test_information,
+            coders=[first_coder, second_coder],
+            length_interleavers=[length_second_interleaver, length_first_interleaver],
+            start=start,
+            finish=finish,
+            noise_package_length=noise_package_length,
+            noise_package_period=noise_package_period,
+            noise_mode=noise_mode,
+            quantity_step=quantity_step,
+            listener=listener,
+            noise_biased_probability=noise_biased_probability,
+        )
+        self._currentCoder = current_coder
+        self._coderName = 'Cascade codec: {0} and {1}'.format(first_coder.name, second_coder.name)
+
+    def _create_channel(self, noise_biased_probability: Optional[float]) -> CascadeCodec:
+        return CascadeCodec(
+            first_coder=self._firstCoder,
+            second_coder=self._secondCoder,
+            noise_probability=self._noiseChance,
+            count_cyclical=self._countTest,
+            duplex=False,
+            first_interleaver=Interleaver(self._length_first_interleaver
+                                          ) if self._length_first_interleaver is not None else None,
+            second_interleaver=Interleaver(self._length_second_interleaver
+                                           ) if self._length_second_interleaver is not None else None,
+            noise_package_length=self._noisePackageLength,
+            noise_package_period=self._noisePackagePeriod,
+            noise_mode=self._noiseMode,
+            noise_biased_probability=noise_biased_probability,
+        )
+
+    def _get_statistic(self, test_result: List[TestResult]) -> StatisticCollector:
+        return StatisticCollector(
+            flgCascade=True,
+            firstCoder=self._firstCoder,
+            secondCoder=self._secondCoder,
+            testResult=test_result,
+            lengthFirstInterleaver=self._length_first_interleaver,
+            lengthSecondInterleaver=self._length_second_interleaver,
+            beginNoise=self._start_t,
+            endNoise=self._finish_t,
+            quantityStepsInCycle=self._quantity_steps,
+            noisePeriod=self._noisePackagePeriod,
+            noiseLength=self._noisePackageLength,
+        )
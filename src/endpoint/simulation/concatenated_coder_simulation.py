@@ -0,0 +1,91 @@
+# coding=utf-8
+from typing import Optional, List
+
+from src.channel.codec_stage import CodecStage
+from src.channel.concatenated_codec import ConcatenatedCodec
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.coders.abstract_coder import AbstractCoder
+from src.coders.interleaver.Interleaver import Interleaver
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.endpoint.simulation.single_coder_simulation import SingleCoderSimulation
+from src.statistics.object.statistic_collector import StatisticCollector, TestResult
+
+
+class ConcatenatedCoderSimulation(SingleCoderSimulation):
+    """
+    Simulation of transfer via concatenated codec with coders from outer to inner
+    """
+    _coders: List[AbstractCoder]
+    # Lengths of interleavers of codewords of each coder, None without interleaver
+    _lengthInterleavers: List[Optional[int]]
+
+    def __init__(
+            self,
+            noise_chance: float,
+            count_test: int,
+            test_information: int,
+            coders: List[AbstractCoder],
+            length_interleavers: List[Optional[int]],
+            noise_mode: EnumNoiseMode,
+            noise_package_length: int,
+            noise_package_period: int,
+            start: float,
+            finish: float,
+            quantity_step: int,
+            listener: ISimulationListener,
+            noise_biased_probability: Optional[float] = None,
+    ):
+        # Attributes of channel are set before constructor of base class which creates channel
+        self._coders = coders
+        self._lengthInterleavers = length_interleavers
+        super().__init__(
+            noise_chance=noise_chance,
+            count_test=count_test,
+            test_information=test_information,
+            current_coder=coders[0],
+            start=start,
+            finish=finish,
+            noise_package_length=noise_package_length,
+            noise_package_period=noise_package_period,
+            noise_mode=noise_mode,
+            first_interleaver_length=length_interleavers[-1],
+            quantity_step=quantity_step,
+            listener=listener,
+            noise_biased_probability=noise_biased_probability,
+        )
+        self._coderSpeed = 1.0
+        for coder in coders:
+            self._coderSpeed *= coder.get_speed()
+        self._coderName = 'Concatenated codec: {0}'.format(", ".join(coder.name for coder in coders))
+
+    def _create_channel(self, noise_biased_probability: Optional[float]) -> ConcatenatedCodec:
+        return ConcatenatedCodec(
+            stages=[
+                CodecStage(coder, Interleaver(length) if length is not None else None)
+                for coder, length in zip(self._coders, self._lengthInterleavers)
+            ],
+            noise_probability=self._noiseChance,
+            count_cyclical=self._countTest,
+            duplex=False,
+            noise_package_length=self._noisePackageLength,
+            noise_package_period=self._noisePackagePeriod,
+            noise_mode=self._noiseMode,
+            noise_biased_probability=noise_biased_probability,
+        )
+
+    def _get_statistic(self, test_result: List[TestResult]) -> StatisticCollector:
+        return StatisticCollector(
+            flgCascade=True,
+            firstCoder=self._coders[0],
+            secondCoder=self._coders[-1],
+            testResult=test_result,
+            lengthFirstInterleaver=self._lengthInterleavers[-1],
+            lengthSecondInterleaver=self._lengthInterleavers[0],
+            beginNoise=self._start_t,
+            endNoise=self._finish_t,
+            quantityStepsInCycle=self._quantity_steps,
+            noisePeriod=self._noisePackagePeriod,
+            noiseLength=self._noisePackageLength,
+            coders=self._coders,
+            lengthInterleavers=self._lengthInterleavers,
+        )
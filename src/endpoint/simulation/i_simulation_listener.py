@@ -0,0 +1,45 @@
+# coding=utf-8
+from abc import ABC, abstractmethod
+
+from src.endpoint.simulation.progress_info import ProgressInfo
+from src.helper.error.exception.application_exception import ApplicationException
+
+
+class ISimulationListener(ABC):
+    """
+    Interface for notification about progress of simulation. Implementations decide how to show it
+    (Qt signals for GUI, log and standard output for console)
+    """
+
+    @abstractmethod
+    def start_testing(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def step_finished(self, progress: int) -> None:
+        """
+        :param progress: int Progress of current test case in percents
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def auto_step_finished(self, progress: int) -> None:
+        """
+        :param progress: int Progress of test cycle in percents
+        """
+        raise NotImplementedError
+
+    def progress_updated(self, progress_info: ProgressInfo) -> None:
+        """
+        Notification about whole simulation with speed and ETA, it's sent not more often then ProgressReporter interval
+        :param progress_info: ProgressInfo
+        """
+        pass
+
+    @abstractmethod
+    def ended(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def not_correct(self, exception: ApplicationException) -> None:
+        raise NotImplementedError
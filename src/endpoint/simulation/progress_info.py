@@ -0,0 +1,25 @@
+# coding=utf-8
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ProgressInfo:
+    quantity_trials: int
+    quantity_total_trials: int
+    trials_per_second: float
+    # Estimated time to end of simulation in seconds, None if it cannot be estimated yet
+    eta: Optional[float]
+
+    @property
+    def percent(self) -> float:
+        return 100.0 * self.quantity_trials / self.quantity_total_trials if self.quantity_total_trials else 0.0
+
+    def __str__(self) -> str:
+        return "{0:.0f}% ({1} of {2} trials, {3:.0f} trials/s, ETA {4})".format(
+            self.percent,
+            self.quantity_trials,
+            self.quantity_total_trials,
+            self.trials_per_second,
+            "{0:.0f}s".format(self.eta) if self.eta is not None else "unknown",
+        )
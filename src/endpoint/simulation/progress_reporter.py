@@ -0,0 +1,112 @@
+# coding=utf-8
+import time
+from typing import Dict, Optional, Tuple
+
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.endpoint.simulation.progress_info import ProgressInfo
+
+
+def _get_progress_info(quantity_trials: int, quantity_total_trials: int, duration: float) -> ProgressInfo:
+    trials_per_second: float = quantity_trials / duration if duration > 0 else 0.0
+    return ProgressInfo(
+        quantity_trials=quantity_trials,
+        quantity_total_trials=quantity_total_trials,
+        trials_per_second=trials_per_second,
+        eta=max(quantity_total_trials - quantity_trials, 0) / trials_per_second if trials_per_second > 0 else None,
+    )
+
+
+class ProgressReporter:
+    """
+    Class provide functionality for rate limited notification of listener about progress,
+    so cost of notification doesn't depend on quantity of trials
+    """
+    DEFAULT_INTERVAL: float = 0.1
+
+    _listener: ISimulationListener
+    _interval: float
+    _quantityTrials: int = 0
+    _quantityTotalTrials: int = 0
+    _startTime: float = 0.0
+    _lastReportTime: float = 0.0
+
+    def __init__(self, listener: ISimulationListener, interval: float = DEFAULT_INTERVAL):
+        self._listener = listener
+        self._interval = interval
+
+    def start(self, quantity_total_trials: int) -> None:
+        """
+        Method provide functionality for beginning of new simulation
+        :param quantity_total_trials: int Expected quantity of trials (upper bound for adaptive tests)
+        :return: None
+        """
+        self._quantityTrials = 0
+        self._quantityTotalTrials = quantity_total_trials
+        self._startTime = time.monotonic()
+        self._lastReportTime = self._startTime
+
+    def update(self, case_progress: float, quantity_trials: int = 1) -> None:
+        """
+        Method provide functionality for registration of processed trials, listener is notified not more often
+        then once per interval
+        :param case_progress: float Progress of current test case in percents
+        :param quantity_trials: int Quantity of processed trials
+        :return: None
+        """
+        self._quantityTrials += quantity_trials
+        current_time: float = time.monotonic()
+        if current_time - self._lastReportTime >= self._interval:
+            self._lastReportTime = current_time
+            self._listener.step_finished(int(case_progress))
+            self._listener.progress_updated(self.progress_info)
+
+    def finish(self) -> None:
+        self._quantityTotalTrials = self._quantityTrials
+        self._listener.progress_updated(self.progress_info)
+
+    @property
+    def progress_info(self) -> ProgressInfo:
+        return _get_progress_info(
+            self._quantityTrials,
+            self._quantityTotalTrials,
+            time.monotonic() - self._startTime,
+        )
+
+
+class ProgressAggregator:
+    """
+    Class provide functionality for aggregation of progress from several parallel simulations (e.g. batch workers)
+    """
+    _interval: float
+    _sources: Dict[object, Tuple[int, int]]
+    _startTime: float
+    _lastReportTime: float
+
+    def __init__(self, interval: float = ProgressReporter.DEFAULT_INTERVAL):
+        self._interval = interval
+        self._sources = {}
+        self._startTime = time.monotonic()
+        self._lastReportTime = self._startTime
+
+    def update(self, source: object, quantity_trials: int, quantity_total_trials: int) -> Optional[ProgressInfo]:
+        """
+        Method provide functionality for registration of progress of one simulation
+        :param source: object Identifier of simulation
+        :param quantity_trials: int
+        :param quantity_total_trials: int
+        :return: Optional[ProgressInfo] Aggregated progress if it should be reported (not more often then interval)
+        """
+        self._sources[source] = (quantity_trials, quantity_total_trials)
+        current_time: float = time.monotonic()
+        if current_time - self._lastReportTime < self._interval:
+            return None
+        self._lastReportTime = current_time
+        return self.progress_info
+
+    @property
+    def progress_info(self) -> ProgressInfo:
+        return _get_progress_info(
+            sum(quantity_trials for quantity_trials, _ in self._sources.values()),
+            sum(quantity_total_trials for _, quantity_total_trials in self._sources.values()),
+            time.monotonic() - self._startTime,
+        )
@@ -0,0 +1,408 @@
+# coding=utf-8
+from typing import Dict, List, Optional
+
+from src.channel.codec import Codec
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.channel.enum_package_transfer_result import EnumPackageTransferResult
+from src.channel.stage_profiler import StageProfiler
+from src.coders.abstract_coder import AbstractCoder
+from src.coders.casts import int_to_bit_list
+from src.coders.interleaver.Interleaver import Interleaver
+from src.config.config import Config
+from src.config.config_processor import ConfigProcessor
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.endpoint.simulation.progress_reporter import ProgressReporter
+from src.helper.calc.simple_calculation_for_transfer_process import SimpleCalculationForTransferProcess
+from src.helper.error.exception.application_exception import ApplicationException
+from src.logger import log
+from src.statistics.object.statistic_collector import CaseResult, TestResult, StatisticCollector
+from src.statistics.object.test_result_serializer import TestResultSerializer
+
+
+class SingleCoderSimulation:
+    """
+    Simulation of transfer via codec with one coder. It doesn't depend on GUI and notifies about progress via listener
+    """
+    _MIN_PERCENT: float = 0.00
+    _MAX_PERCENT: float = 100.00
+
+    class GlobalTestStatistic:
+        """
+        Counters of all trials with one noise. Layout is fixed by slots, so accumulation doesn't create objects
+        """
+        __slots__ = (
+            "quantity_successful_package", "quantity_error_package", "quantity_repair_package",
+            "quantity_shadow_package", "quantity_correct_bits", "quantity_error_bits", "based_error_bits",
+            "based_correct_bits", "weighted_error_package", "weighted_error_package_square",
+        )
+
+        def __init__(self):
+            self.quantity_successful_package: int = 0
+            self.quantity_error_package: int = 0
+            self.quantity_repair_package: int = 0
+            self.quantity_shadow_package: int = 0
+            self.quantity_correct_bits: int = 0
+            self.quantity_error_bits: int = 0
+            self.based_error_bits: int = 0
+            self.based_correct_bits: int = 0
+            self.weighted_error_package: float = 0.0
+            self.weighted_error_package_square: float = 0.0
+
+        def add(self, transfer_statistic: Codec.TransferStatistic) -> None:
+            """
+            Method provide functionality for accumulation of counters of one trial
+            :param transfer_statistic: Codec.TransferStatistic
+            :return: None
+            """
+            if transfer_statistic.result_status == EnumPackageTransferResult.SUCCESS:
+                self.quantity_successful_package += 1
+            elif transfer_statistic.result_status == EnumPackageTransferResult.REPAIR:
+                self.quantity_repair_package += 1
+            else:
+                if transfer_statistic.result_status == EnumPackageTransferResult.ERROR:
+                    self.quantity_error_package += 1
+                else:
+                    self.quantity_shadow_package += 1
+                # Package decoded into wrong word is failed too
+                self.weighted_error_package += transfer_statistic.likelihood_weight
+                self.weighted_error_package_square += transfer_statistic.likelihood_weight ** 2
+
+            self.quantity_correct_bits += transfer_statistic.quantity_successful_bits
+            self.quantity_error_bits += transfer_statistic.quantity_error_bits
+            self.based_correct_bits += transfer_statistic.based_correct_bits
+            self.based_error_bits += transfer_statistic.based_error_bits
+
+        def merge(self, other: 'SingleCoderSimulation.GlobalTestStatistic') -> None:
+            """
+            Method provide functionality for merging counters of other trials (e.g. processed by other worker)
+            :param other: SingleCoderSimulation.GlobalTestStatistic
+            :return: None
+            """
+            for counter in self.__slots__:
+                setattr(self, counter, getattr(self, counter) + getattr(other, counter))
+
+    _information_dict: Dict = {}
+    _listener: ISimulationListener
+    _progressReporter: ProgressReporter
+    _noiseChance: float = 0
+    _countTest: int = 1
+    _information: int = 1
+    _mode: int = 0
+    _currentCoder: AbstractCoder
+    _flg_auto: bool = False
+    _progress: float = 0.0
+    _length_interleaver: int
+
+    # Extension of stored result
+    _extendStatistic: Optional[StatisticCollector] = None
+    _extendIndexes: Optional[List[int]] = None
+
+    # Storing of result
+    _resultFileName: Optional[str] = None
+    _flgGraphic: bool = True
+
+    _start_t: float
+    _finish_t: float
+    _quantity_steps: int
+
+    # Package noise mode attr
+    _noiseMode: EnumNoiseMode
+    _noisePackageLength: int
+    _noisePackagePeriod: int
+
+    def __init__(
+            self,
+            noise_chance: float,
+            count_test: int,
+            test_information: int,
+            current_coder: AbstractCoder,
+            noise_mode: EnumNoiseMode,
+            noise_package_length: int,
+            noise_package_period: int,
+            first_interleaver_length: Optional[int],
+            start: float,
+            finish: float,
+            quantity_step: int,
+            listener: ISimulationListener,
+            noise_biased_probability: Optional[float] = None,
+    ):
+        self._listener = listener
+        self._progressReporter = ProgressReporter(listener)
+        self._start_t = start
+        self._finish_t = finish
+
+        self._length_interleaver = first_interleaver_length
+        self._currentCoder = current_coder
+        self._noiseChance = noise_chance
+        self._countTest = count_test
+        self._information = test_information
+        self._coderSpeed = self._currentCoder.get_speed()
+        self._coderName = self._currentCoder.name
+        self._noiseMode = noise_mode
+        self._noisePackageLength = noise_package_length
+        self._noisePackagePeriod = noise_package_period
+        self._quantity_steps = quantity_step
+
+        self.channel = self._create_channel(noise_biased_probability)
+
+    def _create_channel(self, noise_biased_probability: Optional[float]) -> Codec:
+        """
+        Method provide functionality for creation of channel of simulation. It's called once by constructor,
+        so subclass should set attributes used by its channel before constructor of this class
+        :param noise_biased_probability: Optional[float]
+        :return: Codec
+        """
+        return Codec(
+            coder=self._currentCoder,
+            noise_probability=self._noiseChance,
+            count_cyclical=self._countTest,
+            duplex=False,
+            interleaver=Interleaver(self._length_interleaver) if self._length_interleaver is not None else None,
+            noise_mode=self._noiseMode,
+            noise_package_length=self._noisePackageLength,
+            noise_package_period=self._noisePackagePeriod,
+            noise_biased_probability=noise_biased_probability,
+        )
+
+    def set_auto(self, flag: bool) -> None:
+        """
+        Method provide functionality for change flag for automatic testing
+        :return: None
+        """
+        self._flg_auto = flag
+
+    def set_result_file_name(self, file_name: str) -> None:
+        """
+        Method provide functionality for storing result in specified files instead of last result files
+        :param file_name: str Path to result files without extension
+        :return: None
+        """
+        self._resultFileName = file_name
+
+    def set_flg_graphic(self, flag: bool) -> None:
+        """
+        Method provide functionality for disabling of graphic (e.g. for batch jobs), even if it's enabled in config
+        :param flag: bool
+        :return: None
+        """
+        self._flgGraphic = flag
+
+    def set_extension(self, statistic: StatisticCollector, noise_indexes: Optional[List[int]] = None) -> None:
+        """
+        Method provide functionality for extension of stored result by additional trials instead of new test cycle
+        :param statistic: StatisticCollector Result which should be extended
+        :param noise_indexes: Optional[List[int]] Indexes of extended noise levels, all levels if None
+        :return: None
+        """
+        self._extendStatistic = statistic
+        self._extendIndexes = noise_indexes
+
+    def _single_test(self) -> TestResult:
+        """
+        Method provide functionality for processing single test case
+        :return: TestResult
+        """
+        adaptive_setting: Config.AdaptiveSetting = ConfigProcessor().config.adaptive_setting
+        self._progress = self._MIN_PERCENT
+        if adaptive_setting.flg_enabled:
+            test_result: TestResult = self._adaptive_test(adaptive_setting)
+        else:
+            test_result: TestResult = self._run_trials(self._countTest, self._MAX_PERCENT / self._countTest)
+
+        test_result.update_confidence_interval(adaptive_setting.confidence_level)
+        return test_result
+
+    def _adaptive_test(self, adaptive_setting: Config.AdaptiveSetting) -> TestResult:
+        """
+        Method provide functionality for processing test case by chunks of trials until target quantity of
+        package errors or target width of confidence interval is reached (but not more then maximal budget)
+        :param adaptive_setting: Config.AdaptiveSetting
+        :return: TestResult
+        """
+        step: float = self._MAX_PERCENT / adaptive_setting.max_count_test
+        quantity_test: int = min(adaptive_setting.chunk_size, adaptive_setting.max_count_test)
+        test_result: TestResult = self._run_trials(quantity_test, step)
+
+        while quantity_test < adaptive_setting.max_count_test:
+            if test_result.failed_packages >= adaptive_setting.target_error_packages:
+                break
+            test_result.update_confidence_interval(adaptive_setting.confidence_level)
+            if adaptive_setting.max_relative_interval_width > 0 \
+                    and test_result.relative_interval_width <= adaptive_setting.max_relative_interval_width:
+                break
+
+            chunk_size: int = min(adaptive_setting.chunk_size, adaptive_setting.max_count_test - quantity_test)
+            test_result.merge(self._run_trials(chunk_size, step))
+            quantity_test += chunk_size
+
+        log.debug("Adaptive test finished after {0} trials with {1} package errors".format(
+            quantity_test, test_result.failed_packages))
+        return test_result
+
+    def _run_trials(self, count_test: int, step: float) -> TestResult:
+        """
+        Method provide functionality for processing fixed quantity of trials with current noise
+        :param count_test: int Quantity of trials
+        :param step: float Progress of one trial in percents
+        :return: TestResult
+        """
+        information: list = int_to_bit_list(self._information)
+        case_result_list: List[CaseResult] = []
+        global_test_statistic: SingleCoderSimulation.GlobalTestStatistic = SingleCoderSimulation.GlobalTestStatistic()
+        profiler: Optional[StageProfiler] = StageProfiler() \
+            if ConfigProcessor().config.profiling_setting.flg_enabled else None
+        self.channel.set_profiler(profiler)
+        log.debug("Test cycle begin")
+        for number_of_test in range(count_test):
+            transfer_statistic: Codec.TransferStatistic = self.channel.transfer_one_step(information)
+            global_test_statistic.add(transfer_statistic)
+            self._progress += step
+            self._progressReporter.update(self._progress)
+
+            case_result_list.append(CaseResult(
+                successfulBits=transfer_statistic.quantity_successful_bits,
+                repairBits=transfer_statistic.quantity_repair_bits,
+                changedBits=transfer_statistic.quantity_changed_bits,
+                errorBits=transfer_statistic.quantity_error_bits
+            ))
+
+        return TestResult(
+            list_case_result=case_result_list,
+            first_coder=self._currentCoder,
+            second_coder=None,
+            noise_type=self._noiseMode,
+            noise=self.channel.noiseProbability,
+            flg_cascade=True,
+            successful_packages=global_test_statistic.quantity_successful_package,
+            repair_packages=global_test_statistic.quantity_repair_package,
+            changed_packages=global_test_statistic.quantity_repair_package,
+            error_packages=global_test_statistic.quantity_error_package,
+            shadow_packages=global_test_statistic.quantity_shadow_package,
+            quantity_correct_bits=global_test_statistic.quantity_correct_bits,
+            quantity_error_bits=global_test_statistic.quantity_error_bits,
+            based_correct_bits=global_test_statistic.based_correct_bits,
+            based_error_bits=global_test_statistic.based_error_bits,
+            weighted_error_packages=global_test_statistic.weighted_error_package,
+            weighted_error_packages_square=global_test_statistic.weighted_error_package_square,
+            stage_durations=profiler.durations if profiler is not None else None,
+            stage_calls=profiler.calls if profiler is not None else None,
+        )
+
+    def _auto_test(self) -> List[TestResult]:
+        log.debug("Auto-test button pressed")
+        step: float = SimpleCalculationForTransferProcess.calc_noise_of_steps_different(
+            start=self._start_t,
+            finish=self._finish_t,
+            quantity_steps=self._quantity_steps
+        )
+        progress: int = 0
+        sum_result_of_single_test: List[TestResult] = []
+        for iterator in [self._start_t + iterator * step for iterator in range(self._quantity_steps)]:
+            progress += int(self._MAX_PERCENT / self._quantity_steps)
+            self.channel.noiseProbability = self._MAX_PERCENT * (1 / (iterator + 1))
+            sum_result_of_single_test.append(self._single_test())
+            self._listener.auto_step_finished(int(progress))
+
+        self._listener.auto_step_finished(int(self._MAX_PERCENT))
+        self._listener.auto_step_finished(int(self._MAX_PERCENT))
+        return sum_result_of_single_test
+
+    def _extend_test(self) -> StatisticCollector:
+        """
+        Method provide functionality for running additional trials only for selected noise levels
+        and merging their counters into stored result
+        :return: StatisticCollector
+        """
+        log.debug("Extension of stored result begin")
+        noise_indexes: List[int] = self._extendIndexes if self._extendIndexes is not None \
+            else list(range(len(self._extendStatistic.testResult)))
+        progress: int = 0
+        for index in noise_indexes:
+            progress += int(self._MAX_PERCENT / len(noise_indexes))
+            self.channel.noiseProbability = self._extendStatistic.testResult[index].noise
+            self._extendStatistic.testResult[index].merge(self._single_test())
+            self._listener.auto_step_finished(int(progress))
+
+        self._listener.auto_step_finished(int(self._MAX_PERCENT))
+        return self._extendStatistic
+
+    def _get_statistic(self, test_result: List[TestResult]) -> StatisticCollector:
+        """
+        Method provide functionality for collecting results of test with settings of this simulation
+        :param test_result: List[TestResult]
+        :return: StatisticCollector
+        """
+        return StatisticCollector(
+            flgCascade=False,
+            firstCoder=self._currentCoder,
+            secondCoder=None,
+            testResult=test_result,
+            lengthFirstInterleaver=self._length_interleaver,
+            lengthSecondInterleaver=None,
+            beginNoise=self._start_t,
+            endNoise=self._finish_t,
+            quantityStepsInCycle=self._quantity_steps,
+            noisePeriod=self._noisePackagePeriod,
+            noiseLength=self._noisePackageLength,
+        )
+
+    def _get_quantity_total_trials(self) -> int:
+        """
+        Method provide functionality for estimation of quantity of trials in simulation
+        (upper bound if adaptive test is enabled)
+        :return: int
+        """
+        adaptive_setting: Config.AdaptiveSetting = ConfigProcessor().config.adaptive_setting
+        count_test: int = adaptive_setting.max_count_test if adaptive_setting.flg_enabled else self._countTest
+        if self._extendStatistic is not None:
+            return count_test * (len(self._extendIndexes) if self._extendIndexes is not None
+                                 else len(self._extendStatistic.testResult))
+        elif self._flg_auto:
+            return count_test * self._quantity_steps
+        return count_test
+
+    def run(self) -> Optional[StatisticCollector]:
+        """
+        Method provide functionality for processing of simulation in current thread
+        :return: Optional[StatisticCollector] Result of simulation, None if error occurs
+        """
+        # noinspection PyBroadException
+        try:
+            self._progressReporter.start(self._get_quantity_total_trials())
+            if self._extendStatistic is not None:
+                statistic = self._extend_test()
+            elif self._flg_auto:
+                statistic = self._get_statistic(self._auto_test())
+            else:
+                statistic = self._get_statistic([self._single_test()])
+
+            self._progressReporter.finish()
+            self._listener.ended()
+            # Graphic should showing only for Cycle of the test
+            if (self._flg_auto or self._extendStatistic is not None) and self._flgGraphic \
+                    and ConfigProcessor().config.graphic_setting.flg_enabled:
+                from src.GUI.graphics import GraphicController
+                GraphicController().draw_graphic(statistic)
+
+            self._listener.step_finished(int(self._MAX_PERCENT))
+
+            # DB Action
+            if ConfigProcessor().config.db_setting.flg_used:
+                TestResultSerializer().serialize_to_db(statistic)
+            if self._resultFileName is None:
+                TestResultSerializer().serialize_to_json(statistic)
+                TestResultSerializer().serialize_to_state(statistic)
+            else:
+                TestResultSerializer().serialize_to_json(statistic, "{0}.json".format(self._resultFileName))
+                TestResultSerializer().serialize_to_state(statistic, "{0}.state".format(self._resultFileName))
+            log.debug("End of test cycle")
+            return statistic
+
+        except ApplicationException as application_exception:
+            self._listener.ended()
+            self._listener.not_correct(application_exception)
+        except Exception as err:
+            self._listener.ended()
+            log.error(str(err))
+            self._listener.not_correct(ApplicationException(previous=err))
+        return None
@@ -0,0 +1,18 @@
+# coding=utf-8
+from PyQt5.QtCore import QThread
+
+from src.endpoint.simulation.single_coder_simulation import SingleCoderSimulation
+
+
+class SimulationThread(QThread):
+    """
+    Thread for processing of simulation in background without blocking of GUI
+    """
+    _simulation: SingleCoderSimulation
+
+    def __init__(self, simulation: SingleCoderSimulation):
+        super(SimulationThread, self).__init__()
+        self._simulation = simulation
+
+    def run(self):
+        self._simulation.run()
@@ -0,0 +1,57 @@
+# coding=utf-8
+from statistics import NormalDist
+from typing import Tuple
+
+from math import sqrt
+
+
+class ConfidenceCalculation:
+
+    @staticmethod
+    def get_wilson_interval(quantity_errors: int, quantity_tests: int, confidence_level: float) -> Tuple[float, float]:
+        """
+        Method provide functionality for determination Wilson score interval of error probability.
+        Interval is correct even if quantity of errors equals zero
+        :param quantity_errors: int
+        :param quantity_tests: int
+        :param confidence_level: float from 0.0 to 1.0
+        :return: Tuple[float, float] low and high bounds of interval
+        """
+        if quantity_tests == 0:
+            return 0.0, 1.0
+
+        z: float = NormalDist().inv_cdf(0.5 + confidence_level / 2)
+        estimate: float = quantity_errors / quantity_tests
+        denominator: float = 1 + z ** 2 / quantity_tests
+        center: float = (estimate + z ** 2 / (2 * quantity_tests)) / denominator
+        half_width: float = z * sqrt(
+            estimate * (1 - estimate) / quantity_tests + z ** 2 / (4 * quantity_tests ** 2)
+        ) / denominator
+        low: float = max(0.0, center - half_width) if quantity_errors != 0 else 0.0
+        high: float = min(1.0, center + half_width) if quantity_errors != quantity_tests else 1.0
+        return low, high
+
+    @staticmethod
+    def get_weighted_interval(
+            sum_weights: float,
+            sum_square_weights: float,
+            quantity_tests: int,
+            confidence_level: float
+    ) -> Tuple[float, float]:
+        """
+        Method provide functionality for determination normal interval of probability which estimated as mean of
+        likelihood weights of error events (importance sampling)
+        :param sum_weights: float Sum of weights of error events
+        :param sum_square_weights: float Sum of squares of weights of error events
+        :param quantity_tests: int
+        :param confidence_level: float from 0.0 to 1.0
+        :return: Tuple[float, float] low and high bounds of interval
+        """
+        if quantity_tests == 0:
+            return 0.0, 1.0
+
+        z: float = NormalDist().inv_cdf(0.5 + confidence_level / 2)
+        estimate: float = sum_weights / quantity_tests
+        variance: float = max(0.0, sum_square_weights / quantity_tests - estimate ** 2)
+        half_width: float = z * sqrt(variance / quantity_tests)
+        return max(0.0, estimate - half_width), min(1.0, estimate + half_width)
@@ -0,0 +1,190 @@
+# coding=utf-8
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.helper.error.exception.codding_exception import CodingException
+
+
+class GaloisField:
+    """
+    Arithmetic of GF(2^m) by tables of logarithms and powers of primitive element alpha.
+    Element is packed into integer, bit i is coefficient of alpha^i
+    """
+    # Primitive polynomials for degree of field, bit i is coefficient of x^i
+    PRIMITIVE_POLYNOMIALS: Dict[int, int] = {
+        2: 0x7,
+        3: 0xB,
+        4: 0x13,
+        5: 0x25,
+        6: 0x43,
+        7: 0x89,
+        8: 0x11D,
+        9: 0x211,
+        10: 0x409,
+        11: 0x805,
+        12: 0x1053,
+        13: 0x201B,
+        14: 0x4443,
+        15: 0x8003,
+        16: 0x1100B,
+    }
+
+    degree: int
+    # Quantity of elements
+    size: int
+    primitivePolynomial: int
+    # Powers of alpha, table is doubled, so sum of two logarithms can be used without reduction
+    exp: np.ndarray
+    # Logarithms of elements, logarithm of zero is undefined and equals 0
+    log: np.ndarray
+    # Copies of tables for arithmetic of single elements, indexing of lists is faster
+    _expList: List[int]
+    _logList: List[int]
+
+    def __init__(self, degree: int, primitive_polynomial: Optional[int] = None):
+        if primitive_polynomial is None:
+            primitive_polynomial = self.PRIMITIVE_POLYNOMIALS.get(degree, 0)
+        self.degree = degree
+        self.size = 1 << degree
+        self.primitivePolynomial = primitive_polynomial
+
+        # Tables are built only for polynomial of correct degree
+        exp: List[int] = [0] * (2 * self.order) if primitive_polynomial.bit_length() - 1 == degree else []
+        log: List[int] = [0] * self.size if exp else []
+        element: int = 1
+        for power in range(len(exp) // 2):
+            exp[power] = exp[power + self.order] = element
+            log[element] = power
+            element <<= 1
+            if element & self.size:
+                element ^= primitive_polynomial
+
+        # Polynomial isn't primitive if powers of alpha don't cover all not zero elements
+        if not exp or len(set(exp[:self.order])) != self.order:
+            raise CodingException(
+                message=CodingException.GALOIS_FIELD_INCORRECT.message,
+                long_message=CodingException.GALOIS_FIELD_INCORRECT.long_message.format(degree, primitive_polynomial),
+            )
+
+        self._expList = exp
+        self._logList = log
+        self.exp = np.array(exp, dtype=np.int64)
+        self.log = np.array(log, dtype=np.int64)
+
+    @property
+    def order(self) -> int:
+        """
+        :return: int Order of multiplicative group (quantity of not zero elements)
+        """
+        return self.size - 1
+
+    def power_of_alpha(self, power: int) -> int:
+        return self._expList[power % self.order]
+
+    def multiply(self, first: int, second: int) -> int:
+        if first == 0 or second == 0:
+            return 0
+        return self._expList[self._logList[first] + self._logList[second]]
+
+    def divide(self, dividend: int, divisor: int) -> int:
+        if divisor == 0:
+            raise ZeroDivisionError("Division by zero in GF(2^{0})".format(self.degree))
+        if dividend == 0:
+            return 0
+        return self._expList[self._logList[dividend] - self._logList[divisor] + self.order]
+
+    def power(self, element: int, power: int) -> int:
+        if element == 0:
+            return 0 if power else 1
+        return self._expList[(self._logList[element] * power) % self.order]
+
+    def multiply_arrays(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """
+        Method provide functionality for elementwise multiplication of arrays of elements
+        :param first: np.ndarray
+        :param second: np.ndarray
+        :return: np.ndarray Array of int64
+        """
+        first = np.asarray(first, dtype=np.int64)
+        second = np.asarray(second, dtype=np.int64)
+        product: np.ndarray = self.exp[self.log[first] + self.log[second]]
+        return np.where((first == 0) | (second == 0), 0, product)
+
+    def get_cyclotomic_coset(self, power: int) -> List[int]:
+        """
+        :param power: int
+        :return: List[int] Powers of conjugate elements of alpha^power: power * 2^i mod order
+        """
+        coset: List[int] = [power % self.order]
+        while (coset[-1] * 2) % self.order != coset[0]:
+            coset.append((coset[-1] * 2) % self.order)
+        return coset
+
+    def get_minimal_polynomial(self, power: int) -> int:
+        """
+        Method provide functionality for calculation of minimal polynomial of alpha^power over GF(2)
+        as product of (x + conjugate element)
+        :param power: int
+        :return: int Packed polynomial, bit i is coefficient of x^i
+        """
+        # Coefficients from x^0 are elements of field until all conjugates are multiplied
+        coefficients: List[int] = [1]
+        for conjugate_power in self.get_cyclotomic_coset(power):
+            root: int = self.power_of_alpha(conjugate_power)
+            shifted: List[int] = [0] + coefficients
+            for iterator, coefficient in enumerate(coefficients):
+                shifted[iterator] ^= self.multiply(coefficient, root)
+            coefficients = shifted
+        return sum(coefficient << iterator for iterator, coefficient in enumerate(coefficients))
+
+    def get_error_locator(self, syndromes: List[int]) -> List[int]:
+        """
+        Method provide functionality for calculation of error locator by Berlekamp-Massey algorithm
+        :param syndromes: List[int] Syndromes r(alpha^b), r(alpha^(b + 1)), ... for the first root alpha^b
+        :return: List[int] Coefficients of error locator from x^0, degree equals quantity of errors
+        """
+        locator: List[int] = [1]
+        previous_locator: List[int] = [1]
+        previous_discrepancy: int = 1
+        count_errors: int = 0
+        # Quantity of steps since the last change of count of errors
+        shift: int = 1
+        for step in range(len(syndromes)):
+            discrepancy: int = syndromes[step]
+            for iterator in range(1, min(count_errors, len(locator) - 1) + 1):
+                discrepancy ^= self.multiply(locator[iterator], syndromes[step - iterator])
+            if discrepancy == 0:
+                shift += 1
+                continue
+
+            coefficient: int = self.divide(discrepancy, previous_discrepancy)
+            updated: List[int] = locator + [0] * max(0, len(previous_locator) + shift - len(locator))
+            for iterator, value in enumerate(previous_locator):
+                updated[iterator + shift] ^= self.multiply(coefficient, value)
+            if 2 * count_errors <= step:
+                previous_locator, previous_discrepancy = locator, discrepancy
+                count_errors = step + 1 - count_errors
+                shift = 1
+            else:
+                shift += 1
+            locator = updated
+        # Degree of locator doesn't exceed count of errors
+        return (locator + [0] * count_errors)[:count_errors + 1]
+
+    def evaluate_at_inverse_powers(self, polynomials: np.ndarray, count_powers: int) -> np.ndarray:
+        """
+        Method provide functionality for evaluation of polynomials in alpha^-p for p from 0 to count_powers - 1
+        (Chien search), all polynomials and points are processed at once
+        :param polynomials: np.ndarray Coefficients from x^0 with shape (polynomials, degree + 1)
+        :param count_powers: int
+        :return: np.ndarray Values with shape (polynomials, count_powers)
+        """
+        powers: np.ndarray = np.arange(count_powers)
+        values: np.ndarray = np.zeros((len(polynomials), count_powers), dtype=np.int64)
+        for degree in range(polynomials.shape[1]):
+            column: np.ndarray = polynomials[:, degree]
+            # Logarithm of term in point alpha^-p is log(coefficient) - degree * p
+            terms: np.ndarray = self.exp[(self.log[column][:, np.newaxis] - degree * powers) % self.order]
+            values ^= np.where(column[:, np.newaxis] != 0, terms, 0)
+        return values
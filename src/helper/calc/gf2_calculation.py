@@ -0,0 +1,106 @@
+# coding=utf-8
+from typing import List, Tuple
+
+
+class GF2Calculation:
+    """
+    Calculations with matrices over GF(2). Row of matrix is packed into integer, where the most significant bit
+    (bit length - 1) corresponds to the first column like in bit_list_to_int
+    """
+
+    @staticmethod
+    def get_reduced_row_echelon_form(rows: List[int], length: int) -> Tuple[List[int], List[int]]:
+        """
+        Method provide functionality for Gaussian elimination of matrix
+        :param rows: List[int] Packed rows of matrix
+        :param length: int Quantity of columns
+        :return: Tuple[List[int], List[int]] Linear independent rows in reduced row echelon form and pivot columns
+        """
+        reduced_rows: List[int] = list(rows)
+        pivot_columns: List[int] = []
+        rank: int = 0
+        for column in range(length):
+            mask: int = 1 << (length - 1 - column)
+            for iterator in range(rank, len(reduced_rows)):
+                if reduced_rows[iterator] & mask:
+                    reduced_rows[rank], reduced_rows[iterator] = reduced_rows[iterator], reduced_rows[rank]
+                    break
+            else:
+                continue
+
+            for iterator in range(len(reduced_rows)):
+                if iterator != rank and reduced_rows[iterator] & mask:
+                    reduced_rows[iterator] ^= reduced_rows[rank]
+            pivot_columns.append(column)
+            rank += 1
+
+        return reduced_rows[:rank], pivot_columns
+
+    @staticmethod
+    def get_dual_rows(rows: List[int], length: int) -> List[int]:
+        """
+        Method provide functionality for determination basis of dual code (parity check matrix for generator matrix)
+        :param rows: List[int] Packed rows of matrix
+        :param length: int Quantity of columns
+        :return: List[int] Packed rows of dual matrix
+        """
+        reduced_rows, pivot_columns = GF2Calculation.get_reduced_row_echelon_form(rows, length)
+        dual_rows: List[int] = []
+        for column in range(length):
+            if column in pivot_columns:
+                continue
+            column_mask: int = 1 << (length - 1 - column)
+            dual_row: int = column_mask
+            for row, pivot_column in zip(reduced_rows, pivot_columns):
+                if row & column_mask:
+                    dual_row |= 1 << (length - 1 - pivot_column)
+            dual_rows.append(dual_row)
+        return dual_rows
+
+    @staticmethod
+    def get_weight_distribution(rows: List[int], length: int) -> List[int]:
+        """
+        Method provide functionality for enumeration of all combinations of linear independent rows in Gray code order,
+        so every next word differs from previous by one row
+        :param rows: List[int] Packed linear independent rows
+        :param length: int Quantity of columns
+        :return: List[int] Quantity of words for every weight from 0 to length
+        """
+        distribution: List[int] = [0] * (length + 1)
+        word: int = 0
+        distribution[0] = 1
+        for iterator in range(1, 1 << len(rows)):
+            # Number of changed bit of Gray code equals quantity of trailing zeros of iterator
+            word ^= rows[(iterator & -iterator).bit_length() - 1]
+            distribution[word.bit_count()] += 1
+        return distribution
+
+    @staticmethod
+    def multiply_polynomials(first: int, second: int) -> int:
+        """
+        Method provide functionality for multiplication of polynomials over GF(2),
+        bit i of packed polynomial is coefficient of x^i
+        :param first: int Packed polynomial
+        :param second: int Packed polynomial
+        :return: int Packed product
+        """
+        product: int = 0
+        while second:
+            if second & 1:
+                product ^= first
+            first <<= 1
+            second >>= 1
+        return product
+
+    @staticmethod
+    def get_polynomial_remainder(dividend: int, divisor: int) -> int:
+        """
+        Method provide functionality for division of polynomials over GF(2)
+        :param dividend: int Packed polynomial
+        :param divisor: int Packed not zero polynomial
+        :return: int Packed remainder
+        """
+        degree: int = divisor.bit_length() - 1
+        while dividend.bit_length() - 1 >= degree:
+            dividend ^= divisor << (dividend.bit_length() - 1 - degree)
+        return dividend
@@ -0,0 +1,227 @@
+# coding=utf-8
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple, Optional
+
+from math import comb
+
+from src.coders.abstract_coder import AbstractCoder
+from src.coders.casts import bit_list_to_int
+from src.helper.calc.gf2_calculation import GF2Calculation
+from src.helper.error.exception.codding_exception import CodingException
+
+
+@dataclass(frozen=True)
+class WeightSpectrum:
+    lengthTotal: int
+    lengthInformation: int
+    # Quantity of code words for every weight from 0 to lengthTotal
+    distribution: Tuple[int, ...]
+    # Quantity of coset leaders for every weight (None if code has too many cosets)
+    cosetLeaders: Optional[Tuple[int, ...]]
+
+    @property
+    def min_distance(self) -> int:
+        for weight in range(1, len(self.distribution)):
+            if self.distribution[weight] != 0:
+                return weight
+        return 0
+
+    @property
+    def correction_ability(self) -> int:
+        return (self.min_distance - 1) // 2
+
+
+class WeightSpectrumCalculation:
+    """
+    Analytic calculation of error correction performance of linear block coders on binary symmetric chanel
+    """
+    # Maximal quantity of rows which can be enumerated (2 ** rows words)
+    _MAX_ENUMERATION_LENGTH: int = 22
+
+    @staticmethod
+    def get_generator_rows(coder: AbstractCoder) -> Tuple[int, ...]:
+        """
+        Method provide functionality for determination of generator matrix of linear block coder
+        by encoding of unit vectors
+        :param coder: AbstractCoder
+        :return: Tuple[int, ...] Packed rows of generator matrix
+        """
+        if not coder.isDivIntoPackage:
+            raise CodingException(
+                message=CodingException.ANALYTIC_CALCULATION_NOT_BLOCK_CODER.message,
+                long_message=CodingException.ANALYTIC_CALCULATION_NOT_BLOCK_CODER.long_message.format(coder.name),
+            )
+
+        # Some coders (e.g. Reed-Muller) encode not all bits of information, so matrix is used directly
+        if hasattr(coder, "matrix_G"):
+            return tuple(bit_list_to_int([int(x) % 2 for x in row]) for row in coder.matrix_G.tolist())
+
+        rows: List[int] = []
+        for iterator in range(coder.lengthInformation):
+            unit_vector: List[int] = [0] * coder.lengthInformation
+            unit_vector[iterator] = 1
+            rows.append(bit_list_to_int([int(x) % 2 for x in coder.encoding(unit_vector)]))
+        return tuple(rows)
+
+    @staticmethod
+    def get_weight_spectrum(coder: AbstractCoder) -> WeightSpectrum:
+        """
+        Method provide functionality for calculation weight spectrum of coder. Result is cached for configuration
+        :param coder: AbstractCoder
+        :return: WeightSpectrum
+        """
+        return _get_weight_spectrum(coder.lengthTotal, WeightSpectrumCalculation.get_generator_rows(coder))
+
+    @staticmethod
+    def get_block_error_probability(spectrum: WeightSpectrum, probability: float) -> float:
+        """
+        Method provide functionality for calculation probability of incorrect decoding of block by complete syndrome
+        decoder (exact value). If quantity of cosets is too large, bounded distance decoder is used
+        :param spectrum: WeightSpectrum
+        :param probability: float Probability of bit error from 0.0 to 1.0
+        :return: float
+        """
+        if spectrum.cosetLeaders is None:
+            return WeightSpectrumCalculation.get_bounded_distance_error_probability(spectrum, probability)
+
+        correct_probability: float = sum(
+            quantity * probability ** weight * (1 - probability) ** (spectrum.lengthTotal - weight)
+            for weight, quantity in enumerate(spectrum.cosetLeaders)
+        )
+        return max(0.0, 1 - correct_probability)
+
+    @staticmethod
+    def get_bounded_distance_error_probability(spectrum: WeightSpectrum, probability: float) -> float:
+        """
+        Method provide functionality for calculation probability of incorrect decoding of block by decoder which
+        corrects all errors with weight not more then correction ability
+        :param spectrum: WeightSpectrum
+        :param probability: float Probability of bit error from 0.0 to 1.0
+        :return: float
+        """
+        correct_probability: float = sum(
+            comb(spectrum.lengthTotal, weight) * probability ** weight
+            * (1 - probability) ** (spectrum.lengthTotal - weight)
+            for weight in range(spectrum.correction_ability + 1)
+        )
+        return max(0.0, 1 - correct_probability)
+
+    @staticmethod
+    def get_union_bound(spectrum: WeightSpectrum, probability: float) -> float:
+        """
+        Method provide functionality for calculation union bound of probability of incorrect maximum likelihood
+        decoding of block
+        :param spectrum: WeightSpectrum
+        :param probability: float Probability of bit error from 0.0 to 1.0
+        :return: float
+        """
+        answer: float = 0.0
+        for weight in range(1, len(spectrum.distribution)):
+            if spectrum.distribution[weight] == 0:
+                continue
+            # Probability that word with this weight is closer to received word then transferred one
+            pair_probability: float = sum(
+                comb(weight, count) * probability ** count * (1 - probability) ** (weight - count)
+                for count in range(weight // 2 + 1, weight + 1)
+            )
+            if weight % 2 == 0:
+                pair_probability += 0.5 * comb(weight, weight // 2) * (probability * (1 - probability)) ** (weight // 2)
+            answer += spectrum.distribution[weight] * pair_probability
+        return min(1.0, answer)
+
+    @staticmethod
+    def get_error_curve(coder: AbstractCoder, noise_list: List[float]) -> List[float]:
+        """
+        Method provide functionality for calculation of package error probability for list of noise values
+        :param coder: AbstractCoder
+        :param noise_list: List[float] Noise probability from 0.00 to 100.00 like in Codec
+        :return: List[float]
+        """
+        spectrum: WeightSpectrum = WeightSpectrumCalculation.get_weight_spectrum(coder)
+        return [WeightSpectrumCalculation.get_block_error_probability(spectrum, noise / 100) for noise in noise_list]
+
+
+@lru_cache(maxsize=None)
+def _get_weight_spectrum(length_total: int, generator_rows: Tuple[int, ...]) -> WeightSpectrum:
+    rows, _ = GF2Calculation.get_reduced_row_echelon_form(list(generator_rows), length_total)
+    dual_rows: List[int] = GF2Calculation.get_dual_rows(rows, length_total)
+
+    # Enumerate words of code or its dual code, which is smaller
+    if len(rows) <= min(len(dual_rows), WeightSpectrumCalculation._MAX_ENUMERATION_LENGTH):
+        distribution: List[int] = GF2Calculation.get_weight_distribution(rows, length_total)
+    elif len(dual_rows) <= WeightSpectrumCalculation._MAX_ENUMERATION_LENGTH:
+        distribution: List[int] = _get_mac_williams_distribution(
+            GF2Calculation.get_weight_distribution(dual_rows, length_total),
+            length_total
+        )
+    else:
+        raise CodingException(
+            message=CodingException.WEIGHT_SPECTRUM_TOO_LARGE.message,
+            long_message=CodingException.WEIGHT_SPECTRUM_TOO_LARGE.long_message.format(
+                length_total, len(rows), WeightSpectrumCalculation._MAX_ENUMERATION_LENGTH),
+        )
+
+    coset_leaders: Optional[Tuple[int, ...]] = None
+    if len(dual_rows) <= WeightSpectrumCalculation._MAX_ENUMERATION_LENGTH:
+        coset_leaders = tuple(_get_coset_leaders_distribution(dual_rows, length_total))
+
+    return WeightSpectrum(
+        lengthTotal=length_total,
+        lengthInformation=len(rows),
+        distribution=tuple(distribution),
+        cosetLeaders=coset_leaders,
+    )
+
+
+def _get_mac_williams_distribution(dual_distribution: List[int], length: int) -> List[int]:
+    """
+    MacWilliams identity: A(w) = 2^-(n-k) * sum(B(j) * K_w(j)), where K_w is Krawtchouk polynomial
+    """
+    quantity_dual_words: int = sum(dual_distribution)
+    distribution: List[int] = []
+    for weight in range(length + 1):
+        value: int = 0
+        for dual_weight, quantity in enumerate(dual_distribution):
+            if quantity == 0:
+                continue
+            krawtchouk: int = sum(
+                (-1) ** count * comb(dual_weight, count) * comb(length - dual_weight, weight - count)
+                for count in range(min(weight, dual_weight) + 1)
+            )
+            value += quantity * krawtchouk
+        distribution.append(value // quantity_dual_words)
+    return distribution
+
+
+def _get_coset_leaders_distribution(dual_rows: List[int], length: int) -> List[int]:
+    """
+    Breadth-first search over syndromes: distance from zero syndrome equals weight of coset leader
+    """
+    columns: List[int] = []
+    for column in range(length):
+        mask: int = 1 << (length - 1 - column)
+        syndrome: int = 0
+        for row in dual_rows:
+            syndrome = (syndrome << 1) | (1 if row & mask else 0)
+        columns.append(syndrome)
+
+    distribution: List[int] = [0] * (length + 1)
+    distribution[0] = 1
+    visited: bytearray = bytearray(1 << len(dual_rows))
+    visited[0] = 1
+    frontier: List[int] = [0]
+    weight: int = 0
+    while frontier:
+        weight += 1
+        next_frontier: List[int] = []
+        for syndrome in frontier:
+            for column in columns:
+                next_syndrome: int = syndrome ^ column
+                if not visited[next_syndrome]:
+                    visited[next_syndrome] = 1
+                    next_frontier.append(next_syndrome)
+        if next_frontier:
+            distribution[weight] = len(next_frontier)
+        frontier = next_frontier
+    return distribution
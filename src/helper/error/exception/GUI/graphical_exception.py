@@ -1,6 +1,5 @@
 # coding=utf-8
 from src.helper.error.enum_exception_standard_message import EnumExceptionStandardMessage
-from src.helper.error.error_handler import ErrorHandler
 from src.helper.error.exception.application_exception import ApplicationException
 
 
@@ -9,4 +8,6 @@ class GraphicalException(ApplicationException):
     _longMessage = EnumExceptionStandardMessage.GRAPHICAL_EXCEPTION.value
 
     def show_message_box(self):
+        # Error handler uses PyQt5, so it is loaded only when message box is really shown
+        from src.helper.error.error_handler import ErrorHandler
         ErrorHandler().gui_message_box(rcx_exception=self)
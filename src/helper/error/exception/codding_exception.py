@@ -30,3 +30,114 @@ class CodingException(ApplicationException):
         message="Lacks of blocks for decoding package with fountain _coder",
         long_message="Lacks of blocks for decoding package with fountain _coder",
     )
+
+    PUNCTURING_MATRIX_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect puncturing matrix of convolutional _coder",
+        long_message="""
+                    Puncturing matrix should have row for each of {0} polynomials
+                    and at least one transmitted bit in each column, but it is {1}
+                    """
+    )
+
+    LENGTH_OF_PUNCTURED_PACKAGE_INCORRECT: TemplateException = TemplateException(
+        message="Length of punctured package doesn't match puncturing matrix",
+        long_message="Punctured package with length {0} cannot be received with puncturing matrix {1}",
+    )
+
+    TAIL_BITING_STREAM: TemplateException = TemplateException(
+        message="Tail-biting convolutional _coder cannot process stream",
+        long_message="Tail-biting requires whole package, use truncated or zero-terminated mode for streams",
+    )
+
+    STREAM_ENDED_INSIDE_STEP: TemplateException = TemplateException(
+        message="Stream of convolutional _coder ended inside step",
+        long_message="Stream ended with {0} received bits which don't form whole step",
+    )
+
+    LINEAR_MATRIX_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect matrix of linear block _coder",
+        long_message="""
+                    Only one of generator and parity check matrices should be specified.
+                    Matrix should consist of bits, rows should have equal length
+                    and rows of generator matrix should be linear independent, but it is {0}
+                    """
+    )
+
+    LENGTH_OF_CODEWORD_INCORRECT: TemplateException = TemplateException(
+        message="Length of codeword doesn't match _coder",
+        long_message="Codeword of _coder {0} should have length {1}, but current length is {2}",
+    )
+
+    LDPC_MATRIX_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect parity check matrix of LDPC _coder",
+        long_message="Matrix should have edges and indexes of them should be less than {0} checks and {1} variables",
+    )
+
+    LDPC_ALIST_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect alist file of LDPC _coder",
+        long_message="File {0} doesn't contain parity check matrix in alist format",
+    )
+
+    LDPC_PARAMETERS_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect parameters of LDPC _coder",
+        long_message="""
+                    Length of codeword {0} should be divisible by row weight {2},
+                    column weight {1} should be positive and row weight should be greater than 1
+                    """
+    )
+
+    GALOIS_FIELD_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect Galois field",
+        long_message="Polynomial {1} isn't primitive polynomial of degree {0}",
+    )
+
+    BCH_PARAMETERS_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect parameters of BCH _coder",
+        long_message="""
+                    Degree of field {0} should be from 3 to 16, code should correct {1} errors with at least one
+                    information bit and length of information {2} shouldn't exceed length of not shortened code
+                    """
+    )
+
+    REED_SOLOMON_PARAMETERS_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect parameters of Reed-Solomon _coder",
+        long_message="""
+                    Quantity of symbols {0} shouldn't exceed {2} and quantity of information symbols {1}
+                    should be positive and less than quantity of symbols at least by 2
+                    """
+    )
+
+    LENGTH_OF_BYTES_INCORRECT: TemplateException = TemplateException(
+        message="Length of bytes doesn't match _coder",
+        long_message="Length of bytes for _coder {0} is {1}, but it should be multiple of {2}",
+    )
+
+    TURBO_PARAMETERS_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect parameters of turbo _coder",
+        long_message="""
+                    Length of information {0} and quantity of registers {3} should be positive,
+                    feedback polynomial {1} should contain 1 and polynomials {1}, {2} shouldn't have
+                    delays greater than quantity of registers
+                    """
+    )
+
+    POLAR_PARAMETERS_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect parameters of polar _coder",
+        long_message="""
+                    Length {0} should be power of two (at least 2), length of information {1} should be positive
+                    and shouldn't exceed length, size of list {2} should be positive
+                    """
+    )
+
+    ANALYTIC_CALCULATION_NOT_BLOCK_CODER: TemplateException = TemplateException(
+        message="Analytic calculation is possible only for block coders",
+        long_message="Coder {0} doesn't divide information into packages, so it hasn't weight spectrum",
+    )
+
+    WEIGHT_SPECTRUM_TOO_LARGE: TemplateException = TemplateException(
+        message="Code is too large for calculation of weight spectrum",
+        long_message="""
+                    Code with length {0} and {1} information bits is too large for calculation of weight spectrum,
+                    code or its dual code should have at most {2} information bits
+                    """
+    )
@@ -32,3 +32,13 @@ class ParametersParseException(ApplicationException):
         message="Incorrect interleaver settings",
         long_message="Please, change interleaver setting",
     )
+
+    BATCH_SPEC_FORMAT: TemplateException = TemplateException(
+        message="Unknown format of batch specification",
+        long_message="Batch specification {0} should be JSON (*.json) or YAML (*.yaml, *.yml, PyYAML is required)"
+    )
+
+    BATCH_SPEC_INCORRECT: TemplateException = TemplateException(
+        message="Incorrect batch specification",
+        long_message="Batch specification contains incorrect parameter {0}"
+    )
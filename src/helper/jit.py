@@ -0,0 +1,32 @@
+# coding=utf-8
+import functools
+from importlib.util import find_spec
+from typing import Callable, Optional
+
+# Kernels are used only if numba is installed, otherwise callers use NumPy implementations.
+# Numba is only found here, it's imported by the first call of kernel, so it doesn't slow down startup
+ENABLED: bool = find_spec("numba") is not None
+
+
+def kernel(function: Callable) -> Callable:
+    """
+    Decorator of function with loops over arrays. With numba function is compiled in nopython mode on the first call,
+    compiled code is cached on disk, so it isn't compiled again by the next processes.
+    Without numba function is called as is, it should be called only if ENABLED is set
+    :param function: Callable
+    :return: Callable
+    """
+    compiled_function: Optional[Callable] = None
+
+    @functools.wraps(function)
+    def wrapper(*args):
+        nonlocal compiled_function
+        if compiled_function is None:
+            if find_spec("numba") is None:
+                compiled_function = function
+            else:
+                import numba
+                compiled_function = numba.njit(cache=True, nogil=True)(function)
+        return compiled_function(*args)
+
+    return wrapper
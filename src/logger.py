@@ -12,10 +12,12 @@ class __Logger(logging.Logger, metaclass=Singleton):
         self.setLevel("DEBUG")
 
         log_crt_timestamp = str(datetime.datetime.now())
-        log_full_name = ("log\\log_{0}.log".format(log_crt_timestamp)).replace(" ", "").replace(":", "-")
+        log_full_name = os.path.join(
+            "log",
+            "log_{0}.log".format(log_crt_timestamp).replace(" ", "").replace(":", "-")
+        )
 
-        if not os.path.exists("log\\"):
-            os.makedirs("log")
+        os.makedirs("log", exist_ok=True)
 
         if os.path.exists(log_full_name):
             os.remove(log_full_name)
@@ -8,3 +8,9 @@ class EnumCodersType(Enum):
     CYCLICAL = 1
     CONVOLUTION = 2
     FOUNTAIN = 3
+    LINEAR_BLOCK = 4
+    LDPC = 5
+    BCH = 6
+    REED_SOLOMON = 7
+    TURBO = 8
+    POLAR = 9
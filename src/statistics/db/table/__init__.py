@@ -1,7 +1,9 @@
 # coding=utf-8
 from src.statistics.db.table.case_table import case_table
 from src.statistics.db.table.coder_table import coder_table
-from src.statistics.db.table.desc_coder_tables import hamming_table, cyclic_table, fountain_table, convolution_table
+from src.statistics.db.table.desc_coder_tables import hamming_table, cyclic_table, fountain_table, convolution_table, \
+    linear_block_table, ldpc_table, bch_table, reed_solomon_table, \
+    turbo_table, polar_table
 from src.statistics.db.table.result_table import result_table
 
 __all__ = [
@@ -11,5 +13,11 @@ __all__ = [
     hamming_table,
     cyclic_table,
     fountain_table,
-    convolution_table
+    convolution_table,
+    linear_block_table,
+    ldpc_table,
+    bch_table,
+    reed_solomon_table,
+    turbo_table,
+    polar_table
 ]
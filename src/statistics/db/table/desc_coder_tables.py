@@ -1,5 +1,5 @@
 # coding=utf-8
-from sqlalchemy import Table, Column, Boolean, ForeignKey, Integer, BigInteger
+from sqlalchemy import Table, Column, Boolean, ForeignKey, Integer, BigInteger, String, Float
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 
 from src.statistics.db.statmetadata import StatMetaData
@@ -43,5 +43,71 @@ convolution_table = Table(
     Column('count_input_bits', Integer),
     Column('count_output_bits', Integer),
     Column('count_registers', Integer),
-    Column('polynomial', ARRAY(Integer))
+    Column('polynomial', ARRAY(Integer)),
+    Column('puncturing_matrix', ARRAY(Integer, dimensions=2)),
+    Column('termination_mode', String)
+)
+
+linear_block_table = Table(
+    EnumCoderTableName.LINEAR_BLOCK.value,
+    StatMetaData().metadata,
+    Column('guid', UUID(as_uuid=True), ForeignKey("coder.guid"), primary_key=True),
+    Column('generator_matrix', ARRAY(Integer, dimensions=2)),
+    Column('parity_check_matrix', ARRAY(Integer, dimensions=2)),
+    Column('information_columns', ARRAY(Integer))
+)
+
+ldpc_table = Table(
+    EnumCoderTableName.LDPC.value,
+    StatMetaData().metadata,
+    Column('guid', UUID(as_uuid=True), ForeignKey("coder.guid"), primary_key=True),
+    Column('length_total', Integer),
+    Column('length_information', Integer),
+    # Edges of parity check matrix
+    Column('check_indexes', ARRAY(Integer)),
+    Column('variable_indexes', ARRAY(Integer)),
+    Column('max_iterations', Integer)
+)
+
+bch_table = Table(
+    EnumCoderTableName.BCH.value,
+    StatMetaData().metadata,
+    Column('guid', UUID(as_uuid=True), ForeignKey("coder.guid"), primary_key=True),
+    Column('degree', Integer),
+    Column('correctable_errors', Integer),
+    Column('length_information', Integer),
+    Column('generator_polynomial', ARRAY(Integer))
+)
+
+reed_solomon_table = Table(
+    EnumCoderTableName.REED_SOLOMON.value,
+    StatMetaData().metadata,
+    Column('guid', UUID(as_uuid=True), ForeignKey("coder.guid"), primary_key=True),
+    Column('count_symbols', Integer),
+    Column('count_information_symbols', Integer),
+    Column('generator_polynomial', ARRAY(Integer))
+)
+
+turbo_table = Table(
+    EnumCoderTableName.TURBO.value,
+    StatMetaData().metadata,
+    Column('guid', UUID(as_uuid=True), ForeignKey("coder.guid"), primary_key=True),
+    Column('length_information', Integer),
+    Column('feedback', Integer),
+    Column('polynomial', Integer),
+    Column('count_registers', Integer),
+    Column('interleaver_length', Integer),
+    Column('max_iterations', Integer)
+)
+
+polar_table = Table(
+    EnumCoderTableName.POLAR.value,
+    StatMetaData().metadata,
+    Column('guid', UUID(as_uuid=True), ForeignKey("coder.guid"), primary_key=True),
+    Column('length_total', Integer),
+    Column('length_information', Integer),
+    Column('design_snr', Float),
+    Column('construction', String),
+    Column('list_size', Integer),
+    Column('information_positions', ARRAY(Integer))
 )
@@ -6,6 +6,12 @@ class EnumCoderTableName(Enum):
     CYCLIC = "cyclic"
     FOUNTAIN = "fountain"
     CONVOLUTION = "convolution"
+    LINEAR_BLOCK = "linear_block"
+    LDPC = "ldpc"
+    BCH = "bch"
+    REED_SOLOMON = "reed_solomon"
+    TURBO = "turbo"
+    POLAR = "polar"
     TEST_RESULT = "test_result"
     CODER = "coder"
     CASE_RESULT = "case_result"
@@ -1,6 +1,6 @@
 # coding=utf-8
-from sqlalchemy import Table, Column, Integer, Boolean, Float, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
+from sqlalchemy import Table, Column, Integer, Boolean, Float, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP, JSONB
 
 from src.statistics.db.statmetadata import StatMetaData
 from src.statistics.db.table.enum_coder_table_name import EnumCoderTableName
@@ -13,5 +13,20 @@ result_table = Table(
     Column('first_coder', UUID(as_uuid=True), ForeignKey("coder.guid")),
     Column('second_coder', UUID(as_uuid=True), ForeignKey("coder.guid")),
     Column('type_of_noise', Integer),
-    Column('noise', Float)
+    Column('noise', Float),
+    # Value of EnumNoiseMode, type_of_noise isn't filled
+    Column('noise_mode', String(1)),
+    # Failed packages: with exception of decoder and decoded into wrong word
+    Column('error_packages', Integer),
+    Column('shadow_packages', Integer),
+    # Sums of likelihood weights (and their squares) of failed packages for importance noise mode
+    Column('weighted_error_packages', Float),
+    Column('weighted_error_packages_square', Float),
+    # Confidence interval of package error probability, bounds are empty if it isn't calculated
+    Column('confidence_level', Float),
+    Column('confidence_low', Float),
+    Column('confidence_high', Float),
+    # Durations (seconds) and quantity of calls of transfer stages, empty if profiling is disabled
+    Column('stage_durations', JSONB(none_as_null=True)),
+    Column('stage_calls', JSONB(none_as_null=True)),
 )
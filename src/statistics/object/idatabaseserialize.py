@@ -1,12 +1,15 @@
 # coding=utf-8
 import uuid
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from sqlalchemy.engine import Connection
+# SQLAlchemy is required only for saving of results, so it shouldn't be loaded with every coder
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
 
 
 class IDataBaseSerialize(ABC):
 
     @abstractmethod
-    def save_to_database(self, coder_guid: uuid.UUID, connection: Connection):
+    def save_to_database(self, coder_guid: uuid.UUID, connection: 'Connection'):
         raise NotImplementedError()
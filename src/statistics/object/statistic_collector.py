@@ -1,9 +1,10 @@
 # coding=utf-8
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict
 
 from src.channel.enum_noise_mode import EnumNoiseMode
 from src.coders.abstract_coder import AbstractCoder
+from src.helper.calc.confidence_calculation import ConfidenceCalculation
 
 
 @dataclass
@@ -30,6 +31,100 @@ class TestResult:
     quantity_error_bits: int
     based_correct_bits: int
     based_error_bits: int
+    # Packages which are decoded into wrong word without exception of decoder
+    shadow_packages: int = 0
+    # Sum of likelihood weights (and their squares) of failed packages for importance noise mode
+    weighted_error_packages: float = 0.0
+    weighted_error_packages_square: float = 0.0
+    confidence_level: float = 0.95
+    # Confidence interval of package error probability
+    confidence_interval: Optional[Tuple[float, float]] = None
+    # Durations (seconds) and quantity of calls of transfer stages, None if profiling is disabled
+    stage_durations: Optional[Dict[str, float]] = None
+    stage_calls: Optional[Dict[str, int]] = None
+
+    @property
+    def quantity_packages(self) -> int:
+        """
+        Quantity of trials
+        """
+        return self.successful_packages + self.repair_packages + self.error_packages + self.shadow_packages
+
+    @property
+    def failed_packages(self) -> int:
+        """
+        Quantity of packages which aren't transferred correctly: with exception of decoder or decoded into wrong word
+        """
+        return self.error_packages + self.shadow_packages
+
+    @property
+    def error_package_probability(self) -> float:
+        """
+        Estimate of package error probability. For importance noise mode it is weighted by likelihood ratio
+        """
+        if self.quantity_packages == 0:
+            return 0.0
+        if self.noise_type == EnumNoiseMode.IMPORTANCE:
+            return self.weighted_error_packages / self.quantity_packages
+        return self.failed_packages / self.quantity_packages
+
+    @property
+    def relative_interval_width(self) -> float:
+        """
+        Width of confidence interval relative to estimate of package error probability, infinity without errors
+        """
+        if self.confidence_interval is None or self.error_package_probability == 0:
+            return float("inf")
+        return (self.confidence_interval[1] - self.confidence_interval[0]) / self.error_package_probability
+
+    def merge(self, other: 'TestResult') -> None:
+        """
+        Method provide functionality for merging counters of additional trials with the same noise into this result
+        :param other: TestResult
+        :return: None
+        """
+        self.list_case_result += other.list_case_result
+        self.successful_packages += other.successful_packages
+        self.repair_packages += other.repair_packages
+        self.changed_packages += other.changed_packages
+        self.error_packages += other.error_packages
+        self.shadow_packages += other.shadow_packages
+        self.quantity_correct_bits += other.quantity_correct_bits
+        self.quantity_error_bits += other.quantity_error_bits
+        self.based_correct_bits += other.based_correct_bits
+        self.based_error_bits += other.based_error_bits
+        self.weighted_error_packages += other.weighted_error_packages
+        self.weighted_error_packages_square += other.weighted_error_packages_square
+        if self.stage_durations is None and other.stage_durations is not None:
+            # Result stored without profiling gets profile of additional trials
+            self.stage_durations, self.stage_calls = dict(other.stage_durations), dict(other.stage_calls)
+        elif self.stage_durations is not None and other.stage_durations is not None:
+            for stage in other.stage_durations:
+                self.stage_durations[stage] = self.stage_durations.get(stage, 0.0) + other.stage_durations[stage]
+                self.stage_calls[stage] = self.stage_calls.get(stage, 0) + other.stage_calls[stage]
+        self.update_confidence_interval()
+
+    def update_confidence_interval(self, confidence_level: Optional[float] = None) -> None:
+        """
+        Method provide functionality for recalculation confidence interval of package error probability
+        :param confidence_level: Optional[float] Keep current level if None
+        :return: None
+        """
+        if confidence_level is not None:
+            self.confidence_level = confidence_level
+        if self.noise_type == EnumNoiseMode.IMPORTANCE:
+            self.confidence_interval = ConfidenceCalculation.get_weighted_interval(
+                sum_weights=self.weighted_error_packages,
+                sum_square_weights=self.weighted_error_packages_square,
+                quantity_tests=self.quantity_packages,
+                confidence_level=self.confidence_level,
+            )
+            return
+        self.confidence_interval = ConfidenceCalculation.get_wilson_interval(
+            quantity_errors=self.failed_packages,
+            quantity_tests=self.quantity_packages,
+            confidence_level=self.confidence_level,
+        )
 
 
 @dataclass
@@ -45,3 +140,17 @@ class StatisticCollector:
     quantityStepsInCycle: int
     noisePeriod: Optional[int]
     noiseLength: Optional[int]
+    # Coders of concatenated codec from outer to inner and lengths of interleavers of their codewords
+    coders: Optional[List[AbstractCoder]] = None
+    lengthInterleavers: Optional[List[Optional[int]]] = None
+
+    def get_low_confidence_indexes(self, min_error_packages: int) -> List[int]:
+        """
+        Method provide functionality for search noise levels which collected too few package errors
+        :param min_error_packages: int Minimal quantity of package errors for trusted result
+        :return: List[int] Indexes of test results
+        """
+        return [
+            index for index, test_result in enumerate(self.testResult)
+            if test_result.failed_packages < min_error_packages
+        ]
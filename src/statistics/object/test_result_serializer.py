@@ -6,8 +6,6 @@ import jsonpickle
 
 from src.coders.abstract_coder import AbstractCoder
 from src.helper.pattern.singleton import Singleton
-from src.statistics.db.connector import Connector
-from src.statistics.db.table import coder_table, result_table, case_table
 from src.statistics.object.statistic_collector import StatisticCollector
 
 
@@ -15,6 +13,10 @@ from src.statistics.object.statistic_collector import StatisticCollector
 class TestResultSerializer(metaclass=Singleton):
 
     def serialize_to_db(self, statistic_collector: StatisticCollector):
+        # SQLAlchemy is loaded only if saving to database is enabled
+        from src.statistics.db.connector import Connector
+        from src.statistics.db.table import coder_table, result_table, case_table
+
         connection = Connector().get_connection()
 
         # Generate UUID first _coder
@@ -58,6 +60,8 @@ class TestResultSerializer(metaclass=Singleton):
 
         for result_iter in statistic_collector.testResult:
             timestamp = str(datetime.datetime.now())
+            confidence_low, confidence_high = result_iter.confidence_interval \
+                if result_iter.confidence_interval is not None else (None, None)
 
             connection.execute(result_table.insert().values(
                 timestamp=timestamp,
@@ -65,7 +69,17 @@ class TestResultSerializer(metaclass=Singleton):
                 first_coder=first_coder_guid,
                 second_coder=second_coder_guid,
                 type_of_noise=1,
-                noise=result_iter.noise
+                noise=result_iter.noise,
+                noise_mode=result_iter.noise_type.value,
+                error_packages=result_iter.error_packages,
+                shadow_packages=result_iter.shadow_packages,
+                weighted_error_packages=result_iter.weighted_error_packages,
+                weighted_error_packages_square=result_iter.weighted_error_packages_square,
+                confidence_level=result_iter.confidence_level,
+                confidence_low=confidence_low,
+                confidence_high=confidence_high,
+                stage_durations=result_iter.stage_durations,
+                stage_calls=result_iter.stage_calls,
             ))
 
             for case_iter in result_iter.list_case_result:
@@ -80,3 +94,19 @@ class TestResultSerializer(metaclass=Singleton):
 
     def serialize_to_json(self, statistic_collector: StatisticCollector, file_name: str = "lastResult.json") -> None:
         open(file_name, "w", encoding='UTF-8').write(jsonpickle.encode(statistic_collector, unpicklable=False))
+
+    def serialize_to_state(self, statistic_collector: StatisticCollector, file_name: str = "lastResult.state") -> None:
+        """
+        Save full state of result (with coders) for the following extension by additional trials
+        :param statistic_collector: StatisticCollector
+        :param file_name: str
+        """
+        open(file_name, "w", encoding='UTF-8').write(jsonpickle.encode(statistic_collector, keys=True))
+
+    def deserialize_from_state(self, file_name: str = "lastResult.state") -> StatisticCollector:
+        """
+        Restore result which was saved by serialize_to_state
+        :param file_name: str
+        :return: StatisticCollector
+        """
+        return jsonpickle.decode(open(file_name, encoding='UTF-8').read(), keys=True)
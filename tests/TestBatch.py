@@ -0,0 +1,123 @@
+# coding=utf-8
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from src.endpoint.batch.batch_runner import BatchRunner
+from src.endpoint.batch.batch_spec_parser import BatchSpecParser
+from src.helper.error.exception.parameters_parse_exception import ParametersParseException
+
+
+class TestBatchSpecParser(unittest.TestCase):
+    def test_get_jobs(self):
+        jobs = BatchSpecParser({
+            "first_coders": [
+                {"coder_type_int": 0, "hem_size_pack": [4, 8]},
+                {"coder_type_int": 1, "cyc_size_pack": 4, "cyc_poly": 11},
+            ],
+            "noise_mode": ["s", "p"],
+            "first_interleaver_length": [None, 16],
+            "count_test": 10,
+        }).get_jobs()
+
+        self.assertEqual(len(jobs), 3 * 2 * 2)
+        self.assertEqual([job.index for job in jobs], list(range(12)))
+        self.assertEqual(jobs[0].first_coder, {"coder_type_int": 0, "hem_size_pack": 4})
+        self.assertFalse(jobs[0].flg_cascade)
+        self.assertEqual({job.length_first_interleaver for job in jobs}, {None, 16})
+        self.assertTrue(all(job.count_test == 10 for job in jobs))
+
+    def test_cascade_jobs(self):
+        jobs = BatchSpecParser({
+            "first_coders": [{"coder_type_int": 0, "hem_size_pack": 4}],
+            "second_coders": [{"coder_type_int": 0, "hem_size_pack": [7, 8]}],
+        }).get_jobs()
+
+        self.assertEqual(len(jobs), 2)
+        self.assertTrue(jobs[1].flg_cascade)
+        self.assertEqual(jobs[1].second_coder["hem_size_pack"], 8)
+
+    def test_concatenated_jobs(self):
+        jobs = BatchSpecParser({
+            "stages": [
+                [{"coder_type_int": 1, "cyc_size_pack": 4, "cyc_poly": 11}],
+                [{"coder_type_int": 0, "hem_size_pack": [7, 8]}],
+                [{"coder_type_int": 0, "hem_size_pack": 4}],
+            ],
+            "stage_interleaver_lengths": [None, 16, None],
+        }).get_jobs()
+
+        self.assertEqual(len(jobs), 2)
+        self.assertTrue(all(job.flg_concatenated and not job.flg_cascade for job in jobs))
+        self.assertEqual(jobs[1].stages[1]["hem_size_pack"], 8)
+        self.assertEqual(jobs[1].first_coder, jobs[1].stages[0])
+        self.assertEqual(jobs[1].length_stage_interleavers, [None, 16, None])
+
+    def test_incorrect_spec(self):
+        with self.assertRaises(ParametersParseException):
+            BatchSpecParser({"first_coders": [{"coder_type_int": 0}], "noise": 1})
+        with self.assertRaises(ParametersParseException):
+            BatchSpecParser({"first_coders": [{"coder_type_int": 0, "size": 1}]}).get_jobs()
+        with self.assertRaises(ParametersParseException):
+            BatchSpecParser({})
+        with self.assertRaises(ParametersParseException):
+            BatchSpecParser({"stages": [[{"coder_type_int": 0}]], "stage_interleaver_lengths": [None, 16]})
+
+
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        self._workDir = os.getcwd()
+        self._tempDir = tempfile.TemporaryDirectory()
+        os.chdir(self._tempDir.name)
+
+    def tearDown(self):
+        os.chdir(self._workDir)
+        self._tempDir.cleanup()
+
+    def test_failed_job(self):
+        spec_parser: BatchSpecParser = BatchSpecParser({
+            "result_dir": "batch_result",
+            "first_coders": [
+                {"coder_type_int": 0, "hem_size_pack": 4},
+                # Polynomial isn't number, so coder can't be created
+                {"coder_type_int": 1, "cyc_size_pack": 4, "cyc_poly": "x"},
+            ],
+            "noise_start": 5,
+            "noise_end": 10,
+            "quantity_steps": 2,
+            "count_test": 5,
+        })
+        runner: BatchRunner = BatchRunner(spec_parser, quantity_workers=1)
+        job_results = runner.run()
+
+        self.assertEqual([job_result.flg_successful for job_result in job_results], [True, False])
+        self.assertTrue(os.path.exists(job_results[0].result_file))
+        self.assertIsNone(job_results[1].result_file)
+        self.assertIn("x", job_results[1].error)
+        with open(runner.summary_file_name, encoding='UTF-8') as summary_file:
+            self.assertEqual(len(json.load(summary_file)), 2)
+
+    def test_failed_pool(self):
+        thread_errors: list = []
+        previous_hook = threading.excepthook
+        threading.excepthook = thread_errors.append
+        try:
+            spec_parser: BatchSpecParser = BatchSpecParser({
+                "result_dir": "batch_result",
+                "first_coders": [{"coder_type_int": 0, "hem_size_pack": 4}],
+            })
+            # Pool can't be created without workers
+            with self.assertRaises(ValueError):
+                BatchRunner(spec_parser, quantity_workers=0).run()
+        finally:
+            threading.excepthook = previous_hook
+
+        # Progress thread is stopped before shutdown of manager
+        self.assertEqual(thread_errors, [])
+        self.assertFalse(any(thread.daemon and thread.is_alive() for thread in threading.enumerate()))
+
+if __name__ == '__main__':
+    unittest.main()
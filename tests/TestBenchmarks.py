@@ -0,0 +1,42 @@
+# coding=utf-8
+import unittest
+from unittest import mock
+
+from benchmarks.benchmark_cases import get_benchmark_cases
+from benchmarks.run_benchmarks import BenchmarkResult, compare
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_cases(self):
+        cases = get_benchmark_cases()
+        self.assertEqual(len({case.name for case in cases}), len(cases))
+        for case in cases:
+            case.function()
+
+    def test_filter_of_cases(self):
+        # Coders of not selected cases aren't created
+        with mock.patch("benchmarks.benchmark_cases.Polar") as polar:
+            cases = get_benchmark_cases("ldpc(96,3,6)")
+        polar.assert_not_called()
+        self.assertEqual([case.name for case in cases], [
+            "coder.encode.ldpc(96,3,6)",
+            "coder.decode.ldpc(96,3,6)",
+            "coder.encode_batch.ldpc(96,3,6)",
+            "coder.decode_batch.ldpc(96,3,6)",
+        ])
+
+    def test_compare(self):
+        baseline = {
+            "first": {"throughput": 10.0},
+            "second": {"throughput": 10.0},
+        }
+        results = [
+            BenchmarkResult("first", 1.0, 8.5, "Mbit/s"),
+            BenchmarkResult("second", 1.0, 7.0, "Mbit/s"),
+            BenchmarkResult("third", 1.0, 1.0, "Mbit/s"),
+        ]
+        self.assertEqual(compare(results, baseline, 0.2), ["second"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# coding=utf-8
+import unittest
+
+from src.coders.convolutional.coder import Coder as ConvolutionalCoder
+from src.coders.cyclical.bch import Coder as BchCoder
+from src.coders.cyclical.coder import Coder as CyclicalCoder
+from src.coders.linear.hamming import Coder as HammingCoder
+from src.coders.linear.reed_muller import Coder as ReedMullerCoder
+from src.helper.calc.galois_field import GaloisField
+from src.helper.calc.gf2_calculation import GF2Calculation
+from src.helper.error.exception.codding_exception import CodingException
+from src.helper.calc.weight_spectrum_calculation import WeightSpectrumCalculation, WeightSpectrum
+
+
+class TestGF2Calculation(unittest.TestCase):
+    def test_dual_rows(self):
+        rows: list = [0b1000110, 0b0100011, 0b0010111, 0b0001101]
+        dual_rows: list = GF2Calculation.get_dual_rows(rows, 7)
+
+        self.assertEqual(len(dual_rows), 3)
+        for row in rows:
+            for dual_row in dual_rows:
+                self.assertEqual((row & dual_row).bit_count() % 2, 0)
+
+    def test_rank(self):
+        rows, pivot_columns = GF2Calculation.get_reduced_row_echelon_form([0b110, 0b011, 0b101], 3)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(pivot_columns, [0, 1])
+
+    def test_polynomials(self):
+        # (x + 1)(x^2 + x + 1) = x^3 + 1
+        self.assertEqual(GF2Calculation.multiply_polynomials(0b11, 0b111), 0b1001)
+        self.assertEqual(GF2Calculation.get_polynomial_remainder(0b1001, 0b111), 0)
+        self.assertEqual(GF2Calculation.get_polynomial_remainder(0b1000, 0b1011), 0b011)
+
+
+class TestGaloisField(unittest.TestCase):
+    def test_arithmetic(self):
+        field: GaloisField = GaloisField(8)
+        for element in (1, 2, 29, 255):
+            self.assertEqual(field.multiply(element, field.divide(1, element)), 1)
+            self.assertEqual(field.power(element, field.order), 1)
+        self.assertEqual(field.multiply(0x80, 2), 0x1D)
+        self.assertEqual(field.multiply_arrays([0, 3, 0x80], [5, 7, 2]).tolist(), [0, 9, 0x1D])
+
+        with self.assertRaises(CodingException):
+            GaloisField(4, 0b11111)
+
+    def test_minimal_polynomial(self):
+        field: GaloisField = GaloisField(4)
+        self.assertEqual(field.get_cyclotomic_coset(3), [3, 6, 12, 9])
+        self.assertEqual(field.get_minimal_polynomial(1), 0b10011)
+        self.assertEqual(field.get_minimal_polynomial(3), 0b11111)
+        self.assertEqual(field.get_minimal_polynomial(5), 0b111)
+
+
+class TestWeightSpectrumCalculation(unittest.TestCase):
+    def test_hamming(self):
+        spectrum: WeightSpectrum = WeightSpectrumCalculation.get_weight_spectrum(HammingCoder(4))
+        self.assertEqual(spectrum.distribution, (1, 0, 0, 7, 7, 0, 0, 1))
+        self.assertEqual(spectrum.min_distance, 3)
+        # Hamming code is perfect, so syndrome decoder corrects exactly all single errors
+        self.assertAlmostEqual(
+            WeightSpectrumCalculation.get_block_error_probability(spectrum, 0.01),
+            1 - 0.99 ** 7 - 7 * 0.01 * 0.99 ** 6
+        )
+
+    def test_mac_williams(self):
+        # Hamming (31, 26) is calculated via dual code
+        spectrum: WeightSpectrum = WeightSpectrumCalculation.get_weight_spectrum(HammingCoder(26))
+        self.assertEqual(sum(spectrum.distribution), 2 ** 26)
+        self.assertEqual(spectrum.distribution[3], 155)
+
+    def test_cyclical_and_reed_muller(self):
+        self.assertEqual(WeightSpectrumCalculation.get_weight_spectrum(CyclicalCoder(4, 11)).min_distance, 3)
+        # Designed distance of BCH code is 2t + 1
+        self.assertEqual(WeightSpectrumCalculation.get_weight_spectrum(BchCoder(4, 2)).min_distance, 5)
+        spectrum: WeightSpectrum = WeightSpectrumCalculation.get_weight_spectrum(ReedMullerCoder(3, 1))
+        self.assertEqual(spectrum.distribution, (1, 0, 0, 0, 14, 0, 0, 0, 1))
+        self.assertLessEqual(
+            WeightSpectrumCalculation.get_block_error_probability(spectrum, 0.05),
+            WeightSpectrumCalculation.get_union_bound(spectrum, 0.05)
+        )
+
+    def test_incorrect_coders(self):
+        with self.assertRaises(CodingException) as context:
+            WeightSpectrumCalculation.get_weight_spectrum(ConvolutionalCoder([5, 7], 1, 2, 3))
+        self.assertEqual(context.exception.message,
+                         CodingException.ANALYTIC_CALCULATION_NOT_BLOCK_CODER.message)
+
+        # Both BCH (255, 191) and its dual code are too large for enumeration
+        with self.assertRaises(CodingException) as context:
+            WeightSpectrumCalculation.get_weight_spectrum(BchCoder(8, 8))
+        self.assertEqual(context.exception.message, CodingException.WEIGHT_SPECTRUM_TOO_LARGE.message)
@@ -0,0 +1,256 @@
+# coding=utf-8
+import os
+import random
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.channel.cascadecodec import CascadeCodec
+from src.channel.chanel import Chanel
+from src.channel.codec import Codec
+from src.channel.codec_stage import CodecStage
+from src.channel.concatenated_codec import ConcatenatedCodec
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.channel.enum_package_transfer_result import EnumPackageTransferResult
+from src.channel.stage_profiler import StageProfiler
+from src.coders.convolutional.coder import Coder as ConvolutionalCoder
+from src.coders.cyclical.coder import Coder as CyclicalCoder
+from src.coders.interleaver.Interleaver import Interleaver
+from src.coders.linear.hamming import Coder as HammingCoder
+from src.helper import jit
+
+
+class TestChanel(unittest.TestCase):
+    def test_biased_interference(self):
+        information: list = [0] * 100
+        noise_information, likelihood_ratio = Chanel().gen_biased_interference(information, 1.0, 10.0)
+        count_change_bit: int = sum(noise_information)
+
+        self.assertEqual(information, [0] * 100)
+        self.assertAlmostEqual(likelihood_ratio, 0.1 ** count_change_bit * (0.99 / 0.9) ** (100 - count_change_bit))
+
+    def test_unbiased_interference(self):
+        _, likelihood_ratio = Chanel().gen_biased_interference([1, 0] * 50, 5.0, 5.0)
+        self.assertAlmostEqual(likelihood_ratio, 1.0)
+
+    def test_divide_on_blocks(self):
+        self.assertEqual(Chanel().divide_on_blocks([1, 0, 1, 1, 1], 2), [[1, 0], [1, 1], [1, 0]])
+        self.assertEqual(Chanel().divide_on_blocks([1], 3), [[1, 0, 0]])
+
+    def test_get_blocks(self):
+        information: np.ndarray = np.array([1, 0, 1, 1, 0, 1])
+        blocks: np.ndarray = Chanel().get_blocks(information, 3)
+        self.assertEqual(blocks.tolist(), [[1, 0, 1], [1, 0, 1]])
+        # Array of suitable length isn't copied
+        self.assertTrue(np.shares_memory(blocks, information))
+
+        buffer: np.ndarray = np.ones(10, dtype=np.int64)
+        blocks = Chanel().get_blocks([1, 1, 1, 1], 3, buffer)
+        self.assertEqual(blocks.tolist(), [[1, 1, 1], [1, 0, 0]])
+        self.assertTrue(np.shares_memory(blocks, buffer))
+
+    def test_package_interference(self):
+        flg_enabled_before: bool = jit.ENABLED
+        results: list = []
+        try:
+            for flg_enabled in (True, False):
+                jit.ENABLED = flg_enabled
+                random.seed(1)
+                information: list = [0] * 100
+                # Information is changed in place, list and array are changed the same way
+                self.assertIs(Chanel().generate_package_interference(information, 3, 10), information)
+                random.seed(1)
+                bits: np.ndarray = Chanel().generate_package_interference(np.zeros(100, dtype=np.uint8), 3, 10)
+                self.assertEqual(bits.tolist(), information)
+                self.assertEqual(sum(information), 30)
+
+                random.seed(1)
+                results.append((information, Chanel().gen_package_interference([0] * 100, 4, 0.2, True)))
+        finally:
+            jit.ENABLED = flg_enabled_before
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(sum(results[0][1]), 20)
+
+    def test_numba_is_imported_lazily(self):
+        # Numba is imported only by the first call of kernel, so it doesn't slow down startup
+        output: str = subprocess.run(
+            [sys.executable, "-c", "import sys, src.channel.chanel; print('numba' in sys.modules)"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+
+class _FirstBlockNoiseCodec(Codec):
+    """
+    Codec which changes three bits of the first block only
+    """
+    _countNoiseCalls: int = 0
+
+    def _do_noise(self, information: list, noise_probability: float) -> list:
+        self._countNoiseCalls += 1
+        if self._countNoiseCalls > 1:
+            return information
+        return [bit ^ 1 if position < 3 else bit for position, bit in enumerate(information)]
+
+
+class TestCodec(unittest.TestCase):
+    def test_transfer_of_several_blocks(self):
+        codec: Codec = _FirstBlockNoiseCodec(
+            coder=HammingCoder(4),
+            noise_probability=0,
+            count_cyclical=1,
+            duplex=False,
+            interleaver=None,
+            noise_mode=EnumNoiseMode.SINGLE,
+            noise_package_length=1,
+            noise_package_period=2,
+        )
+        transfer_statistic: Codec.TransferStatistic = codec.transfer_one_step([1, 0, 1, 1, 0, 1, 1, 1, 0, 0, 1])
+
+        # Package of three blocks fails if the first block fails, counters of all blocks are summed
+        self.assertEqual(transfer_statistic.result_status, EnumPackageTransferResult.SHADOW)
+        self.assertEqual(transfer_statistic.based_error_bits, 3)
+        self.assertEqual(transfer_statistic.based_correct_bits, 3 * 7 - 3)
+        self.assertEqual(transfer_statistic.quantity_changed_bits, 3)
+        self.assertGreater(transfer_statistic.quantity_error_bits, 0)
+        self.assertEqual(transfer_statistic.quantity_successful_bits + transfer_statistic.quantity_error_bits, 12)
+
+    def test_blocks_are_transferred_at_once(self):
+        coder: HammingCoder = HammingCoder(4)
+        codec: Codec = Codec(
+            coder=coder,
+            noise_probability=0,
+            count_cyclical=1,
+            duplex=False,
+            interleaver=None,
+            noise_mode=EnumNoiseMode.SINGLE,
+            noise_package_length=1,
+            noise_package_period=2,
+        )
+        with mock.patch.object(coder, "encoding_batch", wraps=coder.encoding_batch) as encoding_batch, \
+                mock.patch.object(coder, "decoding_batch", wraps=coder.decoding_batch) as decoding_batch:
+            transfer_statistic: Codec.TransferStatistic = codec.transfer_one_step([1, 0, 1, 1, 0, 1, 1, 1, 0, 0, 1])
+
+        # Blocks are rows of one matrix, which is encoded by one call
+        encoding_batch.assert_called_once()
+        self.assertEqual(encoding_batch.call_args[0][0].tolist(), [[1, 0, 1, 1], [0, 1, 1, 1], [0, 0, 1, 0]])
+        decoding_batch.assert_called_once()
+        self.assertEqual(len(decoding_batch.call_args[0][0]), 3)
+        self.assertEqual(transfer_statistic.result_status, EnumPackageTransferResult.SUCCESS)
+        self.assertEqual(transfer_statistic.quantity_successful_bits, 12)
+
+    def test_stage_profiler(self):
+        codec: Codec = Codec(
+            coder=HammingCoder(4),
+            noise_probability=10,
+            count_cyclical=1,
+            duplex=False,
+            interleaver=Interleaver(7),
+            noise_mode=EnumNoiseMode.SINGLE,
+            noise_package_length=1,
+            noise_package_period=2,
+        )
+        codec.transfer_one_step([1, 0, 1, 1])
+
+        profiler: StageProfiler = StageProfiler()
+        codec.set_profiler(profiler)
+        for _ in range(5):
+            codec.transfer_one_step([1, 0, 1, 1])
+
+        self.assertEqual(profiler.calls["encode"], 5)
+        self.assertEqual(profiler.calls["shuffle"], 5)
+        self.assertEqual(profiler.calls["noise"], 5)
+        self.assertEqual(profiler.calls["reestablish"], 5)
+        self.assertEqual(profiler.calls["decode"], 5)
+        self.assertEqual(profiler.calls["compare"], 10)
+        self.assertTrue(all(duration > 0 for duration in profiler.durations.values()))
+
+
+class TestCascadeCodec(unittest.TestCase):
+    @staticmethod
+    def _get_codec(noise_probability: float) -> CascadeCodec:
+        return CascadeCodec(
+            first_coder=HammingCoder(4),
+            second_coder=ConvolutionalCoder([5, 7], 1, 2, 3),
+            noise_probability=noise_probability,
+            count_cyclical=1,
+            duplex=False,
+            first_interleaver=None,
+            second_interleaver=None,
+            noise_mode=EnumNoiseMode.SINGLE,
+            noise_package_length=1,
+            noise_package_period=2,
+        )
+
+    def test_transfer(self):
+        information: list = [1, 0, 1, 1, 0, 1, 1, 1, 0, 0, 1]
+        transfer_statistic: Codec.TransferStatistic = self._get_codec(0).transfer_one_step(information)
+        self.assertEqual(transfer_statistic.result_status, EnumPackageTransferResult.SUCCESS)
+        # Three packages of outer coder, the last one is supplemented by zero bits
+        self.assertEqual(transfer_statistic.current_information_state, information + [0])
+        self.assertEqual(transfer_statistic.quantity_successful_bits, 12)
+        self.assertEqual(transfer_statistic.based_correct_bits, 42)
+
+        # One error in stream of inner coder is repaired
+        transfer_statistic = self._get_codec(3).transfer_one_step(information)
+        self.assertEqual(transfer_statistic.result_status, EnumPackageTransferResult.REPAIR)
+        self.assertEqual(transfer_statistic.based_error_bits, 1)
+        self.assertEqual(transfer_statistic.quantity_error_bits, 0)
+
+    def test_stage_profiler(self):
+        codec: CascadeCodec = self._get_codec(10)
+        profiler: StageProfiler = StageProfiler()
+        codec.set_profiler(profiler)
+        codec.transfer_one_step([1, 0, 1, 1, 0, 1, 1, 1, 0, 0, 1])
+
+        # Each stage processes all packages at once
+        self.assertEqual(profiler.calls["encode"], 2)
+        self.assertEqual(profiler.calls["noise"], 1)
+        self.assertEqual(profiler.calls["decode"], 2)
+
+
+class TestConcatenatedCodec(unittest.TestCase):
+    @staticmethod
+    def _get_codec(noise_probability: float) -> ConcatenatedCodec:
+        return ConcatenatedCodec(
+            stages=[
+                CodecStage(CyclicalCoder(4, 11)),
+                CodecStage(ConvolutionalCoder([5, 7], 1, 2, 3), Interleaver(7)),
+                CodecStage(HammingCoder(4)),
+            ],
+            noise_probability=noise_probability,
+            count_cyclical=1,
+            duplex=False,
+            noise_mode=EnumNoiseMode.SINGLE,
+            noise_package_length=1,
+            noise_package_period=2,
+        )
+
+    def test_transfer(self):
+        information: list = [1, 0, 1, 1, 0, 1, 1, 1]
+        transfer_statistic: Codec.TransferStatistic = self._get_codec(0).transfer_one_step(information)
+        self.assertEqual(transfer_statistic.result_status, EnumPackageTransferResult.SUCCESS)
+        self.assertEqual(transfer_statistic.current_information_state, information)
+        self.assertEqual(transfer_statistic.stage_error_bits, [0, 0, 0])
+
+        transfer_statistic = self._get_codec(5).transfer_one_step(information)
+        self.assertEqual(len(transfer_statistic.stage_error_bits), 3)
+        self.assertEqual(transfer_statistic.stage_error_bits[0], transfer_statistic.quantity_error_bits)
+        self.assertEqual(transfer_statistic.stage_error_bits[-1], transfer_statistic.quantity_inner_error_bits)
+
+    def test_stage_profiler(self):
+        codec: ConcatenatedCodec = self._get_codec(5)
+        profiler: StageProfiler = StageProfiler()
+        codec.set_profiler(profiler)
+        codec.transfer_one_step([1, 0, 1, 1, 0, 1, 1, 1])
+
+        self.assertEqual(len(codec.stages), 3)
+        self.assertEqual(profiler.calls["encode"], 3)
+        self.assertEqual(profiler.calls["noise"], 1)
+        self.assertEqual(profiler.calls["decode"], 3)
@@ -1,13 +1,35 @@
 # coding=utf-8
 # coding=utf-8
+import os
+import tempfile
 import unittest
 
+import numpy as np
+
+from src.coders import casts
+from src.coders.coder_loader import CoderLoader
 from src.coders.convolutional.coder import Coder as ConvolutionalCoder
+from src.coders.convolutional.enum_termination_mode import EnumTerminationMode
+from src.coders.convolutional.puncturing import Puncturing
 from src.coders.convolutional.coder_for_packet import ConvolutionalCoderForPacket
+from src.coders.convolutional.trellis import Trellis, get_trellis
+from src.coders.convolutional.turbo import Coder as TurboCoder
+from src.coders.cyclical.bch import Coder as BchCoder
 from src.coders.cyclical.coder import Coder as CyclicalCoder
+from src.coders.cyclical.reed_solomon import Coder as ReedSolomonCoder
 from src.coders.fountain.luby_transform import Coder as LubyTransformCoder
+from src.coders.ldpc.coder import Coder as LdpcCoder
+from src.coders.ldpc.parity_check_matrix import ParityCheckMatrix
 from src.coders.linear.hamming import Coder as hammingCoder
+from src.coders.linear.linear_block import Coder as LinearBlockCoder
 from src.coders.linear.reed_muller import Coder as ReedMullerCoder
+from src.coders.polar.coder import Coder as PolarCoder
+from src.coders.polar.enum_construction_mode import EnumConstructionMode
+from src.coders.polar.frozen_bits import get_frozen_bits
+from src.coders.polar.transform import polar_transform
+from src.helper import jit
+from src.helper.error.exception.codding_exception import CodingException
+from src.statistics.db.enum_coders_type import EnumCodersType
 
 
 class TestConvolutionalCoder(unittest.TestCase):
@@ -36,6 +58,143 @@ class TestConvolutionalCoder(unittest.TestCase):
         # так как d(min)=4, кодер не может исправить однозначно 3 подряд идущие ошибки
 
 
+class TestPuncturedConvolutionalCoder(unittest.TestCase):
+    def test_encode(self):
+        test_coder: ConvolutionalCoder = ConvolutionalCoder(
+            [5, 7], 1, 2, 3, ConvolutionalCoder.get_puncturing_matrix("3/4"))
+
+        start_code: list = [1, 1, 0, 1, 0, 0, 1, 0, 0]
+        code: list = test_coder.encoding(start_code)
+        self.assertEqual(len(code), 12)
+        self.assertEqual(test_coder.get_speed(), 0.75)
+        self.assertEqual(test_coder.decoding(code), start_code)
+
+    def test_correct_ability(self):
+        test_coder: ConvolutionalCoder = ConvolutionalCoder(
+            [79, 109], 1, 2, 6, ConvolutionalCoder.get_puncturing_matrix("2/3"))
+
+        start_code: list = [1, 1, 0, 1, 0, 0, 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0]
+        code: list = test_coder.encoding(start_code)
+        code[5] ^= 1
+        self.assertEqual(test_coder.decoding(code), start_code)
+
+    def test_depuncture(self):
+        puncturing: Puncturing = Puncturing([[1, 1, 0], [1, 0, 1]], 2)
+
+        bits, mask = puncturing.depuncture([1, 0, 1, 1, 1, 0, 0])
+        self.assertEqual(bits.tolist(), [[1, 0], [1, 0], [0, 1], [1, 0], [0, 0]])
+        self.assertEqual(mask.tolist(), [[True, True], [True, False], [False, True], [True, True], [True, False]])
+        self.assertRaises(CodingException, puncturing.depuncture, [1, 0, 1, 1, 1])
+        self.assertRaises(CodingException, Puncturing, [[1, 0], [1, 0], [1, 1]], 2)
+        self.assertRaises(CodingException, Puncturing, [[1, 0], [1, 0]], 2)
+
+
+class TestConvolutionalTermination(unittest.TestCase):
+    start_code: list = [1, 1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0]
+
+    def test_zero_terminated(self):
+        test_coder: ConvolutionalCoder = ConvolutionalCoder(
+            [5, 7], 1, 2, 2, termination_mode=EnumTerminationMode.ZERO)
+
+        code: list = test_coder.encoding(self.start_code)
+        self.assertEqual(len(code), 2 * (len(self.start_code) + 2))
+        code[-1] ^= 1
+        self.assertEqual(test_coder.decoding(code), self.start_code)
+
+    def test_tail_biting(self):
+        test_coder: ConvolutionalCoder = ConvolutionalCoder(
+            [79, 109], 1, 2, 6, termination_mode=EnumTerminationMode.TAIL_BITING)
+
+        code: list = test_coder.encoding(self.start_code)
+        self.assertEqual(len(code), 2 * len(self.start_code))
+        self.assertEqual(test_coder.decoding(code), self.start_code)
+        # Error at the start of package is corrected as in the middle
+        code[0] ^= 1
+        self.assertEqual(test_coder.decoding(code), self.start_code)
+        self.assertRaises(CodingException, test_coder.get_stream_decoder)
+
+    def test_tail_biting_with_puncturing(self):
+        test_coder: ConvolutionalCoder = ConvolutionalCoder(
+            [79, 109], 1, 2, 6, ConvolutionalCoder.get_puncturing_matrix("3/4"),
+            termination_mode=EnumTerminationMode.TAIL_BITING)
+
+        # Code isn't catastrophic, so periodic input isn't encoded into zero word
+        self.assertGreater(sum(test_coder.encoding([0, 0, 1] * 20)), 0)
+        for length in range(6, 40):
+            start_code: list = (self.start_code * 10)[:length]
+            self.assertEqual(test_coder.decoding(test_coder.encoding(start_code)), start_code)
+
+    def test_stream(self):
+        for puncturing_rate in (None, "3/4"):
+            for termination_mode in (EnumTerminationMode.TRUNCATED, EnumTerminationMode.ZERO):
+                test_coder: ConvolutionalCoder = ConvolutionalCoder(
+                    [79, 109], 1, 2, 6,
+                    ConvolutionalCoder.get_puncturing_matrix(puncturing_rate),
+                    termination_mode,
+                    traceback_depth=10
+                )
+                start_code: list = self.start_code * 10
+
+                stream_encoder = test_coder.get_stream_encoder()
+                code: list = []
+                for position in range(0, len(start_code), 7):
+                    code += stream_encoder.push(start_code[position:position + 7])
+                code += stream_encoder.flush()
+                self.assertEqual(code, test_coder.encoding(start_code))
+
+                code[30] ^= 1
+                stream_decoder = test_coder.get_stream_decoder()
+                answer: list = []
+                for position in range(0, len(code), 5):
+                    answer += stream_decoder.push(code[position:position + 5])
+                    # Decoded bits are returned with latency not more than two traceback depths
+                    self.assertLessEqual(position + 5 - len(answer) * len(code) / len(start_code), 2 * 10 * 2 + 5)
+                answer += stream_decoder.flush()
+                self.assertEqual(answer, start_code)
+
+
+class TestTrellis(unittest.TestCase):
+    def test_build(self):
+        trellis: Trellis = Trellis.build((5, 7), 2)
+
+        self.assertEqual(trellis.nextStates.tolist(), [[0, 2], [0, 2], [1, 3], [1, 3]])
+        self.assertEqual(trellis.outputs.tolist(), [
+            [[0, 0], [1, 1]],
+            [[0, 1], [1, 0]],
+            [[1, 1], [0, 0]],
+            [[1, 0], [0, 1]],
+        ])
+        self.assertEqual(trellis.graph[1], [[0, [0, 1]], [2, [1, 0]]])
+
+    def test_build_recursive(self):
+        # Feedback 1 + D + D^2 and parity 1 + D^2
+        trellis: Trellis = Trellis.build_recursive(7, (5,), 2)
+
+        self.assertEqual(trellis.nextStates.tolist(), [[0, 2], [2, 0], [3, 1], [1, 3]])
+        self.assertEqual(trellis.outputs[:, :, 0].tolist(), [[0, 1], [0, 1], [1, 0], [1, 0]])
+        self.assertEqual(trellis.previous_inputs.tolist(), [[0, 1], [1, 0], [1, 0], [0, 1]])
+        # Termination inputs lead from any state to zero state
+        for state in range(trellis.count_states):
+            for _ in range(trellis.countRegisters):
+                state = trellis.nextStates[state, trellis.termination_inputs[state]]
+            self.assertEqual(state, 0)
+
+    def test_shared(self):
+        self.assertIs(get_trellis((5, 7), 2), get_trellis((5, 7), 2))
+        self.assertIs(ConvolutionalCoder([5, 7], 1, 2, 2)._trellis, ConvolutionalCoder([5, 7], 1, 2, 2)._trellis)
+
+    def test_save_load(self):
+        trellis: Trellis = Trellis.build((91, 121), 6)
+        with tempfile.TemporaryDirectory() as directory:
+            file_name: str = Trellis.get_file_name(directory, (91, 121), 6)
+            trellis.save(file_name)
+            self.assertTrue(os.path.exists(file_name))
+
+            loaded: Trellis = Trellis.load(file_name, (91, 121), 6)
+        self.assertTrue(np.array_equal(loaded.nextStates, trellis.nextStates))
+        self.assertTrue(np.array_equal(loaded.outputs, trellis.outputs))
+
+
 class TestHammingCoder(unittest.TestCase):
     def test_init(self):
         first_coder: hammingCoder = hammingCoder(4)
@@ -135,3 +294,413 @@ class TestReedMullerCoder(unittest.TestCase):
         # print(test_coder.matrixG)
 
         pass
+
+
+class TestJitKernels(unittest.TestCase):
+    """
+    Kernels are compiled only if numba is installed, otherwise they are run as python functions.
+    In both cases result should be the same as result of numpy implementation
+    """
+    def setUp(self):
+        self.flg_enabled: bool = jit.ENABLED
+
+    def tearDown(self):
+        jit.ENABLED = self.flg_enabled
+
+    def _assert_same_decoding(self, coder, codes: list):
+        results: list = []
+        for flg_enabled in (True, False):
+            jit.ENABLED = flg_enabled
+            results.append([coder.decoding(list(code)) for code in codes])
+        self.assertEqual(results[0], results[1])
+
+    def _get_noised_codes(self, coder, length: int, count_errors: int) -> list:
+        random_generator: np.random.Generator = np.random.default_rng(7)
+        codes: list = []
+        for _ in range(20):
+            code: list = coder.encoding(random_generator.integers(0, 2, length).tolist())
+            for position in random_generator.choice(len(code), count_errors, replace=False):
+                code[position] ^= 1
+            codes.append(code)
+        return codes
+
+    def test_viterbi(self):
+        coder: ConvolutionalCoder = ConvolutionalCoder([5, 7], 1, 2, 3)
+        self._assert_same_decoding(coder, self._get_noised_codes(coder, 16, 3))
+
+    def test_reed_muller(self):
+        coder: ReedMullerCoder = ReedMullerCoder(4, 2)
+        self._assert_same_decoding(coder, self._get_noised_codes(coder, coder.lengthInformation, 2))
+
+    def test_fountain(self):
+        coder: LubyTransformCoder = LubyTransformCoder(3, 3, 6)
+        code: list = coder.encoding([1, 0, 0, 1, 1, 0])
+        for flg_enabled in (True, False):
+            jit.ENABLED = flg_enabled
+            self.assertEqual(coder.decoding(code), [1, 0, 0, 1, 1, 0])
+
+
+class TestCoderLoader(unittest.TestCase):
+    def test_get_coder_class(self):
+        self.assertIs(CoderLoader.get_coder_class(EnumCodersType.HAMMING), hammingCoder)
+        self.assertIs(CoderLoader.get_coder_class(EnumCodersType.FOUNTAIN), LubyTransformCoder)
+
+    def test_get_coder_classes(self):
+        for coder_type, coder_class in zip(CoderLoader.get_coder_types(), CoderLoader.get_coder_classes()):
+            self.assertEqual(coder_class._typeOfCoder, coder_type)
+
+
+class TestCasts(unittest.TestCase):
+    def test_int_to_bit_list(self):
+        self.assertEqual(casts.int_to_bit_list(100), [1, 1, 0, 0, 1, 0, 0])
+        self.assertEqual(casts.int_to_bit_list(100, 9, rev=True), [0, 0, 1, 0, 0, 1, 1, 0, 0])
+        self.assertEqual(casts.int_to_bit_list(0), [])
+        # Long integers are converted through numpy
+        self.assertEqual(casts.int_to_bit_list((1 << 99) + 5, 101), [0, 1] + [0] * 96 + [1, 0, 1])
+
+    def test_bit_list_to_int(self):
+        bits: list = [1, 0, 1, 1, 0, 0, 1] * 10
+        self.assertEqual(casts.bit_list_to_int(bits), int("1011001" * 10, 2))
+        self.assertEqual(casts.bit_list_to_int(bits[:7], rev=True), 0b1001101)
+        self.assertEqual(casts.bit_list_to_int_list(bits[:4]), [0, 1, 3])
+        # Input isn't changed
+        self.assertEqual(bits[:7], [1, 0, 1, 1, 0, 0, 1])
+
+    def test_arrays(self):
+        values: np.ndarray = np.array([0, 5, 255, 1 << 40], dtype=np.uint64)
+        bits: np.ndarray = casts.int_array_to_bit_array(values, 41)
+        self.assertEqual(bits.shape, (4, 41))
+        self.assertEqual(bits[1].tolist(), casts.int_to_bit_list(5, 41))
+        self.assertEqual(casts.bit_array_to_int_array(bits).tolist(), values.tolist())
+        self.assertEqual(casts.get_weights(values).tolist(), [0, 2, 8, 1])
+        self.assertEqual(casts.get_hamming_distances(bits, bits[0]).tolist(), [0, 2, 8, 1])
+
+    def test_hamming_distance(self):
+        self.assertEqual(casts.get_hamming_distance([1, 0, 1], [0, 0, 0]), 2)
+        self.assertEqual(casts.get_hamming_distance(np.array([1, 0, 1]), [1, 1, 1]), 1)
+        with self.assertRaises(CodingException):
+            casts.get_hamming_distance([1], [1, 0])
+
+
+class _SingleErrorLinearBlockCoder(LinearBlockCoder):
+    MAX_SYNDROME_TABLE_BITS: int = 8
+
+
+class TestLinearBlockCoder(unittest.TestCase):
+    # Generator matrix of Hamming (7, 4) code
+    _GENERATOR_MATRIX: list = [
+        [1, 0, 0, 0, 1, 1, 0],
+        [0, 1, 0, 0, 1, 0, 1],
+        [0, 0, 1, 0, 0, 1, 1],
+        [0, 0, 0, 1, 1, 1, 1],
+    ]
+
+    @staticmethod
+    def _get_golay_coder() -> LinearBlockCoder:
+        # Generator polynomial x^11 + x^10 + x^6 + x^5 + x^4 + x^2 + 1 of Golay (23, 12) code
+        polynomial: list = [1, 1, 0, 0, 0, 1, 1, 1, 0, 1, 0, 1]
+        return LinearBlockCoder(generator_matrix=[[0] * shift + polynomial + [0] * (11 - shift) for shift in range(12)])
+
+    def test_init(self):
+        coder: LinearBlockCoder = LinearBlockCoder(generator_matrix=self._GENERATOR_MATRIX)
+        self.assertEqual((coder.lengthTotal, coder.lengthInformation, coder.lengthAdditional), (7, 4, 3))
+        self.assertEqual(coder.information_columns, [0, 1, 2, 3])
+        self.assertEqual(coder.encoding([1, 0, 1, 1]), [1, 0, 1, 1, 0, 1, 0])
+
+        # The same code is defined by parity check matrix
+        parity_check_coder: LinearBlockCoder = LinearBlockCoder(parity_check_matrix=coder.parity_check_matrix)
+        self.assertEqual(parity_check_coder.generator_matrix, coder.generator_matrix)
+
+        with self.assertRaises(CodingException):
+            LinearBlockCoder(generator_matrix=[[1, 0, 1], [1, 0, 1]])
+        with self.assertRaises(CodingException):
+            LinearBlockCoder(generator_matrix=[[1, 0, 1]], parity_check_matrix=[[1, 1, 0]])
+        self.assertEqual(LinearBlockCoder.get_matrix("1000110, 0100101"), self._GENERATOR_MATRIX[:2])
+
+    def test_decoding(self):
+        coder: LinearBlockCoder = LinearBlockCoder(generator_matrix=self._GENERATOR_MATRIX)
+        information: list = [1, 0, 1, 1]
+        codeword: list = coder.encoding(information)
+        self.assertEqual(coder.decoding(codeword), information)
+        for position in range(coder.lengthTotal):
+            received: list = codeword.copy()
+            received[position] ^= 1
+            self.assertEqual(coder.decoding(received), information)
+        with self.assertRaises(CodingException):
+            coder.decoding(codeword[:-1])
+
+    def test_golay(self):
+        coder: LinearBlockCoder = self._get_golay_coder()
+        information: list = [1, 0, 1, 1, 0, 0, 1, 1, 1, 0, 0, 1]
+        codeword: list = coder.encoding(information)
+        received: list = codeword.copy()
+        for position in (0, 7, 22):
+            received[position] ^= 1
+        # Perfect code corrects any three errors
+        self.assertEqual(coder.decoding(received), information)
+
+        # Without syndrome table only single errors are corrected
+        coder = _SingleErrorLinearBlockCoder(generator_matrix=coder.generator_matrix)
+        received = codeword.copy()
+        received[5] ^= 1
+        self.assertEqual(coder.decoding(received), information)
+        self.assertEqual(coder.decoding_batch([received, codeword]), [information, information])
+
+    def test_batch(self):
+        coder: LinearBlockCoder = self._get_golay_coder()
+        packages: np.ndarray = np.random.RandomState(1).randint(0, 2, (20, coder.lengthInformation))
+        codewords: list = coder.encoding_batch(packages)
+        self.assertEqual(codewords, [coder.encoding(package) for package in packages.tolist()])
+
+        noise: np.ndarray = np.zeros((20, coder.lengthTotal), dtype=int)
+        noise[:, :4] = 1
+        received: list = (np.array(codewords) ^ noise).tolist()
+        self.assertEqual(coder.decoding_batch(received), [coder.decoding(package) for package in received])
+        self.assertEqual(coder.decoding_batch([received[0][:-1]]), [None])
+
+
+class TestLdpcCoder(unittest.TestCase):
+    def test_parity_check_matrix(self):
+        matrix: ParityCheckMatrix = ParityCheckMatrix.generate(24, 3, 6, seed=2)
+        dense: np.ndarray = np.array(matrix.to_dense())
+        self.assertEqual(dense.shape, (12, 24))
+        self.assertTrue((dense.sum(axis=0) <= 3).all() and (dense.sum(axis=1) <= 6).all())
+
+        # Checks of each layer don't have common variables and each edge belongs to one layer
+        layers: list = matrix.get_layers()
+        for edges in layers:
+            variables: np.ndarray = matrix.variableIndexes[edges]
+            self.assertEqual(len(np.unique(variables)), len(variables))
+        self.assertEqual(sorted(np.concatenate(layers).tolist()), list(range(matrix.count_edges)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_name: str = os.path.join(directory, "matrix.alist")
+            matrix.save_alist(file_name)
+            self.assertEqual(ParityCheckMatrix.load_alist(file_name).to_dense(), matrix.to_dense())
+
+        with self.assertRaises(CodingException):
+            ParityCheckMatrix.generate(25, 3, 6)
+        with self.assertRaises(CodingException):
+            ParityCheckMatrix(2, 3, [0, 1], [0, 3])
+
+    def test_decoding(self):
+        coder: LdpcCoder = LdpcCoder(ParityCheckMatrix.generate(96, 3, 6, seed=1))
+        self.assertEqual(coder.typeOfCoder, EnumCodersType.LDPC)
+        information: list = np.random.RandomState(3).randint(0, 2, coder.lengthInformation).tolist()
+        codeword: list = coder.encoding(information)
+        self.assertEqual(coder.decoding(codeword), information)
+        for positions in ([5], [0, 50], [10, 40, 90]):
+            received: list = codeword.copy()
+            for position in positions:
+                received[position] ^= 1
+            self.assertEqual(coder.decoding(received), information)
+        with self.assertRaises(CodingException):
+            coder.decoding(codeword[:-1])
+
+    def test_batch(self):
+        coder: LdpcCoder = LdpcCoder(ParityCheckMatrix.generate(48, 3, 6), max_iterations=5)
+        random_state: np.random.RandomState = np.random.RandomState(4)
+        packages: np.ndarray = random_state.randint(0, 2, (30, coder.lengthInformation))
+        codewords: list = coder.encoding_batch(packages)
+        self.assertEqual(codewords, [coder.encoding(package) for package in packages.tolist()])
+
+        # Some words aren't corrected, result of batch should be the same for them too
+        received: list = (np.array(codewords) ^ (random_state.random_sample((30, 48)) < 0.05)).tolist()
+        self.assertEqual(coder.decoding_batch(received), [coder.decoding(package) for package in received])
+        self.assertEqual(coder.decoding_batch([received[0][:-1]]), [None])
+
+
+class TestBchCoder(unittest.TestCase):
+    def test_init(self):
+        coder: BchCoder = BchCoder(4, 2)
+        self.assertEqual((coder.lengthTotal, coder.lengthInformation), (15, 7))
+        # x^8 + x^7 + x^6 + x^4 + 1
+        self.assertEqual(coder.generator_polynomial, [1, 0, 0, 0, 1, 0, 1, 1, 1])
+        self.assertEqual(coder.encoding([1, 0, 0, 0, 0, 0, 0]), coder.generator_polynomial + [0] * 6)
+        self.assertEqual((BchCoder(10, 8).lengthTotal, BchCoder(10, 8, 500).lengthTotal), (1023, 580))
+
+        with self.assertRaises(CodingException):
+            BchCoder(2, 1)
+        with self.assertRaises(CodingException):
+            BchCoder(4, 2, 8)
+
+    def test_decoding(self):
+        coder: BchCoder = BchCoder(8, 4, 100)
+        information: list = np.random.RandomState(5).randint(0, 2, coder.lengthInformation).tolist()
+        codeword: list = coder.encoding(information)
+        self.assertEqual(coder.decoding(codeword), information)
+        for positions in ([0], [3, 70], [1, 50, 100, 130], [coder.lengthTotal - 1, 10, 20, 40]):
+            received: list = codeword.copy()
+            for position in positions:
+                received[position] ^= 1
+            self.assertEqual(coder.decoding(received), information)
+        with self.assertRaises(CodingException):
+            coder.decoding(codeword[:-1])
+
+    def test_batch(self):
+        coder: BchCoder = BchCoder(7, 3)
+        random_state: np.random.RandomState = np.random.RandomState(6)
+        packages: np.ndarray = random_state.randint(0, 2, (40, coder.lengthInformation))
+        codewords: list = coder.encoding_batch(packages)
+        self.assertEqual(codewords, [coder.encoding(package) for package in packages.tolist()])
+
+        # Words from 0 to 6 errors, uncorrectable words are returned without correction in both methods
+        noise: np.ndarray = np.zeros((40, coder.lengthTotal), dtype=int)
+        for row in range(40):
+            noise[row, random_state.choice(coder.lengthTotal, row % 7, replace=False)] = 1
+        received: list = (np.array(codewords) ^ noise).tolist()
+        decoded: list = coder.decoding_batch(received)
+        self.assertEqual(decoded, [coder.decoding(package) for package in received])
+        for row in range(40):
+            if row % 7 <= 3:
+                self.assertEqual(decoded[row], packages[row].tolist())
+
+
+class TestReedSolomonCoder(unittest.TestCase):
+    def test_init(self):
+        coder: ReedSolomonCoder = ReedSolomonCoder(255, 223)
+        self.assertEqual((coder.lengthTotal, coder.lengthInformation, coder.correctable_symbols), (2040, 1784, 16))
+        self.assertEqual(len(coder.generator_polynomial), 33)
+
+        # Codeword polynomial is divisible by (x + alpha), so syndrome r(alpha) of codeword is zero
+        codewords: np.ndarray = coder.encode_symbols(np.random.RandomState(7).randint(0, 256, (3, 223)))
+        self.assertFalse(coder.get_syndromes(codewords).any())
+
+        with self.assertRaises(CodingException):
+            ReedSolomonCoder(256, 200)
+        with self.assertRaises(CodingException):
+            ReedSolomonCoder(20, 19)
+
+    def test_bytes(self):
+        coder: ReedSolomonCoder = ReedSolomonCoder(40, 30)
+        data: bytes = bytes(range(60))
+        encoded: bytearray = bytearray(coder.encoding_bytes(data))
+        self.assertEqual(bytes(encoded[:30]), data[:30])
+        self.assertEqual(len(encoded), 80)
+        # Five wrong bytes in each codeword, one of them is in check symbols
+        for position in (0, 7, 8, 20, 35, 41, 42, 43, 44, 79):
+            encoded[position] ^= 0xA5
+        self.assertEqual(coder.decoding_bytes(bytes(encoded)), data)
+        with self.assertRaises(CodingException):
+            coder.decoding_bytes(bytes(encoded[:-1]))
+
+    def test_burst(self):
+        coder: ReedSolomonCoder = ReedSolomonCoder(60, 50)
+        information: list = np.random.RandomState(8).randint(0, 2, coder.lengthInformation).tolist()
+        codeword: list = coder.encoding(information)
+        self.assertEqual(coder.decoding(codeword), information)
+        # Burst of 33 bits spoils 5 symbols
+        received: list = codeword.copy()
+        for position in range(100, 133):
+            received[position] ^= 1
+        self.assertEqual(coder.decoding(received), information)
+        with self.assertRaises(CodingException):
+            coder.decoding(codeword[:-1])
+
+    def test_batch(self):
+        coder: ReedSolomonCoder = ReedSolomonCoder(30, 20)
+        random_state: np.random.RandomState = np.random.RandomState(9)
+        packages: np.ndarray = random_state.randint(0, 2, (20, coder.lengthInformation))
+        codewords: list = coder.encoding_batch(packages)
+        self.assertEqual(codewords, [coder.encoding(package) for package in packages.tolist()])
+
+        # Words from 0 to 9 wrong symbols, uncorrectable words are returned without correction in both methods
+        noise: np.ndarray = np.zeros((20, coder.count_symbols), dtype=np.uint8)
+        for row in range(20):
+            noise[row, random_state.choice(coder.count_symbols, row % 10, replace=False)] = 0xFF
+        received: list = (np.array(codewords) ^ np.unpackbits(noise, axis=1)).tolist()
+        decoded: list = coder.decoding_batch(received)
+        self.assertEqual(decoded, [coder.decoding(package) for package in received])
+        for row in range(20):
+            if row % 10 <= 5:
+                self.assertEqual(decoded[row], packages[row].tolist())
+
+
+class TestTurboCoder(unittest.TestCase):
+    def test_init(self):
+        coder: TurboCoder = TurboCoder(40)
+        self.assertEqual((coder.lengthInformation, coder.lengthTotal), (40, 132))
+        self.assertEqual(coder.interleaver_length, 7)
+        self.assertEqual(coder.typeOfCoder, EnumCodersType.TURBO)
+
+        with self.assertRaises(CodingException):
+            TurboCoder(40, feedback=12)
+        with self.assertRaises(CodingException):
+            TurboCoder(40, polynomial=17)
+
+    def test_encoding(self):
+        coder: TurboCoder = TurboCoder(10, interleaver_length=2)
+        information: list = [1, 0, 1, 1, 0, 0, 0, 1, 0, 1]
+        codeword: list = coder.encoding(information)
+        self.assertEqual(codeword[0:30:3], information)
+        # The second coder encodes interleaved information
+        permuted: list = [information[position] for position in (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)]
+        self.assertEqual(
+            codeword[2:30:3],
+            coder.encoding(permuted)[1:30:3],
+        )
+        self.assertEqual(coder.decoding(codeword), information)
+        with self.assertRaises(CodingException):
+            coder.decoding(codeword[:-1])
+
+    def test_batch(self):
+        coder: TurboCoder = TurboCoder(256)
+        random_state: np.random.RandomState = np.random.RandomState(10)
+        packages: np.ndarray = random_state.randint(0, 2, (12, coder.lengthInformation))
+        codewords: list = coder.encoding_batch(packages)
+        self.assertEqual(codewords, [coder.encoding(package) for package in packages.tolist()])
+
+        # 4 percents of wrong bits are corrected
+        received: np.ndarray = np.array(codewords) ^ (random_state.random_sample((12, coder.lengthTotal)) < 0.04)
+        decoded: list = coder.decoding_batch(received.tolist())
+        self.assertEqual(decoded, packages.tolist())
+        self.assertEqual(decoded[3], coder.decoding(received[3].tolist()))
+
+
+class TestPolarCoder(unittest.TestCase):
+    def test_frozen_bits(self):
+        # Information bits of (8, 4) code are in the most reliable positions for both constructions
+        for construction in EnumConstructionMode:
+            self.assertEqual(np.flatnonzero(~get_frozen_bits(8, 4, 0.0, construction)).tolist(), [3, 5, 6, 7])
+        self.assertIs(
+            get_frozen_bits(256, 128, 1.0, EnumConstructionMode.BHATTACHARYYA),
+            PolarCoder(256, 128, 1.0, EnumConstructionMode.BHATTACHARYYA)._frozenBits,
+        )
+
+        with self.assertRaises(CodingException):
+            PolarCoder(100, 50)
+        with self.assertRaises(CodingException):
+            PolarCoder(64, 65)
+
+    def test_transform(self):
+        # Kronecker power of kernel [[1, 0], [1, 1]] for length 4
+        matrix: np.ndarray = np.array([[1, 0, 0, 0], [1, 1, 0, 0], [1, 0, 1, 0], [1, 1, 1, 1]])
+        words: np.ndarray = np.random.RandomState(11).randint(0, 2, (10, 4))
+        self.assertEqual(polar_transform(words).tolist(), ((words @ matrix) % 2).tolist())
+        self.assertEqual(polar_transform(polar_transform(words)).tolist(), words.tolist())
+
+    def test_coding(self):
+        coder: PolarCoder = PolarCoder(16, 8)
+        information: list = [1, 0, 1, 1, 0, 0, 1, 0]
+        codeword: list = coder.encoding(information)
+        self.assertEqual(len(codeword), 16)
+        self.assertEqual(coder.decoding(codeword), information)
+        for position in range(16):
+            received: list = codeword.copy()
+            received[position] ^= 1
+            self.assertEqual(coder.decoding(received), information)
+        with self.assertRaises(CodingException):
+            coder.decoding(codeword[:-1])
+
+    def test_batch(self):
+        random_state: np.random.RandomState = np.random.RandomState(12)
+        for list_size in (1, 4):
+            coder: PolarCoder = PolarCoder(256, 128, 2.0, list_size=list_size)
+            packages: np.ndarray = random_state.randint(0, 2, (20, coder.lengthInformation))
+            codewords: list = coder.encoding_batch(packages)
+            self.assertEqual(codewords, [coder.encoding(package) for package in packages.tolist()])
+
+            received: np.ndarray = np.array(codewords) ^ (random_state.random_sample((20, coder.lengthTotal)) < 0.02)
+            decoded: list = coder.decoding_batch(received.tolist())
+            self.assertEqual(decoded, packages.tolist())
+            self.assertEqual(decoded[5], coder.decoding(received[5].tolist()))
@@ -0,0 +1,288 @@
+# coding=utf-8
+import os
+import random
+import tempfile
+import unittest
+from typing import List, Optional
+from unittest import mock
+
+from src.channel.cascadecodec import CascadeCodec
+from src.channel.codec import Codec
+from src.channel.concatenated_codec import ConcatenatedCodec
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.channel.enum_package_transfer_result import EnumPackageTransferResult
+from src.coders.interleaver.Interleaver import Interleaver
+from src.coders.linear.hamming import Coder as HammingCoder
+from src.config.config import Config
+from src.config.config_processor import ConfigProcessor
+from src.endpoint.general_chanel_simulate import GeneralChanelSimulate
+from src.endpoint.general_coder_simulate import GeneralCoderSimulate
+from src.endpoint.simulation.cascade_coder_simulation import CascadeCoderSimulation
+from src.endpoint.simulation.concatenated_coder_simulation import ConcatenatedCoderSimulation
+from src.endpoint.simulation.i_simulation_listener import ISimulationListener
+from src.endpoint.simulation.progress_info import ProgressInfo
+from src.endpoint.simulation.progress_reporter import ProgressReporter, ProgressAggregator
+from src.endpoint.simulation.single_coder_simulation import SingleCoderSimulation
+from src.helper.error.exception.application_exception import ApplicationException
+from src.statistics.object.test_result_serializer import TestResultSerializer
+
+
+class _RecordSimulationListener(ISimulationListener):
+    events: List[str]
+
+    def __init__(self):
+        self.events = []
+
+    def start_testing(self) -> None:
+        self.events.append("start")
+
+    def step_finished(self, progress: int) -> None:
+        self.events.append("step")
+
+    def auto_step_finished(self, progress: int) -> None:
+        self.events.append("auto_step")
+
+    def progress_updated(self, progress_info: ProgressInfo) -> None:
+        self.events.append("progress")
+        self.lastProgressInfo = progress_info
+
+    def ended(self) -> None:
+        self.events.append("ended")
+
+    def not_correct(self, exception: ApplicationException) -> None:
+        self.events.append("not_correct")
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        self._workDir = os.getcwd()
+        self._tempDir = tempfile.TemporaryDirectory()
+        os.chdir(self._tempDir.name)
+
+    def tearDown(self):
+        os.chdir(self._workDir)
+        self._tempDir.cleanup()
+
+    def test_headless_single_test(self):
+        listener: _RecordSimulationListener = _RecordSimulationListener()
+        simulation: SingleCoderSimulation = SingleCoderSimulation(
+            noise_chance=10,
+            count_test=20,
+            test_information=11,
+            current_coder=HammingCoder(4),
+            noise_mode=EnumNoiseMode.SINGLE,
+            noise_package_length=0,
+            noise_package_period=0,
+            first_interleaver_length=None,
+            start=10,
+            finish=10,
+            quantity_step=1,
+            listener=listener,
+        )
+        statistic = simulation.run()
+
+        self.assertIsNotNone(statistic)
+        self.assertEqual(statistic.testResult[0].quantity_packages, 20)
+        self.assertEqual(listener.events.count("ended"), 1)
+        self.assertNotIn("not_correct", listener.events)
+        self.assertTrue(os.path.exists("lastResult.state"))
+
+    def test_adaptive_test_counts_shadow_packages(self):
+        adaptive_setting: Config.AdaptiveSetting = ConfigProcessor().config.adaptive_setting
+        previous_setting: tuple = (adaptive_setting.flg_enabled, adaptive_setting.chunk_size,
+                                   adaptive_setting.target_error_packages, adaptive_setting.max_count_test)
+        adaptive_setting.flg_enabled, adaptive_setting.chunk_size = True, 20
+        adaptive_setting.target_error_packages, adaptive_setting.max_count_test = 5, 1000
+        random.seed(0)
+        try:
+            simulation: SingleCoderSimulation = SingleCoderSimulation(
+                noise_chance=30,
+                count_test=1,
+                test_information=15,
+                current_coder=HammingCoder(4),
+                noise_mode=EnumNoiseMode.SINGLE,
+                noise_package_length=0,
+                noise_package_period=0,
+                first_interleaver_length=None,
+                start=30,
+                finish=30,
+                quantity_step=1,
+                listener=_RecordSimulationListener(),
+            )
+            test_result = simulation.run().testResult[0]
+        finally:
+            (adaptive_setting.flg_enabled, adaptive_setting.chunk_size,
+             adaptive_setting.target_error_packages, adaptive_setting.max_count_test) = previous_setting
+
+        # Hamming decoder doesn't raise exception, so most of failed packages are decoded into wrong word
+        self.assertGreater(test_result.shadow_packages, 0)
+        self.assertGreaterEqual(test_result.failed_packages, 5)
+        # Target quantity of failed packages is reached by the first chunk
+        self.assertEqual(test_result.quantity_packages, 20)
+        self.assertEqual(len(test_result.list_case_result), 20)
+        self.assertTrue(test_result.confidence_interval[0] > 0.0)
+
+    def _get_importance_test_result(self, count_test: int, biased_probability: Optional[float]):
+        return SingleCoderSimulation(
+            noise_chance=5,
+            count_test=count_test,
+            test_information=15,
+            current_coder=HammingCoder(4),
+            noise_mode=EnumNoiseMode.IMPORTANCE,
+            noise_package_length=0,
+            noise_package_period=0,
+            first_interleaver_length=None,
+            start=5,
+            finish=5,
+            quantity_step=1,
+            listener=_RecordSimulationListener(),
+            noise_biased_probability=biased_probability,
+        ).run().testResult[0]
+
+    def test_extension_of_concatenated_result(self):
+        coders = [HammingCoder(4), HammingCoder(7), HammingCoder(11)]
+        ConcatenatedCoderSimulation(
+            noise_chance=1,
+            count_test=10,
+            test_information=4,
+            coders=coders,
+            length_interleavers=[None, 2, 3],
+            noise_mode=EnumNoiseMode.SINGLE,
+            noise_package_length=0,
+            noise_package_period=0,
+            start=1,
+            finish=1,
+            quantity_step=1,
+            listener=_RecordSimulationListener(),
+        ).run()
+        statistic = TestResultSerializer().deserialize_from_state()
+
+        chanel: GeneralChanelSimulate = GeneralChanelSimulate(
+            first_coder_params=GeneralCoderSimulate(),
+            second_coder_params=GeneralCoderSimulate(),
+            listener=_RecordSimulationListener(),
+            count_test=10,
+            test_info=4,
+        )
+        chanel.start_concatenated_test_extension(statistic)
+
+        codec: ConcatenatedCodec = chanel._concatenatedSimulation.channel
+        self.assertEqual([stage.coder.name for stage in codec.stages], [coder.name for coder in coders])
+        self.assertEqual([stage.coder.lengthTotal for stage in codec.stages], [coder.lengthTotal for coder in coders])
+        extended_statistic = TestResultSerializer().deserialize_from_state()
+        self.assertEqual(len(extended_statistic.coders), 3)
+        self.assertEqual(extended_statistic.lengthInterleavers, [None, 2, 3])
+        self.assertEqual(extended_statistic.testResult[0].quantity_packages, 20)
+
+    def test_importance_estimate_of_hamming_coder(self):
+        random.seed(1)
+        # Biased probability equals noise probability, so all weights are 1 like in plain Monte Carlo
+        monte_carlo_result = self._get_importance_test_result(4000, 5.0)
+        importance_result = self._get_importance_test_result(4000, None)
+        # Hamming(7,4) fails if two or more bits of codeword are changed
+        expected_probability: float = 1 - 0.95 ** 7 - 7 * 0.05 * 0.95 ** 6
+
+        # Failed packages of Hamming coder are decoded into wrong word and they are weighted too
+        self.assertEqual(importance_result.error_packages, 0)
+        self.assertGreater(importance_result.shadow_packages, 0)
+        self.assertEqual(importance_result.quantity_packages, 4000)
+        self.assertAlmostEqual(importance_result.error_package_probability, expected_probability, delta=0.01)
+        self.assertAlmostEqual(monte_carlo_result.error_package_probability, expected_probability, delta=0.015)
+
+    def test_global_test_statistic(self):
+        first_transfer: Codec.TransferStatistic = Codec.TransferStatistic()
+        first_transfer.quantity_successful_bits = 4
+        second_transfer: Codec.TransferStatistic = Codec.TransferStatistic()
+        second_transfer.result_status = EnumPackageTransferResult.ERROR
+        second_transfer.likelihood_weight = 0.5
+        second_transfer.quantity_error_bits = 1
+        # Instances don't share lists
+        second_transfer.stage_error_bits.append(1)
+        self.assertEqual(first_transfer.stage_error_bits, [])
+
+        statistic: SingleCoderSimulation.GlobalTestStatistic = SingleCoderSimulation.GlobalTestStatistic()
+        statistic.add(first_transfer)
+        other_statistic: SingleCoderSimulation.GlobalTestStatistic = SingleCoderSimulation.GlobalTestStatistic()
+        other_statistic.add(second_transfer)
+        # Package decoded into wrong word isn't aliased with package of decoder error
+        shadow_transfer: Codec.TransferStatistic = Codec.TransferStatistic()
+        shadow_transfer.result_status = EnumPackageTransferResult.SHADOW
+        other_statistic.add(shadow_transfer)
+        statistic.merge(other_statistic)
+
+        self.assertEqual(statistic.quantity_successful_package, 1)
+        self.assertEqual(statistic.quantity_error_package, 1)
+        self.assertEqual(statistic.quantity_shadow_package, 1)
+        self.assertEqual(statistic.quantity_correct_bits, 4)
+        self.assertEqual(statistic.quantity_error_bits, 1)
+        # Weights of error and shadow packages
+        self.assertAlmostEqual(statistic.weighted_error_package, 1.5)
+        self.assertAlmostEqual(statistic.weighted_error_package_square, 1.25)
+
+    def test_channel_is_created_once(self):
+        original_init = Interleaver.__init__
+        with mock.patch.object(Interleaver, "__init__", autospec=True, side_effect=original_init) as interleaver_init:
+            cascade_simulation: CascadeCoderSimulation = CascadeCoderSimulation(
+                noise_chance=10,
+                count_test=20,
+                test_information=16,
+                current_coder=HammingCoder(16),
+                first_coder=HammingCoder(16),
+                second_coder=HammingCoder(21),
+                noise_mode=EnumNoiseMode.SINGLE,
+                noise_package_length=0,
+                noise_package_period=0,
+                length_first_interleaver=3,
+                length_second_interleaver=2,
+                start=10,
+                finish=10,
+                quantity_step=1,
+                listener=_RecordSimulationListener(),
+            )
+        self.assertIsInstance(cascade_simulation.channel, CascadeCodec)
+        self.assertEqual(interleaver_init.call_count, 2)
+
+        with mock.patch.object(Interleaver, "__init__", autospec=True, side_effect=original_init) as interleaver_init:
+            concatenated_simulation: ConcatenatedCoderSimulation = ConcatenatedCoderSimulation(
+                noise_chance=10,
+                count_test=20,
+                test_information=4,
+                coders=[HammingCoder(4), HammingCoder(7), HammingCoder(11)],
+                length_interleavers=[None, 2, 3],
+                noise_mode=EnumNoiseMode.SINGLE,
+                noise_package_length=0,
+                noise_package_period=0,
+                start=10,
+                finish=10,
+                quantity_step=1,
+                listener=_RecordSimulationListener(),
+            )
+        self.assertIsInstance(concatenated_simulation.channel, ConcatenatedCodec)
+        self.assertEqual(interleaver_init.call_count, 2)
+
+
+class TestProgressReporter(unittest.TestCase):
+    def test_throttling(self):
+        listener: _RecordSimulationListener = _RecordSimulationListener()
+        reporter: ProgressReporter = ProgressReporter(listener, interval=3600)
+        reporter.start(1000)
+        for _ in range(1000):
+            reporter.update(50.0)
+        self.assertEqual(listener.events, [])
+
+        reporter.finish()
+        self.assertEqual(listener.events, ["progress"])
+        self.assertEqual(listener.lastProgressInfo.quantity_trials, 1000)
+        self.assertEqual(listener.lastProgressInfo.percent, 100.0)
+
+    def test_aggregation(self):
+        aggregator: ProgressAggregator = ProgressAggregator(interval=0)
+        aggregator.update("first", 10, 100)
+        progress_info: ProgressInfo = aggregator.update("second", 40, 100)
+        self.assertEqual(progress_info.quantity_trials, 50)
+        self.assertEqual(progress_info.quantity_total_trials, 200)
+        self.assertEqual(aggregator.update("first", 60, 100).quantity_trials, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
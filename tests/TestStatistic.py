@@ -0,0 +1,188 @@
+# coding=utf-8
+import unittest
+from typing import Dict, List
+from unittest import mock
+
+from src.channel.enum_noise_mode import EnumNoiseMode
+from src.coders.linear.hamming import Coder as HammingCoder
+from src.helper.calc.confidence_calculation import ConfidenceCalculation
+from src.statistics.object.statistic_collector import CaseResult, TestResult, StatisticCollector
+from src.statistics.object.test_result_serializer import TestResultSerializer
+
+
+def _get_test_result(noise: float, error_packages: int) -> TestResult:
+    return TestResult(
+        list_case_result=[CaseResult(successfulBits=4, repairBits=0, changedBits=1, errorBits=0)],
+        first_coder=HammingCoder(4),
+        second_coder=None,
+        noise_type=EnumNoiseMode.SINGLE,
+        noise=noise,
+        flg_cascade=False,
+        successful_packages=10 - error_packages,
+        repair_packages=0,
+        changed_packages=0,
+        error_packages=error_packages,
+        quantity_correct_bits=40,
+        quantity_error_bits=0,
+        based_correct_bits=60,
+        based_error_bits=10,
+    )
+
+
+class TestStatisticCollector(unittest.TestCase):
+    def test_merge(self):
+        test_result = _get_test_result(10.0, 1)
+        test_result.merge(_get_test_result(10.0, 3))
+
+        self.assertEqual(test_result.error_packages, 4)
+        self.assertEqual(test_result.successful_packages, 16)
+        self.assertEqual(test_result.quantity_packages, 20)
+        self.assertEqual(test_result.based_error_bits, 20)
+        self.assertEqual(len(test_result.list_case_result), 2)
+
+    def test_merge_shadow_packages(self):
+        test_result = _get_test_result(10.0, 1)
+        other_test_result = _get_test_result(10.0, 1)
+        other_test_result.successful_packages, other_test_result.shadow_packages = 7, 2
+        test_result.merge(other_test_result)
+
+        # Packages decoded into wrong word are trials too
+        self.assertEqual(test_result.shadow_packages, 2)
+        self.assertEqual(test_result.quantity_packages, 20)
+
+    def test_shadow_packages_are_failed(self):
+        test_result = _get_test_result(10.0, 1)
+        test_result.successful_packages, test_result.shadow_packages = 6, 3
+        test_result.update_confidence_interval()
+
+        self.assertEqual(test_result.failed_packages, 4)
+        self.assertAlmostEqual(test_result.error_package_probability, 0.4)
+        self.assertEqual(test_result.confidence_interval, ConfidenceCalculation.get_wilson_interval(4, 10, 0.95))
+
+    def test_merge_stage_profile(self):
+        test_result = _get_test_result(10.0, 1)
+        test_result.stage_durations, test_result.stage_calls = {"encode": 1.0}, {"encode": 10}
+        other_test_result = _get_test_result(10.0, 1)
+        other_test_result.stage_durations, other_test_result.stage_calls = {"encode": 0.5}, {"encode": 5}
+        test_result.merge(other_test_result)
+
+        self.assertEqual(test_result.stage_durations, {"encode": 1.5})
+        self.assertEqual(test_result.stage_calls, {"encode": 15})
+
+    def test_merge_stage_profile_into_result_without_profile(self):
+        test_result = _get_test_result(10.0, 1)
+        other_test_result = _get_test_result(10.0, 1)
+        other_test_result.stage_durations, other_test_result.stage_calls = {"encode": 0.5}, {"encode": 5}
+        test_result.merge(other_test_result)
+
+        self.assertEqual(test_result.stage_durations, {"encode": 0.5})
+        self.assertEqual(test_result.stage_calls, {"encode": 5})
+        # Dictionaries aren't shared with merged result
+        test_result.merge(other_test_result)
+        self.assertEqual(other_test_result.stage_durations, {"encode": 0.5})
+        self.assertEqual(test_result.stage_calls, {"encode": 10})
+
+    def test_low_confidence_indexes(self):
+        statistic = StatisticCollector(
+            flgCascade=False,
+            firstCoder=HammingCoder(4),
+            secondCoder=None,
+            testResult=[_get_test_result(50.0, 9), _get_test_result(10.0, 2), _get_test_result(1.0, 0)],
+            lengthFirstInterleaver=None,
+            lengthSecondInterleaver=None,
+            beginNoise=1.0,
+            endNoise=3.0,
+            quantityStepsInCycle=3,
+            noisePeriod=None,
+            noiseLength=None,
+        )
+        self.assertEqual(statistic.get_low_confidence_indexes(3), [1, 2])
+
+
+class _RecordConnection:
+    """
+    Connection which stores parameters of inserts instead of execution
+    """
+    inserts: List[tuple]
+
+    def __init__(self):
+        self.inserts = []
+
+    def execute(self, statement) -> None:
+        self.inserts.append((statement.table.name, statement.compile().params))
+
+
+class TestResultSerializerToDatabase(unittest.TestCase):
+    def _serialize(self, test_result: TestResult) -> Dict:
+        """
+        :return: Dict Parameters of insert of test result
+        """
+        from src.statistics.db.connector import Connector
+
+        connection: _RecordConnection = _RecordConnection()
+        statistic = StatisticCollector(
+            flgCascade=False,
+            firstCoder=HammingCoder(4),
+            secondCoder=None,
+            testResult=[test_result],
+            lengthFirstInterleaver=None,
+            lengthSecondInterleaver=None,
+            beginNoise=1.0,
+            endNoise=1.0,
+            quantityStepsInCycle=1,
+            noisePeriod=None,
+            noiseLength=None,
+        )
+        with mock.patch.object(Connector, "get_connection", return_value=connection):
+            TestResultSerializer().serialize_to_db(statistic)
+        return [parameters for table_name, parameters in connection.inserts if table_name == "test_result"][0]
+
+    def test_package_counters(self):
+        test_result = _get_test_result(10.0, 1)
+        test_result.shadow_packages = 2
+        parameters: Dict = self._serialize(test_result)
+
+        self.assertEqual(parameters["error_packages"], 1)
+        self.assertEqual(parameters["shadow_packages"], 2)
+
+    def test_importance_weights(self):
+        test_result = _get_test_result(10.0, 1)
+        test_result.noise_type = EnumNoiseMode.IMPORTANCE
+        test_result.weighted_error_packages, test_result.weighted_error_packages_square = 0.5, 0.125
+        parameters: Dict = self._serialize(test_result)
+
+        self.assertEqual(parameters["noise_mode"], EnumNoiseMode.IMPORTANCE.value)
+        self.assertEqual(parameters["weighted_error_packages"], 0.5)
+        self.assertEqual(parameters["weighted_error_packages_square"], 0.125)
+
+    def test_stage_profile(self):
+        test_result = _get_test_result(10.0, 1)
+        self.assertIsNone(self._serialize(test_result)["stage_durations"])
+
+        test_result.stage_durations, test_result.stage_calls = {"encode": 1.5}, {"encode": 10}
+        parameters: Dict = self._serialize(test_result)
+        self.assertEqual(parameters["stage_durations"], {"encode": 1.5})
+        self.assertEqual(parameters["stage_calls"], {"encode": 10})
+
+    def test_confidence_interval(self):
+        test_result = _get_test_result(10.0, 1)
+        self.assertIsNone(self._serialize(test_result)["confidence_low"])
+
+        test_result.update_confidence_interval(0.9)
+        parameters: Dict = self._serialize(test_result)
+        self.assertEqual(parameters["confidence_level"], 0.9)
+        self.assertEqual((parameters["confidence_low"], parameters["confidence_high"]),
+                         test_result.confidence_interval)
+
+
+class TestConfidenceCalculation(unittest.TestCase):
+    def test_wilson_interval(self):
+        low, high = ConfidenceCalculation.get_wilson_interval(10, 100, 0.95)
+        self.assertTrue(low < 0.1 < high)
+        self.assertAlmostEqual(low, 0.0552, places=3)
+        self.assertAlmostEqual(high, 0.1744, places=3)
+
+    def test_zero_errors(self):
+        low, high = ConfidenceCalculation.get_wilson_interval(0, 1000, 0.95)
+        self.assertEqual(low, 0.0)
+        self.assertTrue(0.0 < high < 0.01)